@@ -3,12 +3,13 @@ from playwright.sync_api import sync_playwright
 import logging
 from dataclasses import dataclass, asdict
 
-# Configure logging
-logging.basicConfig(
-    filename='crex_scraper.log',
-    level=logging.INFO,
-    format='%(asctime)s %(levelname)s: %(message)s'
-)
+from src.config import get_settings
+from src.logging.pipeline import LoggingPipeline, route_logger
+from src.monitoring.monitoring import record_static_parse
+from src.static_parser import fetch_document
+
+# Configure logging (root records go to the shared, rotated crex_scraper.log)
+route_logger(LoggingPipeline.ROOT, 'crex_scraper.log', level=logging.INFO, console_level=logging.WARN)
 
 # Helper function to extract text from selectors
 def get_inner_text(page, selector, default_value):
@@ -30,207 +31,315 @@ class MatchInfo:
     playing_xi: dict
     toss_info: str
 
-def scrape_match_info(url):
+def _static_text(root, selector, default_value):
+    # Same fallback rule as the in-page scripts: `?.innerText.trim() || default`
+    element = root.query_selector(selector)
+    text = element.inner_text().strip() if element else ''
+    return text or default_value
+
+def _static_team_form(document):
+    teams_data = {}
+    for section in document.query_selector_all('.format-match-exp'):
+        team_id = section.get_attribute('id') or 'Unknown Team'
+        last_matches = []
+        for card in section.query_selector_all('.format-card-wrap'):
+            teams = []
+            for team_detail in card.query_selector_all('.form-team-detail'):
+                scores = [el.inner_text() for el in team_detail.query_selector_all('.team-score')]
+                overs = [el.inner_text() for el in team_detail.query_selector_all('.team-over')]
+                scores = [score for score in scores if score != '&']
+                overs = [over for over in overs if over != '&']
+                teams.append({
+                    "team_name": _static_text(team_detail, '.team-name', 'Unknown'),
+                    "innings": [
+                        {"team_score": score, "team_over": (overs[idx] if idx < len(overs) else '') or 'N/A'}
+                        for idx, score in enumerate(scores)
+                    ],
+                })
+            match_info = card.query_selector('.form-match-no')
+            if match_info is None:
+                return None  # the in-page script fails on such a card; let Chromium report it
+            last_matches.append({
+                "match_name": _static_text(match_info, '.match-name', 'Unknown Match'),
+                "series_name": _static_text(match_info, '.series-name', 'Unknown Series'),
+                "teams": teams,
+                "result": _static_text(card, '.win.match, .loss.match, .draw.match', 'Unknown Result'),
+            })
+        teams_data[team_id] = last_matches
+    return teams_data
+
+def _static_team_comparison(document):
+    rows = document.query_selector_all('#table tbody tr')
+    if not rows:
+        return {}
+    team1_name = _static_text(document, '.team1 .team-name', 'Team 1')
+    team2_name = _static_text(document, '.team2 .team-name', 'Team 2')
+    team_comparison = {team1_name: {}, team2_name: {}}
+    for row in rows:
+        cells = row.query_selector_all('td')
+        if len(cells) >= 3:
+            # String.replace in the in-page script only replaces the first space
+            stat_name = cells[1].inner_text().lower().replace(' ', '_', 1)
+            team_comparison[team1_name][stat_name] = cells[0].inner_text()
+            team_comparison[team2_name][stat_name] = cells[2].inner_text()
+    return team_comparison
+
+def _static_venue_stats(document):
+    if document.query_selector('.match-count') is None:
+        return {}
+    return {
+        "matches": _static_text(document, '.match-count', 'No data'),
+        "win_bat_first": _static_text(document, '.win-bat-first .match-win-per', 'No data'),
+        "win_bowl_first": _static_text(document, '.win-bowl-first .match-win-per', 'No data'),
+        "avg_1st_inns": _static_text(document, '.venue-avg-sec-inn .venue-avg-val', 'No data'),
+        "avg_2nd_inns": _static_text(document, '.venue-avg-wrap .venue-avg-val', 'No data'),
+    }
+
+def scrape_match_info_static(url, document=None):
+    """Match info read from the server-rendered page, or None when Chromium is needed.
+
+    The page counts as complete when its header (name, date, venue) is present
+    and no playing XI tab has to be clicked open.
+    """
+    if document is None:
+        document = fetch_document(url, page="match_info")
+        if document is None:
+            return None
+    match_name = get_inner_text(document, '.s-name', None)
+    match_date = get_inner_text(document, '.match-date', None)
+    venue = get_inner_text(document, '.match-venue', None)
+    team_form = _static_team_form(document)
+    if not (match_name and match_date and venue) or team_form is None or document.query_selector('.playingxi-button'):
+        record_static_parse("match_info", "incomplete")
+        logging.info(f"Static parse of {url} incomplete; falling back to the browser")
+        return None
+    record_static_parse("match_info", "complete")
+    return asdict(MatchInfo(
+        match_date=match_date,
+        venue=venue,
+        match_name=match_name,
+        team_form=team_form,
+        team_comparison=_static_team_comparison(document),
+        venue_stats=_static_venue_stats(document),
+        playing_xi={},
+        toss_info=get_inner_text(document, '.toss-wrap p', 'No toss information'),
+    ))
+
+def scrape_match_info(url, browser_context=None, capture_console=None):
+    """Scrape a match info page.
+
+    The server-rendered page is tried first (no browser). Otherwise the page
+    is opened in ``browser_context`` (normally the match scraper's own
+    context) and closed again; a browser is launched only when no context
+    is given. ``capture_console`` forwards the page's console messages to
+    the log (default: MATCH_INFO_CONSOLE_CAPTURE, off).
+    """
     logging.info(f"Scraping match info page: {url}")
+    static_info = scrape_match_info_static(url)
+    if static_info is not None:
+        return static_info
+    if capture_console is None:
+        capture_console = get_settings().match_info_console_capture
+
+    if browser_context is not None:
+        page = browser_context.new_page()
+        try:
+            return _scrape_match_info_page(page, url, capture_console)
+        finally:
+            try:
+                page.close()
+            except Exception as e:
+                logging.warning(f"Could not close match info page {url}: {e}")
+
     with sync_playwright() as p:
         # Set headless=False for debugging
         browser = p.chromium.launch(headless=True, args=['--no-sandbox', '--disable-dev-shm-usage'])
-        context = browser.new_context()
-        page = context.new_page()
-
-        # Define console handler to capture console messages from the page
-        def on_console(msg):
-            if msg.type == 'error':
-                for arg in msg.args:
-                    text = arg.json_value()
-                    logging.error(f"Console error: {text}")
-                    print(f"Console error: {text}")  # Optional: Print to stdout
-            elif msg.type == 'warning':
-                for arg in msg.args:
-                    text = arg.json_value()
-                    logging.warning(f"Console warning: {text}")
-                    print(f"Console warning: {text}")  # Optional: Print to stdout
-            else:
-                for arg in msg.args:
-                    text = arg.json_value()
-                    logging.info(f"Console {msg.type}: {text}")
-                    print(f"Console {msg.type}: {text}")  # Optional: Print to stdout
-
-        # Attach console handler
-        page.on("console", on_console)
-
         try:
-            # Navigate to the URL
-            page.goto(url, timeout=60000)
-
-            # Scrape toss information
-            toss_info = get_inner_text(page, '.toss-wrap p', 'No toss information')
-
-            # Scrape match details (date, venue, teams)
-            match_date = get_inner_text(page, '.match-date', 'No match date')
-            venue = get_inner_text(page, '.match-venue', 'No venue info')
-            match_name = get_inner_text(page, '.s-name', 'No match name')
-
-            # Scrape team form
-            team_form = page.evaluate('''() => {
-                const teamsData = {};
-
-                // Query for all team sections containing the team forms
-                const teamSections = document.querySelectorAll('.format-match-exp');
-
-                console.log(`Number of team sections found: ${teamSections.length}`);
-
-                teamSections.forEach(section => {
-                    const teamId = section.id || 'Unknown Team';
-                    console.log(`Processing Team ID: ${teamId}`);
-                    const last_matches = [];
-
-                    // Find all match cards within the team section
-                    const match_cards = section.querySelectorAll('.format-card-wrap');
-                    console.log(`Found ${match_cards.length} match cards for team ${teamId}`);
-
-                    match_cards.forEach((card, cardIdx) => {
-                        console.log(`Processing Match Card ${cardIdx + 1} for team ${teamId}`);
-                        const teams = [];
-
-                        // Extract team details
-                        const team_details = card.querySelectorAll('.form-team-detail');
-                        team_details.forEach((teamDetail, detailIdx) => {
-                            const teamName = teamDetail.querySelector('.team-name')?.innerText.trim() || 'Unknown';
-                            console.log(`Team ${detailIdx + 1} Name: ${teamName}`);
-
-                            // Extract scores and overs, filtering out ampersands
-                            const innings_scores = teamDetail.querySelectorAll('.team-score');
-                            const innings_overs = teamDetail.querySelectorAll('.team-over');
-
-                            // Convert NodeLists to Arrays and filter out ampersands
-                            const inningsScoresArray = Array.from(innings_scores).filter(el => el.innerText.trim() !== '&');
-                            const inningsOversArray = Array.from(innings_overs).filter(el => el.innerText.trim() !== '&');
-
-                            const scores = [];
-                            inningsScoresArray.forEach((scoreElement, idx) => {
-                                const score = scoreElement.innerText.trim();
-                                const over = inningsOversArray[idx]?.innerText.trim() || 'N/A';
-                                console.log(`Innings ${idx + 1} - Score: ${score}, Over: ${over}`);
-                                scores.push({
-                                    "team_score": score,
-                                    "team_over": over
-                                });
-                            });
+            return _scrape_match_info_page(browser.new_context().new_page(), url, capture_console)
+        finally:
+            browser.close()
+            logging.info("Browser closed after scraping match info page.")
+
+def _log_console_message(msg):
+    # msg.text is already serialised; reading msg.args would cost a round trip per argument
+    if msg.type == 'error':
+        logging.error(f"Console error: {msg.text}")
+    elif msg.type == 'warning':
+        logging.warning(f"Console warning: {msg.text}")
+    else:
+        logging.info(f"Console {msg.type}: {msg.text}")
+
+def _scrape_match_info_page(page, url, capture_console=False):
+    if capture_console:
+        page.on("console", _log_console_message)
 
-                            teams.push({
-                                "team_name": teamName,
-                                "innings": scores
+    try:
+        # Navigate to the URL
+        page.goto(url, timeout=60000)
+
+        # Scrape toss information
+        toss_info = get_inner_text(page, '.toss-wrap p', 'No toss information')
+
+        # Scrape match details (date, venue, teams)
+        match_date = get_inner_text(page, '.match-date', 'No match date')
+        venue = get_inner_text(page, '.match-venue', 'No venue info')
+        match_name = get_inner_text(page, '.s-name', 'No match name')
+
+        # Scrape team form
+        team_form = page.evaluate('''() => {
+            const teamsData = {};
+
+            // Query for all team sections containing the team forms
+            const teamSections = document.querySelectorAll('.format-match-exp');
+
+            console.log(`Number of team sections found: ${teamSections.length}`);
+
+            teamSections.forEach(section => {
+                const teamId = section.id || 'Unknown Team';
+                console.log(`Processing Team ID: ${teamId}`);
+                const last_matches = [];
+
+                // Find all match cards within the team section
+                const match_cards = section.querySelectorAll('.format-card-wrap');
+                console.log(`Found ${match_cards.length} match cards for team ${teamId}`);
+
+                match_cards.forEach((card, cardIdx) => {
+                    console.log(`Processing Match Card ${cardIdx + 1} for team ${teamId}`);
+                    const teams = [];
+
+                    // Extract team details
+                    const team_details = card.querySelectorAll('.form-team-detail');
+                    team_details.forEach((teamDetail, detailIdx) => {
+                        const teamName = teamDetail.querySelector('.team-name')?.innerText.trim() || 'Unknown';
+                        console.log(`Team ${detailIdx + 1} Name: ${teamName}`);
+
+                        // Extract scores and overs, filtering out ampersands
+                        const innings_scores = teamDetail.querySelectorAll('.team-score');
+                        const innings_overs = teamDetail.querySelectorAll('.team-over');
+
+                        // Convert NodeLists to Arrays and filter out ampersands
+                        const inningsScoresArray = Array.from(innings_scores).filter(el => el.innerText.trim() !== '&');
+                        const inningsOversArray = Array.from(innings_overs).filter(el => el.innerText.trim() !== '&');
+
+                        const scores = [];
+                        inningsScoresArray.forEach((scoreElement, idx) => {
+                            const score = scoreElement.innerText.trim();
+                            const over = inningsOversArray[idx]?.innerText.trim() || 'N/A';
+                            console.log(`Innings ${idx + 1} - Score: ${score}, Over: ${over}`);
+                            scores.push({
+                                "team_score": score,
+                                "team_over": over
                             });
                         });
 
-                        // Extract match info
-                        const match_info = card.querySelector('.form-match-no');
-                        const match_name = match_info.querySelector('.match-name')?.innerText.trim() || 'Unknown Match';
-                        const series_name = match_info.querySelector('.series-name')?.innerText.trim() || 'Unknown Series';
+                        teams.push({
+                            "team_name": teamName,
+                            "innings": scores
+                        });
+                    });
 
-                        // Extract result
-                        const resultElement = card.querySelector('.win.match, .loss.match, .draw.match');
-                        const result = resultElement?.innerText.trim() || 'Unknown Result';
+                    // Extract match info
+                    const match_info = card.querySelector('.form-match-no');
+                    const match_name = match_info.querySelector('.match-name')?.innerText.trim() || 'Unknown Match';
+                    const series_name = match_info.querySelector('.series-name')?.innerText.trim() || 'Unknown Series';
 
-                        console.log(`Match Name: ${match_name}, Series Name: ${series_name}, Result: ${result}`);
+                    // Extract result
+                    const resultElement = card.querySelector('.win.match, .loss.match, .draw.match');
+                    const result = resultElement?.innerText.trim() || 'Unknown Result';
 
-                        last_matches.push({
-                            "match_name": match_name,
-                            "series_name": series_name,
-                            "teams": teams,
-                            "result": result
-                        });
-                    });
+                    console.log(`Match Name: ${match_name}, Series Name: ${series_name}, Result: ${result}`);
 
-                    // Store team form data in the final result
-                    teamsData[teamId] = last_matches;
+                    last_matches.push({
+                        "match_name": match_name,
+                        "series_name": series_name,
+                        "teams": teams,
+                        "result": result
+                    });
                 });
 
-                return teamsData;
-            }''') if page.query_selector('.format-match-exp') else {}
-
-            # Scrape team comparison
-            team_comparison = page.evaluate('''() => {
-                const team_comparison = {};
-                const team1_element = document.querySelector('.team1 .team-name');
-                const team2_element = document.querySelector('.team2 .team-name');
-                const team1_name = team1_element ? team1_element.innerText.trim() : 'Team 1';
-                const team2_name = team2_element ? team2_element.innerText.trim() : 'Team 2';
-                team_comparison[team1_name] = {};
-                team_comparison[team2_name] = {};
-                const rows = document.querySelectorAll('#table tbody tr');
-                rows.forEach(row => {
-                    const cells = row.querySelectorAll('td');
-                    if (cells.length >= 3) {
-                        const stat_name = cells[1].innerText.trim();
-                        const team1_stat = cells[0].innerText.trim();
-                        const team2_stat = cells[2].innerText.trim();
-                        team_comparison[team1_name][stat_name.toLowerCase().replace(' ', '_')] = team1_stat;
-                        team_comparison[team2_name][stat_name.toLowerCase().replace(' ', '_')] = team2_stat;
-                    }
+                // Store team form data in the final result
+                teamsData[teamId] = last_matches;
+            });
+
+            return teamsData;
+        }''') if page.query_selector('.format-match-exp') else {}
+
+        # Scrape team comparison
+        team_comparison = page.evaluate('''() => {
+            const team_comparison = {};
+            const team1_element = document.querySelector('.team1 .team-name');
+            const team2_element = document.querySelector('.team2 .team-name');
+            const team1_name = team1_element ? team1_element.innerText.trim() : 'Team 1';
+            const team2_name = team2_element ? team2_element.innerText.trim() : 'Team 2';
+            team_comparison[team1_name] = {};
+            team_comparison[team2_name] = {};
+            const rows = document.querySelectorAll('#table tbody tr');
+            rows.forEach(row => {
+                const cells = row.querySelectorAll('td');
+                if (cells.length >= 3) {
+                    const stat_name = cells[1].innerText.trim();
+                    const team1_stat = cells[0].innerText.trim();
+                    const team2_stat = cells[2].innerText.trim();
+                    team_comparison[team1_name][stat_name.toLowerCase().replace(' ', '_')] = team1_stat;
+                    team_comparison[team2_name][stat_name.toLowerCase().replace(' ', '_')] = team2_stat;
+                }
+            });
+            return team_comparison;
+        }''') if page.query_selector('#table tbody tr') else {}
+
+        # Scrape venue stats
+        venue_stats = page.evaluate('''() => {
+            const stats = {};
+            stats.matches = document.querySelector('.match-count')?.innerText.trim() || 'No data';
+            stats.win_bat_first = document.querySelector('.win-bat-first .match-win-per')?.innerText.trim() || 'No data';
+            stats.win_bowl_first = document.querySelector('.win-bowl-first .match-win-per')?.innerText.trim() || 'No data';
+            stats.avg_1st_inns = document.querySelector('.venue-avg-sec-inn .venue-avg-val')?.innerText.trim() || 'No data';
+            stats.avg_2nd_inns = document.querySelector('.venue-avg-wrap .venue-avg-val')?.innerText.trim() || 'No data';
+            return stats;
+        }''') if page.query_selector('.match-count') else {}
+
+        # Scrape playing XI for both teams
+        playing_xi = {}
+        buttons = page.query_selector_all('.playingxi-button')
+        for button in buttons:
+            team_name = button.inner_text().strip()
+            button.click()
+            page.wait_for_selector('.playingxi-card-row')  # Ensure playing XI loads
+            players = page.evaluate('''() => {
+                const playersList = [];
+                document.querySelectorAll('.playingxi-card-row').forEach(player => {
+                    const playerName = player.querySelector('.player-name')?.innerText.trim() || 'Unknown Player';
+                    const playerRole = player.querySelector('.bat-ball-type')?.innerText.trim() || 'Unknown Role';
+                    playersList.push({ playerName, playerRole });
                 });
-                return team_comparison;
-            }''') if page.query_selector('#table tbody tr') else {}
-
-            # Scrape venue stats
-            venue_stats = page.evaluate('''() => {
-                const stats = {};
-                stats.matches = document.querySelector('.match-count')?.innerText.trim() || 'No data';
-                stats.win_bat_first = document.querySelector('.win-bat-first .match-win-per')?.innerText.trim() || 'No data';
-                stats.win_bowl_first = document.querySelector('.win-bowl-first .match-win-per')?.innerText.trim() || 'No data';
-                stats.avg_1st_inns = document.querySelector('.venue-avg-sec-inn .venue-avg-val')?.innerText.trim() || 'No data';
-                stats.avg_2nd_inns = document.querySelector('.venue-avg-wrap .venue-avg-val')?.innerText.trim() || 'No data';
-                return stats;
-            }''') if page.query_selector('.match-count') else {}
-
-            # Scrape playing XI for both teams
-            playing_xi = {}
-            buttons = page.query_selector_all('.playingxi-button')
-            for button in buttons:
-                team_name = button.inner_text().strip()
-                button.click()
-                page.wait_for_selector('.playingxi-card-row')  # Ensure playing XI loads
-                players = page.evaluate('''() => {
-                    const playersList = [];
-                    document.querySelectorAll('.playingxi-card-row').forEach(player => {
-                        const playerName = player.querySelector('.player-name')?.innerText.trim() || 'Unknown Player';
-                        const playerRole = player.querySelector('.bat-ball-type')?.innerText.trim() || 'Unknown Role';
-                        playersList.push({ playerName, playerRole });
-                    });
-                    return playersList;
-                }''')
-                playing_xi[team_name] = players
-
-            # Logging scraped data
-            match_info_dict = asdict(MatchInfo(
-                match_date=match_date,
-                venue=venue,
-                match_name=match_name,
-                team_form=team_form,
-                team_comparison=team_comparison,
-                venue_stats=venue_stats,
-                playing_xi=playing_xi,
-                toss_info=toss_info
-            ))
-
-            logging.info("Match Info Data: " + json.dumps(match_info_dict, indent=4))
-
-            # Print the scraped data
-            # print(json.dumps(match_info_dict, indent=4))
-
-            # Return scraped data as a dataclass
-            return match_info_dict
-
-        except Exception as e:
-            logging.error(f"Error scraping match info page: {e}")
-            print(f"Error scraping match info page: {e}")
-            return {}
+                return playersList;
+            }''')
+            playing_xi[team_name] = players
+
+        # Logging scraped data
+        match_info_dict = asdict(MatchInfo(
+            match_date=match_date,
+            venue=venue,
+            match_name=match_name,
+            team_form=team_form,
+            team_comparison=team_comparison,
+            venue_stats=venue_stats,
+            playing_xi=playing_xi,
+            toss_info=toss_info
+        ))
+
+        logging.info("Match Info Data: " + json.dumps(match_info_dict, indent=4))
+
+        # Print the scraped data
+        # print(json.dumps(match_info_dict, indent=4))
+
+        # Return scraped data as a dataclass
+        return match_info_dict
 
-        finally:
-            if browser:
-                browser.close()
-                logging.info("Browser closed after scraping match info page.")
+    except Exception as e:
+        logging.error(f"Error scraping match info page: {e}")
+        print(f"Error scraping match info page: {e}")
+        return {}
 
 # Example usage
 if __name__ == "__main__":
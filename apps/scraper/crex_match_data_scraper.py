@@ -5,11 +5,26 @@ import os
 import sys
 
 import concurrent.futures
+import dataclasses
 import threading
 import requests
 # Use batched version for better performance
 import cricket_data_service
 from playwright.sync_api import sync_playwright
+from src import monitoring
+from src.config import get_settings
+from src.core.bulkhead import BulkheadFullError, get_bulkhead
+from src.core.match_info_cache import get_match_info_cache
+from src.core.process_census import browser_root_pid
+from src.core.scraper_context import derive_match_id
+from src.core.scraper_state import ScraperStateSnapshot, get_state_store, payload_digest
+from src.logging.capture import capture_session, end_capture_tick, finish_capture
+from src.logging.pipeline import route_logger
+from src.monitoring.freshness import FreshnessStamp
+from src.monitoring.memory_growth import unwatch_match, watch_match
+from src.monitoring.tracing import get_tracer
+from src.persistence.ball_archive import close_ball_archive, get_ball_archive
+from src.replay.recorder import open_recorder
 import json
 import logging
 from shared import scraping_tasks 
@@ -17,36 +32,30 @@ from crex_info_url import scrape_match_info  # Import the modularized info scrap
 import time
 from urllib.parse import urlparse, parse_qs
 
-# Initialize loggers
-api_logger = logging.getLogger('api_logger')
-api_logger.setLevel(logging.DEBUG)
-scraper_logger = logging.getLogger('scraper_logger')
-scraper_logger.setLevel(logging.WARN)
-
-# File handlers
-api_file_handler = logging.FileHandler('api.log',encoding='utf-8')
-scraper_file_handler = logging.FileHandler('crex_scraper.log',encoding='utf-8')
-
-# Console handler
-console_handler = logging.StreamHandler()
-api_file_handler.setLevel(logging.DEBUG)
-scraper_file_handler.setLevel(logging.WARN)
-console_handler.setLevel(logging.WARN)
-
-# Define log formats
-formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-api_file_handler.setFormatter(formatter)
-scraper_file_handler.setFormatter(formatter)
-console_handler.setFormatter(formatter)
-
-# Add handlers to the loggers
-api_logger.addHandler(api_file_handler)
-api_logger.addHandler(console_handler)  # Console handler for debugging in real-time
-scraper_logger.addHandler(scraper_file_handler)
-scraper_logger.addHandler(console_handler)  # Console handler for real-time feedback
+# Initialize loggers. Both go through the shared logging pipeline: the scraping
+# threads only enqueue records; files (rotated and compressed) and the console
+# are written by the pipeline's listener thread.
+api_logger = route_logger('api_logger', 'api.log', level=logging.DEBUG, console_level=logging.WARN)
+scraper_logger = route_logger('scraper_logger', 'crex_scraper.log', level=logging.WARN)
 
 # Initialize a ThreadPoolExecutor with a suitable number of workers
 executor = concurrent.futures.ThreadPoolExecutor(max_workers=5)  # Adjust as needed
+# sC4 tasks submitted to the executor that no worker has started yet
+_sc4_queued = 0
+_sc4_queued_lock = threading.Lock()
+
+
+def _adjust_sc4_queue_depth(delta):
+    global _sc4_queued
+    with _sc4_queued_lock:
+        _sc4_queued += delta
+        depth = _sc4_queued
+    monitoring.set_queue_depth("sc4_executor", depth)
+
+
+def _run_queued_sC4_call(*args):
+    _adjust_sc4_queue_depth(-1)
+    return trigger_sC4_call(*args)
 
 
 def get_team_name(team_code, team_data):
@@ -108,12 +117,14 @@ def get_player_name(player_code, player_data):
         return player_code
 
 
-def categorize_local_storage_data(page):
+def categorize_local_storage_data(page, capture=None):
     """
     Extracts and categorizes local storage data into player, team, and series maps.
     
     Args:
         page: The Playwright page object.
+        capture: Armed diagnostic ``CaptureSession`` for this match, which keeps
+            the raw localStorage map (None in steady state).
     
     Returns:
         A dictionary containing player_data, team_data, and series_data.
@@ -122,32 +133,19 @@ def categorize_local_storage_data(page):
         page.wait_for_load_state(state='domcontentloaded')
         local_storage = page.evaluate("() => Object.fromEntries(Object.entries(localStorage).map(([k, v]) => [k, v]))")
         scraper_logger.info("Successfully extracted local storage data.")
+        if capture is not None:
+            capture.record('local_storage', local_storage)
 
         # Categorize data
         player_data = {k: v for k, v in local_storage.items() if k.startswith('p_')}
         team_data = {k: v for k, v in local_storage.items() if k.startswith('t_')}
         series_data = {k: v for k, v in local_storage.items() if k.startswith('s_')}
 
-        # [INVESTIGATION] Task 1.2: Log localStorage counts
-        api_logger.info(f"[LOCALSTORAGE] Total entries: {len(local_storage)}")
-        api_logger.info(f"[LOCALSTORAGE] Player entries (p_*): {len(player_data)}")
-        api_logger.info(f"[LOCALSTORAGE] Team entries (t_*): {len(team_data)}")
-        api_logger.info(f"[LOCALSTORAGE] Series entries (s_*): {len(series_data)}")
-        
-        # [INVESTIGATION] Task 1.2: Save localStorage dump for debugging
-        try:
-            import time
-            timestamp = int(time.time())
-            dump_file = f"localStorage_dump_{timestamp}.json"
-            with open(dump_file, 'w', encoding='utf-8') as f:
-                json.dump(local_storage, f, indent=2, ensure_ascii=False)
-            api_logger.info(f"[LOCALSTORAGE] Saved dump to {dump_file}")
-        except Exception as dump_error:
-            api_logger.warning(f"[LOCALSTORAGE] Failed to save dump: {dump_error}")
-
-        scraper_logger.info(f"Player Data Map: {player_data}")
-        scraper_logger.info(f"Team Data Map: {team_data}")
-        scraper_logger.debug(f"Series Data Map: {series_data}")
+        # Full maps are only kept by an armed /debug/capture session.
+        api_logger.debug(
+            "[LOCALSTORAGE] entries=%d players=%d teams=%d series=%d",
+            len(local_storage), len(player_data), len(team_data), len(series_data),
+        )
 
         return {'player_data': player_data, 'team_data': team_data, 'series_data': series_data}
     except Exception as e:
@@ -382,11 +380,21 @@ def trigger_sC4_call_async(sc4_url, headers, data_store):
     """
     # [INVESTIGATION] Task 2.2: Log executor task submission
     api_logger.info(f"[EXECUTOR] Submitting sC4 task for URL: {sc4_url}")
-    future = executor.submit(trigger_sC4_call, sc4_url, headers)
+    # The worker thread does not inherit the caller's context; hand it the current span.
+    parent_span = get_tracer().current_span()
+    capture = capture_session(data_store.get('match_id'))
+    _adjust_sc4_queue_depth(1)
+    try:
+        future = executor.submit(
+            _run_queued_sC4_call, sc4_url, headers, data_store.get('recorder'), parent_span, capture
+        )
+    except RuntimeError:  # executor already shut down
+        _adjust_sc4_queue_depth(-1)
+        raise
     api_logger.info(f"[EXECUTOR] Task submitted, future ID: {id(future)}")
     future.add_done_callback(functools.partial(handle_sC4_result, data_store=data_store))
         
-def trigger_sC4_call(sc4_url, headers):
+def trigger_sC4_call(sc4_url, headers, recorder=None, parent_span=None, capture=None):
     """
     Makes a GET request to sC4.php with the provided key and headers,
     extracts bowler statistics by innings using extract_bowlers_stats_by_innings,
@@ -395,20 +403,29 @@ def trigger_sC4_call(sc4_url, headers):
     Args:
         sc4_url (str): The full URL for the sC4 API call.
         headers (dict): The headers to include in the request.
+        recorder: Optional MatchRecorder that keeps the raw response for replay.
+        parent_span: Optional tracing span the sC4 span is recorded under.
+        capture: Armed diagnostic ``CaptureSession`` that keeps the response body.
 
     Returns:
         dict: Extracted bowlers_stats organized by innings if successful, else None.
     """
     try:
-        response = requests.get(sc4_url, headers=headers, timeout=10)
+        with get_tracer().span("sc4.fetch", parent=parent_span) as span, monitoring.stage_timer("sc4_fetch"):
+            response = get_bulkhead("crex-api").call(requests.get, sc4_url, headers=headers, timeout=10)
+            if span is not None:
+                span.set_attribute("http.status_code", response.status_code)
         if response.status_code == 200:
+            decode_started = time.perf_counter()
             try:
                 sc4_data = response.json()
+                if recorder is not None:
+                    recorder.record('sc4', sc4_data, key=extract_key_from_url(sc4_url))
+                if capture is not None:
+                    capture.record('sc4', sc4_data)
                 
-                # [INVESTIGATION] Task 1.1: Log full sC4 response for data completeness validation
-                api_logger.info(f"[SC4_RESPONSE] Full response received from {sc4_url}")
-                api_logger.info(f"[SC4_RESPONSE] Response size: {len(json.dumps(sc4_data))} bytes")
-                api_logger.debug(f"[SC4_RESPONSE] Full JSON: {json.dumps(sc4_data, indent=2)}")
+                # The full body is only kept by an armed /debug/capture session.
+                api_logger.info(f"[SC4_RESPONSE] Response received from {sc4_url} ({len(response.content)} bytes)")
                 
                 # [INVESTIGATION] Task 1.1: Validate innings count
                 innings_count = len(sc4_data) if isinstance(sc4_data, list) else 0
@@ -420,11 +437,10 @@ def trigger_sC4_call(sc4_url, headers):
                     batsmen_array = inning_data.get('b', [])
                     team_code = inning_data.get('c', 'Unknown')
                     api_logger.info(f"[SC4_RESPONSE] Innings {idx+1} (Team: {team_code}): {len(bowlers_array)} bowlers, {len(batsmen_array)} batsmen")
-                    api_logger.debug(f"[SC4_RESPONSE] Innings {idx+1} bowlers array: {bowlers_array}")
-                    api_logger.debug(f"[SC4_RESPONSE] Innings {idx+1} batsmen array: {batsmen_array}")
 
                 # Extract bowlers_stats by innings using the provided function
                 bowlers_stats_by_innings = extract_match_stats_by_innings(sc4_data)
+                monitoring.observe_stage("sc4_decode", time.perf_counter() - decode_started)
 
                 # Log the extracted bowlers_stats
                 api_logger.info(
@@ -446,6 +462,9 @@ def trigger_sC4_call(sc4_url, headers):
     except requests.RequestException as e:
         api_logger.error(f"Exception during sC4 API call: {e}")
         return None
+    except BulkheadFullError as e:
+        api_logger.warning(f"sC4 API call shed: {e}")
+        return None
         
 def parse_batsman_stats(value):
     """
@@ -572,18 +591,18 @@ def handle_sC4_result(future, data_store):
                 "url": data_store.get('url', 'Unknown URL')  # Include the URL for reference
             }
             
-            # Send the data to the backend
-            success = cricket_data_service.send_data_to_api_endpoint(
+            # Scorecards ride the rate-limited bulk lane so they never delay score updates
+            queued = cricket_data_service.queue_data_to_api_endpoint(
                 data=sc4_payload,
                 bearer_token=token,
                 url=data_store.get('url', 'Unknown URL'),  # Optional, depending on your backend requirements
                 api_endpoint=sc4_endpoint_url
             )
             
-            if success:
-                api_logger.info("sC4 stats successfully sent to the backend.")
+            if queued:
+                api_logger.info("sC4 stats queued for the backend.")
             else:
-                api_logger.error("Failed to send sC4 stats to the backend.")
+                api_logger.error("Failed to queue sC4 stats for the backend.")
             
     except Exception as e:
         # [INVESTIGATION] Task 2.1: Log full exception with stack trace
@@ -599,11 +618,22 @@ def handle_api_responses(response, data_store):
         data_store (dict): The shared data storage for scraped data.
     """
     if "sV3.php" in response.url:
+        # Freshness is measured from the moment the response reached us.
+        observed_at = time.time()
         try:
-            api_data = response.json()
-            api_logger.debug(f"API data: {api_data}")  # Log the raw API data
+            with get_tracer().span("sv3.decode", attributes={"match.id": data_store.get('match_id')}) as span, monitoring.stage_timer("decode"):
+                api_data = response.json()
+            if span is not None:
+                # Ticks that send this response's data link back to it.
+                data_store['sv3_span'] = span.context
+            if data_store.get('recorder') is not None:
+                data_store['recorder'].record('sv3', api_data, url=response.url)
+            capture = capture_session(data_store.get('match_id'))
+            if capture is not None:
+                capture.record('sv3', api_data)
 
             with data_store['lock']:
+                data_store['sv3_observed_at'] = observed_at
                 # Extract 'B' (current ball info)
                 current_ball_info = api_data.get('B', 'No current ball info available')
                 data_store['current_ball_info'] = current_ball_info
@@ -732,6 +762,20 @@ def handle_api_responses(response, data_store):
                 data_store['bowler_stats'] = bowler_stats
                 api_logger.debug(f"Bowler Stats: {bowler_stats}")
 
+                archive = data_store.get('archive')
+                if archive is not None:
+                    archive.record_sv3(
+                        {
+                            'current_ball_info': current_ball_info,
+                            'favorite_team': favorite_team,
+                            'favorite_team_odds': favorite_team_odds,
+                            'batsman_1_stats': batsman_1_stats,
+                            'batsman_2_stats': batsman_2_stats,
+                            'bowler_stats': bowler_stats,
+                        },
+                        sessions=session_data,
+                    )
+
                 # Log captured information
                 api_logger.debug(f"Current Ball Info: {current_ball_info}")
                 api_logger.debug(f"Favorite Team: {data_store.get('favorite_team', 'Unknown Team')}")
@@ -768,7 +812,8 @@ def handle_api_responses(response, data_store):
                 if not key_parameter:
                     api_logger.warning("key parameter 'key' not found in sV3 response.")
                 
-                sc4_url = f"https://api-v1.com/v10/sC4.php?key={key_parameter}"
+                sc4_base_url = os.getenv('CREX_SC4_URL', 'https://api-v1.com/v10/sC4.php')
+                sc4_url = f"{sc4_base_url}?key={key_parameter}"
                 api_logger.info(f"Triggering sC4 API call with URL: {sc4_url}")
                 
                 # Extract headers from the original sV3 request
@@ -821,7 +866,7 @@ def block_unnecessary_resources(route, request):
     else:
         route.continue_()
 
-def printUpdatedText(updatedTexts, token, url):
+def printUpdatedText(updatedTexts, token, url, freshness=None):
     """
     Sends updated text content to the backend.
     
@@ -829,28 +874,25 @@ def printUpdatedText(updatedTexts, token, url):
         updatedTexts (list): List of updated text strings.
         token (str): Bearer token for authentication.
         url (str): The URL being observed.
+        freshness (FreshnessStamp): When the texts were read from the page.
     """
     for text in updatedTexts:
         score_update = {'score_update': text}
-        cricket_data_service.send_cricket_data_to_service(score_update, token, url)
+        cricket_data_service.send_cricket_data_to_service(score_update, token, url, freshness=freshness)
         scraper_logger.info(score_update)
 
-def fetchData(url, context=None):
+def create_data_store(url):
     """
-    Fetches data from a given URL using Playwright library.
+    Creates the per-match state shared by the response handlers and the observation loop.
     
     Args:
-        url (str): The URL to fetch data from.
-        context: Optional ScraperContext for monitoring and restart management.
+        url (str): The live match URL.
     
     Returns:
-        None
+        dict: The data store (see ``close_data_store``).
     """
-    scraper_logger.info(f"Starting fetchData for URL: {url}")
-    if context:
-        scraper_logger.info(f"ScraperContext provided for {url}, restart logic enabled")
-    
-    # Create a new data store for this thread
+    # Key per-match files by the match slug; every live URL ends in '/live'.
+    match_id = derive_match_id(url.rsplit('/live', 1)[0])
     data_store = {
         'current_ball_info': 'No current ball info available',
         'favorite_team': 'Unknown Team',
@@ -860,31 +902,209 @@ def fetchData(url, context=None):
         'batsman_2_stats': {},
         'bowler_stats': {},
         'url':url,
-        'lock': threading.Lock()  # Added lock        
+        'match_id': match_id,
+        'lock': threading.Lock(),  # Added lock
+        # Local ball-by-ball archive (None when BALL_ARCHIVE_ENABLED is off)
+        'archive': get_ball_archive(match_id),
+        # Record/replay capture (None unless SCRAPER_RECORD_DIR is set)
+        'recorder': open_recorder(match_id, url),
         # 'local_storage_data' will be added by handle_api_responses
     }
+    # Measured on every memory snapshot when MEMORY_TRACKING_ENABLED is on.
+    watch_match(match_id, lambda: {'data_store': data_store})
+    return data_store
+
+def close_data_store(data_store):
+    """
+    Flushes and closes the files a data store holds open.
     
-    # Scrape match info before proceeding to live scraping
-    info_url = url.replace('/live', '/info')
-    scraper_logger.info(f"Fetching match info from URL: {info_url}")
+    Args:
+        data_store (dict): The data store returned by ``create_data_store``.
+    """
+    unwatch_match(data_store['match_id'])
+    finish_capture(data_store['match_id'])
+    close_ball_archive(data_store['match_id'])
+    if data_store.get('recorder') is not None:
+        data_store['recorder'].close()
+
+_CAPTURED_STATE_KEYS = (
+    'current_ball_info', 'favorite_team', 'favorite_team_odds', 'session_data',
+    'batsman_1_stats', 'batsman_2_stats', 'bowler_stats', 'sC4_stats',
+)
+
+def record_capture_tick(capture, page, data_store, previous):
+    """
+    Adds one observation tick to an armed diagnostic capture: the page HTML and
+    the decoded state (serialised now, since the data store keeps changing).
     
-    # Determine if the match is a test match
-    is_test_match = 'test' in url.lower()
-    scraper_logger.info(f"Is test match: {is_test_match}")
+    Args:
+        capture: The ``CaptureSession`` armed for this match.
+        page: The Playwright page object.
+        data_store (dict): Shared data storage for scraped data.
+        previous (dict): Change-detection state after this tick.
+    """
+    try:
+        capture.record('dom', page.content())
+    except Exception as e:
+        scraper_logger.warning(f"Capture could not read the page content: {e}")
+    with data_store['lock']:
+        state = {key: data_store.get(key) for key in _CAPTURED_STATE_KEYS}
+    state['sent_digests'] = dict(previous)
+    capture.record('state', json.dumps(state, indent=2, default=str, ensure_ascii=False))
+
+def new_change_state(sent_hashes=None):
+    """
+    Creates the change-detection state carried between ``observe_iteration`` passes.
+    
+    Each channel ('texts', 'odds', 'score') holds the digest of the payload last
+    sent for it, so a warm restart can seed it from the persisted snapshot and
+    skip re-sending what the backend already has.
+    
+    Args:
+        sent_hashes (dict): Optional digests from ``ScraperStateSnapshot.sent_hashes``.
+    
+    Returns:
+        dict: The change-detection state.
+    """
+    previous = {'texts': None, 'odds': None, 'score': None}
+    for channel, digest in (sent_hashes or {}).items():
+        if channel in previous:
+            previous[channel] = digest
+    return previous
+
+def load_warm_state(data_store):
+    """
+    Loads the persisted snapshot for this match when it is fresh enough to resume from.
+    
+    Args:
+        data_store (dict): The data store returned by ``create_data_store``.
+    
+    Returns:
+        ScraperStateSnapshot or None: The snapshot, or None for a cold start.
+    """
+    settings = get_settings()
+    if not settings.warm_restart_enabled:
+        return None
+    try:
+        snapshot = get_state_store().load(data_store['match_id'])
+    except Exception as e:
+        scraper_logger.error(f"[WARM_RESTART] Could not load state for {data_store['match_id']}: {e}")
+        return None
+    if snapshot is None:
+        return None
+    age = snapshot.age_seconds()
+    if age is None or age > settings.warm_restart_max_age_seconds:
+        api_logger.info(f"[WARM_RESTART] Ignoring stale state for {data_store['match_id']} (age={age})")
+        return None
+    api_logger.info(f"[WARM_RESTART] Resuming {data_store['match_id']} from state saved {age:.0f}s ago")
+    return snapshot
+
+def save_warm_state(data_store, previous, context=None, critical=False):
+    """
+    Persists what a restarted job needs to skip the cold bootstrap.
     
+    Saves are write-behind (see ``StateStore``), so calling this after every
+    pass that sent something is cheap; ``critical`` writes synchronously and is
+    used right before the job exits.
+    
+    Args:
+        data_store (dict): The data store returned by ``create_data_store``.
+        previous (dict): The change-detection state from ``new_change_state``.
+        context: Optional ScraperContext the snapshot is taken from.
+        critical (bool): Write the snapshot before returning.
+    """
+    if not get_settings().warm_restart_enabled:
+        return
+    fields = {
+        'code_dictionary': data_store.get('local_storage_data') or {},
+        'storage_state': data_store.get('storage_state'),
+        'match_info': data_store.get('match_info'),
+        'sent_hashes': {channel: digest for channel, digest in previous.items() if digest is not None},
+    }
+    try:
+        if context is not None:
+            # Keyed by the match slug, like the ball archive, not the context's id.
+            snapshot = dataclasses.replace(context.create_state_snapshot(**fields), match_id=data_store['match_id'])
+        else:
+            snapshot = ScraperStateSnapshot(match_id=data_store['match_id'], url=data_store['url'], **fields)
+        get_state_store().save(snapshot, critical=critical)
+    except Exception as e:
+        scraper_logger.error(f"[WARM_RESTART] Could not save state for {data_store['match_id']}: {e}")
+
+def load_match_info(data_store, warm_state=None, browser_context=None):
+    """
+    Puts the match info in ``data_store['match_info']``, scraping it only when needed.
+
+    The snapshot left by a restarted job comes first. Next is the process-wide
+    match info cache, shared by every job (and restart) of the match. Only
+    when both miss is the info page scraped, in ``browser_context`` if the
+    static parse is not enough. The result is sent to the backend once.
+
+    Args:
+        data_store (dict): The match's data store.
+        warm_state: The warm-restart snapshot, if any.
+        browser_context: The match's Playwright browser context.
+    """
+    match_id = data_store['match_id']
+    info_url = data_store['url'].replace('/live', '/info')
+    cache = get_match_info_cache()
+
+    if warm_state and warm_state.match_info:
+        # Already scraped and sent by the job we are replacing
+        data_store['match_info'] = warm_state.match_info
+        cache.put(match_id, warm_state.match_info)
+        api_logger.info(f"[WARM_RESTART] Reusing cached match info, skipping {info_url}")
+        return
+
+    cached = cache.get(match_id)
+    if cached is not None:
+        # Scraped (and sent) by an earlier job for this match
+        data_store['match_info'] = cached
+        api_logger.info(f"[MATCH_INFO] Cache hit for {match_id}, skipping {info_url}")
+        return
+
+    scraper_logger.info(f"Fetching match info from URL: {info_url}")
     # Scrape match info using the crex_info_url.py module
     try:
-        match_info_json = scrape_match_info(info_url)
+        match_info_json = scrape_match_info(info_url, browser_context=browser_context)
         scraper_logger.info(f"Scraped match info: {match_info_json}")
-        
+        data_store['match_info'] = match_info_json
+        cache.put(match_id, match_info_json)
+
         # Send match info to backend (once)
         token = cricket_data_service.get_bearer_token()
         # endpoint_url = os.getenv('API_ENDPOINT', 'http://spring-security-jwt-app:8099/cricket-data/match-info/save')
         endpoint_url = os.getenv('API_ENDPOINT', 'http://127.0.0.1:8099/cricket-data/match-info/save')
 
-        cricket_data_service.send_data_to_api_endpoint(match_info_json, token, info_url, endpoint_url)
+        cricket_data_service.queue_data_to_api_endpoint(match_info_json, token, info_url, endpoint_url)
     except Exception as e:
         scraper_logger.error(f"Error scraping match info from {info_url}: {e}")
+
+def fetchData(url, context=None):
+    """
+    Fetches data from a given URL using Playwright library.
+    
+    Args:
+        url (str): The URL to fetch data from.
+        context: Optional ScraperContext for monitoring and restart management.
+    
+    Returns:
+        None
+    """
+    scraper_logger.info(f"Starting fetchData for URL: {url}")
+    if context:
+        scraper_logger.info(f"ScraperContext provided for {url}, restart logic enabled")
+    
+    # Create a new data store for this thread
+    data_store = create_data_store(url)
+    
+    # A recent snapshot (left by a restarted job) lets us skip the cold bootstrap
+    warm_state = load_warm_state(data_store)
+    previous = new_change_state(warm_state.sent_hashes if warm_state else None)
+    
+    # Determine if the match is a test match
+    is_test_match = 'test' in url.lower()
+    scraper_logger.info(f"Is test match: {is_test_match}")
     
     with sync_playwright() as p:
         try:
@@ -913,50 +1133,73 @@ def fetchData(url, context=None):
                 ]
             )
             scraper_logger.info("Browser launched successfully with optimized resource usage")
+            if context:
+                # Lets the process census attribute this browser's tree (and its memory) to the match
+                browser_pid = browser_root_pid(browser)
+                if browser_pid:
+                    context.set_browser_pid(browser_pid)
+                    scraper_logger.info(f"Registered browser process tree root {browser_pid} for {url}")
+                else:
+                    scraper_logger.warning(f"Could not determine browser PID for {url}; memory will not be attributed")
             browser_context = browser.new_context(
                 user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/128.0.0.0 Safari/537.36',
                 extra_http_headers={
                     'sec-ch-ua': '"Chromium";v="128", "Not;A=Brand";v="24", "Google Chrome";v="128"',
                     'sec-ch-ua-mobile': '?0',
                     'sec-ch-ua-platform': '"Windows"',
-                }
+                },
+                # Cookies and localStorage saved by the previous job (None on a cold start)
+                storage_state=warm_state.storage_state if warm_state else None,
             )
+            # Match info before live scraping; a browser fallback opens a page in this context
+            load_match_info(data_store, warm_state, browser_context)
             page = browser_context.new_page()
             page.route("**/*", block_unnecessary_resources)
 
             scraper_logger.info("Browser context and page created")
 
-            # **Step 1: Open /scorecard in a new tab to trigger localStorage population**
-            scorecard_url = url.replace('/live', '/scorecard')
-            scraper_logger.info(f"Opening scorecard URL in a new tab: {scorecard_url}")
-            api_logger.info(f"[SCORECARD_TAB] Triggering scorecard page to populate localStorage")
+            scorecard_page = None
+            if warm_state and warm_state.code_dictionary:
+                # The code dictionary survived the restart; skip the scorecard tab and its 5s wait
+                data_store['local_storage_data'] = warm_state.code_dictionary
+                data_store['storage_state'] = warm_state.storage_state
+                if data_store.get('recorder') is not None:
+                    data_store['recorder'].record('local_storage', warm_state.code_dictionary)
+                api_logger.info(f"[WARM_RESTART] Skipping scorecard tab, {len(warm_state.code_dictionary.get('player_data', {}))} player codes restored")
+            else:
+                # **Step 1: Open /scorecard in a new tab to trigger localStorage population**
+                scorecard_url = url.replace('/live', '/scorecard')
+                scraper_logger.info(f"Opening scorecard URL in a new tab: {scorecard_url}")
+                api_logger.info(f"[SCORECARD_TAB] Triggering scorecard page to populate localStorage")
             
-            try:
-                scorecard_page = browser_context.new_page()
-                scorecard_page.route("**/*", block_unnecessary_resources)
-                scraper_logger.info(f"Attempting to navigate to: {scorecard_url}")
-                response = scorecard_page.goto(scorecard_url, timeout=30000, wait_until="networkidle")
-                scraper_logger.info(f"Scorecard page loaded with status: {response.status if response else 'unknown'}")
+                try:
+                    scorecard_page = browser_context.new_page()
+                    scorecard_page.route("**/*", block_unnecessary_resources)
+                    scraper_logger.info(f"Attempting to navigate to: {scorecard_url}")
+                    response = scorecard_page.goto(scorecard_url, timeout=30000, wait_until="networkidle")
+                    scraper_logger.info(f"Scorecard page loaded with status: {response.status if response else 'unknown'}")
                 
-                # **CRITICAL FIX: Extract localStorage from scorecard page after it loads**
-                # This page has all player data populated in localStorage
-                # Wait for network idle, then additional time for JS to populate localStorage
-                api_logger.info(f"[SCORECARD_TAB] Waiting 5 seconds for localStorage to fully populate")
-                time.sleep(5)  # Wait for JavaScript to populate localStorage
+                    # **CRITICAL FIX: Extract localStorage from scorecard page after it loads**
+                    # This page has all player data populated in localStorage
+                    # Wait for network idle, then additional time for JS to populate localStorage
+                    api_logger.info(f"[SCORECARD_TAB] Waiting 5 seconds for localStorage to fully populate")
+                    time.sleep(5)  # Wait for JavaScript to populate localStorage
                 
-                try:
-                    scorecard_local_storage_data = categorize_local_storage_data(scorecard_page)
-                    data_store['local_storage_data'] = scorecard_local_storage_data
-                    api_logger.info(f"[SCORECARD_TAB] Successfully extracted complete localStorage from scorecard page")
-                    api_logger.info(f"[SCORECARD_TAB] Player codes available: {len(scorecard_local_storage_data.get('player_data', {}))} players")
-                except Exception as storage_error:
-                    api_logger.error(f"[SCORECARD_TAB] Failed to extract localStorage: {storage_error}")
+                    try:
+                        scorecard_local_storage_data = categorize_local_storage_data(scorecard_page)
+                        data_store['local_storage_data'] = scorecard_local_storage_data
+                        if data_store.get('recorder') is not None:
+                            data_store['recorder'].record('local_storage', scorecard_local_storage_data)
+                        api_logger.info(f"[SCORECARD_TAB] Successfully extracted complete localStorage from scorecard page")
+                        api_logger.info(f"[SCORECARD_TAB] Player codes available: {len(scorecard_local_storage_data.get('player_data', {}))} players")
+                    except Exception as storage_error:
+                        api_logger.error(f"[SCORECARD_TAB] Failed to extract localStorage: {storage_error}")
                     
-            except Exception as e:
-                scraper_logger.error(f"Failed to load scorecard page {scorecard_url}: {e}")
-                # Skip scorecard page and continue with main scraping
-                scraper_logger.info("Skipping scorecard page, continuing with live page scraping...")
-                scorecard_page = None
+                except Exception as e:
+                    scraper_logger.error(f"Failed to load scorecard page {scorecard_url}: {e}")
+                    # Skip scorecard page and continue with main scraping
+                    scraper_logger.info("Skipping scorecard page, continuing with live page scraping...")
+                    scorecard_page = None
             
             # **Step 2: Extract cookies from the browser context**
             cookies = browser_context.cookies()
@@ -964,6 +1207,11 @@ def fetchData(url, context=None):
             
             # Close the scorecard tab if it was opened successfully
             if scorecard_page:
+                try:
+                    # Lets a restarted job open its context with this localStorage
+                    data_store['storage_state'] = browser_context.storage_state()
+                except Exception as e:
+                    scraper_logger.warning(f"Could not capture browser storage state: {e}")
                 try:
                     scorecard_page.close()
                     scraper_logger.info("Scorecard tab closed")
@@ -1016,7 +1264,7 @@ def fetchData(url, context=None):
                 scraper_logger.info("Not a test match, skipping Odds View button click.")
 
             # Start the observation loop in the main thread
-            observeTextChanges(page, isButtonFoundFlag, token, url, retry_count, max_retries, data_store, is_test_match, context)
+            observeTextChanges(page, isButtonFoundFlag, token, url, retry_count, max_retries, data_store, is_test_match, context, previous=previous)
 
         except Exception as e:
             scraper_logger.error(f"Uncaught error: {e}", exc_info=True)
@@ -1024,6 +1272,15 @@ def fetchData(url, context=None):
             # NOTE: Batched data flushing removed - using non-batched service
             # No pending data to flush since we send immediately
             
+            if scraping_tasks.get(url, {}).get('status') == 'stopping':
+                # Stopped on purpose: the next start should bootstrap from scratch
+                try:
+                    get_state_store().delete(data_store['match_id'])
+                except Exception as e:
+                    scraper_logger.error(f"[WARM_RESTART] Could not clear state for {data_store['match_id']}: {e}")
+            else:
+                save_warm_state(data_store, previous, context, critical=True)
+            close_data_store(data_store)
             browser.close()
             scraper_logger.info("Browser closed.")
             # NOTE: Do NOT shutdown the global executor here - it's shared across all scraper instances
@@ -1060,7 +1317,271 @@ def search_and_click_odds_button(page):
         scraper_logger.error(f"Odds View button not found within the specified timeout period: {e}")
         return False
 
-def observeTextChanges(page, isButtonFoundFlag, token, url, retry_count, max_retries, data_store, is_test_match, context=None):
+def observe_iteration(page, isButtonFoundFlag, token, url, data_store, is_test_match, previous):
+    """
+    Runs a single pass of the observation loop: refreshes localStorage, reads the
+    DOM and sends whatever changed to the backend.
+
+    Args:
+        page: The Playwright page object (or anything with a compatible ``evaluate``).
+        isButtonFoundFlag (bool): Flag indicating if the Odds View button was found.
+        token (str): Bearer token for authentication.
+        url (str): The URL being observed.
+        data_store (dict): Shared data storage for scraped data.
+        is_test_match (bool): Flag indicating if the match is a test match.
+        previous (dict): Change-detection state carried between passes
+            (see ``new_change_state``).
+
+    Returns:
+        None
+    """
+    # Refresh local storage data
+    try:
+        local_storage_data = categorize_local_storage_data(page, capture_session(data_store.get('match_id')))
+        if local_storage_data:
+            data_store['local_storage_data'] = local_storage_data
+            scraper_logger.debug("Local storage data refreshed and stored in data_store.")
+        else:
+            data_store['local_storage_data'] = {}
+            scraper_logger.warning("Local storage data could not be refreshed.")
+    except Exception as e:
+        scraper_logger.error(f"Error refreshing local storage data in observeTextChanges: {e}")
+        data_store['local_storage_data'] = {}
+
+    # Batsman/bowler and non-test odds come from the latest sV3 response; the rest is read from the DOM below.
+    match_id = data_store.get('match_id')
+    sv3_observed_at = data_store.get('sv3_observed_at')
+    sv3_freshness = FreshnessStamp(url, sv3_observed_at, match_id) if sv3_observed_at else None
+                    
+    # Extract and send batsman and bowler data
+    try:
+        batsman_1_stats = data_store.get('batsman_1_stats', {})
+        batsman_2_stats = data_store.get('batsman_2_stats', {})
+        bowler_stats = data_store.get('bowler_stats', {})
+
+        scraper_logger.warning(f"Using API extracted batsman and bowler data: \nBatsman 1: {batsman_1_stats} \nBatsman 2: {batsman_2_stats} \nBowler: {bowler_stats}")
+        # Retrieve local storage data from data_store
+        if data_store.get('local_storage_data'):
+            scraper_logger.debug("Local storage data is available, attempting to retrieve team data...")
+            player_data = data_store['local_storage_data'].get('player_data', {})
+                        
+            # Update batsman and bowler names from local storage values 
+            batsman_1_stats['name'] = player_data.get(f"p_{batsman_1_stats.get('name', '')}_name", 'Unknown Batsman 1')
+            batsman_2_stats['name'] = player_data.get(f"p_{batsman_2_stats.get('name', '')}_name", 'Unknown Batsman 2')
+            bowler_stats['name'] = player_data.get(f"p_{bowler_stats.get('name', '')}_name", 'Unknown Bowler')
+
+        # Prepare data to send to the backend
+        batsman_and_bowler_data = {
+            "batsman_data": [
+                batsman_1_stats,  # Send batsman 1 data
+                batsman_2_stats    # Send batsman 2 data
+            ],
+            "bowler_data": bowler_stats,  # Send bowler data
+            "url": url
+        }
+                    
+        # Send batsman and bowler data
+        cricket_data_service.send_cricket_data_to_service(batsman_and_bowler_data, token, url, freshness=sv3_freshness)
+        scraper_logger.info(f"Batsman and Bowler data sent: {batsman_and_bowler_data}")
+
+    except Exception as e:
+        scraper_logger.error(f"Error during batsman and bowler data extraction: {e}")   
+
+    # Evaluate JavaScript on the page to get updated texts
+    dom_freshness = FreshnessStamp(url, time.time(), match_id)
+    evaluate_started = time.perf_counter()
+    updatedTexts = page.evaluate('''
+        () => {
+            const spans = document.querySelectorAll('.result-box span');
+            return Array.from(spans).map(span => span.textContent.trim());
+        }
+    ''')
+    scraper_logger.debug(f"Updated texts: {updatedTexts}")
+                
+    # Extract CRR
+    crr = page.evaluate('''
+        () => {
+            const crrElement = document.querySelector('.team-run-rate .data');
+            return crrElement ? crrElement.textContent.trim() : 'CRR not found';
+        }
+    ''')
+    scraper_logger.debug(f"CRR: {crr}")
+                
+    # Extract the "KAR need 277 runs to win" text
+    final_result_text = page.evaluate('''
+        () => {
+            const finalResultElement = document.querySelector('.final-result.m-none');
+            return finalResultElement ? finalResultElement.textContent.trim() : 'Final result text not found';
+        }
+    ''')
+    scraper_logger.debug(f"Final Result Text: {final_result_text}")
+                
+    # Extract Score
+    score = page.evaluate('''
+        () => {
+            const teamDivs = Array.from(document.querySelectorAll('.team-content'));
+            return teamDivs.map(div => {
+                const teamNameElement = div.querySelector('.team-name');
+                const runsElement = div.querySelector('.runs span:nth-child(1)');
+                const overElement = div.querySelector('.runs span:nth-child(2)');
+                const teamName = teamNameElement ? teamNameElement.textContent.trim() : 'Unknown Team';
+                const score = runsElement ? runsElement.textContent : '0/0';
+                const over = overElement ? overElement.textContent : '0.0';
+                return {
+                    teamName,
+                    score,
+                    over,
+                };
+            });
+        }
+    ''')
+    scraper_logger.debug(f"Score: {score}")
+
+    # Extract Overs Data
+    overs_data = page.evaluate('''() => {
+        const overs = [];
+        document.querySelectorAll('div#slideOver .overs-slide').forEach(overElement => {
+            const overNumber = overElement.querySelector('span').textContent;
+            const balls = Array.from(overElement.querySelectorAll('.over-ball')).map(ball => ball.textContent);
+            const totalRuns = overElement.querySelector('.total').textContent;
+
+            overs.push({
+                overNumber: overNumber.trim(),
+                balls: balls,
+                totalRuns: totalRuns.trim()
+            });
+        });
+        return overs;
+    }''')
+    scraper_logger.debug(f"Overs data: {overs_data}")
+    monitoring.observe_stage("evaluate", time.perf_counter() - evaluate_started)
+
+    # Log extracted data
+    for over in overs_data:
+        scraper_logger.debug(f"{over['overNumber']}: {' '.join(over['balls'])} (Total: {over['totalRuns']})")
+
+    # Prepare match update data
+    data_to_send = {
+        "match_update": {
+            "score": score[0] if score else {},  # Send the first score object or an empty dict if no score
+            "crr": crr,
+            "final_result_text": final_result_text
+        },
+        "overs_data": overs_data if overs_data else [],
+    }
+    score_digest = payload_digest(score)
+    if score_digest != previous['score']:
+        scraper_logger.info(f"Sending match update data: {data_to_send['match_update']}")
+        cricket_data_service.send_cricket_data_to_service(data_to_send, token, url, freshness=dom_freshness)
+        previous['score'] = score_digest
+        archive = data_store.get('archive')
+        if archive is not None:
+            for team_score in score or []:
+                archive.record_score(team_score['teamName'], team_score['score'], team_score['over'])
+            archive.record_overs(overs_data or [])
+
+    # Handle Odds Data for Test Matches
+    if isButtonFoundFlag and is_test_match:
+        scraper_logger.info(f"Button found, searching for odds in test for url: {url}")
+
+        # Extract odds data for test matches
+        odds_data = page.evaluate('''
+            () => {
+                const teamDivs = Array.from(document.querySelectorAll('.fav-odd .d-flex'));
+                return teamDivs.map(div => {
+                    const teamName = div.querySelector('.team-name span').textContent;
+                    const odds = Array.from(div.querySelectorAll('.odd div')).map(div => div.textContent);
+                    return {
+                        teamName,
+                        backOdds: odds[0],
+                        layOdds: odds[1],
+                    };
+                });
+            }
+        ''')
+
+        # Compare data to previous data and if not the same then send
+        odds_digest = payload_digest(odds_data)
+        if odds_digest != previous['odds']:
+            scraper_logger.info(f"Odds data changed: {odds_data}")
+            # Prepare and send odds data
+            odds_payload = {
+                "odds_data": odds_data,
+                "url": url
+            }
+            cricket_data_service.send_cricket_data_to_service(odds_payload, token, url, freshness=dom_freshness)
+            previous['odds'] = odds_digest
+            archive = data_store.get('archive')
+            if archive is not None:
+                for team_odds in odds_data:
+                    archive.record_odds(team_odds['teamName'], team_odds['backOdds'], team_odds['layOdds'])
+
+    # Handle Odds Data for Non-Test Matches
+    if not is_test_match:
+        try:
+            # Prepare the data structure to match your previous format
+            odds = data_store.get('favorite_team_odds', '0+0').split('+')  # Assuming odds are in the format 'X+Y'
+            back_odds = odds[0] if len(odds) > 0 else '0'
+            lay_odds = str(int(back_odds) + int(odds[1])) if len(odds) > 1 else back_odds
+                        
+            # Fetch the favorite team name from local storage
+            favorite_team = data_store.get('favorite_team', 'Unknown Team')
+            scraper_logger.debug(f"Favorite team from data_store: {favorite_team}")
+
+            if data_store.get('local_storage_data'):
+                scraper_logger.debug("Local storage data is available, attempting to retrieve team data...")
+                team_data = data_store['local_storage_data'].get('team_data', {})
+                scraper_logger.debug(f"Team data from local storage: {json.dumps(team_data, indent=2)}")
+
+                # First, try to get team name using team code (e.g., 'Y4')
+                team_key_name = f't_{favorite_team}_name'
+                teamNameFromLocalStorage = team_data.get(team_key_name)
+                if teamNameFromLocalStorage:
+                    teamName = teamNameFromLocalStorage
+                    scraper_logger.info(f"Favorite team from local storage by code: {teamName}")
+                else:
+                    # If not found by code, try to find by matching team name
+                    for key, value in team_data.items():
+                        if key.endswith('_name') and value.strip().lower() == favorite_team.strip().lower():
+                            teamName = value.strip()
+                            scraper_logger.info(f"Favorite team found in team_data by name: {teamName}")
+                            break
+                    else:
+                        teamName = favorite_team
+                        scraper_logger.warning(f"Favorite team '{favorite_team}' not found in team_data. Using code as team name.")
+            else:
+                scraper_logger.warning("Local storage data not available. Using team name from data_store.")  
+                            
+            odds_payload = {
+                'firstTeamData': [
+                    {
+                        'teamName': teamName,  # Map the favorite team
+                        'backOdds': back_odds,  # Use the first value for back odds
+                        'layOdds': lay_odds  # Use the second value for lay odds
+                    }
+                ],
+                'sessionData': data_store.get('session_data', [])  # Leave this empty or add relevant data if available
+            }
+                        
+            # Log and send the API-fetched odds data
+            scraper_logger.info(f"Sending formatted odds data: {odds_payload}")
+            cricket_data_service.send_cricket_data_to_service(odds_payload, token, url, freshness=sv3_freshness)
+
+        except Exception as e:
+            scraper_logger.error(f"Error during odds evaluation or sending: {e}")
+
+    # Only print if the text content has changed
+    texts_digest = payload_digest(set(updatedTexts))
+    if texts_digest != previous['texts']:
+        scraper_logger.info(f"Text content changed: {updatedTexts}")
+        printUpdatedText(updatedTexts, token, url, freshness=dom_freshness)
+        previous['texts'] = texts_digest
+        archive = data_store.get('archive')
+        if archive is not None:
+            for text in updatedTexts:
+                archive.record_text(text)
+
+def observeTextChanges(page, isButtonFoundFlag, token, url, retry_count, max_retries, data_store, is_test_match, context=None, previous=None):
     """
     Observes text changes on a web page and sends updated data to the backend.
     
@@ -1074,6 +1595,7 @@ def observeTextChanges(page, isButtonFoundFlag, token, url, retry_count, max_ret
         data_store (dict): Shared data storage for scraped data.
         is_test_match (bool): Flag indicating if the match is a test match.
         context: Optional ScraperContext for monitoring and restart management.
+        previous (dict): Change-detection state to resume from (see ``new_change_state``).
     
     Returns:
         None
@@ -1082,11 +1604,15 @@ def observeTextChanges(page, isButtonFoundFlag, token, url, retry_count, max_ret
     if context:
         scraper_logger.info(f"Context monitoring enabled for {url}")
 
+    recorder = data_store.get('recorder')
+    if recorder is not None:
+        recorder.record('observe', {'is_test_match': is_test_match, 'odds_button': isButtonFoundFlag})
+        page = recorder.wrap_page(page)
+
     try:
         running = True
-        previousTexts = set()
-        previousData = []
-        previousScore = []
+        if previous is None:
+            previous = new_change_state()
         iteration_count = 0
         
         while running:
@@ -1112,237 +1638,26 @@ def observeTextChanges(page, isButtonFoundFlag, token, url, retry_count, max_ret
                 running = False
                 break
 
+            sent_before = dict(previous)
             try:
-                # Refresh local storage data
-                try:
-                    local_storage_data = categorize_local_storage_data(page)
-                    if local_storage_data:
-                        data_store['local_storage_data'] = local_storage_data
-                        scraper_logger.warning("Local storage data refreshed and stored in data_store.")
-                    else:
-                        data_store['local_storage_data'] = {}
-                        scraper_logger.warning("Local storage data could not be refreshed.")
-                except Exception as e:
-                    scraper_logger.error(f"Error refreshing local storage data in observeTextChanges: {e}")
-                    data_store['local_storage_data'] = {}
-                    
-                # Extract and send batsman and bowler data
-                try:
-                    batsman_1_stats = data_store.get('batsman_1_stats', {})
-                    batsman_2_stats = data_store.get('batsman_2_stats', {})
-                    bowler_stats = data_store.get('bowler_stats', {})
-
-                    scraper_logger.warning(f"Using API extracted batsman and bowler data: \nBatsman 1: {batsman_1_stats} \nBatsman 2: {batsman_2_stats} \nBowler: {bowler_stats}")
-                    scraper_logger.warning(f"All data from local storage: {json.dumps(data_store.get('local_storage_data', {}), indent=2)}")
-                    # Retrieve local storage data from data_store
-                    if data_store.get('local_storage_data'):
-                        scraper_logger.debug("Local storage data is available, attempting to retrieve team data...")
-                        player_data = data_store['local_storage_data'].get('player_data', {})
-                        scraper_logger.warning(f"Player data from local storage: {json.dumps(player_data, indent=2)}")
-                        scraper_logger.debug(f"Team data from local storage: {json.dumps(data_store['local_storage_data'].get('team_data', {}), indent=2)}")
-                        
-                        # Update batsman and bowler names from local storage values 
-                        batsman_1_stats['name'] = player_data.get(f"p_{batsman_1_stats.get('name', '')}_name", 'Unknown Batsman 1')
-                        batsman_2_stats['name'] = player_data.get(f"p_{batsman_2_stats.get('name', '')}_name", 'Unknown Batsman 2')
-                        bowler_stats['name'] = player_data.get(f"p_{bowler_stats.get('name', '')}_name", 'Unknown Bowler')
-
-                    # Prepare data to send to the backend
-                    batsman_and_bowler_data = {
-                        "batsman_data": [
-                            batsman_1_stats,  # Send batsman 1 data
-                            batsman_2_stats    # Send batsman 2 data
-                        ],
-                        "bowler_data": bowler_stats,  # Send bowler data
-                        "url": url
-                    }
-                    
-                    # Send batsman and bowler data
-                    cricket_data_service.send_cricket_data_to_service(batsman_and_bowler_data, token, url)
-                    scraper_logger.info(f"Batsman and Bowler data sent: {batsman_and_bowler_data}")
-
-                except Exception as e:
-                    scraper_logger.error(f"Error during batsman and bowler data extraction: {e}")   
-
-                # Evaluate JavaScript on the page to get updated texts
-                updatedTexts = page.evaluate('''
-                    () => {
-                        const spans = document.querySelectorAll('.result-box span');
-                        return Array.from(spans).map(span => span.textContent.trim());
-                    }
-                ''')
-                scraper_logger.debug(f"Updated texts: {updatedTexts}")
-                
-                # Extract CRR
-                crr = page.evaluate('''
-                    () => {
-                        const crrElement = document.querySelector('.team-run-rate .data');
-                        return crrElement ? crrElement.textContent.trim() : 'CRR not found';
-                    }
-                ''')
-                scraper_logger.debug(f"CRR: {crr}")
-                
-                # Extract the "KAR need 277 runs to win" text
-                final_result_text = page.evaluate('''
-                    () => {
-                        const finalResultElement = document.querySelector('.final-result.m-none');
-                        return finalResultElement ? finalResultElement.textContent.trim() : 'Final result text not found';
-                    }
-                ''')
-                scraper_logger.debug(f"Final Result Text: {final_result_text}")
-                
-                # Extract Score
-                score = page.evaluate('''
-                    () => {
-                        const teamDivs = Array.from(document.querySelectorAll('.team-content'));
-                        return teamDivs.map(div => {
-                            const teamNameElement = div.querySelector('.team-name');
-                            const runsElement = div.querySelector('.runs span:nth-child(1)');
-                            const overElement = div.querySelector('.runs span:nth-child(2)');
-                            const teamName = teamNameElement ? teamNameElement.textContent.trim() : 'Unknown Team';
-                            const score = runsElement ? runsElement.textContent : '0/0';
-                            const over = overElement ? overElement.textContent : '0.0';
-                            return {
-                                teamName,
-                                score,
-                                over,
-                            };
-                        });
-                    }
-                ''')
-                scraper_logger.debug(f"Score: {score}")
-
-                # Extract Overs Data
-                overs_data = page.evaluate('''() => {
-                    const overs = [];
-                    document.querySelectorAll('div#slideOver .overs-slide').forEach(overElement => {
-                        const overNumber = overElement.querySelector('span').textContent;
-                        const balls = Array.from(overElement.querySelectorAll('.over-ball')).map(ball => ball.textContent);
-                        const totalRuns = overElement.querySelector('.total').textContent;
-
-                        overs.push({
-                            overNumber: overNumber.trim(),
-                            balls: balls,
-                            totalRuns: totalRuns.trim()
-                        });
-                    });
-                    return overs;
-                }''')
-                scraper_logger.debug(f"Overs data: {overs_data}")
-
-                # Log extracted data
-                for over in overs_data:
-                    scraper_logger.debug(f"{over['overNumber']}: {' '.join(over['balls'])} (Total: {over['totalRuns']})")
-
-                # Prepare match update data
-                data_to_send = {
-                    "match_update": {
-                        "score": score[0] if score else {},  # Send the first score object or an empty dict if no score
-                        "crr": crr,
-                        "final_result_text": final_result_text
-                    },
-                    "overs_data": overs_data if overs_data else [],
-                }
-                if score != previousScore:
-                    scraper_logger.info(f"Sending match update data: {data_to_send['match_update']}")
-                    cricket_data_service.send_cricket_data_to_service(data_to_send, token, url)
-                    previousScore = score
-
-                # Handle Odds Data for Test Matches
-                if isButtonFoundFlag and is_test_match:
-                    scraper_logger.info(f"Button found, searching for odds in test for url: {url}")
-
-                    # Extract odds data for test matches
-                    odds_data = page.evaluate('''
-                        () => {
-                            const teamDivs = Array.from(document.querySelectorAll('.fav-odd .d-flex'));
-                            return teamDivs.map(div => {
-                                const teamName = div.querySelector('.team-name span').textContent;
-                                const odds = Array.from(div.querySelectorAll('.odd div')).map(div => div.textContent);
-                                return {
-                                    teamName,
-                                    backOdds: odds[0],
-                                    layOdds: odds[1],
-                                };
-                            });
-                        }
-                    ''')
-
-                    # Compare data to previous data and if not the same then send
-                    if odds_data != previousData:
-                        scraper_logger.info(f"Odds data changed: {odds_data}")
-                        # Prepare and send odds data
-                        odds_payload = {
-                            "odds_data": odds_data,
-                            "url": url
-                        }
-                        cricket_data_service.send_cricket_data_to_service(odds_payload, token, url)
-                        previousData = odds_data
-
-                # Handle Odds Data for Non-Test Matches
-                if not is_test_match:
-                    try:
-                        # Prepare the data structure to match your previous format
-                        odds = data_store.get('favorite_team_odds', '0+0').split('+')  # Assuming odds are in the format 'X+Y'
-                        back_odds = odds[0] if len(odds) > 0 else '0'
-                        lay_odds = str(int(back_odds) + int(odds[1])) if len(odds) > 1 else back_odds
-                        
-                        # Fetch the favorite team name from local storage
-                        favorite_team = data_store.get('favorite_team', 'Unknown Team')
-                        scraper_logger.debug(f"Favorite team from data_store: {favorite_team}")
-
-                        if data_store.get('local_storage_data'):
-                            scraper_logger.debug("Local storage data is available, attempting to retrieve team data...")
-                            team_data = data_store['local_storage_data'].get('team_data', {})
-                            scraper_logger.debug(f"Team data from local storage: {json.dumps(team_data, indent=2)}")
-
-                            # First, try to get team name using team code (e.g., 'Y4')
-                            team_key_name = f't_{favorite_team}_name'
-                            teamNameFromLocalStorage = team_data.get(team_key_name)
-                            if teamNameFromLocalStorage:
-                                teamName = teamNameFromLocalStorage
-                                scraper_logger.info(f"Favorite team from local storage by code: {teamName}")
-                            else:
-                                # If not found by code, try to find by matching team name
-                                for key, value in team_data.items():
-                                    if key.endswith('_name') and value.strip().lower() == favorite_team.strip().lower():
-                                        teamName = value.strip()
-                                        scraper_logger.info(f"Favorite team found in team_data by name: {teamName}")
-                                        break
-                                else:
-                                    teamName = favorite_team
-                                    scraper_logger.warning(f"Favorite team '{favorite_team}' not found in team_data. Using code as team name.")
-                        else:
-                            scraper_logger.warning("Local storage data not available. Using team name from data_store.")  
-                            
-                        odds_payload = {
-                            'firstTeamData': [
-                                {
-                                    'teamName': teamName,  # Map the favorite team
-                                    'backOdds': back_odds,  # Use the first value for back odds
-                                    'layOdds': lay_odds  # Use the second value for lay odds
-                                }
-                            ],
-                            'sessionData': data_store.get('session_data', [])  # Leave this empty or add relevant data if available
-                        }
-                        
-                        # Log and send the API-fetched odds data
-                        scraper_logger.info(f"Sending formatted odds data: {odds_payload}")
-                        cricket_data_service.send_cricket_data_to_service(odds_payload, token, url)
-
-                    except Exception as e:
-                        scraper_logger.error(f"Error during odds evaluation or sending: {e}")
-
-                # Only print if the text content has changed
-                if set(updatedTexts) != previousTexts:
-                    scraper_logger.info(f"Text content changed: {updatedTexts}")
-                    printUpdatedText(updatedTexts, token, url)
-                    previousTexts = set(updatedTexts)
-
+                tick_attributes = {"match.id": data_store['match_id'], "tick.iteration": iteration_count}
+                with get_tracer().span("tick", attributes=tick_attributes, links=[data_store.get('sv3_span')]) as span, monitoring.stage_timer("tick"):
+                    observe_iteration(page, isButtonFoundFlag, token, url, data_store, is_test_match, previous)
+                    if span is not None:
+                        span.set_attribute("tick.changed", sorted(key for key in previous if previous[key] != sent_before.get(key)))
+                if previous != sent_before:
+                    save_warm_state(data_store, previous, context)
             except Exception as e:
                 scraper_logger.error(f"Error during DOM manipulation: {e}", exc_info=True)
                 # Record error in context if available
                 if context:
                     context.record_error()
+            if recorder is not None:
+                page.end_iteration()
+            capture = capture_session(data_store['match_id'])
+            if capture is not None:
+                record_capture_tick(capture, page, data_store, previous)
+                end_capture_tick(data_store['match_id'])
 
             # Update resource usage periodically (every 10 iterations ~25 seconds)
             if context and iteration_count % 10 == 0:
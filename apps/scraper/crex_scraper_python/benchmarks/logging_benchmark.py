@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""Records per second through the structlog processor chain, legacy vs current.
+
+"legacy" reproduces the old tail of the chain: ``_ensure_standard_schema``
+copying ``metadata`` and rescanning every key on each record, then
+structlog's stdlib ``JSONRenderer``. "current" is the chain
+``configure_logging`` builds today (``build_json_renderer`` picks orjson
+when it is installed). Both chains log to a null stream and share the same
+head processors, so the difference is schema handling plus rendering.
+
+    python benchmarks/logging_benchmark.py --records 50000
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+from collections.abc import MutableMapping
+from pathlib import Path
+
+import structlog
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.logging.adapters import (  # noqa: E402
+    _ALLOWED_TOP_LEVEL_KEYS,
+    _CORRELATION_ID_VAR,
+    _DEFAULT_COMPONENT,
+    _ensure_standard_schema,
+    _json_fallback,
+    _uppercase_level,
+    build_json_renderer,
+)
+
+
+def _legacy_schema(_, __, event_dict):
+    event_dict["correlation_id"] = event_dict.get("correlation_id") or _CORRELATION_ID_VAR.get() or "unknown"
+    event_dict["component"] = event_dict.get("component") or _DEFAULT_COMPONENT
+    event_dict["scraper_id"] = event_dict.get("scraper_id") or "unknown"
+    event_dict["match_id"] = event_dict.get("match_id") or "unbound"
+    metadata = event_dict.get("metadata")
+    if isinstance(metadata, MutableMapping):
+        metadata = dict(metadata)
+    elif metadata is None:
+        metadata = {}
+    else:
+        metadata = {"value": metadata}
+    extras = {}
+    for key in list(event_dict.keys()):
+        if key not in _ALLOWED_TOP_LEVEL_KEYS:
+            extras[key] = event_dict.pop(key)
+    if extras:
+        metadata.update(extras)
+    event_dict["metadata"] = metadata
+    return event_dict
+
+
+_HEAD = [
+    structlog.contextvars.merge_contextvars,
+    structlog.stdlib.add_log_level,
+    _uppercase_level,
+    structlog.processors.TimeStamper(fmt="iso", key="timestamp", utc=True),
+    structlog.stdlib.PositionalArgumentsFormatter(),
+    structlog.processors.StackInfoRenderer(),
+    structlog.processors.format_exc_info,
+]
+
+CHAINS = {
+    "legacy": _HEAD
+    + [_legacy_schema, structlog.processors.JSONRenderer(default=_json_fallback, ensure_ascii=False)],
+    "current": _HEAD + [_ensure_standard_schema, build_json_renderer()],
+}
+
+# A scrape event, a health snapshot (the largest record the service logs
+# routinely) and an event with ad-hoc keyword arguments folded into metadata.
+EVENTS = {
+    "scrape_event": ("scrape.update.sent", {"metadata": {"match_id": "m-123", "payload": "score", "bytes": 812}}),
+    "health": (
+        "health.snapshot",
+        {
+            "metadata": {
+                "active_scrapers": 12,
+                "memory_mb": 1184.5,
+                "scrapers": [
+                    {"match_id": f"m-{i}", "status": "healthy", "staleness_seconds": 1.2 + i, "errors": i % 3}
+                    for i in range(12)
+                ],
+            }
+        },
+    ),
+    "extra_kwargs": ("egress.retry", {"url": "https://crex.example/api", "attempt": 2, "delay_ms": 250}),
+}
+
+
+def run(records):
+    results = {}
+    with open(os.devnull, "w") as null:
+        for kind, (event, fields) in EVENTS.items():
+            results[kind] = {}
+            for name, chain in CHAINS.items():
+                logger = structlog.wrap_logger(
+                    structlog.PrintLogger(null),
+                    processors=chain,
+                    wrapper_class=structlog.make_filtering_bound_logger(logging.INFO),
+                    context_class=dict,
+                ).bind(component="benchmark", scraper_id="bench")
+                start = time.perf_counter()
+                for _ in range(records):
+                    logger.info(event, **fields)
+                elapsed = time.perf_counter() - start
+                results[kind][name] = round(records / elapsed)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=20000)
+    parser.add_argument("--json", action="store_true", help="emit machine readable results")
+    args = parser.parse_args(argv)
+
+    results = run(args.records)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    print(f"{'event':<14}{'legacy rec/s':>16}{'current rec/s':>16}{'speedup':>10}")
+    for kind, row in results.items():
+        print(f"{kind:<14}{row['legacy']:>16,}{row['current']:>16,}{row['current'] / row['legacy']:>9.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""Replay recorded matches through the live pipeline and report its throughput.
+
+Recordings come from a scraper started with ``SCRAPER_RECORD_DIR`` set (one
+``<match>-<timestamp>.jsonl.gz`` per match). Without recordings,
+``--synthetic-overs`` generates a T20-shaped one by running the observation
+loop against a synthetic page.
+
+    python benchmarks/replay_benchmark.py recordings/*.jsonl.gz --speed 100 --copies 5
+    python benchmarks/replay_benchmark.py --synthetic-overs 20 --speed max --output results.json
+    python benchmarks/replay_benchmark.py --synthetic-overs 20 --speed max --baseline results.json
+
+Results are JSON (see ``ReplayResult``) so runs can be compared between
+releases; with ``--baseline`` the exit status is 1 when a metric regresses
+by more than ``--max-regression``.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(HERE.parent))
+sys.path.insert(0, str(HERE.parent.parent))  # apps/scraper: crex_match_data_scraper and friends
+
+from src.logging.adapters import configure_logging  # noqa: E402
+
+# Before any module binds its logger; stdout is reserved for the result JSON.
+configure_logging(level="WARNING", stream=sys.stderr)
+
+from src.replay.harness import Replayer, StubBackend, backend_environment  # noqa: E402
+from src.replay.recorder import MatchRecorder, Recording  # noqa: E402
+
+SYNTHETIC_URL = "https://crex.live/scoreboard/QZ1/1KL/1st-T20/M/N/ind-vs-aus-1st-t20-india-tour-of-australia-2025/live"
+SV3_URL = "https://api-v1.com/v10/sV3.php?key=replay"
+
+# Lower is better for every compared metric except throughput.
+COMPARED = {
+    "updates_per_second": +1,
+    "cpu_ms_per_update": -1,
+    "memory_mb_per_match": -1,
+    "latency_p95_ms": -1,
+}
+
+
+class _SyntheticPage:
+    """Answers the observation loop's scripts from a simulated match state."""
+
+    def __init__(self):
+        self.ball = 0
+
+    def wait_for_load_state(self, *args, **kwargs):
+        return None
+
+    def evaluate(self, expression, *args):
+        over, ball = divmod(self.ball, 6)
+        runs = self.ball * 8 // 6
+        if "localStorage" in expression:
+            storage = {f"p_P{i}_name": f"Player {i}" for i in range(22)}
+            storage.update({"t_IND_name": "India", "t_AUS_name": "Australia"})
+            return storage
+        if ".result-box" in expression:
+            return [f"{runs}/{self.ball // 30}", "Ball" if self.ball % 7 else "Wicket"]
+        if ".team-run-rate" in expression:
+            return f"{runs / max(self.ball / 6, 1):.2f}"
+        if ".final-result" in expression:
+            return "India opt to bat"
+        if ".team-content" in expression:
+            return [
+                {"teamName": "IND", "score": f"{runs}/{self.ball // 30}", "over": f"{over}.{ball}"},
+                {"teamName": "AUS", "score": "0/0", "over": "0.0"},
+            ]
+        if "slideOver" in expression:
+            return [
+                {"overNumber": f"Ov {number + 1}", "balls": ["1", "4", "0", "6", "1", "2"], "totalRuns": "14"}
+                for number in range(max(0, over - 3), over)
+            ]
+        if ".fav-odd" in expression:
+            return [{"teamName": "IND", "backOdds": "45", "layOdds": "47"}]
+        raise KeyError(expression[:60])
+
+
+def _sv3(ball):
+    return {
+        "B": str(ball % 7),
+        "F": "IND^",
+        "R": f"{40 + ball % 20}+2",
+        "D": "6,10,15,20",
+        "Z": ",".join(f"{30 + ball % 40 + step}+1" for step in range(4)),
+        "p": "P1.P2",
+        "q": f"{ball}.{ball + 3}*",
+        "r": "2.1.0.0",
+        "s": "12.10",
+        "t": "1.0.0.0",
+        "b": "P12",
+        "c": "20.18.1.6",
+    }
+
+
+def _sc4(ball):
+    return [
+        {
+            "c": "IND",
+            "d": f"{ball * 8 // 6}/{ball // 30}",
+            "a": [f"P{12 + i}.{20 + i}.{18 + i}.0.{i % 3}.0" for i in range(5)],
+            "b": [f"P{i}.{10 + i}.{8 + i}.1.0.0.0.0.0.0" for i in range(11)],
+        }
+    ]
+
+
+def synthetic_recording(path, overs):
+    """Record a synthetic match: one sV3 tick, one sC4 response and one DOM pass per ball."""
+    import crex_match_data_scraper as scraper
+    from src.egress import get_dispatcher
+
+    page = _SyntheticPage()
+    recorder = MatchRecorder(path, match_id="synthetic", url=SYNTHETIC_URL, clock=lambda: page.ball * 4.0)
+    recording_page = recorder.wrap_page(page)
+    recorder.record("local_storage", scraper.categorize_local_storage_data(page))
+    recorder.record("observe", {"is_test_match": False, "odds_button": False})
+    data_store = {"lock": scraper.threading.Lock(), "local_storage_data": {}, "match_id": "synthetic"}
+    previous = scraper.new_change_state()
+    # The synthetic pass sends real payloads; point them at a throwaway stub.
+    with StubBackend() as backend, backend_environment(backend.base_url):
+        for ball in range(overs * 6):
+            page.ball = ball
+            recorder.record("sv3", _sv3(ball), url=SV3_URL)
+            recorder.record("sc4", _sc4(ball), key="replay")
+            scraper.observe_iteration(recording_page, False, None, SYNTHETIC_URL, data_store, False, previous)
+            recording_page.end_iteration()
+        get_dispatcher().flush(timeout=30)
+    recorder.close()
+    return path
+
+
+def _git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=HERE, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _flatten(result):
+    return {
+        "updates_per_second": result["updates_per_second"],
+        "cpu_ms_per_update": result["cpu_ms_per_update"],
+        "memory_mb_per_match": result["memory_mb_per_match"],
+        "latency_p95_ms": result["latency_ms"]["p95"],
+    }
+
+
+def compare(current, baseline, max_regression):
+    """Return ``(report, regressed)`` comparing two result dicts."""
+    report = {}
+    regressed = False
+    now, before = _flatten(current), _flatten(baseline)
+    for metric, direction in COMPARED.items():
+        old, new = before[metric], now[metric]
+        change = (new - old) / old if old else 0.0
+        worse = change * direction < -max_regression
+        regressed = regressed or worse
+        report[metric] = {"baseline": old, "current": new, "change": round(change, 4), "regressed": worse}
+    return report, regressed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("recordings", nargs="*", help="recording files (.jsonl or .jsonl.gz)")
+    parser.add_argument("--synthetic-overs", type=int, default=0, help="generate a synthetic recording instead")
+    parser.add_argument("--speed", default="100", help="replay speed multiplier (1-1000) or 'max'")
+    parser.add_argument("--copies", type=int, default=1, help="concurrent copies of each recording")
+    parser.add_argument("--backend-delay-ms", type=float, default=0.0, help="stub backend response delay")
+    parser.add_argument("--output", help="write the result JSON here")
+    parser.add_argument("--baseline", help="result JSON from a previous release to compare against")
+    parser.add_argument("--max-regression", type=float, default=0.10)
+    args = parser.parse_args(argv)
+
+    speed = 0.0 if args.speed == "max" else float(args.speed)
+    if not args.recordings and not args.synthetic_overs:
+        parser.error("pass recordings or --synthetic-overs")
+
+    recordings = [Path(path).resolve() for path in args.recordings]
+    output = Path(args.output).resolve() if args.output else None
+    baseline_path = Path(args.baseline).resolve() if args.baseline else None
+    original_cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="replay-") as workdir:
+        # The scraper writes logs, archives and localStorage dumps relative to the cwd.
+        os.chdir(workdir)
+        os.environ.setdefault("BALL_ARCHIVE_DIR", str(Path(workdir) / "archive"))
+        if args.synthetic_overs:
+            recordings.append(synthetic_recording(Path(workdir) / "synthetic.jsonl.gz", args.synthetic_overs))
+        loaded = [Recording.load(path) for path in recordings]
+        result = Replayer(
+            loaded,
+            speed=speed,
+            copies=args.copies,
+            backend_delay_seconds=args.backend_delay_ms / 1000,
+        ).run()
+        os.chdir(original_cwd)
+
+    payload = result.to_dict()
+    payload["environment"]["git_revision"] = _git_revision()
+    exit_code = 0
+    if baseline_path:
+        baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+        payload["comparison"], regressed = compare(payload, baseline, args.max_regression)
+        exit_code = 1 if regressed else 0
+
+    text = json.dumps(payload, indent=2)
+    if output:
+        output.write_text(text + "\n", encoding="utf-8")
+    print(text)
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Compare bytes and CPU per update for the legacy and current egress encoders.
+
+"legacy" reproduces the old path: dict-comprehension ``None`` filtering,
+``json.dumps`` and the DEBUG payload f-string that was always rendered.
+Every other column is ``prepare_payload`` plus one of the installed
+serializers; the msgspec columns encode the schema structs.
+
+    python benchmarks/serialization_benchmark.py --iterations 20000
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.egress.serialization import (  # noqa: E402
+    _SERIALIZERS,
+    prepare_payload,
+)
+
+URL = "https://crex.live/scoreboard/QZ1/1KL/1st-T20/M/N/ind-vs-aus-1st-t20-india-tour-of-australia-2025/live"
+
+
+def _sample_payloads():
+    innings = {
+        f"inning_{index}": {
+            "batsman_stats": {
+                f"Player {player}": {"runs": player * 7, "balls": player * 5, "fours": 2, "sixes": 1, "sr": "140.0"}
+                for player in range(11)
+            },
+            "bowler_stats": {
+                f"Bowler {player}": {"overs": "4.0", "runs": 30 + player, "wickets": player % 3, "eco": "7.5"}
+                for player in range(6)
+            },
+            "fall_of_wickets": [f"{wicket * 20}-{wicket} ({wicket * 2}.{wicket})" for wicket in range(10)],
+        }
+        for index in range(2)
+    }
+    return {
+        "match_update": {
+            "match_update": {"score": {"team": "IND", "score": "187/4", "over": "18.3"}, "crr": "10.11", "final_result_text": None},
+            "overs_data": [["1", "4", "0", "W", "6", "1"], ["2", "2", "1", "0", "4", "1"]],
+            "url": URL,
+        },
+        "score_update": {"score_update": "FOUR! Driven through covers", "url": URL},
+        "players": {
+            "batsman_data": [
+                {"name": "Batter A", "runs": 54, "balls": 31, "fours": 5, "sixes": 2, "strike_rate": "174.19", "dismissal": None},
+                {"name": "Batter B", "runs": 12, "balls": 9, "fours": 1, "sixes": 0, "strike_rate": "133.33", "dismissal": None},
+            ],
+            "bowler_data": {"name": "Bowler X", "overs": "3.3", "runs": 33, "wickets": 1, "economy": "9.43"},
+            "url": URL,
+        },
+        "odds": {
+            "firstTeamData": [{"teamName": "India", "backOdds": "45", "layOdds": "47"}],
+            "sessionData": [{"over": "20", "yes": "190", "no": "188"}],
+            "url": URL,
+        },
+        "sc4_stats": {"match_stats_by_innings": {"innings": innings}, "url": URL},
+    }
+
+
+def _legacy_encode(payload):
+    filtered = {k: v for k, v in payload.items() if v is not None}
+    body = json.dumps(filtered)
+    _ = f"Serialized JSON payload: {body}"  # the always-on DEBUG line
+    return body.encode("utf-8")
+
+
+def _measure(fn, payload, iterations):
+    start = time.process_time()
+    for _ in range(iterations):
+        body = fn(payload)
+    elapsed = time.process_time() - start
+    return len(body), elapsed / iterations * 1e6
+
+
+def run(iterations):
+    encoders = {"legacy": _legacy_encode}
+    for name, serializer in _SERIALIZERS.items():
+        encoders[name] = lambda payload, serializer=serializer: serializer.encode(
+            prepare_payload(payload, structs=serializer.structs)
+        )
+
+    results = {}
+    for kind, payload in _sample_payloads().items():
+        results[kind] = {}
+        for name, fn in encoders.items():
+            size, cpu_us = _measure(fn, payload, iterations)
+            results[kind][name] = {"bytes": size, "cpu_us": round(cpu_us, 2)}
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=5000)
+    parser.add_argument("--json", action="store_true", help="emit machine readable results")
+    args = parser.parse_args(argv)
+
+    results = run(args.iterations)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    encoders = list(next(iter(results.values())).keys())
+    print(f"{'payload':<14}" + "".join(f"{name:>24}" for name in encoders))
+    for kind, row in results.items():
+        cells = "".join(f"{row[name]['bytes']:>10} B {row[name]['cpu_us']:>7.1f} us" for name in encoders)
+        print(f"{kind:<14}{cells}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
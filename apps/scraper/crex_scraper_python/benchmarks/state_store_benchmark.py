@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Measure the per-match cost of StateStore snapshots.
+
+Simulates a tick that snapshots every live match, then reports the time
+spent in ``save`` (what the scraper thread pays) and in the batched flush
+(what the background writer pays), both per match.
+
+    python benchmarks/state_store_benchmark.py --matches 50 --ticks 200
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.config import load_settings  # noqa: E402
+from src.core.scraper_state import ScraperStateSnapshot, StateStore  # noqa: E402
+
+
+def _snapshot(match, tick):
+    return ScraperStateSnapshot(
+        match_id=f"match-{match}",
+        url=f"https://crex.live/scoreboard/M{match}/live",
+        last_processed_over=tick // 6,
+        last_processed_ball=tick % 6,
+        last_score=f"{tick * 2}/{tick % 10}",
+        last_wickets=tick % 10,
+        metadata={"innings": 1, "batting_team": "IND", "bowling_team": "AUS", "recent": ["1", "4", "0", "W", "6", "1"]},
+    )
+
+
+def run(matches, ticks):
+    with tempfile.TemporaryDirectory() as tmp:
+        # Long interval: flushes are driven explicitly once per tick.
+        settings = load_settings({"STATE_STORE_FLUSH_INTERVAL_SECONDS": "60", "STATE_STORE_BATCH_SIZE": "100000"})
+        store = StateStore(settings=settings, db_path=str(Path(tmp) / "bench.db"))
+        save_seconds = 0.0
+        flush_seconds = 0.0
+        for tick in range(ticks):
+            start = time.perf_counter()
+            for match in range(matches):
+                store.save(_snapshot(match, tick))
+            save_seconds += time.perf_counter() - start
+
+            start = time.perf_counter()
+            store.flush()
+            flush_seconds += time.perf_counter() - start
+        sizes = [row["payload_size"] for row in store.list_metadata()]
+        store.close()
+
+    total = matches * ticks
+    return {
+        "matches": matches,
+        "ticks": ticks,
+        "save_us_per_match": round(save_seconds / total * 1e6, 2),
+        "flush_us_per_match": round(flush_seconds / total * 1e6, 2),
+        "avg_payload_bytes": round(sum(sizes) / len(sizes), 1) if sizes else 0,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--matches", type=int, default=50)
+    parser.add_argument("--ticks", type=int, default=100)
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.matches, args.ticks), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
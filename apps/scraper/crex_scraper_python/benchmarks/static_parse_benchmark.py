@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""Parse time and allocations of saved pages, static parser vs Playwright.
+
+Each fixture in ``benchmarks/fixtures`` (or each page given on the command
+line) is processed by the extraction the scraper actually runs on it:
+``listing*.html`` -> live match links, ``*info*.html`` -> match info. Two
+paths are timed:
+
+``static``      ``parse_html`` (lxml) plus the same selector chains over the tree
+``playwright``  ``page.set_content`` into a warm Chromium page, then the
+                browser-side extraction (skipped when Chromium is not
+                installed)
+
+Only this process's Python allocations are counted (tracemalloc peak), so
+the Playwright column leaves out the browser's own memory. The time is the
+median of ``--repeat`` runs. The bundled fixtures reproduce the listing
+and match info markup that ``SELECTORS`` and ``crex_info_url`` target.
+Pass pages saved from the live site to benchmark against today's markup:
+
+    python benchmarks/static_parse_benchmark.py --repeat 50
+    python benchmarks/static_parse_benchmark.py saved/listing_2025-06-01.html --json
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(HERE.parent))
+sys.path.insert(0, str(HERE.parent.parent))  # apps/scraper: crex_info_url
+
+from src.logging.adapters import configure_logging  # noqa: E402
+
+# Before any module binds its logger; stdout is reserved for the results.
+configure_logging(level="WARNING", stream=sys.stderr)
+
+from crex_info_url import scrape_match_info_static  # noqa: E402
+from src.parsers import extract_live_match_hrefs  # noqa: E402
+from src.static_parser import (  # noqa: E402
+    HTML_BACKEND,
+    extract_live_match_hrefs_static,
+    parse_html,
+)
+
+
+def _extractor(path):
+    if "info" in path.stem:
+        return "match_info", lambda handle: scrape_match_info_static(None, document=handle)
+    return "listing", None
+
+
+def _measure(fn, repeat):
+    """(median ms, tracemalloc peak KiB of one run, result)."""
+
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return round(statistics.median(timings), 3), round(peak / 1024, 1), result
+
+
+def run_static(path, repeat):
+    html = path.read_text(encoding="utf-8")
+    kind, extract = _extractor(path)
+
+    def once():
+        document = parse_html(html)
+        return extract(document) if extract else extract_live_match_hrefs_static(document)
+
+    millis, peak_kib, result = _measure(once, repeat)
+    return _row(kind, millis, peak_kib, result)
+
+
+def _row(kind, millis, peak_kib, result):
+    return {"kind": kind, "ms": millis, "alloc_peak_kib": peak_kib, "complete": result is not None}
+
+
+def run_playwright(paths, repeat):
+    try:
+        from playwright.sync_api import Error as PlaywrightError, sync_playwright
+    except ImportError:
+        return {path.name: {"unavailable": "playwright is not installed"} for path in paths}
+
+    results = {}
+    try:
+        with sync_playwright() as playwright:
+            browser = playwright.chromium.launch(
+                headless=True, args=["--no-sandbox", "--disable-dev-shm-usage"]
+            )
+            try:
+                page = browser.new_page()
+                for path in paths:
+                    html = path.read_text(encoding="utf-8")
+                    kind, extract = _extractor(path)
+
+                    def once():
+                        page.set_content(html, wait_until="domcontentloaded")
+                        return extract(page) if extract else extract_live_match_hrefs(page)
+
+                    millis, peak_kib, result = _measure(once, repeat)
+                    results[path.name] = _row(kind, millis, peak_kib, result)
+            finally:
+                browser.close()
+    except PlaywrightError as exc:
+        reason = str(exc).splitlines()[0]
+        return {path.name: {"unavailable": reason} for path in paths}
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("pages", nargs="*", type=Path, help="saved pages (default: benchmarks/fixtures/*.html)")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--static-only", action="store_true", help="skip the Playwright path")
+    parser.add_argument("--json", action="store_true", help="emit machine readable results")
+    args = parser.parse_args(argv)
+
+    paths = args.pages or sorted((HERE / "fixtures").glob("*.html"))
+    static = {path.name: run_static(path, args.repeat) for path in paths}
+    browser = {} if args.static_only else run_playwright(paths, args.repeat)
+    results = {
+        "backend": HTML_BACKEND,
+        "pages": {
+            path.name: {
+                "bytes": path.stat().st_size,
+                "static": static[path.name],
+                "playwright": browser.get(path.name),
+            }
+            for path in paths
+        },
+    }
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    print(f"static parser backend: {HTML_BACKEND}")
+    print(f"{'page':<24}{'bytes':>9}{'static ms':>11}{'KiB':>9}{'browser ms':>12}{'KiB':>9}{'speedup':>9}")
+    for name, row in results["pages"].items():
+        fast, slow = row["static"], row["playwright"] or {}
+        if "ms" in slow:
+            browser_cols = f"{slow['ms']:>12.2f}{slow['alloc_peak_kib']:>9.1f}{slow['ms'] / fast['ms']:>8.1f}x"
+        else:
+            browser_cols = f"{'n/a':>12}{'':>9}{'':>9}"
+        flag = "" if fast["complete"] else "  (static parse incomplete)"
+        print(f"{name:<24}{row['bytes']:>9,}{fast['ms']:>11.2f}{fast['alloc_peak_kib']:>9.1f}{browser_cols}{flag}")
+    reasons = {(row["playwright"] or {}).get("unavailable") for row in results["pages"].values()}
+    reasons.discard(None)
+    for reason in reasons:
+        print(f"playwright path skipped: {reason}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
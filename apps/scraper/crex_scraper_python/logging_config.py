@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
+import logging
 from contextlib import contextmanager
 from typing import Iterator, Optional
 
 from structlog.contextvars import bind_contextvars, unbind_contextvars
 
+from src.logging.adapters import bind_thread_match_id, unbind_thread_match_id
 from src.logging.adapters import configure_logging as _configure_structlog
+from src.logging.pipeline import LoggingPipeline, get_logging_pipeline
 
 from src.config import ScraperSettings, get_settings
+from src.monitoring.tracing import add_trace_context
 
 try:  # pragma: no cover - typing only
     from typing import TYPE_CHECKING
@@ -25,13 +29,28 @@ def setup_logging(
     *,
     stream=None,
 ) -> ScraperSettings:
-    """Configure structured logging based on scraper settings."""
+    """Configure structured logging based on scraper settings.
+
+    Without ``stream`` every record goes through the shared logging pipeline:
+    the console at ``log_level`` and ``crex_scraper.log`` (rotated) at DEBUG.
+    """
 
     cfg = settings or get_settings()
     fmt = (cfg.log_format or "json").lower()
     indent = 2 if fmt in {"json-pretty", "pretty"} else None
 
-    _configure_structlog(level=cfg.log_level, json_indent=indent, stream=stream)
+    pipeline = None
+    if stream is None:
+        pipeline = get_logging_pipeline(cfg)
+        pipeline.route(LoggingPipeline.ROOT, "crex_scraper.log", level=logging.DEBUG, console_level=cfg.log_level)
+
+    _configure_structlog(
+        level=cfg.log_level,
+        json_indent=indent,
+        stream=stream,
+        extra_processors=[add_trace_context],
+        pipeline=pipeline,
+    )
     bind_contextvars(scraper_id=cfg.scraper_id)
     return cfg
 
@@ -49,6 +68,7 @@ def scraper_logging_context(
 
     if resolved_match_id:
         bind_contextvars(match_id=resolved_match_id)
+        bind_thread_match_id(resolved_match_id)
         keys_to_unbind.append("match_id")
 
     try:
@@ -56,6 +76,7 @@ def scraper_logging_context(
     finally:
         if keys_to_unbind:
             unbind_contextvars(*keys_to_unbind)
+            unbind_thread_match_id()
 
 
 __all__ = ["setup_logging", "scraper_logging_context"]
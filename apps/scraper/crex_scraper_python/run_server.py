@@ -24,6 +24,7 @@ from src.crex_main_url import (
     initialize_database,
     job,
     shutdown_active_scrapes,
+    start_background_services,
 )
 from src.config import get_settings
 from src.monitoring import ensure_metrics_server
@@ -46,6 +47,7 @@ if __name__ == "__main__":
     print("Initializing database...")
     initialize_database()
     print("Database initialized successfully")
+    start_background_services()
 
     settings = get_settings()
     if settings.enable_prometheus_metrics:
@@ -88,6 +88,10 @@ class ScraperSettings:
     retry_base_delay_seconds: float = 1.0
     retry_max_delay_seconds: float = 16.0
     retry_jitter_seconds: float = 0.3
+    retry_after_max_seconds: float = 120.0
+    retry_budget_capacity: float = 20.0
+    retry_budget_refill_per_second: float = 0.5
+    retry_budget_success_deposit: float = 0.1
     memory_restart_grace_seconds: int = 60
     pid_soft_limit: int = 500
     pid_restart_threshold: int = 500
@@ -99,7 +103,7 @@ class ScraperSettings:
     log_format: str = "json"
     batch_size: int = 20
     batch_flush_interval_seconds: float = 5.0
-    sqlite_db_path: str = "url_state.db"
+    sqlite_db_path: str = "storage/url_state.db"
     sqlite_pool_min_size: int = 1
     sqlite_pool_max_size: int = 5
     sqlite_timeout_seconds: float = 30.0
@@ -112,6 +116,86 @@ class ScraperSettings:
     orphan_cleanup_interval_seconds: int = 1800
     pid_restart_threshold: int = 500  # New: restart scrapers if observed chrome/playwright PIDs exceed this
     container_restart_interval_minutes: int = 10  # Periodic container restart interval to prevent resource leaks
+    # Egress lanes: realtime (score events), coalesced (odds/player snapshots), bulk (scorecards/match info)
+    egress_realtime_concurrency: int = 4
+    egress_coalesced_concurrency: int = 2
+    egress_bulk_concurrency: int = 1
+    egress_coalesce_interval_seconds: float = 1.0
+    egress_bulk_rate_per_second: float = 0.5
+    egress_bulk_max_queue: int = 100
+    egress_realtime_slo_seconds: float = 1.0
+    egress_coalesced_slo_seconds: float = 5.0
+    egress_bulk_slo_seconds: float = 30.0
+    # Adaptive batching (AIMD) bounds; flush interval + p95 latency stays within the freshness budget
+    adaptive_batching_enabled: bool = True
+    egress_freshness_budget_seconds: float = 5.0
+    batch_min_size: int = 1
+    batch_max_size: int = 100
+    batch_min_flush_interval_seconds: float = 0.25
+    batch_max_flush_interval_seconds: float = 10.0
+    batch_target_latency_seconds: float = 0.5
+    batch_max_error_rate: float = 0.05
+    batch_adjust_interval_seconds: float = 5.0
+    egress_serializer: str = "auto"  # auto | json | orjson | msgspec
+    egress_msgpack_enabled: bool = False
+    bulkhead_max_concurrent: int = 4
+    bulkhead_max_queue: int = 8
+    bulkhead_queue_timeout_seconds: float = 2.0
+    bulkhead_limits: str = ""  # "dependency=max_concurrent:max_queue:timeout,..."
+    sqlite_wal_enabled: bool = True
+    sqlite_statement_cache_size: int = 128
+    state_store_flush_interval_seconds: float = 1.0
+    state_store_batch_size: int = 64
+    state_store_compression_level: int = 1
+    url_index_flush_interval_seconds: float = 5.0
+    ball_archive_enabled: bool = True
+    ball_archive_dir: str = "archive"
+    ball_archive_segment_records: int = 8192
+    ball_archive_flush_interval_seconds: float = 2.0
+    replay_record_dir: str = ""
+    warm_restart_enabled: bool = True
+    warm_restart_max_age_seconds: float = 900.0
+    process_census_interval_seconds: float = 15.0
+    process_census_collect_pss: bool = True
+    metrics_match_label_limit: int = 50
+    metrics_match_label_idle_seconds: float = 600.0
+    metrics_series_ttl_seconds: float = 300.0
+    debug_endpoints_enabled: bool = False
+    debug_token: str = ""
+    profiler_sample_hz: float = 100.0
+    profiler_max_seconds: float = 120.0
+    tracing_enabled: bool = True
+    trace_sample_ratio: float = 0.01
+    trace_tail_latency_ms: float = 1000.0
+    trace_ring_size: int = 200
+    trace_pending_timeout_seconds: float = 120.0
+    trace_export_path: str = ""
+    trace_export_max_bytes: int = 10 * 1024 * 1024
+    trace_export_backups: int = 3
+    memory_tracking_enabled: bool = False
+    memory_snapshot_interval_seconds: float = 60.0
+    memory_tracemalloc_frames: int = 25
+    memory_top_n: int = 20
+    memory_trend_window: int = 10
+    memory_trend_alarm_seconds: float = 1800.0
+    freshness_slo_seconds: float = 3.0
+    freshness_slo_target: float = 0.95
+    freshness_slo_window_seconds: int = 300
+    log_queue_enabled: bool = True
+    log_queue_size: int = 10000
+    log_max_bytes: int = 50 * 1024 * 1024
+    log_rotate_interval_seconds: int = 86400
+    log_backup_count: int = 5
+    log_compress: bool = True
+    artifact_store_max_bytes: int = 256 * 1024 * 1024
+    artifact_store_queue_size: int = 32
+    debug_capture_ticks: int = 20
+    debug_capture_seconds: float = 120.0
+    static_parse_enabled: bool = True
+    static_fetch_timeout_seconds: float = 10.0
+    match_info_cache_ttl_seconds: int = 6 * 60 * 60  # 0 disables the cache
+    match_info_cache_max_entries: int = 256
+    match_info_console_capture: bool = False
 
     @property
     def is_tiny_profile(self) -> bool:
@@ -140,6 +224,10 @@ class ScraperSettings:
             "retry_base_delay_seconds": self.retry_base_delay_seconds,
             "retry_max_delay_seconds": self.retry_max_delay_seconds,
             "retry_jitter_seconds": self.retry_jitter_seconds,
+            "retry_after_max_seconds": self.retry_after_max_seconds,
+            "retry_budget_capacity": self.retry_budget_capacity,
+            "retry_budget_refill_per_second": self.retry_budget_refill_per_second,
+            "retry_budget_success_deposit": self.retry_budget_success_deposit,
             "memory_restart_grace_seconds": self.memory_restart_grace_seconds,
             "pid_soft_limit": self.pid_soft_limit,
             "pid_restart_threshold": self.pid_restart_threshold,
@@ -163,6 +251,83 @@ class ScraperSettings:
             "degraded_staleness_seconds": self.degraded_staleness_seconds,
             "orphan_cleanup_interval_seconds": self.orphan_cleanup_interval_seconds,
             "container_restart_interval_minutes": self.container_restart_interval_minutes,
+            "egress_realtime_concurrency": self.egress_realtime_concurrency,
+            "egress_coalesced_concurrency": self.egress_coalesced_concurrency,
+            "egress_bulk_concurrency": self.egress_bulk_concurrency,
+            "egress_coalesce_interval_seconds": self.egress_coalesce_interval_seconds,
+            "egress_bulk_rate_per_second": self.egress_bulk_rate_per_second,
+            "egress_bulk_max_queue": self.egress_bulk_max_queue,
+            "egress_realtime_slo_seconds": self.egress_realtime_slo_seconds,
+            "egress_coalesced_slo_seconds": self.egress_coalesced_slo_seconds,
+            "egress_bulk_slo_seconds": self.egress_bulk_slo_seconds,
+            "adaptive_batching_enabled": self.adaptive_batching_enabled,
+            "egress_freshness_budget_seconds": self.egress_freshness_budget_seconds,
+            "batch_min_size": self.batch_min_size,
+            "batch_max_size": self.batch_max_size,
+            "batch_min_flush_interval_seconds": self.batch_min_flush_interval_seconds,
+            "batch_max_flush_interval_seconds": self.batch_max_flush_interval_seconds,
+            "batch_target_latency_seconds": self.batch_target_latency_seconds,
+            "batch_max_error_rate": self.batch_max_error_rate,
+            "batch_adjust_interval_seconds": self.batch_adjust_interval_seconds,
+            "egress_serializer": self.egress_serializer,
+            "egress_msgpack_enabled": self.egress_msgpack_enabled,
+            "bulkhead_max_concurrent": self.bulkhead_max_concurrent,
+            "bulkhead_max_queue": self.bulkhead_max_queue,
+            "bulkhead_queue_timeout_seconds": self.bulkhead_queue_timeout_seconds,
+            "bulkhead_limits": self.bulkhead_limits,
+            "sqlite_wal_enabled": self.sqlite_wal_enabled,
+            "sqlite_statement_cache_size": self.sqlite_statement_cache_size,
+            "state_store_flush_interval_seconds": self.state_store_flush_interval_seconds,
+            "state_store_batch_size": self.state_store_batch_size,
+            "state_store_compression_level": self.state_store_compression_level,
+            "url_index_flush_interval_seconds": self.url_index_flush_interval_seconds,
+            "ball_archive_enabled": self.ball_archive_enabled,
+            "ball_archive_dir": self.ball_archive_dir,
+            "ball_archive_segment_records": self.ball_archive_segment_records,
+            "ball_archive_flush_interval_seconds": self.ball_archive_flush_interval_seconds,
+            "replay_record_dir": self.replay_record_dir,
+            "warm_restart_enabled": self.warm_restart_enabled,
+            "warm_restart_max_age_seconds": self.warm_restart_max_age_seconds,
+            "process_census_interval_seconds": self.process_census_interval_seconds,
+            "process_census_collect_pss": self.process_census_collect_pss,
+            "metrics_match_label_limit": self.metrics_match_label_limit,
+            "metrics_match_label_idle_seconds": self.metrics_match_label_idle_seconds,
+            "metrics_series_ttl_seconds": self.metrics_series_ttl_seconds,
+            "debug_endpoints_enabled": self.debug_endpoints_enabled,
+            "profiler_sample_hz": self.profiler_sample_hz,
+            "profiler_max_seconds": self.profiler_max_seconds,
+            "tracing_enabled": self.tracing_enabled,
+            "trace_sample_ratio": self.trace_sample_ratio,
+            "trace_tail_latency_ms": self.trace_tail_latency_ms,
+            "trace_ring_size": self.trace_ring_size,
+            "trace_pending_timeout_seconds": self.trace_pending_timeout_seconds,
+            "trace_export_path": self.trace_export_path,
+            "trace_export_max_bytes": self.trace_export_max_bytes,
+            "trace_export_backups": self.trace_export_backups,
+            "memory_tracking_enabled": self.memory_tracking_enabled,
+            "memory_snapshot_interval_seconds": self.memory_snapshot_interval_seconds,
+            "memory_tracemalloc_frames": self.memory_tracemalloc_frames,
+            "memory_top_n": self.memory_top_n,
+            "memory_trend_window": self.memory_trend_window,
+            "memory_trend_alarm_seconds": self.memory_trend_alarm_seconds,
+            "freshness_slo_seconds": self.freshness_slo_seconds,
+            "freshness_slo_target": self.freshness_slo_target,
+            "freshness_slo_window_seconds": self.freshness_slo_window_seconds,
+            "log_queue_enabled": self.log_queue_enabled,
+            "log_queue_size": self.log_queue_size,
+            "log_max_bytes": self.log_max_bytes,
+            "log_rotate_interval_seconds": self.log_rotate_interval_seconds,
+            "log_backup_count": self.log_backup_count,
+            "log_compress": self.log_compress,
+            "artifact_store_max_bytes": self.artifact_store_max_bytes,
+            "artifact_store_queue_size": self.artifact_store_queue_size,
+            "debug_capture_ticks": self.debug_capture_ticks,
+            "debug_capture_seconds": self.debug_capture_seconds,
+            "static_parse_enabled": self.static_parse_enabled,
+            "static_fetch_timeout_seconds": self.static_fetch_timeout_seconds,
+            "match_info_cache_ttl_seconds": self.match_info_cache_ttl_seconds,
+            "match_info_cache_max_entries": self.match_info_cache_max_entries,
+            "match_info_console_capture": self.match_info_console_capture,
         }
 
     @classmethod
@@ -184,6 +349,10 @@ class ScraperSettings:
         retry_base_delay_seconds = _coerce_float(env.get("RETRY_BASE_DELAY_SECONDS"), 1.0, minimum=0)
         retry_max_delay_seconds = _coerce_float(env.get("RETRY_MAX_DELAY_SECONDS"), 16.0, minimum=retry_base_delay_seconds)
         retry_jitter_seconds = _coerce_float(env.get("RETRY_JITTER_SECONDS"), 0.3, minimum=0.0)
+        retry_after_max_seconds = _coerce_float(env.get("RETRY_AFTER_MAX_SECONDS"), 120.0, minimum=0.0)
+        retry_budget_capacity = _coerce_float(env.get("RETRY_BUDGET_CAPACITY"), 20.0, minimum=1.0)
+        retry_budget_refill_per_second = _coerce_float(env.get("RETRY_BUDGET_REFILL_PER_SECOND"), 0.5, minimum=0.0)
+        retry_budget_success_deposit = _coerce_float(env.get("RETRY_BUDGET_SUCCESS_DEPOSIT"), 0.1, minimum=0.0)
         memory_restart_grace_seconds = _coerce_int(env.get("SCRAPER_RESTART_GRACE_SECONDS"), 60, minimum=10)
         pid_soft_limit = _coerce_int(env.get("PID_SOFT_LIMIT"), 360, minimum=100)
         pid_restart_threshold = _coerce_int(env.get("PID_RESTART_THRESHOLD"), pid_soft_limit, minimum=100)
@@ -196,7 +365,7 @@ class ScraperSettings:
         batch_size_default = 15 if profile == "tiny" else 20
         batch_size = _coerce_int(env.get("SCRAPER_BATCH_SIZE"), batch_size_default, minimum=1)
         batch_flush_interval_seconds = _coerce_float(env.get("SCRAPER_BATCH_FLUSH_INTERVAL_SECONDS"), 5.0, minimum=0.5)
-        sqlite_db_path = _coerce_str(env.get("SCRAPER_DB_PATH"), "url_state.db")
+        sqlite_db_path = _coerce_str(env.get("SCRAPER_DB_PATH"), "storage/url_state.db")
         pool_min_default = 1 if profile == "standard" else 1
         pool_max_default = 5 if profile == "standard" else 3
         sqlite_pool_min_size = _coerce_int(env.get("SCRAPER_DB_POOL_MIN"), pool_min_default, minimum=1)
@@ -210,8 +379,93 @@ class ScraperSettings:
         degraded_staleness_seconds = _coerce_int(env.get("SCRAPER_DEGRADED_STALENESS_SECONDS"), 120, minimum=30)
         orphan_cleanup_interval_seconds = _coerce_int(env.get("ORPHAN_CLEANUP_INTERVAL_SECONDS"), 1800, minimum=60)
         container_restart_interval_minutes = _coerce_int(env.get("CONTAINER_RESTART_INTERVAL_MINUTES"), 10, minimum=1)
+        realtime_concurrency_default = 2 if profile == "tiny" else 4
+        egress_realtime_concurrency = _coerce_int(env.get("EGRESS_REALTIME_CONCURRENCY"), realtime_concurrency_default, minimum=1)
+        egress_coalesced_concurrency = _coerce_int(env.get("EGRESS_COALESCED_CONCURRENCY"), 2, minimum=1)
+        egress_bulk_concurrency = _coerce_int(env.get("EGRESS_BULK_CONCURRENCY"), 1, minimum=1)
+        egress_coalesce_interval_seconds = _coerce_float(env.get("EGRESS_COALESCE_INTERVAL_SECONDS"), 1.0, minimum=0.05)
+        egress_bulk_rate_per_second = _coerce_float(env.get("EGRESS_BULK_RATE_PER_SECOND"), 0.5, minimum=0.01)
+        egress_bulk_max_queue = _coerce_int(env.get("EGRESS_BULK_MAX_QUEUE"), 100, minimum=1)
+        egress_realtime_slo_seconds = _coerce_float(env.get("EGRESS_REALTIME_SLO_SECONDS"), 1.0, minimum=0.01)
+        egress_coalesced_slo_seconds = _coerce_float(env.get("EGRESS_COALESCED_SLO_SECONDS"), 5.0, minimum=0.01)
+        egress_bulk_slo_seconds = _coerce_float(env.get("EGRESS_BULK_SLO_SECONDS"), 30.0, minimum=0.01)
+        adaptive_batching_enabled = _coerce_bool(env.get("ADAPTIVE_BATCHING_ENABLED"), True)
+        egress_freshness_budget_seconds = _coerce_float(env.get("EGRESS_FRESHNESS_BUDGET_SECONDS"), 5.0, minimum=0.1)
+        batch_min_size = _coerce_int(env.get("SCRAPER_BATCH_MIN_SIZE"), 1, minimum=1)
+        batch_max_size = _coerce_int(env.get("SCRAPER_BATCH_MAX_SIZE"), max(100, batch_size), minimum=batch_min_size)
+        batch_min_flush_interval_seconds = _coerce_float(env.get("SCRAPER_BATCH_MIN_FLUSH_INTERVAL_SECONDS"), 0.25, minimum=0.01)
+        batch_max_flush_interval_seconds = _coerce_float(
+            env.get("SCRAPER_BATCH_MAX_FLUSH_INTERVAL_SECONDS"), 10.0, minimum=batch_min_flush_interval_seconds
+        )
+        batch_target_latency_seconds = _coerce_float(env.get("SCRAPER_BATCH_TARGET_LATENCY_SECONDS"), 0.5, minimum=0.01)
+        batch_max_error_rate = _coerce_float(env.get("SCRAPER_BATCH_MAX_ERROR_RATE"), 0.05, minimum=0.0)
+        batch_adjust_interval_seconds = _coerce_float(env.get("SCRAPER_BATCH_ADJUST_INTERVAL_SECONDS"), 5.0, minimum=0.1)
+        egress_serializer = _coerce_str(env.get("EGRESS_SERIALIZER"), "auto").lower()
+        egress_msgpack_enabled = _coerce_bool(env.get("EGRESS_MSGPACK_ENABLED"), False)
+        bulkhead_max_concurrent = _coerce_int(env.get("BULKHEAD_MAX_CONCURRENT"), 4, minimum=1)
+        bulkhead_max_queue = _coerce_int(env.get("BULKHEAD_MAX_QUEUE"), 8, minimum=0)
+        bulkhead_queue_timeout_seconds = _coerce_float(env.get("BULKHEAD_QUEUE_TIMEOUT_SECONDS"), 2.0, minimum=0.0)
+        bulkhead_limits = _coerce_str(env.get("BULKHEAD_LIMITS"), "")
+        sqlite_wal_enabled = _coerce_bool(env.get("SCRAPER_DB_WAL_ENABLED"), True)
+        sqlite_statement_cache_size = _coerce_int(env.get("SCRAPER_DB_STATEMENT_CACHE_SIZE"), 128, minimum=0)
+        state_store_flush_interval_seconds = _coerce_float(env.get("STATE_STORE_FLUSH_INTERVAL_SECONDS"), 1.0, minimum=0.05)
+        state_store_batch_size = _coerce_int(env.get("STATE_STORE_BATCH_SIZE"), 64, minimum=1)
+        state_store_compression_level = _coerce_int(env.get("STATE_STORE_COMPRESSION_LEVEL"), 1, minimum=0)
+        url_index_flush_interval_seconds = _coerce_float(env.get("URL_INDEX_FLUSH_INTERVAL_SECONDS"), 5.0, minimum=0.05)
+        ball_archive_enabled = _coerce_bool(env.get("BALL_ARCHIVE_ENABLED"), True)
+        ball_archive_dir = _coerce_str(env.get("BALL_ARCHIVE_DIR"), "archive")
+        ball_archive_segment_records = _coerce_int(env.get("BALL_ARCHIVE_SEGMENT_RECORDS"), 8192, minimum=64)
+        ball_archive_flush_interval_seconds = _coerce_float(env.get("BALL_ARCHIVE_FLUSH_INTERVAL_SECONDS"), 2.0, minimum=0.0)
+        replay_record_dir = _coerce_str(env.get("SCRAPER_RECORD_DIR"), "")
+        warm_restart_enabled = _coerce_bool(env.get("WARM_RESTART_ENABLED"), True)
+        warm_restart_max_age_seconds = _coerce_float(env.get("WARM_RESTART_MAX_AGE_SECONDS"), 900.0, minimum=0.0)
+        process_census_interval_seconds = _coerce_float(env.get("PROCESS_CENSUS_INTERVAL_SECONDS"), 15.0, minimum=1.0)
+        process_census_collect_pss = _coerce_bool(env.get("PROCESS_CENSUS_COLLECT_PSS"), True)
+        metrics_match_label_limit = _coerce_int(env.get("METRICS_MATCH_LABEL_LIMIT"), 50, minimum=1)
+        metrics_match_label_idle_seconds = _coerce_float(env.get("METRICS_MATCH_LABEL_IDLE_SECONDS"), 600.0, minimum=0.0)
+        metrics_series_ttl_seconds = _coerce_float(env.get("METRICS_SERIES_TTL_SECONDS"), 300.0, minimum=0.0)
+        debug_endpoints_enabled = _coerce_bool(env.get("DEBUG_ENDPOINTS_ENABLED"), False)
+        debug_token = _coerce_str(env.get("DEBUG_ENDPOINTS_TOKEN"), "")
+        profiler_sample_hz = _coerce_float(env.get("PROFILER_SAMPLE_HZ"), 100.0, minimum=1.0)
+        profiler_max_seconds = _coerce_float(env.get("PROFILER_MAX_SECONDS"), 120.0, minimum=1.0)
+        tracing_enabled = _coerce_bool(env.get("TRACING_ENABLED"), True)
+        trace_sample_ratio = _coerce_float(env.get("TRACE_SAMPLE_RATIO"), 0.01, minimum=0.0)
+        trace_tail_latency_ms = _coerce_float(env.get("TRACE_TAIL_LATENCY_MS"), 1000.0, minimum=0.0)
+        trace_ring_size = _coerce_int(env.get("TRACE_RING_SIZE"), 200, minimum=1)
+        trace_pending_timeout_seconds = _coerce_float(env.get("TRACE_PENDING_TIMEOUT_SECONDS"), 120.0, minimum=1.0)
+        trace_export_path = _coerce_str(env.get("TRACE_EXPORT_PATH"), "")
+        trace_export_max_bytes = _coerce_int(env.get("TRACE_EXPORT_MAX_BYTES"), 10 * 1024 * 1024, minimum=1024)
+        trace_export_backups = _coerce_int(env.get("TRACE_EXPORT_BACKUPS"), 3, minimum=0)
+        memory_tracking_enabled = _coerce_bool(env.get("MEMORY_TRACKING_ENABLED"), False)
+        memory_snapshot_interval_seconds = _coerce_float(env.get("MEMORY_SNAPSHOT_INTERVAL_SECONDS"), 60.0, minimum=5.0)
+        memory_tracemalloc_frames = _coerce_int(env.get("MEMORY_TRACEMALLOC_FRAMES"), 25, minimum=1)
+        memory_top_n = _coerce_int(env.get("MEMORY_TOP_N"), 20, minimum=1)
+        memory_trend_window = _coerce_int(env.get("MEMORY_TREND_WINDOW"), 10, minimum=2)
+        memory_trend_alarm_seconds = _coerce_float(env.get("MEMORY_TREND_ALARM_SECONDS"), 1800.0, minimum=0.0)
+        freshness_slo_seconds = _coerce_float(env.get("FRESHNESS_SLO_SECONDS"), 3.0, minimum=0.1)
+        freshness_slo_target = min(_coerce_float(env.get("FRESHNESS_SLO_TARGET"), 0.95, minimum=0.0), 1.0)
+        freshness_slo_window_seconds = _coerce_int(env.get("FRESHNESS_SLO_WINDOW_SECONDS"), 300, minimum=10)
+        log_queue_enabled = _coerce_bool(env.get("LOG_QUEUE_ENABLED"), True)
+        log_queue_size = _coerce_int(env.get("LOG_QUEUE_SIZE"), 10000, minimum=100)
+        log_max_bytes = _coerce_int(env.get("LOG_MAX_BYTES"), 50 * 1024 * 1024, minimum=0)
+        log_rotate_interval_seconds = _coerce_int(env.get("LOG_ROTATE_INTERVAL_SECONDS"), 86400, minimum=0)
+        log_backup_count = _coerce_int(env.get("LOG_BACKUP_COUNT"), 5, minimum=0)
+        log_compress = _coerce_bool(env.get("LOG_COMPRESS"), True)
+        artifact_store_max_bytes = _coerce_int(env.get("ARTIFACT_STORE_MAX_BYTES"), 256 * 1024 * 1024, minimum=1024 * 1024)
+        artifact_store_queue_size = _coerce_int(env.get("ARTIFACT_STORE_QUEUE_SIZE"), 32, minimum=1)
+        debug_capture_ticks = _coerce_int(env.get("DEBUG_CAPTURE_TICKS"), 20, minimum=1)
+        debug_capture_seconds = _coerce_float(env.get("DEBUG_CAPTURE_SECONDS"), 120.0, minimum=1.0)
+        static_parse_enabled = _coerce_bool(env.get("STATIC_PARSE_ENABLED"), True)
+        static_fetch_timeout_seconds = _coerce_float(env.get("STATIC_FETCH_TIMEOUT_SECONDS"), 10.0, minimum=0.5)
+        match_info_cache_ttl_seconds = _coerce_int(env.get("MATCH_INFO_CACHE_TTL_SECONDS"), 6 * 60 * 60, minimum=0)
+        match_info_cache_max_entries = _coerce_int(env.get("MATCH_INFO_CACHE_MAX_ENTRIES"), 256, minimum=1)
+        match_info_console_capture = _coerce_bool(env.get("MATCH_INFO_CONSOLE_CAPTURE"), False)
         scraper_id = _coerce_str(env.get("SCRAPER_ID"), str(uuid.uuid4()))
 
+        if egress_serializer not in {"auto", "json", "orjson", "msgspec"}:
+            raise ValueError("EGRESS_SERIALIZER must be one of auto, json, orjson, msgspec")
+        if state_store_compression_level > 9:
+            raise ValueError("STATE_STORE_COMPRESSION_LEVEL must be between 0 and 9")
         if memory_soft_limit_mb > memory_hard_limit_mb:
             raise ValueError("MEMORY_SOFT_LIMIT_MB cannot be greater than MEMORY_HARD_LIMIT_MB")
         if failing_error_threshold < degraded_error_threshold:
@@ -236,6 +490,10 @@ class ScraperSettings:
             retry_base_delay_seconds=retry_base_delay_seconds,
             retry_max_delay_seconds=retry_max_delay_seconds,
             retry_jitter_seconds=retry_jitter_seconds,
+            retry_after_max_seconds=retry_after_max_seconds,
+            retry_budget_capacity=retry_budget_capacity,
+            retry_budget_refill_per_second=retry_budget_refill_per_second,
+            retry_budget_success_deposit=retry_budget_success_deposit,
             memory_restart_grace_seconds=memory_restart_grace_seconds,
             pid_soft_limit=pid_soft_limit,
             pid_restart_threshold=pid_restart_threshold,
@@ -259,6 +517,84 @@ class ScraperSettings:
             degraded_staleness_seconds=degraded_staleness_seconds,
             orphan_cleanup_interval_seconds=orphan_cleanup_interval_seconds,
             container_restart_interval_minutes=container_restart_interval_minutes,
+            egress_realtime_concurrency=egress_realtime_concurrency,
+            egress_coalesced_concurrency=egress_coalesced_concurrency,
+            egress_bulk_concurrency=egress_bulk_concurrency,
+            egress_coalesce_interval_seconds=egress_coalesce_interval_seconds,
+            egress_bulk_rate_per_second=egress_bulk_rate_per_second,
+            egress_bulk_max_queue=egress_bulk_max_queue,
+            egress_realtime_slo_seconds=egress_realtime_slo_seconds,
+            egress_coalesced_slo_seconds=egress_coalesced_slo_seconds,
+            egress_bulk_slo_seconds=egress_bulk_slo_seconds,
+            adaptive_batching_enabled=adaptive_batching_enabled,
+            egress_freshness_budget_seconds=egress_freshness_budget_seconds,
+            batch_min_size=batch_min_size,
+            batch_max_size=batch_max_size,
+            batch_min_flush_interval_seconds=batch_min_flush_interval_seconds,
+            batch_max_flush_interval_seconds=batch_max_flush_interval_seconds,
+            batch_target_latency_seconds=batch_target_latency_seconds,
+            batch_max_error_rate=batch_max_error_rate,
+            batch_adjust_interval_seconds=batch_adjust_interval_seconds,
+            egress_serializer=egress_serializer,
+            egress_msgpack_enabled=egress_msgpack_enabled,
+            bulkhead_max_concurrent=bulkhead_max_concurrent,
+            bulkhead_max_queue=bulkhead_max_queue,
+            bulkhead_queue_timeout_seconds=bulkhead_queue_timeout_seconds,
+            bulkhead_limits=bulkhead_limits,
+            sqlite_wal_enabled=sqlite_wal_enabled,
+            sqlite_statement_cache_size=sqlite_statement_cache_size,
+            state_store_flush_interval_seconds=state_store_flush_interval_seconds,
+            state_store_batch_size=state_store_batch_size,
+            state_store_compression_level=state_store_compression_level,
+            url_index_flush_interval_seconds=url_index_flush_interval_seconds,
+            ball_archive_enabled=ball_archive_enabled,
+            ball_archive_dir=ball_archive_dir,
+            ball_archive_segment_records=ball_archive_segment_records,
+            ball_archive_flush_interval_seconds=ball_archive_flush_interval_seconds,
+            replay_record_dir=replay_record_dir,
+            warm_restart_enabled=warm_restart_enabled,
+            warm_restart_max_age_seconds=warm_restart_max_age_seconds,
+            process_census_interval_seconds=process_census_interval_seconds,
+            process_census_collect_pss=process_census_collect_pss,
+            metrics_match_label_limit=metrics_match_label_limit,
+            metrics_match_label_idle_seconds=metrics_match_label_idle_seconds,
+            metrics_series_ttl_seconds=metrics_series_ttl_seconds,
+            debug_endpoints_enabled=debug_endpoints_enabled,
+            debug_token=debug_token,
+            profiler_sample_hz=profiler_sample_hz,
+            profiler_max_seconds=profiler_max_seconds,
+            tracing_enabled=tracing_enabled,
+            trace_sample_ratio=trace_sample_ratio,
+            trace_tail_latency_ms=trace_tail_latency_ms,
+            trace_ring_size=trace_ring_size,
+            trace_pending_timeout_seconds=trace_pending_timeout_seconds,
+            trace_export_path=trace_export_path,
+            trace_export_max_bytes=trace_export_max_bytes,
+            trace_export_backups=trace_export_backups,
+            memory_tracking_enabled=memory_tracking_enabled,
+            memory_snapshot_interval_seconds=memory_snapshot_interval_seconds,
+            memory_tracemalloc_frames=memory_tracemalloc_frames,
+            memory_top_n=memory_top_n,
+            memory_trend_window=memory_trend_window,
+            memory_trend_alarm_seconds=memory_trend_alarm_seconds,
+            freshness_slo_seconds=freshness_slo_seconds,
+            freshness_slo_target=freshness_slo_target,
+            freshness_slo_window_seconds=freshness_slo_window_seconds,
+            log_queue_enabled=log_queue_enabled,
+            log_queue_size=log_queue_size,
+            log_max_bytes=log_max_bytes,
+            log_rotate_interval_seconds=log_rotate_interval_seconds,
+            log_backup_count=log_backup_count,
+            log_compress=log_compress,
+            artifact_store_max_bytes=artifact_store_max_bytes,
+            artifact_store_queue_size=artifact_store_queue_size,
+            debug_capture_ticks=debug_capture_ticks,
+            debug_capture_seconds=debug_capture_seconds,
+            static_parse_enabled=static_parse_enabled,
+            static_fetch_timeout_seconds=static_fetch_timeout_seconds,
+            match_info_cache_ttl_seconds=match_info_cache_ttl_seconds,
+            match_info_cache_max_entries=match_info_cache_max_entries,
+            match_info_console_capture=match_info_console_capture,
         )
 
 
@@ -1,9 +1,33 @@
 """Core resilience modules for the scraper system."""
 
+from .bulkhead import Bulkhead, BulkheadFullError, get_bulkhead
 from .circuit_breaker import CircuitBreaker, CircuitBreakerOpenError
-from .retry_utils import RetryConfig, RetryError, retryable
+from .retry_utils import (
+    RetryBudget,
+    RetryBudgetExhaustedError,
+    RetryConfig,
+    RetryError,
+    TransientHTTPError,
+    async_retryable,
+    get_retry_budget,
+    retryable,
+)
 from .scraper_context import ScraperContext, ScraperRegistry
-from .scraper_state import ScraperStateSnapshot, StateStore
+from .scraper_state import (
+    ScraperStateSnapshot,
+    StateStore,
+    close_state_store,
+    get_state_store,
+    payload_digest,
+)
+from .match_info_cache import MatchInfoCache, get_match_info_cache, match_info_cache_snapshot
+from .process_census import (
+    ProcessCensus,
+    census_snapshot,
+    current_census,
+    start_census_sampler,
+    stop_census_sampler,
+)
 from .cleanup_orphans import (
     find_orphaned_chromium_processes,
     terminate_processes,
@@ -13,12 +37,21 @@ from .cleanup_orphans import (
 )
 
 __all__ = [
+    # Bulkheads
+    "Bulkhead",
+    "BulkheadFullError",
+    "get_bulkhead",
     # Circuit breaker
     "CircuitBreaker",
     "CircuitBreakerOpenError",
     # Retry utilities
+    "RetryBudget",
+    "RetryBudgetExhaustedError",
     "RetryConfig",
     "RetryError",
+    "TransientHTTPError",
+    "async_retryable",
+    "get_retry_budget",
     "retryable",
     # Scraper context
     "ScraperContext",
@@ -26,6 +59,19 @@ __all__ = [
     # State management
     "ScraperStateSnapshot",
     "StateStore",
+    "close_state_store",
+    "get_state_store",
+    "payload_digest",
+    # Match info cache
+    "MatchInfoCache",
+    "get_match_info_cache",
+    "match_info_cache_snapshot",
+    # Process census
+    "ProcessCensus",
+    "census_snapshot",
+    "current_census",
+    "start_census_sampler",
+    "stop_census_sampler",
     # Cleanup
     "find_orphaned_chromium_processes",
     "terminate_processes",
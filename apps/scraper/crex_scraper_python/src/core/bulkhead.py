@@ -0,0 +1,215 @@
+"""Per-dependency bulkheads capping concurrent calls.
+
+A ``CircuitBreaker`` only reacts once a dependency starts failing; a slow
+dependency that still answers ties up every executor thread first. A
+``Bulkhead`` caps in-flight calls per dependency, lets a bounded number of
+callers wait for a slot and sheds the rest with ``BulkheadFullError``, so a
+slow sC4 save cannot starve auth or live score pushes.
+
+Compose with a breaker by putting the bulkhead outside it, so shed calls are
+never counted as dependency failures::
+
+    get_bulkhead("auth").call(breaker.call, fetch_token)
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple, TypeVar
+
+from src.config import ScraperSettings, get_settings
+from src.monitoring import record_bulkhead_rejection, set_bulkhead_state
+
+T = TypeVar("T")
+
+# Defaults per known dependency: (max_concurrent, max_queue, queue_timeout_seconds).
+# Anything else falls back to the global bulkhead settings; BULKHEAD_LIMITS overrides both.
+DEPENDENCY_LIMITS: Dict[str, Tuple[int, int, float]] = {
+    "auth": (2, 4, 2.0),
+    "cricket-data": (6, 12, 2.0),
+    "match-info": (2, 4, 5.0),
+    "sc4-save": (1, 2, 5.0),
+    "crex-api": (4, 8, 5.0),
+}
+
+
+class BulkheadFullError(RuntimeError):
+    """Raised when a bulkhead has no free slot and its queue is full or timed out."""
+
+    def __init__(self, name: str, reason: str) -> None:
+        super().__init__(f"Bulkhead '{name}' rejected call ({reason})")
+        self.name = name
+        self.reason = reason
+
+
+def parse_bulkhead_limits(spec: str) -> Dict[str, Tuple[int, int, float]]:
+    """Parse ``"name=max_concurrent:max_queue:timeout,..."`` (queue and timeout optional)."""
+
+    limits: Dict[str, Tuple[int, int, float]] = {}
+    for entry in filter(None, (part.strip() for part in spec.split(","))):
+        name, sep, values = entry.partition("=")
+        parts = values.split(":") if sep else []
+        if not name.strip() or not 1 <= len(parts) <= 3:
+            raise ValueError(f"Invalid bulkhead limit {entry!r}")
+        max_concurrent = int(parts[0])
+        max_queue = int(parts[1]) if len(parts) > 1 else max_concurrent * 2
+        timeout = float(parts[2]) if len(parts) > 2 else 2.0
+        if max_concurrent < 1 or max_queue < 0 or timeout < 0:
+            raise ValueError(f"Invalid bulkhead limit {entry!r}")
+        limits[name.strip()] = (max_concurrent, max_queue, timeout)
+    return limits
+
+
+class Bulkhead:
+    """Semaphore with a bounded wait queue for one dependency."""
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        max_concurrent: int,
+        max_queue: int = 0,
+        queue_timeout_seconds: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be >= 1")
+        self.name = name
+        self.max_concurrent = int(max_concurrent)
+        self.max_queue = max(int(max_queue), 0)
+        self.queue_timeout_seconds = max(float(queue_timeout_seconds), 0.0)
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._in_flight = 0
+        self._queued = 0
+        self.total_calls = 0
+        self.total_rejections = 0
+        self.peak_in_flight = 0
+
+    @classmethod
+    def from_settings(cls, name: str, settings: Optional[ScraperSettings] = None) -> "Bulkhead":
+        cfg = settings or get_settings()
+        limits = parse_bulkhead_limits(cfg.bulkhead_limits)
+        default = (cfg.bulkhead_max_concurrent, cfg.bulkhead_max_queue, cfg.bulkhead_queue_timeout_seconds)
+        max_concurrent, max_queue, timeout = limits.get(name) or DEPENDENCY_LIMITS.get(name, default)
+        return cls(name, max_concurrent=max_concurrent, max_queue=max_queue, queue_timeout_seconds=timeout)
+
+    # ------------------------------------------------------------------
+
+    @property
+    def in_flight(self) -> int:
+        with self._cond:
+            return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        with self._cond:
+            return self._queued
+
+    def acquire(self, timeout: Optional[float] = None) -> None:
+        """Take a slot, waiting up to ``timeout`` (default: the queue timeout) when all are busy."""
+
+        wait_for = self.queue_timeout_seconds if timeout is None else max(timeout, 0.0)
+        with self._cond:
+            if self._in_flight >= self.max_concurrent or self._queued:
+                if self._queued >= self.max_queue or wait_for <= 0:
+                    self._reject_locked("queue_full")
+                deadline = self._clock() + wait_for
+                self._queued += 1
+                self._publish_locked()
+                try:
+                    while self._in_flight >= self.max_concurrent:
+                        remaining = deadline - self._clock()
+                        if remaining <= 0:
+                            self._reject_locked("timeout")
+                        self._cond.wait(remaining)
+                finally:
+                    self._queued -= 1
+            self._in_flight += 1
+            self.total_calls += 1
+            self.peak_in_flight = max(self.peak_in_flight, self._in_flight)
+            self._publish_locked()
+
+    def release(self) -> None:
+        with self._cond:
+            if self._in_flight <= 0:
+                raise RuntimeError(f"Bulkhead '{self.name}' released more often than acquired")
+            self._in_flight -= 1
+            self._publish_locked()
+            self._cond.notify()
+
+    @contextmanager
+    def slot(self, timeout: Optional[float] = None) -> Iterator[None]:
+        self.acquire(timeout)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def call(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        with self.slot():
+            return func(*args, **kwargs)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                "dependency": self.name,
+                "in_flight": self._in_flight,
+                "queued": self._queued,
+                "max_concurrent": self.max_concurrent,
+                "max_queue": self.max_queue,
+                "queue_timeout_seconds": self.queue_timeout_seconds,
+                "saturation": round(self._in_flight / self.max_concurrent, 3),
+                "peak_in_flight": self.peak_in_flight,
+                "total_calls": self.total_calls,
+                "total_rejections": self.total_rejections,
+            }
+
+    # ------------------------------------------------------------------
+
+    def _reject_locked(self, reason: str) -> None:
+        self.total_rejections += 1
+        record_bulkhead_rejection(self.name, reason)
+        raise BulkheadFullError(self.name, reason)
+
+    def _publish_locked(self) -> None:
+        set_bulkhead_state(self.name, in_flight=self._in_flight, queued=self._queued, limit=self.max_concurrent)
+
+
+_bulkheads_lock = threading.Lock()
+_bulkheads: Dict[str, Bulkhead] = {}
+
+
+def get_bulkhead(name: str, settings: Optional[ScraperSettings] = None) -> Bulkhead:
+    """Return the shared bulkhead for dependency ``name`` (created from settings on first use)."""
+
+    with _bulkheads_lock:
+        bulkhead = _bulkheads.get(name)
+        if bulkhead is None:
+            bulkhead = Bulkhead.from_settings(name, settings)
+            _bulkheads[name] = bulkhead
+        return bulkhead
+
+
+def bulkhead_snapshots() -> Iterable[Dict[str, Any]]:
+    with _bulkheads_lock:
+        bulkheads = list(_bulkheads.values())
+    return [bulkhead.snapshot() for bulkhead in bulkheads]
+
+
+def reset_bulkheads() -> None:
+    with _bulkheads_lock:
+        _bulkheads.clear()
+
+
+__all__ = [
+    "Bulkhead",
+    "BulkheadFullError",
+    "DEPENDENCY_LIMITS",
+    "bulkhead_snapshots",
+    "get_bulkhead",
+    "parse_bulkhead_limits",
+    "reset_bulkheads",
+]
@@ -76,7 +76,8 @@ class CircuitBreaker:
 
     # ------------------------------------------------------------------
 
-    def call(self, func: Callable[..., T], *args, **kwargs) -> T:
+    def before_call(self) -> None:
+        """Admit a call or raise ``CircuitBreakerOpenError`` (for callers that invoke the work themselves)."""
         with self._lock:
             current_state = self.state
             if current_state is CircuitBreakerState.OPEN:
@@ -84,6 +85,16 @@ class CircuitBreaker:
                 raise CircuitBreakerOpenError(f"Circuit breaker '{self.name}' is open")
             self.total_calls += 1
 
+    def open_remaining_seconds(self) -> float:
+        """Seconds until an open breaker moves to half-open (0 when not open)."""
+        with self._lock:
+            if self.state is not CircuitBreakerState.OPEN or self._opened_at is None:
+                return 0.0
+            return max(self.timeout_seconds - (time.monotonic() - self._opened_at), 0.0)
+
+    def call(self, func: Callable[..., T], *args, **kwargs) -> T:
+        self.before_call()
+
         try:
             result = func(*args, **kwargs)
         except Exception:
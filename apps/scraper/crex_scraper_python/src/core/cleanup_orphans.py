@@ -15,6 +15,7 @@ except ImportError:
 
 from src.logging.adapters import get_logger
 from src.config import get_settings
+from src.core.process_census import ProcessCensus, current_census
 
 logger = get_logger(component="orphan_cleanup")
 
@@ -22,57 +23,39 @@ _cleanup_thread: Optional[threading.Thread] = None
 _cleanup_stop_event = threading.Event()
 
 
-def find_orphaned_chromium_processes() -> List[int]:
+def find_orphaned_chromium_processes(census: Optional[ProcessCensus] = None) -> List[int]:
     """Find orphaned Chromium/Playwright browser processes.
     
     Returns list of PIDs for processes that appear to be orphaned
-    (no parent process or parent is not Python).
+    (no parent process, or a parent that is neither Python nor a browser).
+    Uses the shared process census rather than walking the table again.
     """
     if psutil is None:
         logger.warning("cleanup.psutil_unavailable")
         return []
     
-    orphaned_pids = []
-    
     try:
-        for proc in psutil.process_iter(['pid', 'name', 'ppid', 'create_time']):
-            try:
-                name = proc.info['name'].lower()
-                
-                # Check if it's a Chromium/browser process
-                if not any(browser in name for browser in ['chromium', 'chrome', 'playwright']):
-                    continue
-                
-                # Check if parent exists and is Python
-                try:
-                    parent = psutil.Process(proc.info['ppid'])
-                    parent_name = parent.name().lower()
-                    
-                    # If parent is not Python, likely orphaned
-                    if 'python' not in parent_name:
-                        orphaned_pids.append(proc.info['pid'])
-                        logger.info(
-                            "cleanup.orphan_detected",
-                            metadata={
-                                "pid": proc.info['pid'],
-                                "name": proc.info['name'],
-                                "ppid": proc.info['ppid'],
-                                "parent_name": parent_name,
-                            }
-                        )
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    # Parent doesn't exist - definitely orphaned
-                    orphaned_pids.append(proc.info['pid'])
-                    logger.info(
-                        "cleanup.orphan_no_parent",
-                        metadata={"pid": proc.info['pid'], "name": proc.info['name']}
-                    )
-                    
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                continue
-                
+        # Fresh enough that the PIDs we are about to signal have not been reused.
+        census = census or current_census(max_age_seconds=1.0)
     except Exception as e:
         logger.error("cleanup.scan_error", metadata={"error": str(e)})
+        return []
+    if census is None:
+        return []
+    
+    orphaned_pids = census.orphaned_browser_pids()
+    for pid in orphaned_pids:
+        info = census.processes[pid]
+        parent = census.processes.get(info.ppid)
+        logger.info(
+            "cleanup.orphan_detected",
+            metadata={
+                "pid": pid,
+                "name": info.name,
+                "ppid": info.ppid,
+                "parent_name": parent.name if parent else None,
+            }
+        )
     
     return orphaned_pids
 
@@ -0,0 +1,109 @@
+"""Process-wide TTL cache of scraped match info, keyed by match id.
+
+Match info (venue, toss, team form, playing XI) hardly changes during a
+match, yet every job start and every restart of a stalled scraper used to
+scrape the info page again. Jobs now look here first. The cache belongs to
+the process, not the job, so a restarted job reuses what its predecessor
+scraped. (A restarted *process* gets the same from the warm-restart
+snapshot.)
+
+Entries expire ``match_info_cache_ttl_seconds`` after they were stored (0
+disables the cache). At most ``match_info_cache_max_entries`` are kept; the
+oldest go first. Empty results (a failed scrape) are never cached.
+"""
+
+from __future__ import annotations
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+from src.config import ScraperSettings, get_settings
+
+
+class MatchInfoCache:
+    """Match info by match id, expiring after a fixed time to live."""
+
+    def __init__(
+        self,
+        settings: Optional[ScraperSettings] = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        cfg = settings or get_settings()
+        self._ttl = cfg.match_info_cache_ttl_seconds
+        self._max_entries = cfg.match_info_cache_max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        # match id -> (stored at, match info); oldest first
+        self._entries: OrderedDict[str, tuple[float, Dict[str, Any]]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl > 0
+
+    def get(self, match_id: str) -> Optional[Dict[str, Any]]:
+        """A copy of the cached info, or ``None`` when missing or expired."""
+
+        with self._lock:
+            entry = self._entries.get(match_id)
+            if entry is not None and self._clock() - entry[0] >= self._ttl:
+                del self._entries[match_id]
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            return copy.deepcopy(entry[1])
+
+    def put(self, match_id: str, match_info: Optional[Dict[str, Any]]) -> bool:
+        """Cache ``match_info``; returns False when it was not cached (disabled or empty)."""
+
+        if not self.enabled or not match_info:
+            return False
+        with self._lock:
+            self._entries.pop(match_id, None)
+            self._entries[match_id] = (self._clock(), copy.deepcopy(match_info))
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return True
+
+    def invalidate(self, match_id: str) -> None:
+        with self._lock:
+            self._entries.pop(match_id, None)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "ttl_seconds": self._ttl,
+                "max_entries": self._max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+            }
+
+
+_cache_lock = threading.Lock()
+_cache: Optional[MatchInfoCache] = None
+
+
+def get_match_info_cache(settings: Optional[ScraperSettings] = None) -> MatchInfoCache:
+    """Return the process-wide cache (created on first use)."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = MatchInfoCache(settings)
+        return _cache
+
+
+def match_info_cache_snapshot() -> Optional[Dict[str, Any]]:
+    with _cache_lock:
+        cache = _cache
+    return cache.snapshot() if cache is not None else None
+
+
+__all__ = ["MatchInfoCache", "get_match_info_cache", "match_info_cache_snapshot"]
@@ -0,0 +1,355 @@
+"""Host process census shared by every scraper context.
+
+One ``psutil.process_iter`` walk per interval replaces the per-context scans
+``ScraperContext.update_resource_usage`` and the orphan cleanup used to do.
+A census keeps the parent -> children tree so usage can be attributed to a
+match by its browser root PID: RSS, PSS and USS (read only for attributed
+subtrees, they need ``/proc/<pid>/smaps_rollup``), CPU and PID counts.
+The root is the Playwright driver each ``sync_playwright()`` starts (see
+``browser_root_pid``), so the subtree covers the driver, the browser and
+every renderer it spawns.
+
+``current_census`` hands out the latest snapshot and takes a new one when it
+is older than the requested age, so contexts polled between sampler ticks
+still share a single walk. ``start_census_sampler`` runs the walk on a
+background thread and publishes the result to the registered contexts and
+Prometheus.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional
+
+try:
+    import psutil
+except ImportError:  # pragma: no cover - psutil is optional during static analysis
+    psutil = None  # type: ignore
+
+from src.config import ScraperSettings, get_settings
+from src.logging.adapters import get_logger
+
+logger = get_logger(component="process_census")
+
+BROWSER_NAME_MARKERS = ("chrome", "chromium", "headless_shell")
+_ATTRS = ["pid", "ppid", "name", "memory_info", "cpu_percent"]
+
+
+class ProcessInfo(NamedTuple):
+    pid: int
+    ppid: int
+    name: str
+    rss_bytes: int
+    cpu_percent: float
+    is_browser: bool
+    pss_bytes: Optional[int] = None
+    uss_bytes: Optional[int] = None
+
+
+class ProcessUsage(NamedTuple):
+    """Resource usage of one process subtree."""
+
+    root_pid: int
+    pids: int
+    rss_bytes: int
+    pss_bytes: Optional[int]
+    uss_bytes: Optional[int]
+    cpu_percent: float
+    browser_pids: int
+
+    @property
+    def memory_bytes(self) -> int:
+        """PSS when it was collected (shared pages are not double counted), RSS otherwise."""
+        return self.pss_bytes if self.pss_bytes is not None else self.rss_bytes
+
+
+@dataclass
+class ProcessCensus:
+    """One snapshot of the host process table."""
+
+    taken_at: float
+    processes: Dict[int, ProcessInfo]
+    children: Dict[int, List[int]] = field(default_factory=dict)
+    duration_seconds: float = 0.0
+
+    @classmethod
+    def from_processes(cls, processes: Iterable[ProcessInfo], *, taken_at: float, duration_seconds: float = 0.0) -> "ProcessCensus":
+        table = {info.pid: info for info in processes}
+        children: Dict[int, List[int]] = {}
+        for info in table.values():
+            if info.ppid != info.pid:
+                children.setdefault(info.ppid, []).append(info.pid)
+        return cls(taken_at=taken_at, processes=table, children=children, duration_seconds=duration_seconds)
+
+    def age_seconds(self, now: Optional[float] = None) -> float:
+        return (now if now is not None else time.monotonic()) - self.taken_at
+
+    @property
+    def browser_process_count(self) -> int:
+        return sum(1 for info in self.processes.values() if info.is_browser)
+
+    def subtree(self, root_pid: int) -> List[int]:
+        """``root_pid`` and all of its descendants (empty if it is gone)."""
+        if root_pid not in self.processes:
+            return []
+        pids = [root_pid]
+        stack = [root_pid]
+        while stack:
+            for child in self.children.get(stack.pop(), ()):
+                pids.append(child)
+                stack.append(child)
+        return pids
+
+    def usage_for(self, root_pid: Optional[int]) -> Optional[ProcessUsage]:
+        return self.usage_of(self.subtree(root_pid) if root_pid else [], root_pid=root_pid)
+
+    def usage_of(self, pids: Iterable[int], *, root_pid: Optional[int] = None) -> Optional[ProcessUsage]:
+        """Usage summed over the live processes among ``pids`` (``None`` if none are alive)."""
+        infos = [self.processes[pid] for pid in dict.fromkeys(pids) if pid in self.processes]
+        if not infos:
+            return None
+        pss_values = [info.pss_bytes for info in infos]
+        uss_values = [info.uss_bytes for info in infos]
+        return ProcessUsage(
+            root_pid=root_pid or infos[0].pid,
+            pids=len(infos),
+            rss_bytes=sum(info.rss_bytes for info in infos),
+            pss_bytes=None if None in pss_values else sum(pss_values),  # type: ignore[arg-type]
+            uss_bytes=None if None in uss_values else sum(uss_values),  # type: ignore[arg-type]
+            cpu_percent=round(sum(info.cpu_percent for info in infos), 2),
+            browser_pids=sum(1 for info in infos if info.is_browser),
+        )
+
+    def orphaned_browser_pids(self) -> List[int]:
+        """Browser processes whose parent is gone or is not a Python process."""
+        orphans = []
+        for info in self.processes.values():
+            if not info.is_browser:
+                continue
+            parent = self.processes.get(info.ppid)
+            # Renderers and the Playwright driver's browser have a browser-like parent.
+            if parent is not None and (parent.is_browser or "python" in parent.name.lower()):
+                continue
+            orphans.append(info.pid)
+        return orphans
+
+
+def _is_browser(proc, name: str) -> bool:
+    lowered = name.lower()
+    if any(marker in lowered for marker in BROWSER_NAME_MARKERS):
+        return True
+    if lowered.startswith("node"):
+        # The Playwright driver runs under node; only pay for the cmdline read there.
+        try:
+            return "playwright" in " ".join(proc.cmdline()).lower()
+        except psutil.Error:
+            return False
+    return False
+
+
+def browser_root_pid(playwright_object: object) -> Optional[int]:
+    """PID of the Playwright driver behind a ``Playwright``/``Browser`` (best effort).
+
+    Each ``sync_playwright()`` runs its own driver, and the browser and its
+    renderers are its descendants, so this is the root to attribute a match's
+    processes from.
+    """
+    try:
+        impl = getattr(playwright_object, "_impl_obj", playwright_object)
+        transport = getattr(getattr(impl, "_connection", None), "_transport", None)
+        pid = getattr(getattr(transport, "_proc", None), "pid", None)
+    except Exception:
+        return None
+    return pid if isinstance(pid, int) else None
+
+
+def take_census(*, roots: Iterable[int] = (), collect_pss: bool = True) -> Optional[ProcessCensus]:
+    """Walk the process table once; PSS/USS are read for the subtrees under ``roots``."""
+    if psutil is None:
+        return None
+    started = time.perf_counter()
+    processes: List[ProcessInfo] = []
+    for proc in psutil.process_iter(_ATTRS):
+        info = proc.info
+        memory = info.get("memory_info")
+        name = info.get("name") or ""
+        processes.append(
+            ProcessInfo(
+                pid=info["pid"],
+                ppid=info.get("ppid") or 0,
+                name=name,
+                rss_bytes=memory.rss if memory is not None else 0,
+                cpu_percent=info.get("cpu_percent") or 0.0,
+                is_browser=_is_browser(proc, name),
+            )
+        )
+    census = ProcessCensus.from_processes(processes, taken_at=time.monotonic())
+    if collect_pss:
+        attributed = {pid for root in set(roots) for pid in census.subtree(root)}
+        for pid in attributed:
+            try:
+                full = psutil.Process(pid).memory_full_info()
+                pss, uss = getattr(full, "pss", None), getattr(full, "uss", None)
+            except psutil.Error:
+                continue
+            census.processes[pid] = census.processes[pid]._replace(pss_bytes=pss, uss_bytes=uss)
+    census.duration_seconds = time.perf_counter() - started
+    return census
+
+
+_census_lock = threading.Lock()
+_latest: Optional[ProcessCensus] = None
+_roots: set[int] = set()
+
+
+def current_census(*, max_age_seconds: float, roots: Iterable[int] = ()) -> Optional[ProcessCensus]:
+    """Return the latest census, taking a new one if it is older than ``max_age_seconds``."""
+    global _latest
+    with _census_lock:
+        _roots.update(pid for pid in roots if pid)
+        census = _latest
+        if census is not None and census.age_seconds() <= max_age_seconds:
+            return census
+        try:
+            census = take_census(roots=tuple(_roots), collect_pss=get_settings().process_census_collect_pss)
+        except Exception as exc:  # pragma: no cover - defensive: never fail a scraper on a census
+            logger.warning("census.scan_failed", metadata={"error": str(exc)})
+            return _latest
+        if census is not None:
+            # Forget roots whose browser has exited.
+            _roots.intersection_update(census.processes)
+            _latest = census
+        return census
+
+
+def latest_census() -> Optional[ProcessCensus]:
+    with _census_lock:
+        return _latest
+
+
+def reset_census() -> None:
+    global _latest
+    with _census_lock:
+        _latest = None
+        _roots.clear()
+
+
+ContextsProvider = Callable[[], Iterable[object]]
+
+
+class ProcessCensusSampler:
+    """Background thread that refreshes the census and publishes it."""
+
+    def __init__(self, contexts: ContextsProvider, *, settings: Optional[ScraperSettings] = None) -> None:
+        self._contexts = contexts
+        self._settings = settings or get_settings()
+        self._interval = self._settings.process_census_interval_seconds
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._samples = 0
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True, name="ProcessCensus")
+        self._thread.start()
+        logger.info("census.sampler.started", metadata={"interval_seconds": self._interval})
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def sample_once(self) -> Optional[ProcessCensus]:
+        contexts = list(self._contexts())
+        roots = [pid for context in contexts for pid in getattr(context, "tracked_pids", ())]
+        # Slightly under the interval so every tick takes a fresh walk.
+        census = current_census(max_age_seconds=self._interval / 2, roots=roots)
+        if census is None:
+            return None
+        self._samples += 1
+        for context in contexts:
+            try:
+                context.apply_census(census)  # type: ignore[attr-defined]
+            except Exception as exc:
+                logger.debug("census.apply_failed", metadata={"error": str(exc)})
+        try:
+            from src import monitoring
+
+            monitoring.set_process_census(census)
+            for context in contexts:
+                monitoring.update_context_metrics(context)  # type: ignore[arg-type]
+        except Exception as exc:  # pragma: no cover - metrics must never stop sampling
+            logger.debug("census.publish_failed", metadata={"error": str(exc)})
+        return census
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.sample_once()
+            except Exception as exc:
+                logger.error("census.sampler.error", metadata={"error": str(exc)})
+            self._stop.wait(self._interval)
+
+    def snapshot(self) -> Dict[str, object]:
+        census = latest_census()
+        return {
+            "running": bool(self._thread and self._thread.is_alive()),
+            "interval_seconds": self._interval,
+            "samples": self._samples,
+            "processes": len(census.processes) if census else 0,
+            "browser_processes": census.browser_process_count if census else 0,
+            "scan_ms": round(census.duration_seconds * 1000, 2) if census else None,
+            "age_seconds": round(census.age_seconds(), 2) if census else None,
+        }
+
+
+_sampler_lock = threading.Lock()
+_sampler: Optional[ProcessCensusSampler] = None
+
+
+def start_census_sampler(contexts: ContextsProvider, *, settings: Optional[ScraperSettings] = None) -> ProcessCensusSampler:
+    """Start the shared sampler (idempotent)."""
+    global _sampler
+    with _sampler_lock:
+        if _sampler is None:
+            _sampler = ProcessCensusSampler(contexts, settings=settings)
+        _sampler.start()
+        return _sampler
+
+
+def stop_census_sampler() -> None:
+    global _sampler
+    with _sampler_lock:
+        sampler, _sampler = _sampler, None
+    if sampler is not None:
+        sampler.stop()
+
+
+def census_snapshot() -> Dict[str, object]:
+    with _sampler_lock:
+        sampler = _sampler
+    if sampler is None:
+        census = latest_census()
+        return {"running": False, "processes": len(census.processes) if census else 0}
+    return sampler.snapshot()
+
+
+__all__ = [
+    "ProcessCensus",
+    "ProcessCensusSampler",
+    "ProcessInfo",
+    "ProcessUsage",
+    "browser_root_pid",
+    "census_snapshot",
+    "current_census",
+    "latest_census",
+    "reset_census",
+    "start_census_sampler",
+    "stop_census_sampler",
+    "take_census",
+]
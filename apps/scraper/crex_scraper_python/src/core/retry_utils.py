@@ -1,21 +1,52 @@
-"""Retry helpers with exponential backoff and optional jitter."""
+"""Retry helpers with exponential backoff and optional jitter.
+
+Besides the per-call backoff, retries can draw from a process-wide
+``RetryBudget`` per operation. The budget is a token bucket shared by every
+match thread, so a flapping backend cannot trigger a retry storm. It also
+carries shared backoff state: a ``Retry-After`` hint or an open
+``CircuitBreaker`` seen by one caller defers the retries of every caller.
+"""
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import random
+import threading
 import time
 from dataclasses import dataclass
-from typing import Any, Callable, Iterable, Optional, Tuple, Type, TypeVar
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Tuple, Type, TypeVar
 
-from src.config import get_settings
+from src.config import ScraperSettings, get_settings
+from src.core.bulkhead import BulkheadFullError
+from src.core.circuit_breaker import CircuitBreaker, CircuitBreakerOpenError
+from src.monitoring import record_retry_budget_exhausted, set_retry_budget_tokens
 
 T = TypeVar("T")
 
+TRANSIENT_STATUS_CODES = frozenset({429, 502, 503, 504})
+
 
 class RetryError(RuntimeError):
     """Raised when an operation exhausts its retry budget."""
 
 
+class RetryBudgetExhaustedError(RetryError):
+    """Raised when the shared retry budget for an operation has no tokens left."""
+
+
+class TransientHTTPError(RuntimeError):
+    """HTTP failure worth retrying (429/5xx), optionally carrying a Retry-After hint."""
+
+    def __init__(self, status_code: int, *, retry_after: Optional[float] = None, url: Optional[str] = None) -> None:
+        super().__init__(f"Transient HTTP {status_code}" + (f" from {url}" if url else ""))
+        self.status_code = status_code
+        self.retry_after = retry_after
+        self.url = url
+
+
 @dataclass(frozen=True)
 class RetryConfig:
     max_attempts: int = 5
@@ -24,6 +55,8 @@ class RetryConfig:
     jitter: float = 0.25
     retry_exceptions: Tuple[Type[Exception], ...] = (Exception,)
     logger: Optional[Callable[[dict[str, Any]], None]] = None
+    respect_retry_after: bool = True
+    max_retry_after: float = 120.0
 
     @classmethod
     def from_settings(cls, *, overrides: Optional[dict[str, Any]] = None) -> "RetryConfig":
@@ -33,6 +66,7 @@ class RetryConfig:
             "base_delay": settings.retry_base_delay_seconds,
             "max_delay": settings.retry_max_delay_seconds,
             "jitter": settings.retry_jitter_seconds,
+            "max_retry_after": settings.retry_after_max_seconds,
         }
         if overrides:
             data.update(overrides)
@@ -44,14 +78,303 @@ def _compute_delay(attempt: int, config: RetryConfig) -> float:
     return min(exponential, config.max_delay)
 
 
+# ----------------------------------------------------------------------
+# Retry-After handling
+# ----------------------------------------------------------------------
+def parse_retry_after(value: Optional[str], *, now: Optional[datetime] = None) -> Optional[float]:
+    """Parse a ``Retry-After`` header (delta-seconds or HTTP-date) into seconds."""
+
+    if value is None:
+        return None
+    text = str(value).strip()
+    if not text:
+        return None
+    try:
+        return max(float(text), 0.0)
+    except ValueError:
+        pass
+    try:
+        target = parsedate_to_datetime(text)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if target.tzinfo is None:
+        target = target.replace(tzinfo=timezone.utc)
+    reference = now or datetime.now(timezone.utc)
+    return max((target - reference).total_seconds(), 0.0)
+
+
+def retry_after_from_exception(exc: BaseException) -> Optional[float]:
+    """Extract a Retry-After hint from an exception (attribute or ``exc.response`` headers)."""
+
+    hint = getattr(exc, "retry_after", None)
+    if isinstance(hint, (int, float)):
+        return max(float(hint), 0.0)
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    if headers is not None:
+        try:
+            return parse_retry_after(headers.get("Retry-After"))
+        except Exception:  # pragma: no cover - defensive for exotic header objects
+            return None
+    return None
+
+
+def raise_for_transient_status(response: Any, *, url: Optional[str] = None) -> None:
+    """Raise ``TransientHTTPError`` for 429/5xx responses so callers can retry them."""
+
+    status = getattr(response, "status_code", None)
+    if status in TRANSIENT_STATUS_CODES:
+        headers = getattr(response, "headers", None) or {}
+        raise TransientHTTPError(status, retry_after=parse_retry_after(headers.get("Retry-After")), url=url)
+
+
+# ----------------------------------------------------------------------
+# Shared retry budgets
+# ----------------------------------------------------------------------
+class RetryBudget:
+    """Process-wide token bucket limiting retries for one operation.
+
+    First attempts are free; every retry spends one token. Tokens refill over
+    time and successful calls deposit a fraction of a token, so retries stay
+    proportional to healthy traffic.
+    """
+
+    def __init__(
+        self,
+        operation: str,
+        *,
+        capacity: float,
+        refill_per_second: float,
+        success_deposit: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.operation = operation
+        self.capacity = float(capacity)
+        self.refill_per_second = max(float(refill_per_second), 0.0)
+        self.success_deposit = max(float(success_deposit), 0.0)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._blocked_until = 0.0
+        self.exhausted_count = 0
+
+    @classmethod
+    def from_settings(cls, operation: str, settings: Optional[ScraperSettings] = None) -> "RetryBudget":
+        cfg = settings or get_settings()
+        return cls(
+            operation,
+            capacity=cfg.retry_budget_capacity,
+            refill_per_second=cfg.retry_budget_refill_per_second,
+            success_deposit=cfg.retry_budget_success_deposit,
+        )
+
+    def _refill_locked(self) -> None:
+        now = self._clock()
+        elapsed = max(now - self._updated, 0.0)
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.refill_per_second)
+        self._updated = now
+
+    @property
+    def tokens(self) -> float:
+        with self._lock:
+            self._refill_locked()
+            return self._tokens
+
+    def try_acquire(self) -> bool:
+        with self._lock:
+            self._refill_locked()
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                tokens = self._tokens
+                acquired = True
+            else:
+                self.exhausted_count += 1
+                tokens = self._tokens
+                acquired = False
+        set_retry_budget_tokens(self.operation, tokens)
+        if not acquired:
+            record_retry_budget_exhausted(self.operation)
+        return acquired
+
+    def record_success(self) -> None:
+        if not self.success_deposit:
+            return
+        with self._lock:
+            self._refill_locked()
+            self._tokens = min(self.capacity, self._tokens + self.success_deposit)
+
+    def defer(self, seconds: float) -> None:
+        """Ask every caller of this operation to hold off for ``seconds``."""
+
+        if seconds <= 0:
+            return
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, self._clock() + seconds)
+
+    def blocked_for(self) -> float:
+        with self._lock:
+            return max(self._blocked_until - self._clock(), 0.0)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "operation": self.operation,
+            "tokens": round(self.tokens, 2),
+            "capacity": self.capacity,
+            "blocked_for_seconds": round(self.blocked_for(), 2),
+            "exhausted_count": self.exhausted_count,
+        }
+
+
+_budgets_lock = threading.Lock()
+_budgets: Dict[str, RetryBudget] = {}
+
+
+def get_retry_budget(operation: str, settings: Optional[ScraperSettings] = None) -> RetryBudget:
+    """Return the shared budget for ``operation`` (created from settings on first use)."""
+
+    with _budgets_lock:
+        budget = _budgets.get(operation)
+        if budget is None:
+            budget = RetryBudget.from_settings(operation, settings)
+            _budgets[operation] = budget
+        return budget
+
+
+def retry_budget_snapshots() -> Iterable[Dict[str, Any]]:
+    with _budgets_lock:
+        budgets = list(_budgets.values())
+    return [budget.snapshot() for budget in budgets]
+
+
+def reset_retry_budgets() -> None:
+    with _budgets_lock:
+        _budgets.clear()
+
+
+# ----------------------------------------------------------------------
+# Decorators
+# ----------------------------------------------------------------------
+class _RetryPolicy:
+    """Attempt bookkeeping shared by the sync and async decorators."""
+
+    def __init__(
+        self,
+        func: Callable[..., Any],
+        config: RetryConfig,
+        rng: Callable[[], float],
+        on_retry: Optional[Callable[[int, Exception, float], None]],
+        budget: Optional[RetryBudget],
+        breaker: Optional[CircuitBreaker],
+    ) -> None:
+        self.name = getattr(func, "__name__", "<callable>")
+        self.config = config
+        self.rng = rng
+        self.on_retry = on_retry
+        self.budget = budget
+        self.breaker = breaker
+
+    def initial_wait(self) -> float:
+        """Shared backoff the first attempt must honour (or raise if it is too long)."""
+
+        wait = self._shared_wait()
+        if wait > self.config.max_delay:
+            raise RetryBudgetExhaustedError(
+                f"Operation {self.name} is backing off for {wait:.1f}s (shared backpressure)"
+            )
+        return wait
+
+    def before_attempt(self) -> None:
+        if self.breaker is not None:
+            self.breaker.before_call()
+
+    def on_success(self) -> None:
+        if self.breaker is not None:
+            self.breaker.record_success()
+        if self.budget is not None:
+            self.budget.record_success()
+
+    def on_failure(self, attempt: int, exc: Exception) -> Optional[float]:
+        """Return the delay before the next attempt, or None to stop retrying."""
+
+        if self.breaker is not None:
+            self.breaker.record_failure()
+        retry_after = retry_after_from_exception(exc) if self.config.respect_retry_after else None
+        if retry_after is not None:
+            retry_after = min(retry_after, self.config.max_retry_after)
+            if self.budget is not None:
+                self.budget.defer(retry_after)
+        if attempt >= self.config.max_attempts:
+            return None
+        if self.budget is not None and not self.budget.try_acquire():
+            raise RetryBudgetExhaustedError(
+                f"Retry budget for {self.budget.operation} exhausted after {attempt} attempt(s) of {self.name}"
+            ) from exc
+
+        delay = _compute_delay(attempt, self.config)
+        jitter = self.config.jitter * self.rng()
+        total_delay = max(delay + jitter, retry_after or 0.0, self._shared_wait())
+
+        if self.config.logger:
+            self.config.logger(
+                {
+                    "event": "retry",
+                    "function": self.name,
+                    "attempt": attempt,
+                    "max_attempts": self.config.max_attempts,
+                    "delay": total_delay,
+                    "base_delay": delay,
+                    "jitter": jitter,
+                    "retry_after": retry_after,
+                    "error_type": exc.__class__.__name__,
+                    "error": str(exc),
+                }
+            )
+        if self.on_retry:
+            self.on_retry(attempt, exc, total_delay)
+        return total_delay
+
+    def on_fatal(self) -> None:
+        if self.breaker is not None:
+            self.breaker.record_failure()
+
+    def exhausted(self) -> RetryError:
+        return RetryError(f"Operation {self.name} failed after {self.config.max_attempts} attempts")
+
+    def _shared_wait(self) -> float:
+        wait = self.budget.blocked_for() if self.budget is not None else 0.0
+        if self.breaker is not None:
+            wait = max(wait, self.breaker.open_remaining_seconds())
+        return wait
+
+
+def _build_policy(
+    func: Callable[..., Any],
+    config: Optional[RetryConfig],
+    rng: Callable[[], float],
+    on_retry: Optional[Callable[[int, Exception, float], None]],
+    budget: Optional[RetryBudget],
+    breaker: Optional[CircuitBreaker],
+) -> _RetryPolicy:
+    return _RetryPolicy(func, config or RetryConfig.from_settings(), rng, on_retry, budget, breaker)
+
+
 def retryable(
     *,
     config: Optional[RetryConfig] = None,
     sleep: Callable[[float], None] = time.sleep,
     rng: Callable[[], float] = random.random,
     on_retry: Optional[Callable[[int, Exception, float], None]] = None,
+    budget: Optional[RetryBudget] = None,
+    breaker: Optional[CircuitBreaker] = None,
 ) -> Callable[[Callable[..., T]], Callable[..., T]]:
-    """Decorator that retries sync function calls with exponential backoff."""
+    """Decorator that retries sync function calls with exponential backoff.
+
+    ``budget`` shares retry tokens and backoff hints across callers; ``breaker``
+    gates each attempt and stops retrying as soon as it opens.
+    """
 
     retry_config = config or RetryConfig.from_settings()
 
@@ -59,52 +382,108 @@ def retryable(
         raise ValueError("max_attempts must be >= 1")
 
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        @functools.wraps(func)
         def wrapped(*args: Any, **kwargs: Any) -> T:
+            policy = _build_policy(func, retry_config, rng, on_retry, budget, breaker)
+            wait = policy.initial_wait()
+            if wait > 0:
+                sleep(wait)
             attempt = 0
             last_exception: Optional[Exception] = None
 
             while attempt < retry_config.max_attempts:
+                policy.before_attempt()
                 try:
-                    return func(*args, **kwargs)
+                    result = func(*args, **kwargs)
+                except (CircuitBreakerOpenError, BulkheadFullError):
+                    # Shared failure/saturation state: retrying would only be rejected again.
+                    raise
                 except retry_config.retry_exceptions as exc:  # type: ignore[misc]
                     attempt += 1
                     last_exception = exc
-                    if attempt >= retry_config.max_attempts:
+                    delay = policy.on_failure(attempt, exc)
+                    if delay is None:
                         break
+                    sleep(delay)
+                except Exception:
+                    policy.on_fatal()
+                    raise
+                else:
+                    policy.on_success()
+                    return result
+
+            raise policy.exhausted() from last_exception
+
+        return wrapped
+
+    return decorator
 
-                    delay = _compute_delay(attempt, retry_config)
-                    jitter = retry_config.jitter * rng()
-                    total_delay = delay + jitter
-
-                    if retry_config.logger:
-                        retry_config.logger(
-                            {
-                                "event": "retry",
-                                "function": getattr(func, "__name__", "<callable>"),
-                                "attempt": attempt,
-                                "max_attempts": retry_config.max_attempts,
-                                "delay": total_delay,
-                                "base_delay": delay,
-                                "jitter": jitter,
-                                "error_type": exc.__class__.__name__,
-                                "error": str(exc),
-                            }
-                        )
-
-                    if on_retry:
-                        on_retry(attempt, exc, total_delay)
-
-                    sleep(total_delay)
+
+def async_retryable(
+    *,
+    config: Optional[RetryConfig] = None,
+    sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    rng: Callable[[], float] = random.random,
+    on_retry: Optional[Callable[[int, Exception, float], None]] = None,
+    budget: Optional[RetryBudget] = None,
+    breaker: Optional[CircuitBreaker] = None,
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """Async counterpart of :func:`retryable` for coroutine functions."""
+
+    retry_config = config or RetryConfig.from_settings()
+
+    if retry_config.max_attempts < 1:
+        raise ValueError("max_attempts must be >= 1")
+
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        @functools.wraps(func)
+        async def wrapped(*args: Any, **kwargs: Any) -> T:
+            policy = _build_policy(func, retry_config, rng, on_retry, budget, breaker)
+            wait = policy.initial_wait()
+            if wait > 0:
+                await sleep(wait)
+            attempt = 0
+            last_exception: Optional[Exception] = None
+
+            while attempt < retry_config.max_attempts:
+                policy.before_attempt()
+                try:
+                    result = await func(*args, **kwargs)
+                except (CircuitBreakerOpenError, BulkheadFullError):
+                    raise
+                except retry_config.retry_exceptions as exc:  # type: ignore[misc]
+                    attempt += 1
+                    last_exception = exc
+                    delay = policy.on_failure(attempt, exc)
+                    if delay is None:
+                        break
+                    await sleep(delay)
                 except Exception:
+                    policy.on_fatal()
                     raise
+                else:
+                    policy.on_success()
+                    return result
 
-            raise RetryError(
-                f"Operation {getattr(func, '__name__', '<callable>')} failed after {retry_config.max_attempts} attempts"
-            ) from last_exception
+            raise policy.exhausted() from last_exception
 
         return wrapped
 
     return decorator
 
 
-__all__ = ["RetryConfig", "RetryError", "retryable"]
+__all__ = [
+    "RetryBudget",
+    "RetryBudgetExhaustedError",
+    "RetryConfig",
+    "RetryError",
+    "TransientHTTPError",
+    "async_retryable",
+    "get_retry_budget",
+    "parse_retry_after",
+    "raise_for_transient_status",
+    "reset_retry_budgets",
+    "retry_after_from_exception",
+    "retry_budget_snapshots",
+    "retryable",
+]
@@ -8,11 +8,6 @@ from datetime import datetime, timedelta, timezone
 from typing import Any, Callable, Dict, Iterable, List, Optional
 from urllib.parse import urlparse
 
-try:  # Optional dependency for type checking
-    import psutil  # type: ignore
-except Exception:  # pragma: no cover - psutil is optional during static analysis
-    psutil = None  # type: ignore
-
 from src.logging.adapters import get_logger
 
 from src.config import ScraperSettings, get_settings
@@ -21,6 +16,7 @@ try:  # Avoid circular import during type checking
     from typing import TYPE_CHECKING
 
     if TYPE_CHECKING:
+        from .process_census import ProcessCensus
         from .scraper_state import ScraperStateSnapshot
 except ImportError:
     TYPE_CHECKING = False  # type: ignore
@@ -52,6 +48,9 @@ class ScraperContext:
     cpu_percent: float = 0.0
     browser_pid: Optional[int] = None
     total_pids: int = 0  # Count of chromium/playwright related processes observed
+    memory_rss_bytes: int = 0
+    memory_pss_bytes: Optional[int] = None
+    memory_uss_bytes: Optional[int] = None
     polling_interval: float = field(default_factory=lambda: get_settings().polling_interval_seconds)
 
     def __post_init__(self) -> None:
@@ -66,6 +65,7 @@ class ScraperContext:
         self._restart_requested_at: Optional[datetime] = None
         self._restart_deadline: Optional[datetime] = None
         self._restart_metadata: Dict[str, object] = {}
+        self._tracked_pids: set[int] = set()
 
     # --- Derived properties -------------------------------------------------
 
@@ -75,11 +75,28 @@ class ScraperContext:
             reference = self._shutdown_time or utcnow()
             return (reference - self.start_time).total_seconds()
 
+    @property
+    def freshness_time(self) -> datetime:
+        """Observation time of the newest source data the backend has acknowledged.
+
+        Falls back to ``last_update_time`` (the context start, or the last
+        completed scrape job) until acknowledgements arrive, so a new scraper
+        gets the full staleness budget.
+        """
+        from src.monitoring.freshness import get_freshness_tracker
+
+        observed = get_freshness_tracker(self.settings).last_fresh_at(self.url)
+        with self._lock:
+            if observed is None:
+                return self.last_update_time
+            return max(self.last_update_time, datetime.fromtimestamp(observed, tz=timezone.utc))
+
     @property
     def staleness_seconds(self) -> float:
+        fresh = self.freshness_time
         with self._lock:
             reference = self._shutdown_time or utcnow()
-            return (reference - self.last_update_time).total_seconds()
+        return (reference - fresh).total_seconds()
 
     @property
     def health_status(self) -> str:
@@ -98,6 +115,14 @@ class ScraperContext:
             return "degraded"
         return "healthy"
 
+    @property
+    def tracked_pids(self) -> frozenset[int]:
+        """Browser processes attributed to this scraper at the last census."""
+        with self._lock:
+            if self.browser_pid is not None:
+                return frozenset(self._tracked_pids | {self.browser_pid})
+            return frozenset(self._tracked_pids)
+
     @property
     def shutdown_requested(self) -> bool:
         with self._lock:
@@ -164,36 +189,63 @@ class ScraperContext:
             self.total_errors += 1
 
     def update_resource_usage(self, process_pid: Optional[int] = None) -> None:
-        if psutil is None:
+        """Refresh usage from the shared process census (see ``process_census``).
+
+        Every context polled within one census interval reuses the same
+        process-table walk instead of scanning the host itself.
+        """
+        from .process_census import current_census
+
+        if process_pid is not None:
+            self.set_browser_pid(process_pid)
+        census = current_census(
+            max_age_seconds=self.settings.process_census_interval_seconds,
+            roots=self.tracked_pids,
+        )
+        if census is None:
             self._maybe_schedule_memory_restart()
             return
-        pid = process_pid or self.browser_pid
-        rss = None
-        cpu = None
-        if pid is not None:
-            try:
-                process = psutil.Process(pid)
-                rss = process.memory_info().rss
-                cpu = process.cpu_percent(interval=0.0)
-            except psutil.Error:
-                with self._lock:
-                    self.browser_pid = None
-        # Independent PID scan to catch leaks even if browser_pid missing
-        try:
-            chrome_like = 0
-            for proc in psutil.process_iter(['name', 'cmdline']):
-                name = (proc.info.get('name') or '').lower()
-                cmd = ' '.join(proc.info.get('cmdline') or []).lower()
-                if 'chrome' in name or 'chromium' in name or 'playwright' in cmd:
-                    chrome_like += 1
-            with self._lock:
-                self.total_pids = chrome_like
-                if rss is not None:
-                    self.memory_bytes = rss
-                if cpu is not None:
-                    self.cpu_percent = cpu if cpu is not None else self.cpu_percent
-        except Exception:
-            pass
+        self.apply_census(census)
+
+    def apply_census(self, census: "ProcessCensus") -> None:
+        """Attribute the browser subtree's usage from ``census`` to this context.
+
+        Processes seen under the root before stay attributed while they are
+        alive, so renderers reparented away from a crashed browser still
+        count against (and can restart) the match that leaked them.
+        """
+        with self._lock:
+            pid = self.browser_pid
+            previous = set(self._tracked_pids)
+        subtree = census.subtree(pid) if pid else []
+        leaked = [
+            tracked
+            for tracked in previous
+            if tracked not in subtree and tracked in census.processes and census.processes[tracked].is_browser
+        ]
+        pids = subtree + sorted(leaked)
+        usage = census.usage_of(pids, root_pid=pid)
+        with self._lock:
+            self._tracked_pids = set(pids)
+            if pid is not None and not subtree:
+                # The browser exited since it was registered.
+                self.browser_pid = None
+            if usage is not None:
+                self.memory_bytes = usage.memory_bytes
+                self.memory_rss_bytes = usage.rss_bytes
+                self.memory_pss_bytes = usage.pss_bytes
+                self.memory_uss_bytes = usage.uss_bytes
+                self.cpu_percent = usage.cpu_percent
+                self.total_pids = usage.pids
+            else:
+                if pid is not None or previous:
+                    # Everything we attributed has exited.
+                    self.memory_bytes = 0
+                    self.memory_rss_bytes = 0
+                    self.memory_pss_bytes = self.memory_uss_bytes = None
+                    self.cpu_percent = 0.0
+                # Without a root to attribute from, report the host-wide browser count.
+                self.total_pids = census.browser_process_count
         self._maybe_schedule_memory_restart(current_memory_bytes=self.memory_bytes, now=utcnow())
         # Per-context PID restart removed - using periodic container restart instead
 
@@ -203,8 +255,10 @@ class ScraperContext:
         self._maybe_schedule_memory_restart(current_memory_bytes=memory_bytes, now=utcnow())
 
     def set_browser_pid(self, pid: int) -> None:
+        """Register the root of this scraper's browser process tree (see ``browser_root_pid``)."""
         with self._lock:
             self.browser_pid = pid
+            self._tracked_pids = {pid}
 
     def set_polling_interval(self, interval_seconds: float) -> None:
         with self._lock:
@@ -335,11 +389,11 @@ class ScraperContext:
 
     def should_restart(self, *, now: Optional[datetime] = None) -> bool:
         reference = now or utcnow()
+        staleness = (reference - self.freshness_time).total_seconds()
         with self._lock:
             if self._shutdown_requested:
                 return False
             age = (reference - self.start_time).total_seconds()
-            staleness = (reference - self.last_update_time).total_seconds()
             if age >= self.settings.max_lifetime_seconds:
                 return True
             if staleness >= self.settings.staleness_threshold_seconds:
@@ -391,6 +445,7 @@ class ScraperContext:
     # --- Serialization ------------------------------------------------------
 
     def to_health_payload(self) -> dict[str, object]:
+        freshness_time = self.freshness_time
         with self._lock:
             restart_requested = self._restart_requested
             restart_reason = self._restart_reason
@@ -404,6 +459,7 @@ class ScraperContext:
                 "url": self.url,
                 "start_time": self.start_time.isoformat(),
                 "last_update": self.last_update_time.isoformat(),
+                "freshness_time": freshness_time.isoformat(),
                 "uptime_seconds": round(self.uptime_seconds, 2),
                 "staleness_seconds": round(self.staleness_seconds, 2),
                 "error_count": self.error_count,
@@ -411,6 +467,16 @@ class ScraperContext:
                 "total_updates": self.total_updates,
                 "status": self.health_status,
                 "memory_mb": round(self.memory_bytes / 1024 / 1024, 2),
+                "memory_breakdown_mb": {
+                    "rss": round(self.memory_rss_bytes / 1024 / 1024, 2),
+                    "pss": round(self.memory_pss_bytes / 1024 / 1024, 2)
+                    if self.memory_pss_bytes is not None
+                    else None,
+                    "uss": round(self.memory_uss_bytes / 1024 / 1024, 2)
+                    if self.memory_uss_bytes is not None
+                    else None,
+                },
+                "browser_pid": self.browser_pid,
                 "cpu_percent": round(self.cpu_percent, 2),
                 "total_pids": self.total_pids,
                 "polling_interval": self.polling_interval,
@@ -441,11 +507,17 @@ class ScraperContext:
         last_score: Optional[str] = None,
         last_wickets: Optional[int] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        code_dictionary: Optional[Dict[str, Any]] = None,
+        storage_state: Optional[Dict[str, Any]] = None,
+        match_info: Optional[Dict[str, Any]] = None,
+        sent_hashes: Optional[Dict[str, str]] = None,
     ) -> "ScraperStateSnapshot":
         """Create a state snapshot for persistence.
         
         This allows scrapers to save their progress before restart and resume
-        from the last known good state, preventing data duplication.
+        from the last known good state, preventing data duplication. The
+        code dictionary, browser storage state, match info and last-sent
+        digests let the restarted job skip its cold bootstrap.
         """
         from .scraper_state import ScraperStateSnapshot
 
@@ -458,6 +530,10 @@ class ScraperContext:
             last_wickets=last_wickets,
             last_update_timestamp=self.last_update_time.isoformat(),
             metadata=metadata or {},
+            code_dictionary=code_dictionary or {},
+            storage_state=storage_state,
+            match_info=match_info,
+            sent_hashes=dict(sent_hashes or {}),
         )
 
 
@@ -3,24 +3,42 @@
 This module provides lightweight checkpoint functionality to enable scrapers to
 resume from their last known good state after restart, preventing data duplication
 and ensuring continuity during memory-triggered or scheduled restarts.
+
+Snapshots are written behind: ``save`` only records the latest snapshot per
+match and a ``BatchWriter`` upserts them in one transaction on a pooled WAL
+connection. Payloads are stored as versioned, zlib-compressed JSON.
+
+Besides the scoring position, a snapshot carries what a restarted job needs
+to skip the cold bootstrap: the localStorage code dictionary, the Playwright
+storage state, the match info already sent and digests of the last payloads
+sent per channel (see ``payload_digest``).
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
 import sqlite3
 import threading
+import zlib
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 from src.logging.adapters import get_logger
 
 from src.config import ScraperSettings, get_settings
+from src.persistence.batch_writer import BatchWriter
+from src.persistence.db_pool import get_connection_pool
 
 logger = get_logger(component="scraper_state")
 
+# Payload encodings stored in ``state_snapshots.payload_version``.
+LEGACY_JSON_VERSION = 0  # plain JSON text in ``snapshot_data``
+ZLIB_JSON_VERSION = 1  # zlib-compressed compact JSON in ``payload``
+SNAPSHOT_CODEC_VERSION = ZLIB_JSON_VERSION
+
 
 def _utcnow() -> datetime:
     """Return current UTC time with timezone info."""
@@ -40,6 +58,21 @@ class ScraperStateSnapshot:
     last_update_timestamp: Optional[str] = None
     snapshot_timestamp: str = field(default_factory=lambda: _utcnow().isoformat())
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # Warm-restart state; absent from older snapshots.
+    code_dictionary: Dict[str, Any] = field(default_factory=dict)
+    storage_state: Optional[Dict[str, Any]] = None
+    match_info: Optional[Dict[str, Any]] = None
+    sent_hashes: Dict[str, str] = field(default_factory=dict)
+
+    def age_seconds(self, now: Optional[datetime] = None) -> Optional[float]:
+        """Seconds since the snapshot was taken, or ``None`` if unparseable."""
+        try:
+            taken = datetime.fromisoformat(self.snapshot_timestamp)
+        except (TypeError, ValueError):
+            return None
+        if taken.tzinfo is None:
+            taken = taken.replace(tzinfo=timezone.utc)
+        return ((now or _utcnow()) - taken).total_seconds()
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialize to dictionary."""
@@ -59,13 +92,51 @@ class ScraperStateSnapshot:
             "last_update_timestamp",
             "snapshot_timestamp",
             "metadata",
+            "code_dictionary",
+            "storage_state",
+            "match_info",
+            "sent_hashes",
         }
         kwargs = {k: v for k, v in data.items() if k in known_fields}
         return cls(**kwargs)
 
 
+def payload_digest(value: Any) -> str:
+    """Short, order-stable digest of a JSON-compatible payload.
+
+    Sets are digested as sorted lists so that the same texts in a different
+    order compare equal.
+    """
+    if isinstance(value, (set, frozenset)):
+        value = sorted(value)
+    raw = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:16]
+
+
+def encode_snapshot(snapshot: "ScraperStateSnapshot", *, level: int = 1) -> bytes:
+    """Encode a snapshot with the current codec (see ``SNAPSHOT_CODEC_VERSION``)."""
+    raw = json.dumps(snapshot.to_dict(), separators=(",", ":")).encode("utf-8")
+    return zlib.compress(raw, level)
+
+
+def decode_snapshot(version: int, payload: Optional[bytes], legacy_text: Optional[str]) -> "ScraperStateSnapshot":
+    """Decode a stored snapshot; raises ``ValueError`` for unknown versions."""
+    if version == ZLIB_JSON_VERSION:
+        data = json.loads(zlib.decompress(payload or b""))
+    elif version == LEGACY_JSON_VERSION:
+        data = json.loads(legacy_text or "")
+    else:
+        raise ValueError(f"Unknown snapshot payload version {version}")
+    return ScraperStateSnapshot.from_dict(data)
+
+
 class StateStore:
-    """Persistent storage for scraper state snapshots using SQLite."""
+    """Persistent storage for scraper state snapshots using SQLite.
+
+    ``save`` is write-behind: the newest snapshot per match is kept in memory
+    and flushed in batches, so snapshotting every tick stays cheap. Reads see
+    pending snapshots; ``flush``/``close`` force them to disk.
+    """
 
     def __init__(
         self,
@@ -78,75 +149,135 @@ class StateStore:
             Path(self._settings.sqlite_db_path).parent / "scraper_state.db"
         )
         self._lock = threading.RLock()
+        self._pending: Dict[str, ScraperStateSnapshot] = {}
+        # Serialises flushes with deletes, so a flush that read a snapshot
+        # before ``delete`` cannot write it back afterwards. ``save`` never
+        # takes it and so never waits on the database.
+        self._write_lock = threading.Lock()
+        self._compression_level = self._settings.state_store_compression_level
+        self._pool = get_connection_pool(self._db_path, settings=self._settings)
         self._initialize_db()
+        self._writer = BatchWriter(
+            self._pool,
+            self._persist_pending,
+            settings=self._settings,
+            batch_size=self._settings.state_store_batch_size,
+            flush_interval=self._settings.state_store_flush_interval_seconds,
+            name="state_store",
+        )
 
     def _initialize_db(self) -> None:
-        """Create state snapshot table if it doesn't exist."""
-        with self._lock:
-            with sqlite3.connect(self._db_path, timeout=10.0) as conn:
+        """Create the snapshot table (migrating older layouts) and its index."""
+        with self._pool.get_connection() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS state_snapshots (
+                    match_id TEXT PRIMARY KEY,
+                    url TEXT NOT NULL,
+                    snapshot_data TEXT NOT NULL,
+                    snapshot_timestamp TEXT NOT NULL,
+                    created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+                )
+                """
+            )
+            columns = {row["name"] for row in conn.execute("PRAGMA table_info(state_snapshots)")}
+            if "payload" not in columns:
+                conn.execute("ALTER TABLE state_snapshots ADD COLUMN payload BLOB")
+            if "payload_version" not in columns:
                 conn.execute(
-                    """
-                    CREATE TABLE IF NOT EXISTS state_snapshots (
-                        match_id TEXT PRIMARY KEY,
-                        url TEXT NOT NULL,
-                        snapshot_data TEXT NOT NULL,
-                        snapshot_timestamp TEXT NOT NULL,
-                        created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
-                    )
-                    """
+                    "ALTER TABLE state_snapshots ADD COLUMN payload_version INTEGER NOT NULL DEFAULT 0"
                 )
-                conn.commit()
+            if "payload_size" not in columns:
+                conn.execute("ALTER TABLE state_snapshots ADD COLUMN payload_size INTEGER")
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_state_snapshots_updated_at ON state_snapshots (updated_at)"
+            )
+            conn.commit()
+
+    # ------------------------------------------------------------------
 
-    def save(self, snapshot: ScraperStateSnapshot) -> None:
-        """Persist a state snapshot."""
+    def save(self, snapshot: ScraperStateSnapshot, *, critical: bool = False) -> None:
+        """Queue a snapshot; ``critical`` writes it (and only it) synchronously."""
         with self._lock:
-            snapshot_json = json.dumps(snapshot.to_dict())
-            with sqlite3.connect(self._db_path, timeout=10.0) as conn:
-                conn.execute(
-                    """
-                    INSERT INTO state_snapshots 
-                        (match_id, url, snapshot_data, snapshot_timestamp, updated_at)
-                    VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
-                    ON CONFLICT(match_id) DO UPDATE SET
-                        snapshot_data = excluded.snapshot_data,
-                        snapshot_timestamp = excluded.snapshot_timestamp,
-                        updated_at = CURRENT_TIMESTAMP
-                    """,
-                    (
-                        snapshot.match_id,
-                        snapshot.url,
-                        snapshot_json,
-                        snapshot.snapshot_timestamp,
-                    ),
-                )
-                conn.commit()
+            self._pending[snapshot.match_id] = snapshot
+        self._writer.add(snapshot.match_id, critical=critical)
+
+    def flush(self) -> int:
+        """Write every pending snapshot now; returns the number of queued saves flushed."""
+        return self._writer.flush()
+
+    def close(self) -> None:
+        """Flush pending snapshots and stop the background writer."""
+        self._writer.shutdown()
+
+    def _persist_pending(self, conn: Any, match_ids: Sequence[str]) -> None:
+        with self._write_lock:
+            self._write_pending(conn, match_ids)
 
-        logger.info(
-            "state.snapshot.saved",
-            metadata={
-                "match_id": snapshot.match_id,
-                "url": snapshot.url,
-                "timestamp": snapshot.snapshot_timestamp,
-            },
+    def _write_pending(self, conn: Any, match_ids: Sequence[str]) -> None:
+        with self._lock:
+            batch = [self._pending[match_id] for match_id in dict.fromkeys(match_ids) if match_id in self._pending]
+        if not batch:
+            return
+
+        rows = []
+        for snapshot in batch:
+            payload = encode_snapshot(snapshot, level=self._compression_level)
+            rows.append(
+                (
+                    snapshot.match_id,
+                    snapshot.url,
+                    snapshot.snapshot_timestamp,
+                    sqlite3.Binary(payload),
+                    SNAPSHOT_CODEC_VERSION,
+                    len(payload),
+                )
+            )
+        conn.executemany(
+            """
+            INSERT INTO state_snapshots
+                (match_id, url, snapshot_data, snapshot_timestamp, payload, payload_version, payload_size, updated_at)
+            VALUES (?, ?, '', ?, ?, ?, ?, CURRENT_TIMESTAMP)
+            ON CONFLICT(match_id) DO UPDATE SET
+                url = excluded.url,
+                snapshot_data = '',
+                snapshot_timestamp = excluded.snapshot_timestamp,
+                payload = excluded.payload,
+                payload_version = excluded.payload_version,
+                payload_size = excluded.payload_size,
+                updated_at = CURRENT_TIMESTAMP
+            """,
+            rows,
         )
+        conn.commit()
+
+        with self._lock:
+            for snapshot in batch:
+                # A newer save may have arrived while we were writing.
+                if self._pending.get(snapshot.match_id) is snapshot:
+                    del self._pending[snapshot.match_id]
+
+        logger.debug("state.snapshot.flushed", metadata={"count": len(batch)})
+
+    # ------------------------------------------------------------------
 
     def load(self, match_id: str) -> Optional[ScraperStateSnapshot]:
         """Load the most recent state snapshot for a match."""
         with self._lock:
-            with sqlite3.connect(self._db_path, timeout=10.0) as conn:
-                conn.row_factory = sqlite3.Row
-                cursor = conn.execute(
-                    """
-                    SELECT snapshot_data, snapshot_timestamp
-                    FROM state_snapshots
-                    WHERE match_id = ?
-                    ORDER BY updated_at DESC
-                    LIMIT 1
-                    """,
-                    (match_id,),
-                )
-                row = cursor.fetchone()
+            pending = self._pending.get(match_id)
+        if pending is not None:
+            return ScraperStateSnapshot.from_dict(pending.to_dict())
+
+        with self._pool.get_connection() as conn:
+            row = conn.execute(
+                """
+                SELECT payload_version, payload, snapshot_data
+                FROM state_snapshots
+                WHERE match_id = ?
+                """,
+                (match_id,),
+            ).fetchone()
 
         if not row:
             logger.debug(
@@ -156,8 +287,7 @@ class StateStore:
             return None
 
         try:
-            data = json.loads(row["snapshot_data"])
-            snapshot = ScraperStateSnapshot.from_dict(data)
+            snapshot = decode_snapshot(row["payload_version"], row["payload"], row["snapshot_data"])
             logger.info(
                 "state.snapshot.loaded",
                 metadata={
@@ -166,7 +296,7 @@ class StateStore:
                 },
             )
             return snapshot
-        except (json.JSONDecodeError, TypeError, KeyError) as exc:
+        except (ValueError, zlib.error, TypeError, KeyError) as exc:
             logger.error(
                 "state.snapshot.corrupt",
                 metadata={
@@ -179,14 +309,16 @@ class StateStore:
 
     def delete(self, match_id: str) -> bool:
         """Delete a state snapshot (e.g., when match completes)."""
-        with self._lock:
-            with sqlite3.connect(self._db_path, timeout=10.0) as conn:
+        with self._write_lock:
+            with self._lock:
+                had_pending = self._pending.pop(match_id, None) is not None
+            with self._pool.get_connection() as conn:
                 cursor = conn.execute(
                     "DELETE FROM state_snapshots WHERE match_id = ?",
                     (match_id,),
                 )
                 conn.commit()
-                deleted = cursor.rowcount > 0
+                deleted = cursor.rowcount > 0 or had_pending
 
         if deleted:
             logger.info(
@@ -201,26 +333,37 @@ class StateStore:
 
         return deleted
 
+    def list_metadata(self) -> List[Dict[str, Any]]:
+        """List stored snapshots without decoding their payloads (newest first)."""
+        self.flush()
+        with self._pool.get_connection() as conn:
+            rows = conn.execute(
+                """
+                SELECT match_id, url, snapshot_timestamp, updated_at, payload_version,
+                       COALESCE(payload_size, length(snapshot_data)) AS payload_size
+                FROM state_snapshots
+                ORDER BY updated_at DESC
+                """
+            ).fetchall()
+        return [dict(row) for row in rows]
+
     def list_all(self) -> list[ScraperStateSnapshot]:
         """List all stored state snapshots."""
-        with self._lock:
-            with sqlite3.connect(self._db_path, timeout=10.0) as conn:
-                conn.row_factory = sqlite3.Row
-                cursor = conn.execute(
-                    """
-                    SELECT snapshot_data
-                    FROM state_snapshots
-                    ORDER BY updated_at DESC
-                    """
-                )
-                rows = cursor.fetchall()
+        self.flush()
+        with self._pool.get_connection() as conn:
+            rows = conn.execute(
+                """
+                SELECT payload_version, payload, snapshot_data
+                FROM state_snapshots
+                ORDER BY updated_at DESC
+                """
+            ).fetchall()
 
         snapshots = []
         for row in rows:
             try:
-                data = json.loads(row["snapshot_data"])
-                snapshots.append(ScraperStateSnapshot.from_dict(data))
-            except (json.JSONDecodeError, TypeError, KeyError) as exc:
+                snapshots.append(decode_snapshot(row["payload_version"], row["payload"], row["snapshot_data"]))
+            except (ValueError, zlib.error, TypeError, KeyError) as exc:
                 logger.warning(
                     "state.snapshot.corrupt_skip",
                     metadata={"error": str(exc)},
@@ -231,17 +374,50 @@ class StateStore:
 
     def clear_all(self) -> int:
         """Clear all state snapshots. Returns count deleted."""
-        with self._lock:
-            with sqlite3.connect(self._db_path, timeout=10.0) as conn:
-                cursor = conn.execute("DELETE FROM state_snapshots")
-                conn.commit()
-                count = cursor.rowcount
+        self.flush()
+        with self._write_lock, self._pool.get_connection() as conn:
+            cursor = conn.execute("DELETE FROM state_snapshots")
+            conn.commit()
+            count = cursor.rowcount
 
         logger.info("state.snapshots.cleared", metadata={"count": count})
         return count
 
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            pending = len(self._pending)
+        return {"pending_snapshots": pending, **self._writer.get_stats()}
+
+
+_store_lock = threading.Lock()
+_store: Optional[StateStore] = None
+
+
+def get_state_store(*, settings: Optional[ScraperSettings] = None) -> StateStore:
+    """Return the process-wide store shared by every match job."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = StateStore(settings=settings)
+        return _store
+
+
+def close_state_store() -> None:
+    """Flush and drop the shared store (used on shutdown)."""
+    global _store
+    with _store_lock:
+        store, _store = _store, None
+    if store is not None:
+        store.close()
+
 
 __all__ = [
+    "SNAPSHOT_CODEC_VERSION",
     "ScraperStateSnapshot",
     "StateStore",
+    "close_state_store",
+    "decode_snapshot",
+    "encode_snapshot",
+    "get_state_store",
+    "payload_digest",
 ]
@@ -1,9 +1,10 @@
+import hmac
 import logging
 from datetime import datetime, timedelta
 from typing import Optional
 from uuid import uuid4
 
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request
 from flask_cors import CORS
 from playwright.sync_api import sync_playwright
 import requests
@@ -16,12 +17,26 @@ import os
 import logging_config
 from src import monitoring
 from src.config import get_settings
+from src.egress import batch_controller_snapshots, get_dispatcher, shutdown_dispatcher
+from src.core.bulkhead import bulkhead_snapshots
+from src.persistence.db_pool import ConnectionPoolError, close_connection_pools, get_connection_pool
+from src.persistence.ball_archive import ball_archive_snapshots, close_ball_archives
+from src.persistence.url_index import LiveUrlIndex
 from src.core.scraper_context import (
     ScraperContext,
     ScraperRegistry,
     derive_match_id,
     utcnow,
 )
+from src.core.match_info_cache import match_info_cache_snapshot
+from src.core.process_census import census_snapshot, start_census_sampler, stop_census_sampler
+from src.core.scraper_state import close_state_store
+from src.monitoring.freshness import get_freshness_tracker
+from src.monitoring.memory_growth import get_memory_tracker, start_memory_tracker, stop_memory_tracker
+from src.monitoring.profiler import ProfilerBusyError, get_profiler
+from src.monitoring.tracing import get_tracer, reset_tracer
+from src.monitoring.monitoring import record_static_parse
+from src.static_parser import extract_live_match_hrefs_static, fetch_document
 
 # Add parent directory to path to import root-level match data scraper
 parent_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -29,6 +44,9 @@ sys.path.insert(0, parent_dir)
 from crex_match_data_scraper import fetchData as fetch_match_data  # The detailed match scraper
 from src.shared import scraping_tasks
 from src.logging.adapters import get_logger, bind_correlation_id
+from src.logging.artifact_store import artifact_store_snapshot, shutdown_artifact_store
+from src.logging.capture import get_capture_registry
+from src.logging.pipeline import logging_pipeline_snapshot
 
 app = Flask(__name__)
 CORS(app, resources={
@@ -110,6 +128,17 @@ CONTAINER_UNHEALTHY = threading.Event()
 threading.Thread(target=_orphan_cleanup_worker, daemon=True).start()
 
 
+def start_background_services() -> None:
+    """Start the samplers the service entry point needs (idempotent).
+
+    Kept out of import time so importing this module (tests, tooling) does
+    not start threads. One process-table walk per interval feeds every
+    context's memory/CPU/PID figures.
+    """
+    start_census_sampler(scraper_registry.all_contexts, settings=SETTINGS)
+    start_memory_tracker(scraper_registry.all_contexts, settings=SETTINGS)
+
+
 def _maybe_schedule_restart(
     *,
     url: str,
@@ -186,6 +215,7 @@ def _finalize_context(
     context.shutdown()
     scraper_registry.remove_by_url(url)
     monitoring.clear_scraper_gauges(match_id)
+    get_freshness_tracker(SETTINGS).forget(url)
     monitoring.set_active_scrapers(len(scraper_registry.all_contexts()))
 
     if task_state.get("status") != "cancelled":
@@ -332,7 +362,7 @@ def _launch_scrape_job(
                 task_state=task_state,
             )
 
-    thread = threading.Thread(target=scrape_with_context, daemon=True)
+    thread = threading.Thread(target=scrape_with_context, name=f"scraper-{match_id}", daemon=True)
     task_state["thread"] = thread
     scraping_tasks[url] = task_state
     thread.start()
@@ -506,6 +536,17 @@ def performance_metrics():
             "avg_response_time_ms": avg_response_time_ms,
         },
         
+        "egress_lanes": get_dispatcher().get_stats()["lanes"],
+        "adaptive_batching": batch_controller_snapshots(),
+        "bulkheads": bulkhead_snapshots(),
+        "live_url_index": get_live_url_index().snapshot(),
+        "ball_archives": ball_archive_snapshots(),
+        "process_census": census_snapshot(),
+        "freshness": get_freshness_tracker(SETTINGS).snapshot(),
+        "logging_pipeline": logging_pipeline_snapshot(),
+        "artifact_store": artifact_store_snapshot(),
+        "match_info_cache": match_info_cache_snapshot(),
+
         "batching_recommendation": {
             "should_enable_batching": should_batch,
             "readiness_score": min(readiness_score, 100),
@@ -546,6 +587,140 @@ def performance_metrics():
     return jsonify(response), 200
 
 
+def _debug_access_error():
+    """Error response unless /debug is enabled and the request carries the configured token.
+
+    The endpoints expose stacks, traces and page DOM, so they stay closed
+    until ``DEBUG_ENDPOINTS_ENABLED`` and a non-empty ``DEBUG_ENDPOINTS_TOKEN``
+    are both set.
+    """
+    if not SETTINGS.debug_endpoints_enabled or not SETTINGS.debug_token:
+        return jsonify({"error": "debug endpoints are disabled"}), 404
+    supplied = request.headers.get("X-Debug-Token", "")
+    if not hmac.compare_digest(supplied.encode("utf-8"), SETTINGS.debug_token.encode("utf-8")):
+        return jsonify({"error": "invalid or missing X-Debug-Token"}), 403
+    return None
+
+
+@app.route("/debug/profile", methods=["GET"])
+def debug_profile():
+    """Sample every thread's stack for ``seconds`` and return the aggregated profile.
+
+    ``format=collapsed`` returns flamegraph input as text; the default JSON
+    body carries the top-N summary plus the collapsed stacks.
+    """
+    denied = _debug_access_error()
+    if denied:
+        return denied
+    try:
+        seconds = float(request.args.get("seconds", 30))
+        sample_hz = float(request.args["hz"]) if "hz" in request.args else None
+        top = int(request.args.get("top", 20))
+    except ValueError:
+        return jsonify({"error": "seconds, hz and top must be numbers"}), 400
+
+    try:
+        result = get_profiler(SETTINGS).profile(seconds, sample_hz=sample_hz)
+    except ProfilerBusyError as exc:
+        return jsonify({"error": str(exc)}), 409
+
+    if request.args.get("format") == "collapsed":
+        return Response(result.collapsed() + "\n", mimetype="text/plain")
+    body = result.to_dict(top=top)
+    body["collapsed"] = result.collapsed().splitlines()
+    return jsonify(body), 200
+
+
+@app.route("/debug/traces", methods=["GET"])
+def debug_traces():
+    """Kept traces, newest first.
+
+    Filters: ``min_ms`` (trace wall time), ``name`` (root span),
+    ``match_id``, ``correlation_id`` and ``errors=1``; ``limit`` caps the
+    result and ``spans=0`` returns only the trace summaries.
+    """
+    denied = _debug_access_error()
+    if denied:
+        return denied
+    try:
+        limit = int(request.args.get("limit", 50))
+        min_duration_ms = float(request.args.get("min_ms", 0))
+    except ValueError:
+        return jsonify({"error": "limit and min_ms must be numbers"}), 400
+
+    tracer = get_tracer(SETTINGS)
+    traces = tracer.traces(
+        limit=limit,
+        min_duration_ms=min_duration_ms,
+        name=request.args.get("name"),
+        correlation_id=request.args.get("correlation_id"),
+        match_id=request.args.get("match_id"),
+        errors_only=request.args.get("errors") in {"1", "true"},
+    )
+    if request.args.get("spans") in {"0", "false"}:
+        traces = [{key: value for key, value in trace.items() if key != "spans"} for trace in traces]
+    return jsonify({"tracer": tracer.snapshot(), "traces": traces}), 200
+
+
+@app.route("/debug/traces/<trace_id>", methods=["GET"])
+def debug_trace(trace_id: str):
+    denied = _debug_access_error()
+    if denied:
+        return denied
+    trace = get_tracer(SETTINGS).get_trace(trace_id)
+    if trace is None:
+        return jsonify({"error": "trace not found (not kept or already evicted)"}), 404
+    return jsonify(trace), 200
+
+
+@app.route("/debug/memory", methods=["GET"])
+def debug_memory():
+    """Latest memory growth report; ``sample=1`` takes a snapshot first."""
+    denied = _debug_access_error()
+    if denied:
+        return denied
+    tracker = get_memory_tracker()
+    if tracker is None:
+        return jsonify({"error": "memory tracking is off (set MEMORY_TRACKING_ENABLED=true)"}), 409
+    if request.args.get("sample") in {"1", "true"}:
+        tracker.sample_once()
+    return jsonify(tracker.report()), 200
+
+
+@app.route("/debug/capture/<match_id>", methods=["GET", "POST", "DELETE"])
+def debug_capture(match_id: str):
+    """Arm (POST), inspect (GET) or end early (DELETE) a diagnostic capture.
+
+    ``match_id`` is the slug scrapers key their files and metrics by (the
+    match URL without ``/live``). POST takes ``ticks`` and ``seconds``. The
+    capture ends at whichever limit is reached first and is written to one
+    zip under ``<SCRAPER_ARTIFACT_ROOT>/captures``.
+    """
+    denied = _debug_access_error()
+    if denied:
+        return denied
+    registry = get_capture_registry(SETTINGS)
+
+    if request.method == "POST":
+        try:
+            ticks = int(request.args["ticks"]) if "ticks" in request.args else None
+            seconds = float(request.args["seconds"]) if "seconds" in request.args else None
+        except ValueError:
+            return jsonify({"error": "ticks and seconds must be numbers"}), 400
+        urls = [url for url in list(scraping_tasks) if derive_match_id(url.rsplit("/live", 1)[0]) == match_id]
+        if not urls:
+            return jsonify({"error": "no running scraper for this match_id"}), 404
+        session = registry.arm(match_id, ticks=ticks, seconds=seconds)
+        return jsonify({"armed": session.to_dict(), "urls": urls}), 202
+
+    if request.method == "DELETE":
+        if registry.session_for(match_id) is None:
+            return jsonify({"error": "no capture armed for this match_id"}), 404
+        registry.finish(match_id)
+
+    return jsonify(registry.status(match_id)), 200
+
+
 class ScrapeError(Exception):
     pass
 
@@ -555,78 +730,136 @@ class NetworkError(ScrapeError):
 class DOMChangeError(ScrapeError):
     pass
 
-DB_FILE = 'url_state.db'
+# Under the data directory (SCRAPER_DB_PATH), not the working directory:
+# WAL mode keeps -wal/-shm files next to the database.
+DB_FILE = SETTINGS.sqlite_db_path
+
+
+def _url_state_pool():
+    """Shared WAL-mode connection pool for the URL state / leads database."""
+    return get_connection_pool(DB_FILE)
+
+
+_url_index_lock = threading.Lock()
+_url_index: Optional[LiveUrlIndex] = None
+
+
+def get_live_url_index() -> LiveUrlIndex:
+    """In-memory live URL index, loaded from ``scraped_urls`` on first use."""
+    global _url_index
+    with _url_index_lock:
+        if _url_index is None:
+            _url_index = LiveUrlIndex(_url_state_pool())
+        return _url_index
+
+
+def close_live_url_index() -> None:
+    """Flush pending URL writes and drop the index (reloaded on next use)."""
+    global _url_index
+    with _url_index_lock:
+        index, _url_index = _url_index, None
+    if index is not None:
+        index.close()
+
 
 def initialize_database():
     """Creates database and tables if they don't exist."""
     logger.info("database.init", metadata={"message": "Initializing database"})
+    close_live_url_index()
     try:
-        conn = sqlite3.connect(DB_FILE)
-        cursor = conn.cursor()
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS scraped_urls (
-                url TEXT PRIMARY KEY,
-                deletion_attempts INTEGER DEFAULT 0
-            )
-        ''')
-        cursor.execute('DELETE FROM scraped_urls')
-        
-        # Add leads table creation
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS leads (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                company_name TEXT NOT NULL,
-                website TEXT,
-                contact_email TEXT,
-                phone_number TEXT,
-                notes TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        conn.commit()
+        with _url_state_pool().get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS scraped_urls (
+                    url TEXT PRIMARY KEY,
+                    deletion_attempts INTEGER DEFAULT 0
+                )
+            ''')
+            cursor.execute('DELETE FROM scraped_urls')
+
+            # Add leads table creation
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS leads (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    company_name TEXT NOT NULL,
+                    website TEXT,
+                    contact_email TEXT,
+                    phone_number TEXT,
+                    notes TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
         logger.info("database.clear", metadata={"message": "All URLs removed from the table"})
         logger.info("database.init_complete", metadata={"message": "Database initialized successfully"})
     except Exception as e:
         logger.error("database.init_error", metadata={"error": str(e)})
-    finally:
-        conn.close()
 
 def store_urls(urls):
+    """Mark ``urls`` live and persist immediately (discovery uses the write-behind index)."""
     logger.info("urls.store", metadata={"url_count": len(urls)})
     try:
-        conn = sqlite3.connect(DB_FILE)
-        cursor = conn.cursor()
-        cursor.executemany("INSERT INTO scraped_urls (url, deletion_attempts) VALUES (?, 0) ON CONFLICT(url) DO UPDATE SET deletion_attempts = 0", [(url,) for url in urls])
-        conn.commit()
+        index = get_live_url_index()
+        index.upsert(urls)
+        index.flush()
         logger.info("urls.store_complete", metadata={"message": "URLs stored successfully"})
     except Exception as e:
         logger.error("urls.store_error", metadata={"error": str(e)})
-    finally:
-        conn.close()
     
 
 def load_previous_urls():
     logger.info("urls.load", metadata={"message": "Loading previous URLs"})
     try:
-        conn = sqlite3.connect(DB_FILE)
-        cursor = conn.cursor()
-        cursor.execute("SELECT url FROM scraped_urls")
-        results = cursor.fetchall()
+        results = get_live_url_index().urls()
         logger.info("urls.load_complete", metadata={"count": len(results)})
-        return [row[0] for row in results]
+        return list(results)
     except Exception as e:
         logger.error("urls.load_error", metadata={"error": str(e)})
         return []
-    finally:
-        conn.close()
 
 def get_changes(new_urls):
     logger.info("urls.diff", metadata={"new_url_count": len(new_urls)})
-    previous_urls = load_previous_urls()
-    added_urls = set(new_urls) - set(previous_urls)
-    deleted_urls = set(previous_urls) - set(new_urls)
+    added_urls, deleted_urls = get_live_url_index().diff(new_urls)
     logger.info("urls.diff_complete", metadata={"added": len(added_urls), "deleted": len(deleted_urls)})
-    return added_urls, deleted_urls
+    return set(added_urls), set(deleted_urls)
+
+class _ListingBrowser:
+    """Chromium for the live listing, launched only when the static parse falls short.
+
+    The browser stays open for later cycles and is closed when the job stops.
+    """
+
+    def __init__(self) -> None:
+        self._playwright = None
+        self._browser = None
+        self._page = None
+
+    def page(self):
+        if self._page is None:
+            try:
+                self._playwright = sync_playwright().start()
+                self._browser = self._playwright.chromium.launch(
+                    headless=True,
+                    args=['--no-sandbox', '--disable-dev-shm-usage'],
+                )
+                self._page = self._browser.new_page()
+            except Exception:
+                self.close()
+                raise
+        return self._page
+
+    def close(self) -> None:
+        for resource, closer in (
+            (self._page, "close"),
+            (self._browser, "close"),
+            (self._playwright, "stop"),
+        ):
+            if resource is not None:
+                try:
+                    getattr(resource, closer)()
+                except Exception:
+                    pass
+        self._playwright = self._browser = self._page = None
+
 
 def job(stop_event: Optional[threading.Event] = None):
     stop_event = stop_event or SERVICE_SHUTDOWN_EVENT
@@ -638,65 +871,66 @@ def job(stop_event: Optional[threading.Event] = None):
             "shutdown_requested": stop_event.is_set(),
         },
     )
-    browser = None
-    page = None
+    listing_browser = _ListingBrowser()
 
     try:
-        with sync_playwright() as playwright:
-            browser = playwright.chromium.launch(
-                headless=True,
-                args=['--no-sandbox', '--disable-dev-shm-usage'],
-            )
-            page = browser.new_page()
-
-            while not stop_event.is_set():
-                try:
-                    scrape(page, "https://crex.com")
-                except Exception as exc:  # Broad catch to keep scheduler alive
-                    logger.error(
-                        "job.cycle_error",
-                        metadata={
-                            "error": str(exc),
-                            "error_type": type(exc).__name__,
-                            "correlation_id": correlation_id,
-                        },
-                    )
-                if stop_event.wait(60):
-                    break
-    finally:
-        if page is not None:
-            try:
-                page.close()
-            except Exception:
-                pass
-        if browser is not None:
+        while not stop_event.is_set():
             try:
-                browser.close()
-            except Exception:
-                pass
+                scrape(listing_browser.page, "https://crex.com")
+            except Exception as exc:  # Broad catch to keep scheduler alive
+                logger.error(
+                    "job.cycle_error",
+                    metadata={
+                        "error": str(exc).splitlines()[0] if str(exc) else "",
+                        "error_type": type(exc).__name__,
+                        "correlation_id": correlation_id,
+                    },
+                )
+            if stop_event.wait(60):
+                break
+    finally:
+        listing_browser.close()
         logger.info(
             "job.stop",
             metadata={"correlation_id": correlation_id, "shutdown_requested": stop_event.is_set()},
         )
 
-def scrape(page, url):
+def _live_match_hrefs_static(url):
+    """Match links from the server-rendered listing, or ``None`` when Chromium is needed."""
+
+    document = fetch_document(url, page="listing")
+    if document is None:
+        return None
+    hrefs = extract_live_match_hrefs_static(document, log_context={"url": url})
+    record_static_parse("listing", "complete" if hrefs is not None else "incomplete")
+    return hrefs
+
+def _live_match_hrefs_browser(page, url):
+    page.goto(url)
+    page.wait_for_timeout(10000)
+
+    if not page.query_selector("div.live-card"):
+        raise DOMChangeError("Cannot locate essential 'div.live-card' element")
+
+    live_divs = page.query_selector_all("div.live-card .live")
+
+    urls = []
+    for live_div in live_divs:
+        parent_element = live_div.query_selector(":scope >> xpath=..")
+        grandparent_element = parent_element.query_selector(":scope >> xpath=..")
+        sibling_element = grandparent_element.query_selector(":scope >> xpath=following-sibling::*[1]")
+        url = sibling_element.get_attribute('href')
+        urls.append(url)
+    return urls
+
+def scrape(open_page, url):
+    """Sync the live match list; ``open_page()`` supplies a Chromium page only when needed."""
+
     logging.info(f"Scraping URL: {url}")
     try:
-        page.goto(url)
-        page.wait_for_timeout(10000)
-        
-        if not page.query_selector("div.live-card"):  
-            raise DOMChangeError("Cannot locate essential 'div.live-card' element")
-        
-        live_divs = page.query_selector_all("div.live-card .live")
-
-        urls = []
-        for live_div in live_divs:
-            parent_element = live_div.query_selector(":scope >> xpath=..")
-            grandparent_element = parent_element.query_selector(":scope >> xpath=..")
-            sibling_element = grandparent_element.query_selector(":scope >> xpath=following-sibling::*[1]")
-            url = sibling_element.get_attribute('href')
-            urls.append(url)
+        urls = _live_match_hrefs_static(url)
+        if urls is None:
+            urls = _live_match_hrefs_browser(open_page(), url)
 
         logging.info(f"Scraped URLs: {urls}")
 
@@ -704,12 +938,9 @@ def scrape(page, url):
         urls = ['https://crex.com' + url for url in urls]
         logging.info(f"Full URLs: {urls}")
         
-        previous_urls = load_previous_urls()
-        added_urls, deleted_urls = get_changes(urls)    
-        if not previous_urls:
-            added_urls = urls
-            deleted_urls = []
-        store_urls(urls)
+        # O(1) per URL against the in-memory index; the table is updated write-behind.
+        added_urls, deleted_urls = get_live_url_index().update(urls)
+        logger.info("urls.diff_complete", metadata={"added": len(added_urls), "deleted": len(deleted_urls)})
         
         # CRITICAL: Sync complete list of live matches with backend on EVERY scrape
         # This allows backend to mark old/finished matches for deletion
@@ -753,6 +984,21 @@ def scrape(page, url):
         raise ScrapeError(f"Error during navigation: {e}")
 
 
+def _release_shared_resources(egress_timeout_seconds: float) -> None:
+    """Drain egress, stop the samplers and flush/close every shared store."""
+
+    # Deliver whatever the stopped scrapers left queued on the egress lanes.
+    shutdown_dispatcher(timeout=egress_timeout_seconds)
+    stop_census_sampler()
+    stop_memory_tracker()
+    shutdown_artifact_store()
+    close_ball_archives()
+    close_live_url_index()
+    close_state_store()
+    reset_tracer()
+    close_connection_pools()
+
+
 def shutdown_active_scrapes(timeout_seconds: float = 30.0, *, stop_event: Optional[threading.Event] = None) -> None:
     """Attempt to gracefully stop all active scraping threads."""
 
@@ -763,6 +1009,7 @@ def shutdown_active_scrapes(timeout_seconds: float = 30.0, *, stop_event: Option
     if not active_items:
         logger.info("shutdown.scrapers.none", metadata={"timeout_seconds": timeout_seconds})
         monitoring.set_active_scrapers(len(scraper_registry.all_contexts()))
+        _release_shared_resources(timeout_seconds)
         return
 
     logger.info(
@@ -809,6 +1056,8 @@ def shutdown_active_scrapes(timeout_seconds: float = 30.0, *, stop_event: Option
     else:
         logger.info("shutdown.scrapers.complete", metadata=metadata)
 
+    _release_shared_resources(max(0.0, deadline - time.perf_counter()))
+
 
 @app.route('/scrape-live-matches-link', methods=['GET'])
 def scrape_live_matches():
@@ -938,11 +1187,8 @@ def stop_scrape():
     scraping_tasks.pop(url, None)
 
     try:
-        with sqlite3.connect(DB_FILE) as conn:
-            cursor = conn.cursor()
-            cursor.execute("DELETE FROM scraped_urls WHERE url=?", (url,))
-            conn.commit()
-    except sqlite3.Error as exc:
+        get_live_url_index().remove(url)
+    except (sqlite3.Error, ConnectionPoolError) as exc:
         logger.warning("scrape.stop.cleanup_failed", metadata={"url": url, "error": str(exc)})
 
     return jsonify({'status': f'Stopped scraping for url: {url}'})
@@ -972,15 +1218,12 @@ def add_lead():
         if not company_name or not website:
             return jsonify({"error": "Company name and website are required"}), 400
 
-        conn = sqlite3.connect(DB_FILE)
-        cursor = conn.cursor()
-        cursor.execute("""
-            INSERT INTO leads (company_name, website, contact_email, phone_number, notes) 
-            VALUES (?, ?, ?, ?, ?)""",
-            (company_name, website, contact_email, phone_number, notes))
-        conn.commit()
-        lead_id = cursor.lastrowid
-        conn.close()
+        with _url_state_pool().get_connection() as conn:
+            cursor = conn.execute("""
+                INSERT INTO leads (company_name, website, contact_email, phone_number, notes) 
+                VALUES (?, ?, ?, ?, ?)""",
+                (company_name, website, contact_email, phone_number, notes))
+            lead_id = cursor.lastrowid
 
         logging.info(f"New lead added: {company_name}")
         response = jsonify({"message": "Lead added successfully", "lead_id": lead_id})
@@ -993,14 +1236,11 @@ def add_lead():
 @app.route("/view-leads", methods=["GET"])
 def view_leads():
     try:
-        conn = sqlite3.connect(DB_FILE)
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT id, company_name, website, contact_email, phone_number, notes, created_at 
-            FROM leads 
-            ORDER BY created_at DESC""")
-        leads = cursor.fetchall()
-        conn.close()
+        with _url_state_pool().get_connection() as conn:
+            leads = conn.execute("""
+                SELECT id, company_name, website, contact_email, phone_number, notes, created_at 
+                FROM leads 
+                ORDER BY created_at DESC""").fetchall()
 
         lead_list = []
         for lead in leads:
@@ -1024,28 +1264,22 @@ def view_leads():
 def update_lead(lead_id):
     try:
         data = request.json
-        conn = sqlite3.connect(DB_FILE)
-        cursor = conn.cursor()
-        
-        cursor.execute("SELECT * FROM leads WHERE id = ?", (lead_id,))
-        if not cursor.fetchone():
-            conn.close()
-            return jsonify({"error": "Lead not found"}), 404
-
-        update_fields = []
-        values = []
-        for field in ["company_name", "website", "contact_email", "phone_number", "notes"]:
-            if field in data:
-                update_fields.append(f"{field} = ?")
-                values.append(data[field])
-        
-        if update_fields:
-            values.append(lead_id)
-            query = f"UPDATE leads SET {', '.join(update_fields)} WHERE id = ?"
-            cursor.execute(query, values)
-            conn.commit()
-            
-        conn.close()
+        with _url_state_pool().get_connection() as conn:
+            if not conn.execute("SELECT 1 FROM leads WHERE id = ?", (lead_id,)).fetchone():
+                return jsonify({"error": "Lead not found"}), 404
+
+            update_fields = []
+            values = []
+            for field in ["company_name", "website", "contact_email", "phone_number", "notes"]:
+                if field in data:
+                    update_fields.append(f"{field} = ?")
+                    values.append(data[field])
+
+            if update_fields:
+                values.append(lead_id)
+                query = f"UPDATE leads SET {', '.join(update_fields)} WHERE id = ?"
+                conn.execute(query, values)
+
         logging.info(f"Lead {lead_id} updated successfully")
         return jsonify({"message": "Lead updated successfully"}), 200
 
@@ -1056,17 +1290,10 @@ def update_lead(lead_id):
 @app.route("/delete-lead/<int:lead_id>", methods=["DELETE"])
 def delete_lead(lead_id):
     try:
-        conn = sqlite3.connect(DB_FILE)
-        cursor = conn.cursor()
-        
-        cursor.execute("SELECT * FROM leads WHERE id = ?", (lead_id,))
-        if not cursor.fetchone():
-            conn.close()
-            return jsonify({"error": "Lead not found"}), 404
-
-        cursor.execute("DELETE FROM leads WHERE id = ?", (lead_id,))
-        conn.commit()
-        conn.close()
+        with _url_state_pool().get_connection() as conn:
+            if not conn.execute("SELECT 1 FROM leads WHERE id = ?", (lead_id,)).fetchone():
+                return jsonify({"error": "Lead not found"}), 404
+            conn.execute("DELETE FROM leads WHERE id = ?", (lead_id,))
         
         logging.info(f"Lead {lead_id} deleted successfully")
         return jsonify({"message": "Lead deleted successfully"}), 200
@@ -1077,4 +1304,5 @@ def delete_lead(lead_id):
     
 if __name__ == "__main__":
     initialize_database()
+    start_background_services()
     app.run(host="0.0.0.0", port=5000, debug=False, threaded=True)
\ No newline at end of file
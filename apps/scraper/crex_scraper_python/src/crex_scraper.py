@@ -15,19 +15,21 @@ from playwright.sync_api import (
 )
 from requests import RequestException
 from src.logging.adapters import get_logger
-from src.logging.diagnostics import capture_html_snapshot
+from src.logging.artifact_store import store_artifact
 
 from src.monitoring import record_scraper_retry
 try:  # Best-effort import; keep scraper decoupled if context not present
     from src.core.scraper_context import ScraperContext  # type: ignore
 except Exception:  # pragma: no cover - fallback when running standalone
     ScraperContext = None  # type: ignore
-from crex_scraper_python.parsers import (
+from src.parsers import (
     SelectorResolutionError,
-    extract_match_href,
-    select_all,
+    extract_live_match_hrefs,
 )
-from crex_scraper_python.retry_utils import RetryConfig, RetryError, retryable
+from src.static_parser import extract_live_match_hrefs_static, fetch_document
+from src.monitoring.monitoring import record_static_parse
+from src.core.retry_utils import RetryConfig, RetryError, get_retry_budget, retryable
+from src.core.process_census import browser_root_pid
 
 logger = get_logger(component="crex_scraper")
 
@@ -121,23 +123,37 @@ def _run_with_retry(operation: str, func: Callable[..., T], *args: Any, **kwargs
     def _on_retry(attempt: int, exc: Exception, delay: float) -> None:
         record_scraper_retry(operation)
 
-    wrapped = retryable(config=config, on_retry=_on_retry)(lambda: func(*args, **kwargs))
+    # Budget is shared by every match thread retrying the same operation.
+    wrapped = retryable(config=config, on_retry=_on_retry, budget=get_retry_budget(operation))(
+        lambda: func(*args, **kwargs)
+    )
     return wrapped()
 
 
 def _attempt_get_browser_pid(browser: Browser) -> Optional[int]:
-    """Attempt to extract the underlying Chromium process PID (best effort)."""
-    try:
-        impl = getattr(browser, "_impl_obj", None)
-        conn = getattr(impl, "_connection", None)
-        transport = getattr(conn, "_transport", None)
-        proc = getattr(transport, "_proc", None)
-        pid = getattr(proc, "pid", None)
-        if isinstance(pid, int):
-            return pid
-    except Exception:
+    """Attempt to extract the root PID of the browser's process tree (best effort)."""
+    return browser_root_pid(browser)
+
+
+def _scrape_static(url: str) -> Optional[list[str]]:
+    """Match links read from the server-rendered listing, or ``None`` to use Chromium."""
+
+    start = time.time()
+    document = fetch_document(url, page="listing")
+    if document is None:
         return None
-    return None
+    data = extract_live_match_hrefs_static(document, log_context={"url": url})
+    record_static_parse("listing", "complete" if data is not None else "incomplete")
+    if data is not None:
+        logger.info(
+            "extraction.complete",
+            metadata={
+                "url_count": len(data),
+                "parser": "static",
+                "total_duration_ms": int((time.time() - start) * 1000),
+            },
+        )
+    return data
 
 
 def scrape(url: str, context: Optional["ScraperContext"] = None) -> list[str]:
@@ -145,6 +161,9 @@ def scrape(url: str, context: Optional["ScraperContext"] = None) -> list[str]:
     stage_timings: dict[str, float] = {}
 
     logger.info("scrape.start", metadata={"url": url})
+    static_data = _scrape_static(url)
+    if static_data is not None:
+        return static_data
     try:
         with sync_playwright() as playwright:
             with ExitStack() as stack:
@@ -196,27 +215,38 @@ def scrape(url: str, context: Optional["ScraperContext"] = None) -> list[str]:
                 dom_start = time.time()
                 logger.info("dom.check", metadata={"selector_key": "live_match_badge"})
                 try:
-                    live_badges = select_all(
-                        page,
-                        "live_match_badge",
-                        log_context={"url": url},
-                        required=True,
-                    )
+                    # Badges and their match links come back from one in-page evaluation.
+                    data = extract_live_match_hrefs(page, log_context={"url": url})
                 except SelectorResolutionError as exc:
-                    html_content = page.content()
-                    artifact_path = capture_html_snapshot(html_content)
-                    logger.warning(
-                        "dom.selector.missing",
+                    if exc.selector_key == "live_match_badge":
+                        artifact = store_artifact(page.content(), kind="html", label="live_match_badge")
+                        logger.warning(
+                            "dom.selector.missing",
+                            metadata={
+                                "selector_key": exc.selector_key,
+                                "selectors": list(exc.selectors),
+                                "url": url,
+                                "artifact": str(artifact.path) if artifact else None,
+                                "remediation": "Check if site markup changed or selector fallback needs update",
+                            },
+                        )
+                        raise DOMChangeError(
+                            f"Cannot locate essential selector set '{exc.selector_key}'"
+                        ) from exc
+
+                    artifact = store_artifact(page.content(), kind="html", label="match_href")
+                    logger.error(
+                        "extraction.selector_failure",
                         metadata={
                             "selector_key": exc.selector_key,
                             "selectors": list(exc.selectors),
                             "url": url,
-                            "artifact": str(artifact_path),
-                            "remediation": "Check if site markup changed or selector fallback needs update",
+                            "badge_index": (exc.context or {}).get("badge_index"),
+                            "artifact": str(artifact.path) if artifact else None,
                         },
                     )
                     raise DOMChangeError(
-                        f"Cannot locate essential selector set '{exc.selector_key}'"
+                        "Unable to resolve match link for live match badge"
                     ) from exc
 
                 stage_timings["dom_eval"] = time.time() - dom_start
@@ -224,44 +254,17 @@ def scrape(url: str, context: Optional["ScraperContext"] = None) -> list[str]:
                     "dom.ready",
                     metadata={
                         "duration_ms": int(stage_timings["dom_eval"] * 1000),
-                        "candidate_count": len(live_badges),
+                        "candidate_count": len(data),
                     },
                 )
 
-                extract_start = time.time()
-                logger.info("extraction.start")
-                data: list[str] = []
-                for idx, live_badge in enumerate(live_badges):
-                    log_context = {"url": url, "badge_index": idx}
-                    try:
-                        item_url = extract_match_href(live_badge, log_context=log_context)
-                    except SelectorResolutionError as exc:
-                        html_content = page.content()
-                        artifact_path = capture_html_snapshot(html_content)
-                        logger.error(
-                            "extraction.selector_failure",
-                            metadata={
-                                "selector_key": exc.selector_key,
-                                "selectors": list(exc.selectors),
-                                "url": url,
-                                "badge_index": idx,
-                                "artifact": str(artifact_path),
-                            },
-                        )
-                        raise DOMChangeError(
-                            "Unable to resolve match link for live match badge"
-                        ) from exc
-
-                    data.append(item_url)
-
-                stage_timings["extraction"] = time.time() - extract_start
                 total_duration = time.time() - start_time
 
                 logger.info(
                     "extraction.complete",
                     metadata={
                         "url_count": len(data),
-                        "duration_ms": int(stage_timings["extraction"] * 1000),
+                        "duration_ms": int(stage_timings["dom_eval"] * 1000),
                         "total_duration_ms": int(total_duration * 1000),
                         "stage_timings": {k: int(v * 1000) for k, v in stage_timings.items()},
                     },
@@ -1,7 +1,9 @@
 import requests
 import os
 from src.logging.adapters import get_logger
+from src.core.bulkhead import BulkheadFullError, get_bulkhead
 from src.core.circuit_breaker import CircuitBreaker, CircuitBreakerOpenError
+from src.egress.serialization import get_payload_encoder
 
 logger = get_logger(component="cricket_data_service")
 
@@ -29,12 +31,15 @@ class CricketDataService:
             return response.json().get("token")
         
         try:
-            token = _auth_breaker.call(_fetch_token)
+            token = get_bulkhead("auth").call(_auth_breaker.call, _fetch_token)
             logger.info("auth.token.success")
             return token
         except CircuitBreakerOpenError:
             logger.warning("auth.token.circuit_open", metadata={"breaker": "backend_auth"})
             return None
+        except BulkheadFullError as exc:
+            logger.warning("auth.token.shed", metadata={"bulkhead": exc.name, "reason": exc.reason})
+            return None
         except Exception as e:
             logger.error("auth.token.error", metadata={"error": str(e)})
             return None  # Don't raise, just return None so scraping can continue
@@ -52,15 +57,17 @@ class CricketDataService:
             headers = {"Content-Type": "application/json"}
             if token:
                 headers["Authorization"] = f"Bearer {token}"
-            response = requests.post(add_matches_url, json=urls, headers=headers, timeout=2)
+            response = get_payload_encoder().post(add_matches_url, urls, headers=headers, timeout=2)
             response.raise_for_status()
             return response
         
         try:
-            _api_breaker.call(_post_matches)
+            get_bulkhead("cricket-data").call(_api_breaker.call, _post_matches)
             logger.info("matches.add.success", metadata={"url_count": len(urls)})
         except CircuitBreakerOpenError:
             logger.warning("matches.add.circuit_open", metadata={"breaker": "backend_api"})
+        except BulkheadFullError as exc:
+            logger.warning("matches.add.shed", metadata={"bulkhead": exc.name, "reason": exc.reason})
         except Exception as e:
             logger.error("matches.add.error", metadata={"error": str(e), "url": add_matches_url})
             # Don't raise - allow scraping to continue even if backend sync fails
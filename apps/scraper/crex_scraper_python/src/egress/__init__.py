@@ -0,0 +1,39 @@
+"""Outbound (egress) delivery to the cricket backend."""
+
+from .adaptive import (
+    AdaptiveBatchController,
+    BatchDecision,
+    batch_controller_snapshots,
+    get_batch_controller,
+)
+from .lanes import (
+    EgressDispatcher,
+    EgressLane,
+    classify_payload,
+    coalesce_key_for,
+    get_dispatcher,
+    shutdown_dispatcher,
+)
+from .serialization import (
+    PayloadEncoder,
+    encode_json,
+    get_payload_encoder,
+    prepare_payload,
+)
+
+__all__ = [
+    "AdaptiveBatchController",
+    "BatchDecision",
+    "batch_controller_snapshots",
+    "get_batch_controller",
+    "EgressDispatcher",
+    "EgressLane",
+    "classify_payload",
+    "coalesce_key_for",
+    "get_dispatcher",
+    "shutdown_dispatcher",
+    "PayloadEncoder",
+    "encode_json",
+    "get_payload_encoder",
+    "prepare_payload",
+]
@@ -0,0 +1,264 @@
+"""AIMD controller that tunes batch size and flush interval at runtime.
+
+The controller watches three signals:
+
+* backend p95 latency of recent sends,
+* backend error rate over the same window,
+* per-key (per-match) update rate.
+
+While the backend is healthy the flush interval shrinks additively so updates
+leave sooner; once latency or errors cross their targets it backs off
+multiplicatively. The interval never exceeds what the end-to-end freshness
+budget allows after subtracting the observed p95, and the batch size follows
+from how many updates a single key produces during one interval.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, Hashable, Optional, Tuple
+
+from src.config import ScraperSettings, get_settings
+from src.logging.adapters import get_logger
+from src.monitoring import record_batch_adjustment, set_batch_controller_state
+
+logger = get_logger(component="adaptive_batching")
+
+
+@dataclass(frozen=True)
+class BatchDecision:
+    batch_size: int
+    flush_interval_seconds: float
+
+
+def _percentile(values: list, fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, math.ceil(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+class AdaptiveBatchController:
+    """Thread-safe AIMD controller for batch size / flush interval decisions."""
+
+    def __init__(
+        self,
+        name: str,
+        settings: Optional[ScraperSettings] = None,
+        *,
+        initial_batch_size: Optional[int] = None,
+        initial_flush_interval: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        cfg = settings or get_settings()
+        self.name = name
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._min_batch = cfg.batch_min_size
+        self._max_batch = cfg.batch_max_size
+        self._min_interval = cfg.batch_min_flush_interval_seconds
+        self._max_interval = cfg.batch_max_flush_interval_seconds
+        self._freshness_budget = cfg.egress_freshness_budget_seconds
+        self._target_latency = cfg.batch_target_latency_seconds
+        self._max_error_rate = cfg.batch_max_error_rate
+        self._adjust_every = cfg.batch_adjust_interval_seconds
+        self._increase_step = max(self._min_interval, 0.05)
+        self._decrease_factor = 2.0
+        self._window_seconds = max(self._adjust_every * 6, 30.0)
+
+        self._batch_size = self._clamp_batch(initial_batch_size or cfg.batch_size)
+        self._flush_interval = self._clamp_interval(
+            initial_flush_interval or cfg.batch_flush_interval_seconds, p95=0.0
+        )
+        self._sends: Deque[Tuple[float, float, bool]] = deque(maxlen=512)
+        self._updates: Deque[Tuple[float, Hashable]] = deque(maxlen=4096)
+        self._last_adjust = clock()
+        self._last_p95 = 0.0
+        self._last_error_rate = 0.0
+        self._last_update_rate = 0.0
+        self._publish()
+
+    # ------------------------------------------------------------------
+    # Observations
+    # ------------------------------------------------------------------
+    def observe_update(self, key: Hashable = None) -> None:
+        with self._lock:
+            self._updates.append((self._clock(), key))
+        self._maybe_adjust()
+
+    def observe_send(self, latency_seconds: float, *, success: bool) -> None:
+        with self._lock:
+            self._sends.append((self._clock(), max(latency_seconds, 0.0), bool(success)))
+        self._maybe_adjust()
+
+    # ------------------------------------------------------------------
+    # Decisions
+    # ------------------------------------------------------------------
+    @property
+    def batch_size(self) -> int:
+        with self._lock:
+            return self._batch_size
+
+    @property
+    def flush_interval(self) -> float:
+        with self._lock:
+            return self._flush_interval
+
+    def decision(self) -> BatchDecision:
+        with self._lock:
+            return BatchDecision(self._batch_size, self._flush_interval)
+
+    def adjust(self) -> BatchDecision:
+        """Recompute the decision from the current observation window."""
+
+        with self._lock:
+            now = self._clock()
+            self._last_adjust = now
+            self._trim_locked(now)
+            latencies = [latency for _, latency, _ in self._sends]
+            p95 = _percentile(latencies, 0.95)
+            error_rate = (
+                sum(1 for _, _, ok in self._sends if not ok) / len(self._sends) if self._sends else 0.0
+            )
+            update_rate = self._peak_update_rate_locked(now)
+
+            previous = self._flush_interval
+            congested = bool(self._sends) and (
+                p95 > self._target_latency or error_rate > self._max_error_rate
+            )
+            if congested:
+                interval = previous * self._decrease_factor
+                direction = "backoff"
+            elif self._sends:
+                interval = previous - self._increase_step
+                direction = "tighten"
+            else:
+                interval = previous
+                direction = "hold"
+            self._flush_interval = self._clamp_interval(interval, p95=p95)
+            if update_rate > 0:
+                self._batch_size = self._clamp_batch(math.ceil(update_rate * self._flush_interval))
+            self._last_p95 = p95
+            self._last_error_rate = error_rate
+            self._last_update_rate = update_rate
+            decision = BatchDecision(self._batch_size, self._flush_interval)
+
+        if direction != "hold" and decision.flush_interval_seconds != previous:
+            record_batch_adjustment(self.name, direction)
+            logger.debug(
+                "adaptive_batching.adjust",
+                metadata={
+                    "controller": self.name,
+                    "direction": direction,
+                    "batch_size": decision.batch_size,
+                    "flush_interval_seconds": round(decision.flush_interval_seconds, 3),
+                    "p95_seconds": round(p95, 4),
+                    "error_rate": round(error_rate, 4),
+                    "update_rate": round(update_rate, 3),
+                },
+            )
+        self._publish()
+        return decision
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "batch_size": self._batch_size,
+                "flush_interval_seconds": round(self._flush_interval, 3),
+                "observed_p95_seconds": round(self._last_p95, 4),
+                "observed_error_rate": round(self._last_error_rate, 4),
+                "peak_update_rate_per_second": round(self._last_update_rate, 3),
+                "freshness_budget_seconds": self._freshness_budget,
+                "target_latency_seconds": self._target_latency,
+            }
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _maybe_adjust(self) -> None:
+        with self._lock:
+            due = self._clock() - self._last_adjust >= self._adjust_every
+        if due:
+            self.adjust()
+
+    def _trim_locked(self, now: float) -> None:
+        horizon = now - self._window_seconds
+        while self._sends and self._sends[0][0] < horizon:
+            self._sends.popleft()
+        while self._updates and self._updates[0][0] < horizon:
+            self._updates.popleft()
+
+    def _peak_update_rate_locked(self, now: float) -> float:
+        if not self._updates:
+            return 0.0
+        counts: Dict[Hashable, int] = {}
+        for _, key in self._updates:
+            counts[key] = counts.get(key, 0) + 1
+        span = max(now - self._updates[0][0], self._adjust_every, 1e-6)
+        return max(counts.values()) / span
+
+    def _clamp_batch(self, value: int) -> int:
+        return max(self._min_batch, min(self._max_batch, int(value)))
+
+    def _clamp_interval(self, value: float, *, p95: float) -> float:
+        # Queueing time plus delivery latency must fit inside the freshness budget.
+        ceiling = min(self._max_interval, max(self._freshness_budget - p95, self._min_interval))
+        return max(self._min_interval, min(ceiling, value))
+
+    def _publish(self) -> None:
+        with self._lock:
+            batch_size = self._batch_size
+            interval = self._flush_interval
+            p95 = self._last_p95
+            error_rate = self._last_error_rate
+        set_batch_controller_state(
+            self.name,
+            batch_size=batch_size,
+            flush_interval_seconds=interval,
+            p95_seconds=p95,
+            error_rate=error_rate,
+        )
+
+
+_controllers_lock = threading.Lock()
+_controllers: Dict[str, AdaptiveBatchController] = {}
+
+
+def get_batch_controller(
+    name: str,
+    settings: Optional[ScraperSettings] = None,
+    **kwargs: Any,
+) -> AdaptiveBatchController:
+    """Return the named controller, creating it on first use."""
+
+    with _controllers_lock:
+        controller = _controllers.get(name)
+        if controller is None:
+            controller = AdaptiveBatchController(name, settings, **kwargs)
+            _controllers[name] = controller
+        return controller
+
+
+def batch_controller_snapshots() -> Dict[str, Dict[str, Any]]:
+    with _controllers_lock:
+        controllers = list(_controllers.values())
+    return {controller.name: controller.snapshot() for controller in controllers}
+
+
+def reset_batch_controllers() -> None:
+    with _controllers_lock:
+        _controllers.clear()
+
+
+__all__ = [
+    "AdaptiveBatchController",
+    "BatchDecision",
+    "batch_controller_snapshots",
+    "get_batch_controller",
+    "reset_batch_controllers",
+]
@@ -0,0 +1,482 @@
+"""Priority lanes for outbound traffic to the cricket backend.
+
+Every payload the scraper pushes is classified into one of three lanes:
+
+* ``realtime``  – score changes and commentary texts; dispatched immediately.
+* ``coalesced`` – odds and batsman/bowler snapshots; latest value per key wins.
+* ``bulk``      – scorecards and match info; rate limited, behind everything else.
+
+Each lane owns its worker pool so a backlog of large scorecards can never
+delay a headline score update.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Callable, Deque, Dict, Hashable, Mapping, Optional
+
+from src.config import ScraperSettings, get_settings
+from src.egress.adaptive import AdaptiveBatchController, get_batch_controller
+from src.logging.adapters import get_logger
+from src.monitoring import (
+    observe_stage,
+    record_egress_event,
+    record_egress_result,
+    set_egress_queue_depth,
+)
+from src.monitoring.freshness import FreshnessStamp, get_freshness_tracker
+from src.monitoring.tracing import STATUS_ERROR, STATUS_OK, Span, get_tracer
+
+logger = get_logger(component="egress")
+
+SendFn = Callable[[], bool]
+
+
+class EgressLane(Enum):
+    REALTIME = "realtime"
+    COALESCED = "coalesced"
+    BULK = "bulk"
+
+
+# Payload keys that identify each kind of update pushed by the live scraper.
+_REALTIME_KEYS = ("match_update", "score_update")
+_COALESCED_KEYS = {
+    "odds": ("odds_data", "firstTeamData", "sessionData", "team_odds", "session_odds"),
+    "players": ("batsman_data", "bowler_data"),
+}
+_BULK_KEYS = ("match_stats_by_innings", "match_info", "scorecard")
+
+
+def classify_payload(payload: Mapping[str, Any]) -> EgressLane:
+    """Return the lane a backend payload should travel on.
+
+    Unknown payloads default to the realtime lane so nothing is ever
+    coalesced away by accident.
+    """
+
+    if not isinstance(payload, Mapping):
+        return EgressLane.REALTIME
+    if any(key in payload for key in _REALTIME_KEYS):
+        return EgressLane.REALTIME
+    if any(key in payload for keys in _COALESCED_KEYS.values() for key in keys):
+        return EgressLane.COALESCED
+    if any(key in payload for key in _BULK_KEYS):
+        return EgressLane.BULK
+    return EgressLane.REALTIME
+
+
+def coalesce_key_for(payload: Mapping[str, Any], url: Optional[str]) -> Hashable:
+    """Build the latest-wins key for a payload (match url + payload kind)."""
+
+    if isinstance(payload, Mapping):
+        for kind, keys in _COALESCED_KEYS.items():
+            if any(key in payload for key in keys):
+                return (url, kind)
+        for key in _BULK_KEYS:
+            if key in payload:
+                return (url, key)
+    return (url, "payload")
+
+
+@dataclass
+class EgressItem:
+    lane: EgressLane
+    send: SendFn
+    coalesce_key: Optional[Hashable] = None
+    label: str = "payload"
+    enqueued_at: float = field(default_factory=time.monotonic)
+    # Started on the submitting thread (child of its tick span), ended after the send.
+    span: Optional[Span] = None
+    # When the payload's source data was observed; acknowledged sends feed the freshness SLO.
+    freshness: Optional[FreshnessStamp] = None
+
+    def end_span(self, outcome: str) -> None:
+        if self.span is not None:
+            self.span.set_attribute("egress.outcome", outcome)
+            self.span.end()
+
+
+class _TokenBucket:
+    """Simple token bucket used to pace the bulk lane."""
+
+    def __init__(self, rate_per_second: float, capacity: float, *, clock: Callable[[], float] = time.monotonic) -> None:
+        self._rate = max(rate_per_second, 1e-6)
+        self._capacity = max(capacity, 1.0)
+        self._tokens = self._capacity
+        self._clock = clock
+        self._updated = clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = max(now - self._updated, 0.0)
+        self._tokens = min(self._capacity, self._tokens + elapsed * self._rate)
+        self._updated = now
+
+    def try_acquire(self) -> bool:
+        self._refill()
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            return True
+        return False
+
+    def wait_time(self) -> float:
+        self._refill()
+        if self._tokens >= 1.0:
+            return 0.0
+        return (1.0 - self._tokens) / self._rate
+
+
+class EgressDispatcher:
+    """Routes payload sends through per-lane pools with SLO tracking."""
+
+    def __init__(
+        self,
+        settings: Optional[ScraperSettings] = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        controller: Optional[AdaptiveBatchController] = None,
+    ) -> None:
+        cfg = settings or get_settings()
+        self._settings = cfg
+        self._clock = clock
+        # Optional AIMD controller that tunes how long the coalesced lane waits between flushes.
+        self._controller = controller
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._wakeup = threading.Event()
+        self._executors: Dict[EgressLane, ThreadPoolExecutor] = {
+            EgressLane.REALTIME: ThreadPoolExecutor(
+                max_workers=cfg.egress_realtime_concurrency, thread_name_prefix="egress-realtime"
+            ),
+            EgressLane.COALESCED: ThreadPoolExecutor(
+                max_workers=cfg.egress_coalesced_concurrency, thread_name_prefix="egress-coalesced"
+            ),
+            EgressLane.BULK: ThreadPoolExecutor(
+                max_workers=cfg.egress_bulk_concurrency, thread_name_prefix="egress-bulk"
+            ),
+        }
+        self._slo_seconds = {
+            EgressLane.REALTIME: cfg.egress_realtime_slo_seconds,
+            EgressLane.COALESCED: cfg.egress_coalesced_slo_seconds,
+            EgressLane.BULK: cfg.egress_bulk_slo_seconds,
+        }
+        self._realtime_limit = cfg.max_queue_size
+        self._bulk_limit = cfg.egress_bulk_max_queue
+        self._realtime_chains: Dict[Hashable, Deque[EgressItem]] = {}
+        self._coalesced: "OrderedDict[Hashable, EgressItem]" = OrderedDict()
+        self._coalesced_in_flight: set = set()
+        self._bulk: "OrderedDict[Hashable, EgressItem]" = OrderedDict()
+        self._bulk_slots = threading.BoundedSemaphore(cfg.egress_bulk_concurrency)
+        self._bulk_bucket = _TokenBucket(
+            cfg.egress_bulk_rate_per_second,
+            capacity=max(1.0, float(cfg.egress_bulk_concurrency)),
+            clock=clock,
+        )
+        self._in_flight: Dict[EgressLane, int] = {lane: 0 for lane in EgressLane}
+        self._stats: Dict[str, Dict[str, int]] = {
+            lane.value: {"submitted": 0, "sent": 0, "failed": 0, "coalesced": 0, "dropped": 0}
+            for lane in EgressLane
+        }
+        self._coalesce_thread = threading.Thread(
+            target=self._run_coalesced, name="EgressCoalescer", daemon=True
+        )
+        self._bulk_thread = threading.Thread(target=self._run_bulk, name="EgressBulk", daemon=True)
+        self._coalesce_thread.start()
+        self._bulk_thread.start()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    def submit(
+        self,
+        lane: EgressLane,
+        send: SendFn,
+        *,
+        coalesce_key: Optional[Hashable] = None,
+        label: str = "payload",
+        freshness: Optional[FreshnessStamp] = None,
+    ) -> bool:
+        """Queue ``send`` on ``lane``. Returns False if the payload was dropped."""
+
+        if self._stop_event.is_set():
+            return False
+        item = EgressItem(
+            lane=lane,
+            send=send,
+            coalesce_key=coalesce_key,
+            label=label,
+            enqueued_at=self._clock(),
+            freshness=freshness,
+        )
+        item.span = get_tracer().start_span("egress", attributes={"egress.lane": lane.value, "egress.label": label})
+        with self._lock:
+            self._stats[lane.value]["submitted"] += 1
+            if lane is EgressLane.REALTIME:
+                if self._in_flight[lane] >= self._realtime_limit:
+                    self._stats[lane.value]["dropped"] += 1
+                    record_egress_event(lane.value, "dropped")
+                    logger.warning("egress.realtime.dropped", metadata={"label": label})
+                    item.end_span("dropped")
+                    return False
+                self._in_flight[lane] += 1
+                self._publish_depth_locked(lane)
+                if coalesce_key is not None:
+                    # Events for the same match are delivered in submission order.
+                    chain = self._realtime_chains.get(coalesce_key)
+                    if chain is not None:
+                        chain.append(item)
+                        return True
+                    self._realtime_chains[coalesce_key] = deque()
+            elif lane is EgressLane.COALESCED:
+                key = coalesce_key if coalesce_key is not None else label
+                if key in self._coalesced:
+                    # Keep the original enqueue time so latency reflects how stale the key got.
+                    item.enqueued_at = self._coalesced[key].enqueued_at
+                    self._coalesced[key].end_span("coalesced")
+                    self._stats[lane.value]["coalesced"] += 1
+                    record_egress_event(lane.value, "coalesced")
+                self._coalesced[key] = item
+                self._publish_depth_locked(lane)
+                if self._controller is not None:
+                    self._controller.observe_update(key)
+                return True
+            else:
+                key = coalesce_key if coalesce_key is not None else (label, id(item))
+                if key in self._bulk:
+                    self._bulk[key].end_span("coalesced")
+                    self._bulk[key] = item
+                    self._stats[lane.value]["coalesced"] += 1
+                    record_egress_event(lane.value, "coalesced")
+                    return True
+                if len(self._bulk) >= self._bulk_limit:
+                    _, dropped = self._bulk.popitem(last=False)
+                    dropped.end_span("dropped")
+                    self._stats[lane.value]["dropped"] += 1
+                    record_egress_event(lane.value, "dropped")
+                    logger.warning("egress.bulk.dropped", metadata={"label": dropped.label})
+                self._bulk[key] = item
+                self._publish_depth_locked(lane)
+                self._wakeup.set()
+                return True
+        self._executors[EgressLane.REALTIME].submit(self._execute, item)
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Dispatch every queued payload now (ignoring pacing) and wait for completion."""
+
+        deadline = None if timeout is None else self._clock() + timeout
+        with self._lock:
+            coalesced = list(self._coalesced.items())
+            self._coalesced.clear()
+            bulk = list(self._bulk.values())
+            self._bulk.clear()
+            for key, _ in coalesced:
+                self._coalesced_in_flight.add(key)
+            self._in_flight[EgressLane.COALESCED] += len(coalesced)
+            self._in_flight[EgressLane.BULK] += len(bulk)
+        for key, item in coalesced:
+            self._executors[EgressLane.COALESCED].submit(self._execute, item, key)
+        for item in bulk:
+            self._executors[EgressLane.BULK].submit(self._execute, item)
+        while True:
+            with self._lock:
+                pending = sum(self._in_flight.values())
+            if pending == 0:
+                return True
+            if deadline is not None and self._clock() >= deadline:
+                return False
+            time.sleep(0.01)
+
+    def shutdown(self, timeout: Optional[float] = None) -> None:
+        if self._stop_event.is_set():
+            return
+        self.flush(timeout)
+        self._stop_event.set()
+        self._wakeup.set()
+        for executor in self._executors.values():
+            executor.shutdown(wait=False)
+        self._coalesce_thread.join(timeout=1.0)
+        self._bulk_thread.join(timeout=1.0)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lanes = {}
+            for lane in EgressLane:
+                entry = dict(self._stats[lane.value])
+                entry["queued"] = self._queued_locked(lane)
+                entry["in_flight"] = self._in_flight[lane]
+                entry["slo_seconds"] = self._slo_seconds[lane]
+                lanes[lane.value] = entry
+        return {"lanes": lanes}
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _queued_locked(self, lane: EgressLane) -> int:
+        if lane is EgressLane.COALESCED:
+            return len(self._coalesced)
+        if lane is EgressLane.BULK:
+            return len(self._bulk)
+        return 0
+
+    def _publish_depth_locked(self, lane: EgressLane) -> None:
+        set_egress_queue_depth(lane.value, self._queued_locked(lane) + self._in_flight[lane])
+
+    def _execute(
+        self,
+        item: EgressItem,
+        coalesce_key: Optional[Hashable] = None,
+        *,
+        holds_slot: bool = False,
+    ) -> bool:
+        success = False
+        started = self._clock()
+        try:
+            with get_tracer().use_span(item.span):
+                success = bool(item.send())
+        except Exception as exc:  # pragma: no cover - senders log their own failures
+            logger.warning(
+                "egress.send.error",
+                metadata={"lane": item.lane.value, "label": item.label, "error": str(exc)},
+            )
+        finally:
+            finished = self._clock()
+            latency = finished - item.enqueued_at
+            observe_stage("egress", finished - started)
+            freshness = None
+            if success and item.freshness is not None:
+                freshness = get_freshness_tracker(self._settings).record_ack(item.freshness)
+            if item.span is not None:
+                item.span.set_attribute("egress.queue_ms", round((started - item.enqueued_at) * 1000, 3))
+                item.span.set_attribute("egress.send_ms", round((finished - started) * 1000, 3))
+                if freshness is not None:
+                    item.span.set_attribute("egress.freshness_ms", round(freshness * 1000, 3))
+                item.span.set_status(STATUS_OK if success else STATUS_ERROR)
+                item.end_span("sent" if success else "failed")
+            if item.lane is EgressLane.COALESCED and self._controller is not None:
+                self._controller.observe_send(finished - started, success=success)
+            record_egress_result(
+                item.lane.value,
+                latency,
+                success=success,
+                slo_seconds=self._slo_seconds[item.lane],
+            )
+            with self._lock:
+                self._stats[item.lane.value]["sent" if success else "failed"] += 1
+                self._in_flight[item.lane] = max(self._in_flight[item.lane] - 1, 0)
+                if coalesce_key is not None:
+                    self._coalesced_in_flight.discard(coalesce_key)
+                next_item = self._next_in_chain_locked(item)
+                self._publish_depth_locked(item.lane)
+            if next_item is not None:
+                self._executors[EgressLane.REALTIME].submit(self._execute, next_item)
+            if holds_slot:
+                self._bulk_slots.release()
+            if latency > self._slo_seconds[item.lane]:
+                logger.warning(
+                    "egress.slo.breach",
+                    metadata={"lane": item.lane.value, "label": item.label, "latency_seconds": round(latency, 3)},
+                )
+        return success
+
+    def _next_in_chain_locked(self, item: EgressItem) -> Optional[EgressItem]:
+        if item.lane is not EgressLane.REALTIME or item.coalesce_key is None:
+            return None
+        chain = self._realtime_chains.get(item.coalesce_key)
+        if chain:
+            return chain.popleft()
+        self._realtime_chains.pop(item.coalesce_key, None)
+        return None
+
+    def _coalesce_interval(self) -> float:
+        if self._controller is not None:
+            return self._controller.flush_interval
+        return self._settings.egress_coalesce_interval_seconds
+
+    def _run_coalesced(self) -> None:
+        while not self._stop_event.wait(self._coalesce_interval()):
+            ready = []
+            with self._lock:
+                for key in list(self._coalesced.keys()):
+                    # Only one in-flight send per key; newer values keep replacing the queued one.
+                    if key in self._coalesced_in_flight:
+                        continue
+                    ready.append((key, self._coalesced.pop(key)))
+                    self._coalesced_in_flight.add(key)
+                self._in_flight[EgressLane.COALESCED] += len(ready)
+                self._publish_depth_locked(EgressLane.COALESCED)
+            for key, item in ready:
+                self._executors[EgressLane.COALESCED].submit(self._execute, item, key)
+
+    def _run_bulk(self) -> None:
+        while not self._stop_event.is_set():
+            with self._lock:
+                has_work = bool(self._bulk)
+            if not has_work:
+                self._wakeup.wait(0.5)
+                self._wakeup.clear()
+                continue
+            if not self._bulk_slots.acquire(timeout=0.5):
+                continue
+            wait = self._bulk_bucket.wait_time()
+            if wait > 0:
+                self._bulk_slots.release()
+                self._stop_event.wait(min(wait, 1.0))
+                continue
+            with self._lock:
+                if not self._bulk or not self._bulk_bucket.try_acquire():
+                    self._bulk_slots.release()
+                    continue
+                _, item = self._bulk.popitem(last=False)
+                self._in_flight[EgressLane.BULK] += 1
+                self._publish_depth_locked(EgressLane.BULK)
+            self._executors[EgressLane.BULK].submit(self._execute, item, holds_slot=True)
+
+
+_dispatcher_lock = threading.Lock()
+_dispatcher: Optional[EgressDispatcher] = None
+
+
+def get_dispatcher(settings: Optional[ScraperSettings] = None) -> EgressDispatcher:
+    """Return the process-wide dispatcher (created on first use)."""
+
+    global _dispatcher
+    with _dispatcher_lock:
+        if _dispatcher is None:
+            cfg = settings or get_settings()
+            controller = None
+            if cfg.adaptive_batching_enabled:
+                controller = get_batch_controller(
+                    "egress-coalesced",
+                    cfg,
+                    initial_flush_interval=cfg.egress_coalesce_interval_seconds,
+                )
+            _dispatcher = EgressDispatcher(cfg, controller=controller)
+        return _dispatcher
+
+
+def shutdown_dispatcher(timeout: Optional[float] = None) -> None:
+    """Flush and stop the process-wide dispatcher if one was created."""
+
+    global _dispatcher
+    with _dispatcher_lock:
+        dispatcher = _dispatcher
+        _dispatcher = None
+    if dispatcher is not None:
+        dispatcher.shutdown(timeout)
+
+
+__all__ = [
+    "EgressDispatcher",
+    "EgressItem",
+    "EgressLane",
+    "classify_payload",
+    "coalesce_key_for",
+    "get_dispatcher",
+    "shutdown_dispatcher",
+]
@@ -0,0 +1,320 @@
+"""Serializer layer for outbound payloads.
+
+Payloads are normalised against a small set of predefined schemas (known keys
+in a fixed order, ``None`` values dropped) and encoded with the fastest
+available encoder. With msgspec each schema is also a ``msgspec.Struct``
+(``omit_defaults``), so a hot payload whose keys are all known is encoded
+from a struct instead of walking a generic dict; payloads with unknown keys
+keep the dict path:
+
+* ``msgspec`` (pinned in requirements.txt); ``orjson`` or compact stdlib JSON
+  when it is missing, e.g. in a bare development environment;
+* optional MessagePack (``msgspec`` or ``msgpack``), used only for endpoints
+  that have not rejected it – a 415/406 response downgrades the endpoint to
+  JSON and the request is resent once.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, FrozenSet, Mapping, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+
+from src.config import ScraperSettings, get_settings
+from src.monitoring import record_egress_bytes
+from src.monitoring.tracing import STATUS_ERROR, get_tracer
+
+try:  # Optional fast encoders
+    import msgspec  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None  # type: ignore
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
+
+try:
+    import msgpack  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None  # type: ignore
+
+JSON_CONTENT_TYPE = "application/json"
+MSGPACK_CONTENT_TYPE = "application/msgpack"
+_REJECTED_STATUS_CODES = (406, 415)
+
+
+# ----------------------------------------------------------------------
+# Schemas
+# ----------------------------------------------------------------------
+def _define_struct(name: str, fields: Tuple[str, ...]) -> Optional[type]:
+    """``msgspec.Struct`` with ``fields`` in wire order, each defaulting to (and omitting) ``None``."""
+
+    if msgspec is None or not fields:
+        return None
+    return msgspec.defstruct(name, [(key, Any, None) for key in fields], omit_defaults=True)
+
+
+@dataclass(frozen=True)
+class PayloadSchema:
+    """Known layout of a payload type; ``discriminators`` identify it.
+
+    ``struct`` is the matching ``msgspec.Struct`` type, or ``None`` without msgspec.
+    """
+
+    name: str
+    discriminators: Tuple[str, ...]
+    fields: Tuple[str, ...]
+    struct: Optional[type] = None
+    field_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "field_set", frozenset(self.fields))
+
+    def matches(self, payload: Mapping[str, Any]) -> bool:
+        return any(key in payload for key in self.discriminators)
+
+    def prepare(self, payload: Mapping[str, Any]) -> Dict[str, Any]:
+        """Return the payload with known fields first and ``None`` values dropped."""
+
+        prepared: Dict[str, Any] = {}
+        for key in self.fields:
+            value = payload.get(key)
+            if value is not None:
+                prepared[key] = value
+        for key, value in payload.items():
+            if value is not None and key not in prepared:
+                prepared[key] = value
+        return prepared
+
+    def to_struct(self, payload: Mapping[str, Any]) -> Any:
+        """The payload as ``struct``; ``None`` if there is no struct or a key is not a known field."""
+
+        if self.struct is None or not payload.keys() <= self.field_set:
+            return None
+        return self.struct(**payload)
+
+
+def _schema(name: str, struct_name: str, discriminators: Tuple[str, ...], fields: Tuple[str, ...]) -> PayloadSchema:
+    return PayloadSchema(name, discriminators, fields, _define_struct(struct_name, fields))
+
+
+SCHEMAS: Tuple[PayloadSchema, ...] = (
+    _schema("match_update", "MatchUpdatePayload", ("match_update",), ("match_update", "overs_data", "url")),
+    _schema("score_update", "ScoreUpdatePayload", ("score_update",), ("score_update", "url")),
+    _schema("players", "PlayersPayload", ("batsman_data", "bowler_data"), ("batsman_data", "bowler_data", "url")),
+    _schema("odds", "OddsPayload", ("odds_data",), ("odds_data", "url")),
+    _schema(
+        "session_odds",
+        "SessionOddsPayload",
+        ("firstTeamData", "sessionData"),
+        ("firstTeamData", "sessionData", "url"),
+    ),
+    _schema("sc4_stats", "Sc4StatsPayload", ("match_stats_by_innings",), ("match_stats_by_innings", "url")),
+)
+
+_GENERIC_SCHEMA = PayloadSchema("generic", (), ())
+
+
+def schema_for(payload: Mapping[str, Any]) -> PayloadSchema:
+    for schema in SCHEMAS:
+        if schema.matches(payload):
+            return schema
+    return _GENERIC_SCHEMA
+
+
+def prepare_payload(payload: Any, *, structs: bool = False) -> Any:
+    """Normalise a payload for the wire (mirrors the legacy ``None`` filtering).
+
+    With ``structs`` (only for msgspec encoders) a payload matching a schema
+    is returned as that schema's struct when it can be.
+    """
+
+    if isinstance(payload, Mapping):
+        schema = schema_for(payload)
+        if structs:
+            struct = schema.to_struct(payload)
+            if struct is not None:
+                return struct
+        return schema.prepare(payload)
+    if isinstance(payload, list):
+        return [
+            {k: v for k, v in item.items() if v is not None} if isinstance(item, Mapping) else item
+            for item in payload
+        ]
+    return payload
+
+
+# ----------------------------------------------------------------------
+# Encoders
+# ----------------------------------------------------------------------
+@dataclass(frozen=True)
+class Serializer:
+    name: str
+    content_type: str
+    encode: Callable[[Any], bytes]
+    # Encodes the ``msgspec.Struct`` payloads ``prepare_payload(structs=True)`` returns.
+    structs: bool = False
+
+
+def _stdlib_json(obj: Any) -> bytes:
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=str).encode("utf-8")
+
+
+def _build_serializers() -> Dict[str, Serializer]:
+    serializers: Dict[str, Serializer] = {
+        "json": Serializer("json", JSON_CONTENT_TYPE, _stdlib_json),
+    }
+    if orjson is not None:
+        options = orjson.OPT_NON_STR_KEYS
+
+        def _orjson(obj: Any) -> bytes:
+            return orjson.dumps(obj, default=str, option=options)
+
+        serializers["orjson"] = Serializer("orjson", JSON_CONTENT_TYPE, _orjson)
+    if msgspec is not None:
+        json_encoder = msgspec.json.Encoder(enc_hook=str)
+        msgpack_encoder = msgspec.msgpack.Encoder(enc_hook=str)
+        serializers["msgspec"] = Serializer("msgspec", JSON_CONTENT_TYPE, json_encoder.encode, structs=True)
+        serializers["msgpack"] = Serializer("msgpack", MSGPACK_CONTENT_TYPE, msgpack_encoder.encode, structs=True)
+    elif msgpack is not None:
+
+        def _msgpack(obj: Any) -> bytes:
+            return msgpack.packb(obj, use_bin_type=True, default=str)
+
+        serializers["msgpack"] = Serializer("msgpack", MSGPACK_CONTENT_TYPE, _msgpack)
+    return serializers
+
+
+_SERIALIZERS = _build_serializers()
+_JSON_PREFERENCE = ("msgspec", "orjson", "json")
+
+
+def available_serializers() -> Tuple[str, ...]:
+    return tuple(_SERIALIZERS)
+
+
+def get_json_serializer(name: str = "auto") -> Serializer:
+    """Return the requested JSON encoder, or the fastest installed one for ``auto``."""
+
+    if name != "auto":
+        serializer = _SERIALIZERS.get(name)
+        if serializer is None or serializer.content_type != JSON_CONTENT_TYPE:
+            raise ValueError(f"Unknown or unavailable JSON serializer: {name}")
+        return serializer
+    for candidate in _JSON_PREFERENCE:
+        if candidate in _SERIALIZERS:
+            return _SERIALIZERS[candidate]
+    return _SERIALIZERS["json"]  # pragma: no cover - stdlib always present
+
+
+# ----------------------------------------------------------------------
+# Negotiation
+# ----------------------------------------------------------------------
+class PayloadEncoder:
+    """Encodes payloads per endpoint, remembering endpoints that rejected MessagePack."""
+
+    def __init__(self, settings: Optional[ScraperSettings] = None) -> None:
+        cfg = settings or get_settings()
+        self._json = get_json_serializer(cfg.egress_serializer)
+        self._binary = _SERIALIZERS.get("msgpack") if cfg.egress_msgpack_enabled else None
+        self._json_only: set = set()
+        self._lock = threading.Lock()
+
+    @property
+    def json_serializer(self) -> Serializer:
+        return self._json
+
+    def serializer_for(self, endpoint: str) -> Serializer:
+        if self._binary is None:
+            return self._json
+        with self._lock:
+            if endpoint in self._json_only:
+                return self._json
+        return self._binary
+
+    def encode(self, endpoint: str, payload: Any) -> Tuple[bytes, str]:
+        serializer = self.serializer_for(endpoint)
+        return serializer.encode(prepare_payload(payload, structs=serializer.structs)), serializer.content_type
+
+    def mark_json_only(self, endpoint: str) -> None:
+        with self._lock:
+            self._json_only.add(endpoint)
+
+    def post(
+        self,
+        endpoint: str,
+        payload: Any,
+        *,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: Optional[float] = None,
+        session: Any = None,
+    ):
+        """POST ``payload`` to ``endpoint``; downgrade to JSON once if the backend rejects the encoding."""
+
+        session = session or requests
+        serializer = self.serializer_for(endpoint)
+        with get_tracer().span("http.post", attributes={"http.route": urlparse(endpoint).path}) as span:
+            response = self._send(session, endpoint, serializer, payload, headers, timeout)
+            if serializer is not self._json and response.status_code in _REJECTED_STATUS_CODES:
+                self.mark_json_only(endpoint)
+                response = self._send(session, endpoint, self._json, payload, headers, timeout)
+            if span is not None:
+                span.set_attribute("http.status_code", response.status_code)
+                if response.status_code >= 400:
+                    span.set_status(STATUS_ERROR, f"HTTP {response.status_code}")
+        return response
+
+    @staticmethod
+    def _send(session, endpoint, serializer, payload, headers, timeout):
+        request_headers = dict(headers or {})
+        request_headers["Content-Type"] = serializer.content_type
+        if serializer.content_type != JSON_CONTENT_TYPE:
+            request_headers.setdefault("Accept", f"{serializer.content_type}, {JSON_CONTENT_TYPE}")
+        body = serializer.encode(prepare_payload(payload, structs=serializer.structs))
+        # Path only: the host is the same backend for every endpoint.
+        record_egress_bytes(urlparse(endpoint).path or endpoint, serializer.name, len(body))
+        return session.post(
+            endpoint,
+            data=body,
+            headers=request_headers,
+            timeout=timeout,
+        )
+
+
+_encoder_lock = threading.Lock()
+_encoder: Optional[PayloadEncoder] = None
+
+
+def get_payload_encoder(settings: Optional[ScraperSettings] = None) -> PayloadEncoder:
+    global _encoder
+    with _encoder_lock:
+        if _encoder is None:
+            _encoder = PayloadEncoder(settings)
+        return _encoder
+
+
+def encode_json(payload: Any) -> bytes:
+    """Encode ``payload`` with the configured JSON encoder (no schema normalisation)."""
+
+    return get_payload_encoder().json_serializer.encode(payload)
+
+
+__all__ = [
+    "JSON_CONTENT_TYPE",
+    "MSGPACK_CONTENT_TYPE",
+    "PayloadEncoder",
+    "PayloadSchema",
+    "SCHEMAS",
+    "Serializer",
+    "available_serializers",
+    "encode_json",
+    "get_json_serializer",
+    "get_payload_encoder",
+    "prepare_payload",
+    "schema_for",
+]
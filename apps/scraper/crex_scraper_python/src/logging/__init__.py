@@ -7,9 +7,33 @@ artifacts in a consistent way.
 
 from .adapters import (
     bind_correlation_id,
+    bind_thread_match_id,
     clear_correlation_id,
     configure_logging,
     get_logger,
+    thread_match_ids,
+    unbind_thread_match_id,
+)
+from .pipeline import (
+    LoggingPipeline,
+    get_logging_pipeline,
+    logging_pipeline_snapshot,
+    route_logger,
+    shutdown_logging_pipeline,
+)
+from .artifact_store import (
+    ArtifactRef,
+    ArtifactStore,
+    artifact_store_snapshot,
+    get_artifact_store,
+    shutdown_artifact_store,
+    store_artifact,
+)
+from .capture import (
+    CaptureRegistry,
+    CaptureSession,
+    capture_session,
+    get_capture_registry,
 )
 from .diagnostics import (
     capture_html_snapshot,
@@ -21,9 +45,27 @@ from .diagnostics import (
 
 __all__ = [
     "bind_correlation_id",
+    "bind_thread_match_id",
     "clear_correlation_id",
     "configure_logging",
     "get_logger",
+    "thread_match_ids",
+    "unbind_thread_match_id",
+    "LoggingPipeline",
+    "get_logging_pipeline",
+    "logging_pipeline_snapshot",
+    "route_logger",
+    "shutdown_logging_pipeline",
+    "ArtifactRef",
+    "ArtifactStore",
+    "artifact_store_snapshot",
+    "get_artifact_store",
+    "shutdown_artifact_store",
+    "store_artifact",
+    "CaptureRegistry",
+    "CaptureSession",
+    "capture_session",
+    "get_capture_registry",
     "capture_html_snapshot",
     "capture_screenshot",
     "capture_state_dump",
@@ -4,26 +4,42 @@ from __future__ import annotations
 
 import logging
 import sys
-from collections.abc import Callable, MutableMapping, Sequence
+import threading
+from collections.abc import Callable, Mapping, MutableMapping, Sequence
 from contextvars import ContextVar
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 from uuid import uuid4
 
 import structlog
 
+try:  # Optional fast encoder
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
+
+if TYPE_CHECKING:  # pragma: no cover - import hints only
+    from .pipeline import LoggingPipeline
+
 _CORRELATION_ID_VAR: ContextVar[Optional[str]] = ContextVar("correlation_id", default=None)
 _DEFAULT_COMPONENT = "scraper"
-_ALLOWED_TOP_LEVEL_KEYS = {
-    "timestamp",
-    "level",
-    "correlation_id",
-    "component",
-    "event",
-    "metadata",
-    "match_id",
-    "scraper_id",
-}
+_ALLOWED_TOP_LEVEL_KEYS = frozenset(
+    {
+        "timestamp",
+        "level",
+        "correlation_id",
+        "component",
+        "event",
+        "metadata",
+        "match_id",
+        "scraper_id",
+    }
+)
 _IS_CONFIGURED = False
+# Component loggers handed out by ``get_logger``; dropped on reconfiguration.
+_LOGGERS: dict[str, Any] = {}
+# Context variables are invisible to other threads; samplers (see
+# ``src.monitoring.profiler``) read the match a thread works on from here.
+_THREAD_MATCH_IDS: dict[int, str] = {}
 
 Processor = Callable[[structlog.BoundLoggerBase, str, MutableMapping[str, Any]], MutableMapping[str, Any]]
 
@@ -34,8 +50,13 @@ def configure_logging(
     stream: Any = None,
     json_indent: Optional[int] = None,
     extra_processors: Optional[Sequence[Processor]] = None,
+    pipeline: Optional["LoggingPipeline"] = None,
 ) -> None:
-    """Configure structlog to emit JSON records with the required schema."""
+    """Configure structlog to emit JSON records with the required schema.
+
+    With ``pipeline`` the calling thread stops after building the event dict;
+    the pipeline's listener thread renders the JSON (see ``src.logging.pipeline``).
+    """
 
     global _IS_CONFIGURED
 
@@ -48,6 +69,8 @@ def configure_logging(
     # Use PrintLoggerFactory for tests (when stream is provided), stdlib for production
     if stream is not None:
         logger_factory = structlog.PrintLoggerFactory(file=target_stream)
+    elif pipeline is not None:
+        logger_factory = structlog.stdlib.LoggerFactory()
     else:
         logging.basicConfig(level=resolved_level, format="%(message)s", stream=target_stream)
         logger_factory = structlog.stdlib.LoggerFactory()
@@ -66,9 +89,14 @@ def configure_logging(
     if extra_processors:
         processors.extend(extra_processors)
 
-    processors.append(
-        structlog.processors.JSONRenderer(indent=json_indent, default=_json_fallback, ensure_ascii=False)
-    )
+    renderer = build_json_renderer(json_indent)
+    if pipeline is not None and stream is None:
+        pipeline.formatter.structured = structlog.stdlib.ProcessorFormatter(
+            processors=[structlog.stdlib.ProcessorFormatter.remove_processors_meta, renderer],
+        )
+        processors.append(structlog.stdlib.ProcessorFormatter.wrap_for_formatter)
+    else:
+        processors.append(renderer)
 
     structlog.configure(
         processors=processors,
@@ -77,18 +105,24 @@ def configure_logging(
         logger_factory=logger_factory,
         cache_logger_on_first_use=True,
     )
+    _LOGGERS.clear()
 
     _IS_CONFIGURED = True
 
 
 def get_logger(component: Optional[str] = None) -> structlog.stdlib.BoundLogger:
-    """Return a logger bound to the requested component."""
+    """Return a logger bound to the requested component.
+
+    The logger is lazy: it is built against the configuration active when it
+    first logs (module-level loggers usually exist before ``configure_logging``
+    runs) and then cached, so a log call does not rebuild the bound logger.
+    """
 
-    logger = structlog.get_logger()
     component_name = component or _DEFAULT_COMPONENT
+    logger = _LOGGERS.get(component_name)
 
-    if component_name:
-        logger = logger.bind(component=component_name)
+    if logger is None:
+        logger = _LOGGERS.setdefault(component_name, structlog.get_logger(component=component_name))
 
     return logger
 
@@ -110,6 +144,26 @@ def clear_correlation_id() -> None:
     structlog.contextvars.clear_contextvars()
 
 
+def current_correlation_id() -> Optional[str]:
+    return _CORRELATION_ID_VAR.get()
+
+
+def bind_thread_match_id(match_id: str) -> None:
+    """Record ``match_id`` as the match the calling thread is working on."""
+
+    _THREAD_MATCH_IDS[threading.get_ident()] = match_id
+
+
+def unbind_thread_match_id() -> None:
+    _THREAD_MATCH_IDS.pop(threading.get_ident(), None)
+
+
+def thread_match_ids() -> dict[int, str]:
+    """Snapshot of thread ident -> match id for threads inside a match logging context."""
+
+    return dict(_THREAD_MATCH_IDS)
+
+
 def _resolve_log_level(level: int | str) -> int:
     try:
         return logging._checkLevel(level)  # type: ignore[attr-defined]
@@ -131,39 +185,38 @@ def _ensure_standard_schema(
     __: str,
     event_dict: MutableMapping[str, Any],
 ) -> MutableMapping[str, Any]:
-    """Move unexpected keys into the metadata field and set defaults."""
-
-    correlation_id = event_dict.get("correlation_id") or _CORRELATION_ID_VAR.get() or "unknown"
-    event_dict["correlation_id"] = correlation_id
-
-    component = event_dict.get("component") or _DEFAULT_COMPONENT
-    event_dict["component"] = component
-
-    scraper_id = event_dict.get("scraper_id")
-    if not scraper_id:
-        scraper_id = "unknown"
-    event_dict["scraper_id"] = scraper_id
-
-    match_id = event_dict.get("match_id")
-    event_dict["match_id"] = match_id or "unbound"
+    """Move unexpected keys into the metadata field and set defaults.
+
+    Runs for every record. When the event only carries schema keys and a
+    plain ``metadata`` dict, nothing is copied; the caller's metadata is
+    only rebuilt when extra keys have to be merged into it.
+    """
+
+    if not event_dict.get("correlation_id"):
+        event_dict["correlation_id"] = _CORRELATION_ID_VAR.get() or "unknown"
+    if not event_dict.get("component"):
+        event_dict["component"] = _DEFAULT_COMPONENT
+    if not event_dict.get("scraper_id"):
+        event_dict["scraper_id"] = "unknown"
+    if not event_dict.get("match_id"):
+        event_dict["match_id"] = "unbound"
 
     metadata = event_dict.get("metadata")
+    has_extras = not event_dict.keys() <= _ALLOWED_TOP_LEVEL_KEYS
+
+    if type(metadata) is dict and not has_extras:
+        return event_dict
 
-    if isinstance(metadata, MutableMapping):
+    if isinstance(metadata, Mapping):
         metadata = dict(metadata)
     elif metadata is None:
         metadata = {}
     else:
         metadata = {"value": metadata}
 
-    extras: dict[str, Any] = {}
-
-    for key in list(event_dict.keys()):
-        if key not in _ALLOWED_TOP_LEVEL_KEYS:
-            extras[key] = event_dict.pop(key)
-
-    if extras:
-        metadata.update(extras)
+    if has_extras:
+        for key in [key for key in event_dict if key not in _ALLOWED_TOP_LEVEL_KEYS]:
+            metadata[key] = event_dict.pop(key)
 
     event_dict["metadata"] = metadata
 
@@ -172,3 +225,30 @@ def _ensure_standard_schema(
 
 def _json_fallback(value: Any) -> Any:
     return repr(value)
+
+
+class OrjsonRenderer:
+    """``JSONRenderer`` backed by orjson.
+
+    Values orjson cannot encode (integers beyond 64 bits, non-string keys it
+    does not support) are rendered by the stdlib renderer instead; other
+    unknown types are ``repr``'d as before.
+    """
+
+    def __init__(self, indent: Optional[int] = None) -> None:
+        self._option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        self._fallback = structlog.processors.JSONRenderer(indent=indent, default=_json_fallback, ensure_ascii=False)
+
+    def __call__(self, logger: Any, name: str, event_dict: MutableMapping[str, Any]) -> str:
+        try:
+            return orjson.dumps(event_dict, default=_json_fallback, option=self._option).decode("utf-8")
+        except TypeError:
+            return self._fallback(logger, name, event_dict)
+
+
+def build_json_renderer(json_indent: Optional[int] = None) -> Processor:
+    """orjson (pinned in requirements.txt; it only indents by 2), else structlog's stdlib renderer."""
+
+    if orjson is not None and json_indent in (None, 2):
+        return OrjsonRenderer(json_indent)
+    return structlog.processors.JSONRenderer(indent=json_indent, default=_json_fallback, ensure_ascii=False)
@@ -0,0 +1,347 @@
+"""Content-addressed store for diagnostic artifacts.
+
+During a DOM-change outage every scrape cycle fails the same way and
+captures the same page. ``ArtifactStore.put`` hashes the content on the
+calling thread (cheap) and returns a reference at once. An artifact whose
+digest is already stored only refreshes its manifest entry. New content is
+compressed and written by one background thread, so a scrape never waits
+on disk.
+
+Layout under ``<SCRAPER_ARTIFACT_ROOT>/store``::
+
+    manifest.json                 digest -> kind, sizes, last seen, refs
+    objects/ab/abcdef....html.gz
+
+The store is bounded by ``artifact_store_max_bytes`` (compressed): the
+least recently seen artifacts are evicted first. Artifacts not seen within
+the diagnostics retention window (``SCRAPER_ARTIFACT_RETENTION_DAYS``) are
+evicted as well. When more than ``artifact_store_queue_size`` writes are
+pending, new artifacts are dropped and counted instead of queued.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from src.config import ScraperSettings, get_settings
+from src.monitoring.monitoring import record_artifact, set_artifact_store_bytes
+
+from .adapters import get_logger
+from .diagnostics import STORE_DIRNAME, _artifact_root, _resolve_retention_seconds
+
+logger = get_logger(component="artifact_store")
+
+MANIFEST_FILENAME = "manifest.json"
+_MANIFEST_VERSION = 1
+_MAX_REFS = 5
+# kind -> (file extension, compress); screenshots are already compressed.
+_KINDS = {
+    "html": ("html", True),
+    "state": ("json", True),
+    "screenshot": ("png", False),
+}
+
+
+@dataclass(frozen=True)
+class ArtifactRef:
+    """Where an artifact lives; ``deduplicated`` when the content was already stored."""
+
+    digest: str
+    path: Path
+    kind: str
+    deduplicated: bool = False
+
+
+class ArtifactStore:
+    """Deduplicated, compressed, size-budgeted artifacts written off the calling thread."""
+
+    def __init__(
+        self,
+        root: Optional[Path] = None,
+        *,
+        settings: Optional[ScraperSettings] = None,
+        retention_seconds: Optional[int] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        cfg = settings or get_settings()
+        self._root = Path(root) if root is not None else _artifact_root() / STORE_DIRNAME
+        self._budget = cfg.artifact_store_max_bytes
+        self._max_pending = cfg.artifact_store_queue_size
+        self._retention = _resolve_retention_seconds(retention_seconds)
+        self._clock = clock
+        self._lock = threading.Lock()
+        # Least recently seen first.
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._stored_bytes = 0
+        self._pending = 0
+        self._futures: List[Future] = []
+        self._flush_scheduled = False
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="artifact-store")
+        self._load_manifest()
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    def put(
+        self,
+        content: Union[str, bytes],
+        *,
+        kind: str = "html",
+        correlation_id: Optional[str] = None,
+        label: Optional[str] = None,
+    ) -> Optional[ArtifactRef]:
+        """Store ``content``; returns ``None`` when the write queue is full."""
+
+        data = content.encode("utf-8") if isinstance(content, str) else content
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest, kind)
+        now = self._clock()
+        ref = {"correlation_id": correlation_id, "label": label, "at": now}
+
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is not None:
+                entry["last_seen"] = now
+                entry["hits"] += 1
+                entry["refs"] = (entry["refs"] + [ref])[-_MAX_REFS:]
+                self._entries.move_to_end(digest)
+                self._schedule_manifest_locked()
+                deduplicated = True
+            elif self._pending >= self._max_pending:
+                deduplicated = None
+            else:
+                self._entries[digest] = {
+                    "kind": kind,
+                    "path": str(path.relative_to(self._root)),
+                    "size": len(data),
+                    "stored_bytes": None,
+                    "created_at": now,
+                    "last_seen": now,
+                    "hits": 1,
+                    "refs": [ref],
+                }
+                self._pending += 1
+                self._submit_locked(self._write_object, digest, data, path)
+                deduplicated = False
+
+        if deduplicated is None:
+            record_artifact("dropped")
+            return None
+        if deduplicated:
+            record_artifact("deduplicated")
+        return ArtifactRef(digest=digest, path=path, kind=kind, deduplicated=deduplicated)
+
+    def read(self, digest: str) -> Optional[bytes]:
+        """Return the original bytes of a stored artifact."""
+
+        with self._lock:
+            entry = self._entries.get(digest)
+            relative = entry["path"] if entry is not None else None
+        if relative is None:
+            return None
+        path = self._root / relative
+        try:
+            raw = path.read_bytes()
+        except OSError:
+            return None
+        return gzip.decompress(raw) if path.suffix == ".gz" else raw
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait for queued writes; True when all of them finished."""
+
+        with self._lock:
+            futures, self._futures = self._futures, []
+        _, not_done = wait(futures, timeout=timeout)
+        return not not_done
+
+    def close(self) -> None:
+        self.flush(timeout=30.0)
+        self._writer.shutdown(wait=True)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "root": str(self._root),
+                "artifacts": len(self._entries),
+                "stored_bytes": self._stored_bytes,
+                "budget_bytes": self._budget,
+                "pending_writes": self._pending,
+            }
+
+    # ------------------------------------------------------------------
+    # writer thread
+    # ------------------------------------------------------------------
+    def _submit_locked(self, fn: Callable[..., None], *args: Any) -> None:
+        self._futures = [future for future in self._futures if not future.done()]
+        self._futures.append(self._writer.submit(fn, *args))
+
+    def _schedule_manifest_locked(self) -> None:
+        # Repeated captures of the same page only need one manifest rewrite.
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self._submit_locked(self._write_manifest_task)
+
+    def _write_object(self, digest: str, data: bytes, path: Path) -> None:
+        compress = path.suffix == ".gz"
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            staged = path.with_name(path.name + ".tmp")
+            staged.write_bytes(gzip.compress(data, compresslevel=6) if compress else data)
+            os.replace(staged, path)
+            stored_bytes = path.stat().st_size
+        except OSError as exc:
+            with self._lock:
+                self._pending -= 1
+                self._entries.pop(digest, None)
+            logger.warning("artifact.write_failed", metadata={"digest": digest, "error": str(exc)})
+            return
+
+        with self._lock:
+            self._pending -= 1
+            entry = self._entries.get(digest)
+            if entry is not None:
+                entry["stored_bytes"] = stored_bytes
+                self._stored_bytes += stored_bytes
+            evicted = self._evict_locked(keep=digest)
+            manifest = self._manifest_locked()
+            total = self._stored_bytes
+        record_artifact("stored")
+        if evicted:
+            record_artifact("evicted", len(evicted))
+            self._unlink(evicted)
+        self._dump_manifest(manifest)
+        set_artifact_store_bytes(total)
+
+    def _write_manifest_task(self) -> None:
+        with self._lock:
+            self._flush_scheduled = False
+            manifest = self._manifest_locked()
+        self._dump_manifest(manifest)
+
+    def _evict_locked(self, *, keep: str) -> List[str]:
+        """Drop expired, then least recently seen, artifacts until within budget."""
+
+        cutoff = self._clock() - self._retention if self._retention > 0 else None
+        evicted: List[str] = []
+        for digest in list(self._entries):
+            entry = self._entries[digest]
+            if digest == keep or entry["stored_bytes"] is None:
+                continue
+            expired = cutoff is not None and entry["last_seen"] < cutoff
+            if not expired and self._stored_bytes <= self._budget:
+                break
+            del self._entries[digest]
+            self._stored_bytes -= entry["stored_bytes"]
+            evicted.append(entry["path"])
+        return evicted
+
+    def _unlink(self, relative_paths: List[str]) -> None:
+        for relative in relative_paths:
+            try:
+                (self._root / relative).unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as exc:
+                logger.warning("artifact.evict_failed", metadata={"path": relative, "error": str(exc)})
+
+    # ------------------------------------------------------------------
+    # manifest
+    # ------------------------------------------------------------------
+    def _manifest_locked(self) -> Dict[str, Any]:
+        return {
+            "version": _MANIFEST_VERSION,
+            "artifacts": {
+                digest: dict(entry) for digest, entry in self._entries.items() if entry["stored_bytes"] is not None
+            },
+        }
+
+    def _dump_manifest(self, manifest: Dict[str, Any]) -> None:
+        target = self._root / MANIFEST_FILENAME
+        staged = target.with_name(MANIFEST_FILENAME + ".tmp")
+        try:
+            self._root.mkdir(parents=True, exist_ok=True)
+            staged.write_text(json.dumps(manifest, separators=(",", ":")), encoding="utf-8")
+            os.replace(staged, target)
+        except OSError as exc:
+            logger.warning("artifact.manifest_write_failed", metadata={"error": str(exc)})
+
+    def _load_manifest(self) -> None:
+        try:
+            manifest = json.loads((self._root / MANIFEST_FILENAME).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as exc:
+            logger.warning("artifact.manifest_unreadable", metadata={"error": str(exc)})
+            return
+        if manifest.get("version") != _MANIFEST_VERSION:
+            return
+        entries = sorted(manifest.get("artifacts", {}).items(), key=lambda item: item[1]["last_seen"])
+        for digest, entry in entries:
+            if (self._root / entry["path"]).exists():
+                self._entries[digest] = entry
+                self._stored_bytes += entry["stored_bytes"]
+        set_artifact_store_bytes(self._stored_bytes)
+
+    def _object_path(self, digest: str, kind: str) -> Path:
+        extension, compress = _KINDS.get(kind, ("bin", True))
+        name = f"{digest}.{extension}.gz" if compress else f"{digest}.{extension}"
+        return self._root / "objects" / digest[:2] / name
+
+
+_store_lock = threading.Lock()
+_store: Optional[ArtifactStore] = None
+
+
+def get_artifact_store(settings: Optional[ScraperSettings] = None) -> ArtifactStore:
+    """Return the process-wide store (created on first use)."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = ArtifactStore(settings=settings)
+        return _store
+
+
+def store_artifact(
+    content: Union[str, bytes],
+    *,
+    kind: str = "html",
+    correlation_id: Optional[str] = None,
+    label: Optional[str] = None,
+) -> Optional[ArtifactRef]:
+    """``get_artifact_store().put(...)``."""
+    return get_artifact_store().put(content, kind=kind, correlation_id=correlation_id, label=label)
+
+
+def artifact_store_snapshot() -> Optional[Dict[str, Any]]:
+    with _store_lock:
+        store = _store
+    return store.snapshot() if store is not None else None
+
+
+def shutdown_artifact_store() -> None:
+    global _store
+    with _store_lock:
+        store, _store = _store, None
+    if store is not None:
+        store.close()
+
+
+__all__ = [
+    "ArtifactRef",
+    "ArtifactStore",
+    "artifact_store_snapshot",
+    "get_artifact_store",
+    "shutdown_artifact_store",
+    "store_artifact",
+]
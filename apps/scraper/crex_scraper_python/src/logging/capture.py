@@ -0,0 +1,227 @@
+"""On-demand diagnostic capture for one live match.
+
+Scrapers used to dump diagnostics on every tick (localStorage files, the
+full sC4 body at DEBUG, the whole localStorage at WARNING). Those dumps
+are gone. Instead ``POST /debug/capture/<match_id>`` arms a
+``CaptureSession`` for a limited number of observation ticks or seconds,
+whichever comes first. While it is armed, that match's scraper adds:
+
+``local_storage``  the raw localStorage map read on each refresh
+``sv3`` / ``sc4``  response bodies as they arrive
+``dom``            ``page.content()`` once per tick
+``state``          the decoded data store and change-detection state per tick
+
+When the session ends, everything is written to one zip archive under
+``<SCRAPER_ARTIFACT_ROOT>/captures``. With nothing armed, the hot path
+costs one dictionary lookup per call site (``capture_session``).
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+import zipfile
+from collections import deque
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+from src.config import ScraperSettings, get_settings
+
+from .adapters import get_logger
+from .diagnostics import get_artifact_directory
+
+logger = get_logger(component="capture")
+
+CAPTURE_KINDS = ("local_storage", "sv3", "sc4", "dom", "state")
+# Bounds one session's memory however long it runs.
+_MAX_ITEMS_PER_KIND = 50
+_MAX_TICKS = 500
+_MAX_SECONDS = 1800.0
+_FINISHED_HISTORY = 20
+_EXTENSIONS = {"dom": "html"}
+
+
+class CaptureSession:
+    """What one match's scraper saw while the capture was armed."""
+
+    def __init__(
+        self,
+        match_id: str,
+        *,
+        max_ticks: int,
+        max_seconds: float,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.match_id = match_id
+        self.max_ticks = max(1, min(int(max_ticks), _MAX_TICKS))
+        self.max_seconds = max(1.0, min(float(max_seconds), _MAX_SECONDS))
+        self._clock = clock
+        self.started_at = clock()
+        self.ticks = 0
+        self.archive: Optional[Path] = None
+        self._lock = threading.Lock()
+        self._items: Dict[str, Deque[Tuple[float, Any]]] = {
+            kind: deque(maxlen=_MAX_ITEMS_PER_KIND) for kind in CAPTURE_KINDS
+        }
+
+    @property
+    def expired(self) -> bool:
+        return self.ticks >= self.max_ticks or self._clock() - self.started_at >= self.max_seconds
+
+    def record(self, kind: str, payload: Any) -> None:
+        with self._lock:
+            self._items[kind].append((self._clock(), payload))
+
+    def tick(self) -> None:
+        with self._lock:
+            self.ticks += 1
+
+    def counts(self) -> Dict[str, int]:
+        with self._lock:
+            return {kind: len(items) for kind, items in self._items.items()}
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "match_id": self.match_id,
+            "started_at": datetime.fromtimestamp(self.started_at, tz=timezone.utc).isoformat(),
+            "ticks": self.ticks,
+            "max_ticks": self.max_ticks,
+            "max_seconds": self.max_seconds,
+            "captured": self.counts(),
+            "archive": str(self.archive) if self.archive else None,
+        }
+
+    def write_archive(self, directory: Path) -> Path:
+        """Write every captured item into one zip and return its path."""
+
+        with self._lock:
+            items = {kind: list(entries) for kind, entries in self._items.items()}
+        stamp = datetime.fromtimestamp(self.started_at, tz=timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"{self.match_id}-{stamp}.zip"
+        staged = path.with_name(path.name + ".tmp")
+        with zipfile.ZipFile(staged, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr("session.json", json.dumps(self.to_dict(), indent=2))
+            for kind, entries in items.items():
+                extension = _EXTENSIONS.get(kind, "json")
+                for index, (captured_at, payload) in enumerate(entries, start=1):
+                    name = f"{kind}/{index:03d}-{captured_at - self.started_at:08.3f}s.{extension}"
+                    if isinstance(payload, str):  # page HTML, or state serialised when it was recorded
+                        archive.writestr(name, payload)
+                    else:
+                        archive.writestr(name, json.dumps(payload, indent=2, default=str, ensure_ascii=False))
+        staged.replace(path)
+        self.archive = path
+        return path
+
+
+class CaptureRegistry:
+    """Armed capture sessions by match id (``derive_match_id`` of the match URL)."""
+
+    def __init__(self, settings: Optional[ScraperSettings] = None, *, clock: Callable[[], float] = time.time) -> None:
+        cfg = settings or get_settings()
+        self._default_ticks = cfg.debug_capture_ticks
+        self._default_seconds = cfg.debug_capture_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._active: Dict[str, CaptureSession] = {}
+        self._finished: Deque[Dict[str, Any]] = deque(maxlen=_FINISHED_HISTORY)
+
+    def arm(self, match_id: str, *, ticks: Optional[int] = None, seconds: Optional[float] = None) -> CaptureSession:
+        """Start (or restart) a capture for ``match_id``."""
+
+        session = CaptureSession(
+            match_id,
+            max_ticks=ticks if ticks is not None else self._default_ticks,
+            max_seconds=seconds if seconds is not None else self._default_seconds,
+            clock=self._clock,
+        )
+        with self._lock:
+            self._active[match_id] = session
+        logger.info(
+            "capture.armed",
+            metadata={"match_id": match_id, "max_ticks": session.max_ticks, "max_seconds": session.max_seconds},
+        )
+        return session
+
+    def session_for(self, match_id: Optional[str]) -> Optional[CaptureSession]:
+        # Hot path: called by the scrapers on every tick and response.
+        return self._active.get(match_id) if self._active else None
+
+    def end_tick(self, match_id: Optional[str], *, directory: Optional[Path] = None) -> Optional[Path]:
+        """Count one observation tick; writes the archive once the session has run its course."""
+
+        session = self.session_for(match_id)
+        if session is None:
+            return None
+        session.tick()
+        if not session.expired:
+            return None
+        return self.finish(match_id, directory=directory)
+
+    def finish(self, match_id: str, *, directory: Optional[Path] = None) -> Optional[Path]:
+        with self._lock:
+            session = self._active.pop(match_id, None)
+        if session is None:
+            return None
+        try:
+            path = session.write_archive(directory or get_artifact_directory("captures"))
+        except (OSError, TypeError, ValueError) as exc:
+            logger.warning("capture.write_failed", metadata={"match_id": match_id, "error": str(exc)})
+            path = None
+        summary = session.to_dict()
+        with self._lock:
+            self._finished.appendleft(summary)
+        logger.info("capture.finished", metadata=summary)
+        return path
+
+    def status(self, match_id: Optional[str] = None) -> Dict[str, Any]:
+        with self._lock:
+            active = [session for key, session in self._active.items() if match_id in (None, key)]
+            finished = [summary for summary in self._finished if match_id in (None, summary["match_id"])]
+        return {"active": [session.to_dict() for session in active], "finished": finished}
+
+
+_registry_lock = threading.Lock()
+_registry: Optional[CaptureRegistry] = None
+
+
+def get_capture_registry(settings: Optional[ScraperSettings] = None) -> CaptureRegistry:
+    """Return the process-wide registry (created on first use)."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = CaptureRegistry(settings)
+        return _registry
+
+
+def capture_session(match_id: Optional[str]) -> Optional[CaptureSession]:
+    """The armed session for ``match_id``, or ``None`` (the steady state)."""
+    registry = _registry
+    return registry.session_for(match_id) if registry is not None else None
+
+
+def end_capture_tick(match_id: Optional[str]) -> Optional[Path]:
+    registry = _registry
+    return registry.end_tick(match_id) if registry is not None else None
+
+
+def finish_capture(match_id: Optional[str]) -> Optional[Path]:
+    """Write out an armed session early, e.g. because its scraper is stopping."""
+    registry = _registry
+    if registry is None or registry.session_for(match_id) is None:
+        return None
+    return registry.finish(match_id)
+
+
+__all__ = [
+    "CAPTURE_KINDS",
+    "CaptureRegistry",
+    "CaptureSession",
+    "capture_session",
+    "end_capture_tick",
+    "finish_capture",
+    "get_capture_registry",
+]
@@ -9,6 +9,7 @@ import shutil
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Optional
+from uuid import uuid4
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -19,6 +20,8 @@ _DEFAULT_RETENTION_DAYS = 14
 _HTML_FILENAME = "page.html"
 _SCREENSHOT_FILENAME = "page.png"
 _STATE_FILENAME = "state.json"
+# Managed by ``src.logging.artifact_store``, which applies its own retention.
+STORE_DIRNAME = "store"
 
 
 def get_artifact_directory(
@@ -103,7 +106,7 @@ def prune_expired_artifacts(max_age_seconds: Optional[int] = None) -> None:
     cutoff = datetime.now(timezone.utc) - timedelta(seconds=retention_seconds)
 
     for entry in root.iterdir():
-        if not entry.is_dir():
+        if not entry.is_dir() or entry.name == STORE_DIRNAME:
             continue
 
         try:
@@ -143,15 +146,8 @@ def _unique_path(directory: Path, filename: str) -> Path:
     if not candidate.exists():
         return candidate
 
-    stem = candidate.stem
-    suffix = candidate.suffix
-    counter = 1
-
-    while candidate.exists():
-        candidate = directory / f"{stem}_{counter}{suffix}"
-        counter += 1
-
-    return candidate
+    # One random suffix instead of probing page_1, page_2, ... until a free name turns up.
+    return directory / f"{candidate.stem}_{uuid4().hex[:12]}{candidate.suffix}"
 
 
 def _resolve_retention_seconds(max_age_seconds: Optional[int]) -> int:
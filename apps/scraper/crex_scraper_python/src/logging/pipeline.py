@@ -0,0 +1,377 @@
+"""Queued logging: scraping threads enqueue, one listener thread does the I/O.
+
+``LoggingPipeline`` puts one ``DroppingQueueHandler`` on every logger it
+routes (the root logger and the legacy ``api_logger``/``scraper_logger``).
+The calling thread only appends the record to a bounded queue. When the
+queue is full the record is dropped and counted
+(``scraper_log_records_dropped_total``) instead of blocking a scrape. A
+single ``QueueListener`` thread formats the records, including rendering
+structlog event dicts (see ``configure_logging``). It writes them to the
+console and to files that rotate by size and by age, and the rotated
+backups are gzip-compressed on a background thread.
+"""
+
+from __future__ import annotations
+
+import atexit
+import gzip
+import logging
+import logging.handlers
+import os
+import queue
+import shutil
+import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from src.config import ScraperSettings, get_settings
+from src.monitoring.monitoring import record_log_dropped
+
+from .adapters import _resolve_log_level
+
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+_EXCEPTION_FORMATTER = logging.Formatter()
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """Never blocks: records that do not fit in the queue are dropped and counted."""
+
+    def __init__(self, log_queue: "queue.Queue[logging.LogRecord]") -> None:
+        super().__init__(log_queue)
+        self._drop_lock = threading.Lock()
+        self._dropped: Dict[str, int] = {}
+        self._unreported = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Only make the record safe to hand over; formatting happens on the listener thread.
+        if record.args and isinstance(record.msg, str):
+            record.msg = record.getMessage()
+            record.args = None
+        if record.exc_info:
+            # Tracebacks pin frames (and their locals) alive while the record waits.
+            record.exc_text = _EXCEPTION_FORMATTER.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self._unreported:
+            self._report_drops()
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self._drop(record.levelname)
+
+    def dropped(self) -> Dict[str, int]:
+        with self._drop_lock:
+            return dict(self._dropped)
+
+    def _drop(self, level: str) -> None:
+        with self._drop_lock:
+            self._dropped[level] = self._dropped.get(level, 0) + 1
+            self._unreported += 1
+        record_log_dropped(level)
+
+    def _report_drops(self) -> None:
+        with self._drop_lock:
+            count, self._unreported = self._unreported, 0
+        if not count:
+            return
+        notice = logging.makeLogRecord(
+            {
+                "name": __name__,
+                "levelno": logging.WARNING,
+                "levelname": "WARNING",
+                "msg": f"dropped {count} log records while the logging queue was full",
+            }
+        )
+        try:
+            self.queue.put_nowait(notice)
+        except queue.Full:
+            with self._drop_lock:
+                self._unreported += count
+
+
+class _InlineHandler(logging.Handler):
+    """``LOG_QUEUE_ENABLED=false``: the same routing, written on the calling thread."""
+
+    def __init__(self, listener: logging.handlers.QueueListener) -> None:
+        super().__init__()
+        self._listener = listener
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self._listener.handle(record)
+
+    def dropped(self) -> Dict[str, int]:
+        return {}
+
+
+class _DrainingQueueListener(logging.handlers.QueueListener):
+    def enqueue_sentinel(self) -> None:
+        # The queue may be full at shutdown; wait for the listener to make room.
+        self.queue.put(self._sentinel, timeout=5.0)
+
+
+class CompressingRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Rotates when the file reaches ``max_bytes`` or is ``interval_seconds`` old.
+
+    With ``compress`` the backups are named ``<file>.N.gz``. The rotated file
+    is gzipped by a worker thread, so the listener only pays for a rename.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        *,
+        max_bytes: int = 0,
+        interval_seconds: int = 0,
+        backup_count: int = 0,
+        compress: bool = True,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8", delay=True)
+        self._interval = interval_seconds
+        self._clock = clock
+        self._rollover_at = self._next_rollover()
+        self._compressor: Optional[ThreadPoolExecutor] = None
+        self._pending: List[Future] = []
+        if compress:
+            self._compressor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="log-compress")
+            self.namer = lambda name: name + ".gz"
+            self.rotator = self._rotate
+
+    def _next_rollover(self) -> float:
+        return self._clock() + self._interval if self._interval > 0 else float("inf")
+
+    def shouldRollover(self, record: logging.LogRecord) -> int:
+        if self._clock() >= self._rollover_at:
+            if os.path.exists(self.baseFilename) and os.path.getsize(self.baseFilename) > 0:
+                return 1
+            # Nothing written this interval; do not leave empty backups behind.
+            self._rollover_at = self._next_rollover()
+        return super().shouldRollover(record)
+
+    def doRollover(self) -> None:
+        # Shifting N.gz -> N+1.gz must not race a compression still writing 1.gz.
+        self.wait_for_compression()
+        super().doRollover()
+        self._rollover_at = self._next_rollover()
+
+    def _rotate(self, source: str, dest: str) -> None:
+        if not os.path.exists(source):
+            return
+        staged = dest[: -len(".gz")]
+        os.replace(source, staged)
+        self._pending.append(self._compressor.submit(_gzip_file, staged, dest))
+
+    def wait_for_compression(self, timeout: Optional[float] = None) -> None:
+        pending, self._pending = self._pending, []
+        for future in pending:
+            try:
+                future.result(timeout=timeout)
+            except Exception as exc:  # pragma: no cover - a failed gzip leaves the plain backup
+                sys.stderr.write(f"log compression failed: {exc}\n")
+
+    def close(self) -> None:
+        self.wait_for_compression(timeout=30.0)
+        if self._compressor is not None:
+            self._compressor.shutdown(wait=True)
+        super().close()
+
+
+def _gzip_file(source: str, dest: str) -> None:
+    with open(source, "rb") as plain, gzip.open(dest, "wb") as compressed:
+        shutil.copyfileobj(plain, compressed)
+    os.remove(source)
+
+
+class PipelineFormatter(logging.Formatter):
+    """Plain text for stdlib records; structlog event dicts go to ``structured``."""
+
+    def __init__(self) -> None:
+        super().__init__(TEXT_FORMAT)
+        self.structured: Optional[logging.Formatter] = None
+
+    def format(self, record: logging.LogRecord) -> str:
+        if self.structured is not None and isinstance(record.msg, dict):
+            return self.structured.format(record)
+        return super().format(record)
+
+
+@dataclass(frozen=True)
+class _Route:
+    filename: Optional[str]
+    console_level: int
+
+
+class _RouteFilter(logging.Filter):
+    def __init__(self, pipeline: "LoggingPipeline", filename: Optional[str]) -> None:
+        super().__init__()
+        self._pipeline = pipeline
+        self._filename = filename
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        route = self._pipeline.route_for(record.name)
+        if route is None:
+            return False
+        if self._filename is None:
+            return record.levelno >= route.console_level
+        return route.filename == self._filename
+
+
+class LoggingPipeline:
+    """One bounded queue and listener shared by every routed logger."""
+
+    ROOT = ""
+
+    def __init__(self, settings: Optional[ScraperSettings] = None, *, stream: Any = None) -> None:
+        cfg = settings or get_settings()
+        self._settings = cfg
+        self._lock = threading.Lock()
+        self.queue: "queue.Queue[logging.LogRecord]" = queue.Queue(maxsize=cfg.log_queue_size)
+        self.formatter = PipelineFormatter()
+        self._routes: Dict[str, _Route] = {}
+        self._files: Dict[str, CompressingRotatingFileHandler] = {}
+        self._console = logging.StreamHandler(stream if stream is not None else sys.stdout)
+        self._console.setFormatter(self.formatter)
+        self._console.addFilter(_RouteFilter(self, None))
+        self._listener = _DrainingQueueListener(self.queue, self._console, respect_handler_level=True)
+        self.queued = cfg.log_queue_enabled
+        self.handler: logging.Handler = (
+            DroppingQueueHandler(self.queue) if self.queued else _InlineHandler(self._listener)
+        )
+        self._running = False
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def start(self) -> None:
+        with self._lock:
+            if not self._running:
+                if self.queued:
+                    self._listener.start()
+                self._running = True
+
+    def stop(self) -> None:
+        """Write out everything queued, then close the files."""
+        with self._lock:
+            if self._running:
+                if self.queued:
+                    self._listener.stop()
+                self._running = False
+            files = list(self._files.values())
+        for handler in files:
+            handler.close()
+
+    def route(
+        self,
+        name: str,
+        filename: Optional[str] = None,
+        *,
+        level: Union[int, str] = logging.INFO,
+        console_level: Union[int, str, None] = None,
+    ) -> logging.Logger:
+        """Send ``name``'s records (``ROOT`` for the root logger) through the queue.
+
+        Records go to ``filename`` (shared by every route naming it) and to
+        the console at ``console_level`` (default: ``level``). Levels may be
+        names (``"INFO"``) as in ``ScraperSettings.log_level``.
+        """
+        level = _resolve_log_level(level)
+        console_level = level if console_level is None else _resolve_log_level(console_level)
+        logger = logging.getLogger(name or None)
+        with self._lock:
+            self._routes[name] = _Route(filename, console_level)
+            if filename and filename not in self._files:
+                handler = CompressingRotatingFileHandler(
+                    filename,
+                    max_bytes=self._settings.log_max_bytes,
+                    interval_seconds=self._settings.log_rotate_interval_seconds,
+                    backup_count=self._settings.log_backup_count,
+                    compress=self._settings.log_compress,
+                )
+                handler.setFormatter(self.formatter)
+                handler.addFilter(_RouteFilter(self, filename))
+                self._files[filename] = handler
+                self._listener.handlers = (self._console, *self._files.values())
+        logger.setLevel(level)
+        if self.handler not in logger.handlers:
+            logger.addHandler(self.handler)
+        if name:
+            # The record is queued once, here, instead of again via the root logger.
+            logger.propagate = False
+        return logger
+
+    def route_for(self, name: str) -> Optional[_Route]:
+        routes = self._routes
+        while name:
+            route = routes.get(name)
+            if route is not None:
+                return route
+            name = name.rpartition(".")[0]
+        return routes.get(self.ROOT)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "running": self._running,
+            "mode": "queued" if self.queued else "inline",
+            "queued": self.queue.qsize(),
+            "capacity": self.queue.maxsize,
+            "dropped": self.handler.dropped(),
+            "files": sorted(self._files),
+        }
+
+
+_pipeline_lock = threading.Lock()
+_pipeline: Optional[LoggingPipeline] = None
+
+
+def get_logging_pipeline(settings: Optional[ScraperSettings] = None) -> LoggingPipeline:
+    """Return the process-wide pipeline, started on first use and drained at exit."""
+    global _pipeline
+    with _pipeline_lock:
+        if _pipeline is None:
+            _pipeline = LoggingPipeline(settings)
+            _pipeline.start()
+            atexit.register(shutdown_logging_pipeline)
+        return _pipeline
+
+
+def route_logger(
+    name: str,
+    filename: Optional[str] = None,
+    *,
+    level: Union[int, str] = logging.INFO,
+    console_level: Union[int, str, None] = None,
+) -> logging.Logger:
+    """Route ``name`` through the shared pipeline (see ``LoggingPipeline.route``)."""
+    return get_logging_pipeline().route(name, filename, level=level, console_level=console_level)
+
+
+def logging_pipeline_snapshot() -> Optional[Dict[str, Any]]:
+    with _pipeline_lock:
+        pipeline = _pipeline
+    return pipeline.snapshot() if pipeline is not None else None
+
+
+def shutdown_logging_pipeline() -> None:
+    global _pipeline
+    with _pipeline_lock:
+        pipeline, _pipeline = _pipeline, None
+    if pipeline is not None:
+        pipeline.stop()
+
+
+__all__ = [
+    "CompressingRotatingFileHandler",
+    "DroppingQueueHandler",
+    "LoggingPipeline",
+    "PipelineFormatter",
+    "get_logging_pipeline",
+    "logging_pipeline_snapshot",
+    "route_logger",
+    "shutdown_logging_pipeline",
+]
@@ -4,10 +4,38 @@ from .monitoring import (
     ensure_metrics_server,
     record_scraper_error,
     record_scraper_retry,
+    set_retry_budget_tokens,
+    record_retry_budget_exhausted,
     record_scraper_update,
     set_scraper_memory,
     set_data_staleness,
     set_active_scrapers,
+    record_egress_result,
+    record_egress_event,
+    set_egress_queue_depth,
+    set_batch_controller_state,
+    record_batch_adjustment,
+    set_bulkhead_state,
+    record_bulkhead_rejection,
+    record_db_pool_acquire,
+    record_db_pool_event,
+    set_db_pool_connections,
+    set_process_census,
+    observe_stage,
+    stage_timer,
+    set_queue_depth,
+    record_egress_bytes,
+    match_label,
+    collect_stale_series,
+    match_label_snapshot,
+    record_memory_trend_alarm,
+    observe_freshness,
+    set_freshness_attainment,
+    record_log_dropped,
+    record_artifact,
+    set_artifact_store_bytes,
+    record_selector_lookup,
+    record_static_parse,
     clear_scraper_gauges,
     update_context_metrics,
     reset_metrics_for_tests,
@@ -17,10 +45,38 @@ __all__ = [
     "ensure_metrics_server",
     "record_scraper_error",
     "record_scraper_retry",
+    "set_retry_budget_tokens",
+    "record_retry_budget_exhausted",
     "record_scraper_update",
     "set_scraper_memory",
     "set_data_staleness",
     "set_active_scrapers",
+    "record_egress_result",
+    "record_egress_event",
+    "set_egress_queue_depth",
+    "set_batch_controller_state",
+    "record_batch_adjustment",
+    "set_bulkhead_state",
+    "record_bulkhead_rejection",
+    "record_db_pool_acquire",
+    "record_db_pool_event",
+    "set_db_pool_connections",
+    "set_process_census",
+    "observe_stage",
+    "stage_timer",
+    "set_queue_depth",
+    "record_egress_bytes",
+    "match_label",
+    "collect_stale_series",
+    "match_label_snapshot",
+    "record_memory_trend_alarm",
+    "observe_freshness",
+    "set_freshness_attainment",
+    "record_log_dropped",
+    "record_artifact",
+    "set_artifact_store_bytes",
+    "record_selector_lookup",
+    "record_static_parse",
     "clear_scraper_gauges",
     "update_context_metrics",
     "reset_metrics_for_tests",
@@ -0,0 +1,199 @@
+"""End-to-end data freshness for live matches.
+
+Every payload the live scraper sends carries a ``FreshnessStamp``: when its
+source data was observed (the sV3 response arriving, or the DOM read behind
+scores, overs and commentary). When the backend acknowledges the send, the
+egress dispatcher hands the stamp to ``FreshnessTracker.record_ack``, which
+observes ``scraper_freshness_seconds`` and keeps a rolling window of
+source-to-ack latencies per match for SLO attainment: the share of
+acknowledged updates within ``freshness_slo_seconds`` (target
+``freshness_slo_target``, e.g. 95% under 3s).
+
+``ScraperContext.staleness_seconds`` reads ``last_fresh_at``, so health and
+the stale-scraper restarts follow what the backend actually holds rather
+than when a scrape job last returned.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, NamedTuple, Optional, Tuple
+
+from src.config import ScraperSettings, get_settings
+from src.logging.adapters import get_logger
+from src.monitoring.monitoring import observe_freshness, set_freshness_attainment
+
+logger = get_logger(component="freshness")
+
+# Attainment over fewer acknowledgements than this is too noisy to alert on.
+_MIN_SLO_SAMPLES = 10
+
+
+class FreshnessStamp(NamedTuple):
+    """Where and when the data in one outgoing payload was observed."""
+
+    source: str  # the live match URL (``ScraperContext.url``)
+    observed_at: float  # wall-clock seconds (``time.time()``)
+    match_id: Optional[str] = None
+
+
+@dataclass
+class _SourceFreshness:
+    match_id: str
+    last_observed_at: float = 0.0
+    last_acked_at: float = 0.0
+    acks: int = 0
+    breaching: bool = False
+    window: Deque[Tuple[float, float]] = field(default_factory=deque)
+
+
+def _percentile(values: List[float], quantile: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, math.ceil(quantile * len(ordered)) - 1))
+    return ordered[index]
+
+
+class FreshnessTracker:
+    """Source-to-acknowledgement latency and SLO attainment per match."""
+
+    def __init__(
+        self,
+        settings: Optional[ScraperSettings] = None,
+        *,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        cfg = settings or get_settings()
+        self._slo_seconds = cfg.freshness_slo_seconds
+        self._target = cfg.freshness_slo_target
+        self._window_seconds = cfg.freshness_slo_window_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._sources: Dict[str, _SourceFreshness] = {}
+
+    def record_ack(self, stamp: FreshnessStamp, *, acked_at: Optional[float] = None) -> float:
+        """Record that the data stamped ``stamp`` reached the backend; returns the latency."""
+        acked = self._clock() if acked_at is None else acked_at
+        latency = max(acked - stamp.observed_at, 0.0)
+        match_id = stamp.match_id or stamp.source
+        with self._lock:
+            state = self._sources.get(stamp.source)
+            if state is None:
+                state = self._sources[stamp.source] = _SourceFreshness(match_id=match_id)
+            # Acks can land out of order across lanes; freshness never moves backwards.
+            state.last_observed_at = max(state.last_observed_at, stamp.observed_at)
+            state.last_acked_at = acked
+            state.acks += 1
+            state.window.append((acked, latency))
+            self._prune_locked(state, acked)
+            attainment = self._attainment_locked(state)
+            transition = self._transition_locked(state, attainment)
+        observe_freshness(match_id, latency)
+        set_freshness_attainment(match_id, attainment)
+        if transition is not None:
+            metadata = {
+                "match_id": match_id,
+                "attainment": round(attainment, 4),
+                "target": self._target,
+                "slo_seconds": self._slo_seconds,
+            }
+            if transition:
+                logger.warning("freshness.slo.breach", metadata=metadata)
+            else:
+                logger.info("freshness.slo.recovered", metadata=metadata)
+        return latency
+
+    def last_fresh_at(self, source: str) -> Optional[float]:
+        """Observation time of the newest acknowledged data for ``source``."""
+        with self._lock:
+            state = self._sources.get(source)
+            return state.last_observed_at if state is not None else None
+
+    def attainment(self, source: str) -> Optional[float]:
+        with self._lock:
+            state = self._sources.get(source)
+            if state is None:
+                return None
+            self._prune_locked(state, self._clock())
+            return self._attainment_locked(state)
+
+    def forget(self, source: str) -> None:
+        with self._lock:
+            state = self._sources.pop(source, None)
+        if state is not None:
+            set_freshness_attainment(state.match_id, None)
+
+    def snapshot(self) -> Dict[str, Any]:
+        now = self._clock()
+        matches: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            for source, state in self._sources.items():
+                self._prune_locked(state, now)
+                latencies = [latency for _, latency in state.window]
+                attainment = self._attainment_locked(state)
+                matches[state.match_id] = {
+                    "url": source,
+                    "freshness_seconds": round(max(now - state.last_observed_at, 0.0), 3),
+                    "acks": state.acks,
+                    "window_acks": len(latencies),
+                    "p50_seconds": round(_percentile(latencies, 0.5), 3) if latencies else None,
+                    "p95_seconds": round(_percentile(latencies, 0.95), 3) if latencies else None,
+                    "attainment": round(attainment, 4) if attainment is not None else None,
+                    "meets_slo": attainment is None or attainment >= self._target,
+                }
+        return {
+            "slo_seconds": self._slo_seconds,
+            "target": self._target,
+            "window_seconds": self._window_seconds,
+            "matches": matches,
+        }
+
+    def _prune_locked(self, state: _SourceFreshness, now: float) -> None:
+        cutoff = now - self._window_seconds
+        while state.window and state.window[0][0] < cutoff:
+            state.window.popleft()
+
+    def _attainment_locked(self, state: _SourceFreshness) -> Optional[float]:
+        if not state.window:
+            return None
+        within = sum(1 for _, latency in state.window if latency <= self._slo_seconds)
+        return within / len(state.window)
+
+    def _transition_locked(self, state: _SourceFreshness, attainment: Optional[float]) -> Optional[bool]:
+        if attainment is None or len(state.window) < _MIN_SLO_SAMPLES:
+            return None
+        breaching = attainment < self._target
+        if breaching == state.breaching:
+            return None
+        state.breaching = breaching
+        return breaching
+
+
+_tracker_lock = threading.Lock()
+_tracker: Optional[FreshnessTracker] = None
+
+
+def get_freshness_tracker(settings: Optional[ScraperSettings] = None) -> FreshnessTracker:
+    """Return the process-wide tracker (created on first use)."""
+    global _tracker
+    with _tracker_lock:
+        if _tracker is None:
+            _tracker = FreshnessTracker(settings)
+        return _tracker
+
+
+def reset_freshness_tracker() -> None:
+    global _tracker
+    with _tracker_lock:
+        _tracker = None
+
+
+__all__ = [
+    "FreshnessStamp",
+    "FreshnessTracker",
+    "get_freshness_tracker",
+    "reset_freshness_tracker",
+]
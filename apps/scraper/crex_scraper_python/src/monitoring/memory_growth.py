@@ -0,0 +1,366 @@
+"""Opt-in memory growth detector for the scraper service.
+
+Enabled with ``MEMORY_TRACKING_ENABLED``; ``tracemalloc`` costs roughly
+10-30% CPU on allocation-heavy code plus the memory for its tracebacks, so
+it is never on by default. Every ``memory_snapshot_interval_seconds`` the
+tracker:
+
+* takes a ``tracemalloc`` snapshot and diffs it against the previous one and
+  against the first (baseline) snapshot, grouped by allocation traceback;
+* attributes each top growth site to the live threads whose current stack
+  shares a frame with the allocation traceback (the long-running scrape,
+  egress and sampler loops are always on their own stacks), tagged with the
+  match the thread is scraping;
+* measures the objects registered with ``watch_match`` (each match's
+  ``data_store``), so per-match growth is visible even when the allocation
+  sites are shared;
+* fits a line through the last ``memory_trend_window`` memory readings of
+  each scraper context and raises an alarm when the projected time to
+  ``memory_soft_limit_mb`` drops below ``memory_trend_alarm_seconds``.
+
+The latest report is served at ``/debug/memory``.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+from src.config import ScraperSettings, get_settings
+from src.logging.adapters import get_logger, thread_match_ids
+
+logger = get_logger(component="memory_growth")
+
+MB = 1024 * 1024
+_SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+_THREADING_FILE = os.path.basename(threading.__file__)
+
+ContextsProvider = Callable[[], Iterable[object]]
+ObjectsProvider = Callable[[], Mapping[str, object]]
+
+
+def approximate_size(obj: object, *, max_objects: int = 200_000) -> int:
+    """Recursive ``sys.getsizeof`` over builtin containers (shared objects counted once).
+
+    Other objects count only their own size, so a ``data_store`` holding a
+    lock or an archive handle does not pull in unrelated object graphs.
+    """
+    seen: Set[int] = set()
+    stack = [obj]
+    total = 0
+    while stack and len(seen) < max_objects:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        try:
+            total += sys.getsizeof(item)
+        except TypeError:
+            continue
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset, deque)):
+            stack.extend(item)
+    return total
+
+
+def trend_slope(points: Iterable[Tuple[float, float]]) -> Optional[float]:
+    """Least-squares slope (units per second) of ``(time, value)`` points."""
+    samples = list(points)
+    if len(samples) < 2:
+        return None
+    mean_t = sum(t for t, _ in samples) / len(samples)
+    mean_v = sum(v for _, v in samples) / len(samples)
+    denominator = sum((t - mean_t) ** 2 for t, _ in samples)
+    if denominator == 0:
+        return None
+    return sum((t - mean_t) * (v - mean_v) for t, v in samples) / denominator
+
+
+def _stack_frames(frame) -> Set[Tuple[str, int]]:
+    frames = set()
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if os.path.basename(filename) != _THREADING_FILE:
+            frames.add((filename, frame.f_lineno))
+        frame = frame.f_back
+    return frames
+
+
+class MemoryGrowthTracker:
+    """Periodic tracemalloc snapshots, growth attribution and trend alarms."""
+
+    def __init__(
+        self,
+        contexts: ContextsProvider = lambda: (),
+        *,
+        settings: Optional[ScraperSettings] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._contexts = contexts
+        self._settings = settings or get_settings()
+        self._interval = self._settings.memory_snapshot_interval_seconds
+        self._top_n = self._settings.memory_top_n
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._started_tracemalloc = False
+        self._baseline: Optional[tracemalloc.Snapshot] = None
+        self._previous: Optional[tracemalloc.Snapshot] = None
+        self._watched: Dict[str, ObjectsProvider] = {}
+        self._watched_sizes: Dict[str, Dict[str, int]] = {}
+        self._trends: Dict[str, Deque[Tuple[float, float]]] = {}
+        self._alarms: Dict[str, Dict[str, Any]] = {}
+        self._samples = 0
+        self._report: Dict[str, Any] = {}
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self._settings.memory_tracemalloc_frames)
+            self._started_tracemalloc = True
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True, name="MemoryGrowth")
+        self._thread.start()
+        logger.info(
+            "memory.tracker.started",
+            metadata={"interval_seconds": self._interval, "frames": tracemalloc.get_traceback_limit()},
+        )
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+        with self._lock:
+            self._baseline = self._previous = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            try:
+                self.sample_once()
+            except Exception as exc:
+                logger.error("memory.tracker.error", metadata={"error": str(exc)})
+
+    # ------------------------------------------------------------------
+    # Per-match objects
+    # ------------------------------------------------------------------
+    def watch_match(self, match_id: str, objects: ObjectsProvider) -> None:
+        with self._lock:
+            self._watched[match_id] = objects
+
+    def unwatch_match(self, match_id: str) -> None:
+        with self._lock:
+            self._watched.pop(match_id, None)
+            self._watched_sizes.pop(match_id, None)
+            self._trends.pop(match_id, None)
+            self._alarms.pop(match_id, None)
+
+    # ------------------------------------------------------------------
+    # Sampling
+    # ------------------------------------------------------------------
+    def sample_once(self) -> Dict[str, Any]:
+        started = time.perf_counter()
+        report: Dict[str, Any] = {"taken_at": time.time(), "samples": self._samples + 1}
+        if tracemalloc.is_tracing():
+            snapshot = tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+            with self._lock:
+                baseline, previous = self._baseline, self._previous
+                self._baseline = baseline if baseline is not None else snapshot
+                self._previous = snapshot
+            current, peak = tracemalloc.get_traced_memory()
+            report["traced"] = {
+                "current_mb": round(current / MB, 2),
+                "peak_mb": round(peak / MB, 2),
+                "tracemalloc_overhead_mb": round(tracemalloc.get_tracemalloc_memory() / MB, 2),
+            }
+            threads = self._thread_stacks()
+            if previous is not None:
+                report["growth_since_previous"] = self._top_growth(snapshot, previous, threads)
+            if baseline is not None:
+                report["growth_since_baseline"] = self._top_growth(snapshot, baseline, threads)
+        report["matches"] = self._sample_matches()
+        report["alarms"] = list(self._alarms.values())
+        report["sample_ms"] = round((time.perf_counter() - started) * 1000, 2)
+        with self._lock:
+            self._samples += 1
+            self._report = report
+        return report
+
+    def _thread_stacks(self) -> List[Tuple[str, Optional[str], Set[Tuple[str, int]]]]:
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        matches = thread_match_ids()
+        own = threading.get_ident()
+        return [
+            (names.get(ident, f"thread-{ident}"), matches.get(ident), _stack_frames(frame))
+            for ident, frame in sys._current_frames().items()
+            if ident != own
+        ]
+
+    def _top_growth(self, snapshot, reference, threads) -> List[Dict[str, Any]]:
+        rows = []
+        for stat in snapshot.compare_to(reference, "traceback")[: self._top_n]:
+            if stat.size_diff <= 0:
+                continue
+            frames = {(frame.filename, frame.lineno) for frame in stat.traceback}
+            owners = [
+                {"thread": name, "match_id": match_id}
+                for name, match_id, stack in threads
+                if frames & stack
+            ]
+            # Traceback frames run oldest first; the allocating line is the last one.
+            top_frame = stat.traceback[-1]
+            rows.append(
+                {
+                    "site": f"{top_frame.filename}:{top_frame.lineno}",
+                    "size_diff_kb": round(stat.size_diff / 1024, 1),
+                    "count_diff": stat.count_diff,
+                    "size_kb": round(stat.size / 1024, 1),
+                    "threads": owners,
+                    "traceback": [f"{frame.filename}:{frame.lineno}" for frame in reversed(stat.traceback)],
+                }
+            )
+        return rows
+
+    def _sample_matches(self) -> Dict[str, Dict[str, Any]]:
+        now = self._clock()
+        limit_bytes = self._settings.memory_soft_limit_mb * MB
+        window = self._settings.memory_trend_window
+        with self._lock:
+            watched = dict(self._watched)
+        matches: Dict[str, Dict[str, Any]] = {}
+
+        for match_id, provider in watched.items():
+            try:
+                sizes = {name: approximate_size(obj) for name, obj in provider().items()}
+            except Exception as exc:  # the objects may be mutated mid-walk by the scrape thread
+                logger.debug("memory.watch.failed", metadata={"match_id": match_id, "error": str(exc)})
+                continue
+            previous = self._watched_sizes.get(match_id, {})
+            self._watched_sizes[match_id] = sizes
+            matches.setdefault(match_id, {})["objects"] = {
+                name: {"bytes": size, "growth_bytes": size - previous.get(name, size)} for name, size in sizes.items()
+            }
+
+        for context in self._contexts():
+            match_id = getattr(context, "match_id", None)
+            memory_bytes = float(getattr(context, "memory_bytes", 0) or 0)
+            if not match_id or memory_bytes <= 0:
+                continue
+            points = self._trends.setdefault(match_id, deque(maxlen=window))
+            points.append((now, memory_bytes))
+            slope = trend_slope(points)
+            seconds_to_limit = None
+            if slope and slope > 0 and memory_bytes < limit_bytes:
+                seconds_to_limit = (limit_bytes - memory_bytes) / slope
+            trend = {
+                "memory_mb": round(memory_bytes / MB, 1),
+                "slope_mb_per_minute": round(slope * 60 / MB, 3) if slope is not None else None,
+                "seconds_to_soft_limit": round(seconds_to_limit) if seconds_to_limit is not None else None,
+            }
+            matches.setdefault(match_id, {})["trend"] = trend
+            self._update_alarm(match_id, trend, seconds_to_limit, full_window=len(points) >= window)
+        return matches
+
+    def _update_alarm(self, match_id: str, trend: Dict[str, Any], seconds_to_limit: Optional[float], *, full_window: bool) -> None:
+        alarming = full_window and seconds_to_limit is not None and seconds_to_limit < self._settings.memory_trend_alarm_seconds
+        if not alarming:
+            self._alarms.pop(match_id, None)
+            return
+        if match_id not in self._alarms:
+            logger.warning("memory.trend.alarm", metadata={"match_id": match_id, **trend})
+            try:
+                from src import monitoring
+
+                monitoring.record_memory_trend_alarm()
+            except Exception:  # pragma: no cover - metrics must never break sampling
+                pass
+        self._alarms[match_id] = {"match_id": match_id, **trend}
+
+    def report(self) -> Dict[str, Any]:
+        with self._lock:
+            report = dict(self._report)
+            samples = self._samples
+        return {
+            "enabled": True,
+            "running": bool(self._thread and self._thread.is_alive()),
+            "tracing": tracemalloc.is_tracing(),
+            "interval_seconds": self._interval,
+            "samples": samples,
+            "watched_matches": len(self._watched),
+            "latest": report,
+        }
+
+
+_tracker_lock = threading.Lock()
+_tracker: Optional[MemoryGrowthTracker] = None
+
+
+def start_memory_tracker(contexts: ContextsProvider, *, settings: Optional[ScraperSettings] = None) -> Optional[MemoryGrowthTracker]:
+    """Start the shared tracker when ``memory_tracking_enabled`` (idempotent)."""
+    global _tracker
+    cfg = settings or get_settings()
+    if not cfg.memory_tracking_enabled:
+        return None
+    with _tracker_lock:
+        if _tracker is None:
+            _tracker = MemoryGrowthTracker(contexts, settings=cfg)
+        _tracker.start()
+        return _tracker
+
+
+def stop_memory_tracker() -> None:
+    global _tracker
+    with _tracker_lock:
+        tracker, _tracker = _tracker, None
+    if tracker is not None:
+        tracker.stop()
+
+
+def get_memory_tracker() -> Optional[MemoryGrowthTracker]:
+    with _tracker_lock:
+        return _tracker
+
+
+def watch_match(match_id: str, objects: ObjectsProvider) -> None:
+    """Measure ``objects()`` for ``match_id`` on every snapshot (no-op when tracking is off)."""
+    tracker = get_memory_tracker()
+    if tracker is not None:
+        tracker.watch_match(match_id, objects)
+
+
+def unwatch_match(match_id: str) -> None:
+    tracker = get_memory_tracker()
+    if tracker is not None:
+        tracker.unwatch_match(match_id)
+
+
+__all__ = [
+    "MemoryGrowthTracker",
+    "approximate_size",
+    "get_memory_tracker",
+    "start_memory_tracker",
+    "stop_memory_tracker",
+    "trend_slope",
+    "unwatch_match",
+    "watch_match",
+]
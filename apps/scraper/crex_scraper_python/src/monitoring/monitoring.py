@@ -1,9 +1,20 @@
-"""Prometheus metrics helpers for the scraper service."""
+"""Prometheus metrics helpers for the scraper service.
+
+Per-match series go through ``match_label``: at most
+``metrics_match_label_limit`` matches get their own ``match_id`` value (the
+least recently used one is evicted once it has been idle), the rest are
+counted under ``other``. ``clear_scraper_gauges`` drops a finished match's
+gauges at once and its counters and histograms after
+``metrics_series_ttl_seconds``, so their final values are still scraped.
+"""
 
 from __future__ import annotations
 
 import threading
-from typing import Optional
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
 
 from prometheus_client import (
     CollectorRegistry,
@@ -19,6 +30,7 @@ try:  # pragma: no cover - typing-only import
     from typing import TYPE_CHECKING
 
     if TYPE_CHECKING:
+        from src.core.process_census import ProcessCensus
         from src.core.scraper_context import ScraperContext
 except ImportError:  # pragma: no cover - mypy safety on partial installs
     TYPE_CHECKING = False  # type: ignore
@@ -35,6 +47,53 @@ DEFAULT_LATENCY_BUCKETS: tuple[float, ...] = (
     60.0,
 )
 
+EGRESS_LATENCY_BUCKETS: tuple[float, ...] = (
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+STAGE_LATENCY_BUCKETS: tuple[float, ...] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# Source-to-acknowledgement latency; the default SLO sits at 3s.
+FRESHNESS_BUCKETS: tuple[float, ...] = (
+    0.25,
+    0.5,
+    1.0,
+    2.0,
+    3.0,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+)
+
+OTHER_MATCH_LABEL = "other"
+
 _METRIC_LOCK = threading.Lock()
 _METRIC_SERVER_STARTED = False
 
@@ -90,6 +149,205 @@ def _initialize_metrics(registry: CollectorRegistry) -> dict[str, object]:
         ("match_id",),
         registry=registry,
     )
+    egress_latency = Histogram(
+        "scraper_egress_latency_seconds",
+        "Seconds from enqueue to backend acknowledgement per egress lane.",
+        ("lane",),
+        buckets=EGRESS_LATENCY_BUCKETS,
+        registry=registry,
+    )
+    egress_requests = Counter(
+        "scraper_egress_requests_total",
+        "Egress payload outcomes per lane (sent, failed, coalesced, dropped).",
+        ("lane", "outcome"),
+        registry=registry,
+    )
+    egress_slo_breaches = Counter(
+        "scraper_egress_slo_breaches_total",
+        "Egress deliveries whose latency exceeded the lane SLO.",
+        ("lane",),
+        registry=registry,
+    )
+    egress_queue_depth = Gauge(
+        "scraper_egress_queue_depth",
+        "Payloads waiting or in flight per egress lane.",
+        ("lane",),
+        registry=registry,
+    )
+    batch_size = Gauge(
+        "scraper_batch_size",
+        "Current batch size chosen by the adaptive batch controller.",
+        ("controller",),
+        registry=registry,
+    )
+    batch_interval = Gauge(
+        "scraper_batch_flush_interval_seconds",
+        "Current flush interval chosen by the adaptive batch controller.",
+        ("controller",),
+        registry=registry,
+    )
+    batch_p95 = Gauge(
+        "scraper_batch_observed_p95_seconds",
+        "Backend p95 latency observed by the adaptive batch controller.",
+        ("controller",),
+        registry=registry,
+    )
+    batch_error_rate = Gauge(
+        "scraper_batch_observed_error_rate",
+        "Backend error rate observed by the adaptive batch controller.",
+        ("controller",),
+        registry=registry,
+    )
+    batch_adjustments = Counter(
+        "scraper_batch_adjustments_total",
+        "Adaptive batch controller adjustments by direction.",
+        ("controller", "direction"),
+        registry=registry,
+    )
+    retry_budget_tokens = Gauge(
+        "scraper_retry_budget_tokens",
+        "Tokens left in the shared retry budget per operation.",
+        ("operation",),
+        registry=registry,
+    )
+    retry_budget_exhausted = Counter(
+        "scraper_retry_budget_exhausted_total",
+        "Retries refused because the shared retry budget was empty.",
+        ("operation",),
+        registry=registry,
+    )
+    bulkhead_in_flight = Gauge(
+        "scraper_bulkhead_in_flight",
+        "Calls currently running inside each dependency bulkhead.",
+        ("dependency",),
+        registry=registry,
+    )
+    bulkhead_queued = Gauge(
+        "scraper_bulkhead_queued",
+        "Calls waiting for a slot in each dependency bulkhead.",
+        ("dependency",),
+        registry=registry,
+    )
+    bulkhead_saturation = Gauge(
+        "scraper_bulkhead_saturation_ratio",
+        "In-flight calls divided by the bulkhead limit (1.0 means every slot is busy).",
+        ("dependency",),
+        registry=registry,
+    )
+    bulkhead_rejections = Counter(
+        "scraper_bulkhead_rejections_total",
+        "Calls shed by a dependency bulkhead (queue_full, timeout).",
+        ("dependency", "reason"),
+        registry=registry,
+    )
+    db_pool_acquire = Histogram(
+        "scraper_db_pool_acquire_seconds",
+        "Seconds spent waiting to check a connection out of the SQLite pool.",
+        ("pool",),
+        buckets=EGRESS_LATENCY_BUCKETS,
+        registry=registry,
+    )
+    db_pool_events = Counter(
+        "scraper_db_pool_events_total",
+        "SQLite pool events (acquire_timeout, unhealthy_replaced).",
+        ("pool", "event"),
+        registry=registry,
+    )
+    db_pool_connections = Gauge(
+        "scraper_db_pool_connections",
+        "SQLite pool connections by state (in_use, available).",
+        ("pool", "state"),
+        registry=registry,
+    )
+    cpu = Gauge(
+        "scraper_cpu_percent",
+        "CPU percent of the scraper's browser process subtree (from the process census).",
+        ("match_id",),
+        registry=registry,
+    )
+    census_processes = Gauge(
+        "scraper_census_processes",
+        "Processes seen by the last process census, by kind (all, browser, orphaned_browser).",
+        ("kind",),
+        registry=registry,
+    )
+    census_duration = Gauge(
+        "scraper_census_duration_seconds",
+        "Wall time of the last process census walk.",
+        registry=registry,
+    )
+    stage_latency = Histogram(
+        "scraper_stage_latency_seconds",
+        "Duration of one pipeline stage (tick, evaluate, decode, egress, sc4_fetch, sc4_decode).",
+        ("stage",),
+        buckets=STAGE_LATENCY_BUCKETS,
+        registry=registry,
+    )
+    queue_depth = Gauge(
+        "scraper_queue_depth",
+        "Items waiting in an internal queue (sC4 executor, write-behind stores).",
+        ("queue",),
+        registry=registry,
+    )
+    egress_bytes = Counter(
+        "scraper_egress_bytes_total",
+        "Encoded request body bytes sent to the backend.",
+        ("endpoint", "encoding"),
+        registry=registry,
+    )
+    match_label_events = Counter(
+        "scraper_match_label_events_total",
+        "Per-match label cache events (evicted, overflow, collected).",
+        ("event",),
+        registry=registry,
+    )
+    memory_trend_alarms = Counter(
+        "scraper_memory_trend_alarms_total",
+        "Scraper contexts whose memory trend projects the soft limit within the alarm horizon.",
+        registry=registry,
+    )
+    freshness = Histogram(
+        "scraper_freshness_seconds",
+        "Time from observing source data (sV3 response or DOM read) to the backend acknowledging it.",
+        ("match_id",),
+        buckets=FRESHNESS_BUCKETS,
+        registry=registry,
+    )
+    freshness_slo = Gauge(
+        "scraper_freshness_slo_attainment_ratio",
+        "Share of acknowledged updates within the freshness SLO over the SLO window.",
+        ("match_id",),
+        registry=registry,
+    )
+    log_dropped = Counter(
+        "scraper_log_records_dropped_total",
+        "Log records dropped because the logging queue was full.",
+        ("level",),
+        registry=registry,
+    )
+    artifacts = Counter(
+        "scraper_artifacts_total",
+        "Diagnostic artifacts captured, by outcome (stored, deduplicated, dropped, evicted).",
+        ("outcome",),
+        registry=registry,
+    )
+    artifact_store_bytes = Gauge(
+        "scraper_artifact_store_bytes",
+        "Compressed bytes held by the diagnostics artifact store.",
+        registry=registry,
+    )
+    selector_lookups = Counter(
+        "scraper_selector_lookups_total",
+        "Selector chain lookups by the chain position that matched (\"none\" when every selector missed).",
+        ("selector_key", "selector_index"),
+        registry=registry,
+    )
+    static_parses = Counter(
+        "scraper_static_parses_total",
+        "Browser-free page parses by outcome (complete, incomplete, fetch_error); anything but complete falls back to Chromium.",
+        ("page", "outcome"),
+        registry=registry,
+    )
     return {
         "errors": errors,
         "retries": retries,
@@ -99,6 +357,39 @@ def _initialize_metrics(registry: CollectorRegistry) -> dict[str, object]:
         "pids": pids,
         "active": active,
         "staleness": staleness,
+        "egress_latency": egress_latency,
+        "egress_requests": egress_requests,
+        "egress_slo_breaches": egress_slo_breaches,
+        "egress_queue_depth": egress_queue_depth,
+        "batch_size": batch_size,
+        "batch_interval": batch_interval,
+        "batch_p95": batch_p95,
+        "batch_error_rate": batch_error_rate,
+        "batch_adjustments": batch_adjustments,
+        "retry_budget_tokens": retry_budget_tokens,
+        "retry_budget_exhausted": retry_budget_exhausted,
+        "bulkhead_in_flight": bulkhead_in_flight,
+        "bulkhead_queued": bulkhead_queued,
+        "bulkhead_saturation": bulkhead_saturation,
+        "bulkhead_rejections": bulkhead_rejections,
+        "db_pool_acquire": db_pool_acquire,
+        "db_pool_events": db_pool_events,
+        "db_pool_connections": db_pool_connections,
+        "cpu": cpu,
+        "census_processes": census_processes,
+        "census_duration": census_duration,
+        "stage_latency": stage_latency,
+        "queue_depth": queue_depth,
+        "egress_bytes": egress_bytes,
+        "match_label_events": match_label_events,
+        "memory_trend_alarms": memory_trend_alarms,
+        "freshness": freshness,
+        "freshness_slo": freshness_slo,
+        "log_dropped": log_dropped,
+        "artifacts": artifacts,
+        "artifact_store_bytes": artifact_store_bytes,
+        "selector_lookups": selector_lookups,
+        "static_parses": static_parses,
     }
 
 
@@ -111,6 +402,164 @@ SCRAPER_MEMORY_BYTES: Gauge = _metrics["memory"]  # type: ignore[assignment]
 SCRAPER_PIDS_TOTAL: Gauge = _metrics["pids"]  # type: ignore[assignment]
 ACTIVE_SCRAPERS_COUNT: Gauge = _metrics["active"]  # type: ignore[assignment]
 DATA_STALENESS_SECONDS: Gauge = _metrics["staleness"]  # type: ignore[assignment]
+SCRAPER_EGRESS_LATENCY_SECONDS: Histogram = _metrics["egress_latency"]  # type: ignore[assignment]
+SCRAPER_EGRESS_REQUESTS_TOTAL: Counter = _metrics["egress_requests"]  # type: ignore[assignment]
+SCRAPER_EGRESS_SLO_BREACHES_TOTAL: Counter = _metrics["egress_slo_breaches"]  # type: ignore[assignment]
+SCRAPER_EGRESS_QUEUE_DEPTH: Gauge = _metrics["egress_queue_depth"]  # type: ignore[assignment]
+SCRAPER_BATCH_SIZE: Gauge = _metrics["batch_size"]  # type: ignore[assignment]
+SCRAPER_BATCH_FLUSH_INTERVAL_SECONDS: Gauge = _metrics["batch_interval"]  # type: ignore[assignment]
+SCRAPER_BATCH_OBSERVED_P95_SECONDS: Gauge = _metrics["batch_p95"]  # type: ignore[assignment]
+SCRAPER_BATCH_OBSERVED_ERROR_RATE: Gauge = _metrics["batch_error_rate"]  # type: ignore[assignment]
+SCRAPER_BATCH_ADJUSTMENTS_TOTAL: Counter = _metrics["batch_adjustments"]  # type: ignore[assignment]
+SCRAPER_RETRY_BUDGET_TOKENS: Gauge = _metrics["retry_budget_tokens"]  # type: ignore[assignment]
+SCRAPER_RETRY_BUDGET_EXHAUSTED_TOTAL: Counter = _metrics["retry_budget_exhausted"]  # type: ignore[assignment]
+SCRAPER_BULKHEAD_IN_FLIGHT: Gauge = _metrics["bulkhead_in_flight"]  # type: ignore[assignment]
+SCRAPER_BULKHEAD_QUEUED: Gauge = _metrics["bulkhead_queued"]  # type: ignore[assignment]
+SCRAPER_BULKHEAD_SATURATION: Gauge = _metrics["bulkhead_saturation"]  # type: ignore[assignment]
+SCRAPER_BULKHEAD_REJECTIONS_TOTAL: Counter = _metrics["bulkhead_rejections"]  # type: ignore[assignment]
+SCRAPER_DB_POOL_ACQUIRE_SECONDS: Histogram = _metrics["db_pool_acquire"]  # type: ignore[assignment]
+SCRAPER_DB_POOL_EVENTS_TOTAL: Counter = _metrics["db_pool_events"]  # type: ignore[assignment]
+SCRAPER_DB_POOL_CONNECTIONS: Gauge = _metrics["db_pool_connections"]  # type: ignore[assignment]
+SCRAPER_CPU_PERCENT: Gauge = _metrics["cpu"]  # type: ignore[assignment]
+SCRAPER_CENSUS_PROCESSES: Gauge = _metrics["census_processes"]  # type: ignore[assignment]
+SCRAPER_CENSUS_DURATION_SECONDS: Gauge = _metrics["census_duration"]  # type: ignore[assignment]
+SCRAPER_STAGE_LATENCY_SECONDS: Histogram = _metrics["stage_latency"]  # type: ignore[assignment]
+SCRAPER_QUEUE_DEPTH: Gauge = _metrics["queue_depth"]  # type: ignore[assignment]
+SCRAPER_EGRESS_BYTES_TOTAL: Counter = _metrics["egress_bytes"]  # type: ignore[assignment]
+SCRAPER_MATCH_LABEL_EVENTS_TOTAL: Counter = _metrics["match_label_events"]  # type: ignore[assignment]
+SCRAPER_MEMORY_TREND_ALARMS_TOTAL: Counter = _metrics["memory_trend_alarms"]  # type: ignore[assignment]
+SCRAPER_FRESHNESS_SECONDS: Histogram = _metrics["freshness"]  # type: ignore[assignment]
+SCRAPER_FRESHNESS_SLO_ATTAINMENT: Gauge = _metrics["freshness_slo"]  # type: ignore[assignment]
+SCRAPER_LOG_RECORDS_DROPPED_TOTAL: Counter = _metrics["log_dropped"]  # type: ignore[assignment]
+SCRAPER_ARTIFACTS_TOTAL: Counter = _metrics["artifacts"]  # type: ignore[assignment]
+SCRAPER_ARTIFACT_STORE_BYTES: Gauge = _metrics["artifact_store_bytes"]  # type: ignore[assignment]
+SCRAPER_SELECTOR_LOOKUPS_TOTAL: Counter = _metrics["selector_lookups"]  # type: ignore[assignment]
+SCRAPER_STATIC_PARSES_TOTAL: Counter = _metrics["static_parses"]  # type: ignore[assignment]
+
+
+class MatchLabelCache:
+    """LRU of the match ids that get their own ``match_id`` label value."""
+
+    def __init__(
+        self,
+        limit: int,
+        *,
+        idle_seconds: float,
+        series_ttl_seconds: float,
+        clock=time.monotonic,
+    ) -> None:
+        self._limit = max(limit, 1)
+        self._idle_seconds = idle_seconds
+        self._series_ttl_seconds = series_ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._last_used: "OrderedDict[str, float]" = OrderedDict()
+        self._retired: Dict[str, float] = {}
+
+    def resolve(self, match_id: str) -> str:
+        self.collect()
+        now = self._clock()
+        evicted = None
+        with self._lock:
+            if match_id in self._last_used:
+                self._last_used.move_to_end(match_id)
+                self._last_used[match_id] = now
+                self._retired.pop(match_id, None)
+                return match_id
+            if len(self._last_used) >= self._limit:
+                oldest, last_used = next(iter(self._last_used.items()))
+                if now - last_used < self._idle_seconds:
+                    label = OTHER_MATCH_LABEL
+                else:
+                    evicted = oldest
+                    del self._last_used[oldest]
+                    self._retired.pop(oldest, None)
+            if evicted is not None or len(self._last_used) < self._limit:
+                self._last_used[match_id] = now
+                label = match_id
+        if evicted is not None:
+            _remove_match_series(evicted)
+            SCRAPER_MATCH_LABEL_EVENTS_TOTAL.labels(event="evicted").inc()
+        elif label == OTHER_MATCH_LABEL:
+            SCRAPER_MATCH_LABEL_EVENTS_TOTAL.labels(event="overflow").inc()
+        return label
+
+    def is_tracked(self, match_id: str) -> bool:
+        with self._lock:
+            return match_id in self._last_used
+
+    def retire(self, match_id: str) -> None:
+        """Schedule the remaining series of ``match_id`` for removal."""
+        with self._lock:
+            if match_id in self._last_used:
+                self._retired[match_id] = self._clock() + self._series_ttl_seconds
+
+    def collect(self) -> int:
+        """Remove the series of retired matches whose TTL has passed."""
+        now = self._clock()
+        with self._lock:
+            due: List[str] = [key for key, deadline in self._retired.items() if deadline <= now]
+            for key in due:
+                del self._retired[key]
+                self._last_used.pop(key, None)
+        for key in due:
+            _remove_match_series(key)
+            SCRAPER_MATCH_LABEL_EVENTS_TOTAL.labels(event="collected").inc()
+        return len(due)
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return {"limit": self._limit, "tracked": len(self._last_used), "retired": len(self._retired)}
+
+
+_label_cache: Optional[MatchLabelCache] = None
+
+
+def _match_labels() -> MatchLabelCache:
+    global _label_cache
+    with _METRIC_LOCK:
+        if _label_cache is None:
+            cfg = get_settings()
+            _label_cache = MatchLabelCache(
+                cfg.metrics_match_label_limit,
+                idle_seconds=cfg.metrics_match_label_idle_seconds,
+                series_ttl_seconds=cfg.metrics_series_ttl_seconds,
+            )
+        return _label_cache
+
+
+def _remove_match_series(match_id: str) -> None:
+    families = (
+        SCRAPER_ERRORS_TOTAL,
+        SCRAPER_UPDATES_TOTAL,
+        SCRAPER_UPDATE_LATENCY_SECONDS,
+        SCRAPER_MEMORY_BYTES,
+        SCRAPER_PIDS_TOTAL,
+        SCRAPER_CPU_PERCENT,
+        DATA_STALENESS_SECONDS,
+        SCRAPER_FRESHNESS_SECONDS,
+        SCRAPER_FRESHNESS_SLO_ATTAINMENT,
+    )
+    for family in families:
+        # prometheus_client has no public accessor for a family's label sets.
+        for key in [key for key in list(family._metrics) if key[0] == match_id]:
+            try:
+                family.remove(*key)
+            except KeyError:
+                continue
+
+
+def match_label(match_id: str) -> str:
+    """Label value ``match_id`` is recorded under: its own id or ``other``."""
+    return _match_labels().resolve(match_id)
+
+
+def collect_stale_series() -> int:
+    return _match_labels().collect()
+
+
+def match_label_snapshot() -> Dict[str, int]:
+    return _match_labels().snapshot()
 
 
 def ensure_metrics_server(settings: Optional[ScraperSettings] = None) -> bool:
@@ -134,47 +583,212 @@ def ensure_metrics_server(settings: Optional[ScraperSettings] = None) -> bool:
 
 
 def record_scraper_error(match_id: str, error_type: str) -> None:
-    SCRAPER_ERRORS_TOTAL.labels(match_id=match_id, error_type=error_type).inc()
+    SCRAPER_ERRORS_TOTAL.labels(match_id=match_label(match_id), error_type=error_type).inc()
 
 
 def record_scraper_retry(operation: str) -> None:
     SCRAPER_RETRY_ATTEMPTS_TOTAL.labels(operation=operation).inc()
 
 
+def set_retry_budget_tokens(operation: str, tokens: float) -> None:
+    SCRAPER_RETRY_BUDGET_TOKENS.labels(operation=operation).set(max(tokens, 0.0))
+
+
+def record_retry_budget_exhausted(operation: str) -> None:
+    SCRAPER_RETRY_BUDGET_EXHAUSTED_TOTAL.labels(operation=operation).inc()
+
+
+def set_bulkhead_state(dependency: str, *, in_flight: int, queued: int, limit: int) -> None:
+    SCRAPER_BULKHEAD_IN_FLIGHT.labels(dependency=dependency).set(max(in_flight, 0))
+    SCRAPER_BULKHEAD_QUEUED.labels(dependency=dependency).set(max(queued, 0))
+    SCRAPER_BULKHEAD_SATURATION.labels(dependency=dependency).set(max(in_flight, 0) / max(limit, 1))
+
+
+def record_bulkhead_rejection(dependency: str, reason: str) -> None:
+    SCRAPER_BULKHEAD_REJECTIONS_TOTAL.labels(dependency=dependency, reason=reason).inc()
+
+
+def record_db_pool_acquire(pool: str, wait_seconds: float) -> None:
+    SCRAPER_DB_POOL_ACQUIRE_SECONDS.labels(pool=pool).observe(max(wait_seconds, 0.0))
+
+
+def record_db_pool_event(pool: str, event: str) -> None:
+    SCRAPER_DB_POOL_EVENTS_TOTAL.labels(pool=pool, event=event).inc()
+
+
+def set_db_pool_connections(pool: str, *, in_use: int, available: int) -> None:
+    SCRAPER_DB_POOL_CONNECTIONS.labels(pool=pool, state="in_use").set(max(in_use, 0))
+    SCRAPER_DB_POOL_CONNECTIONS.labels(pool=pool, state="available").set(max(available, 0))
+
+
 def record_scraper_update(match_id: str, *, latency_seconds: Optional[float] = None) -> None:
-    SCRAPER_UPDATES_TOTAL.labels(match_id=match_id).inc()
+    label = match_label(match_id)
+    SCRAPER_UPDATES_TOTAL.labels(match_id=label).inc()
     if latency_seconds is not None:
-        SCRAPER_UPDATE_LATENCY_SECONDS.labels(match_id=match_id).observe(
+        SCRAPER_UPDATE_LATENCY_SECONDS.labels(match_id=label).observe(
             max(latency_seconds, 0.0)
         )
     set_data_staleness(match_id, 0.0)
 
 
+# Gauges are point values per match; matches counted under ``other`` have none.
 def set_scraper_memory(match_id: str, memory_bytes: float) -> None:
-    SCRAPER_MEMORY_BYTES.labels(match_id=match_id).set(max(memory_bytes, 0.0))
+    label = match_label(match_id)
+    if label != OTHER_MATCH_LABEL:
+        SCRAPER_MEMORY_BYTES.labels(match_id=label).set(max(memory_bytes, 0.0))
 
 
 def set_data_staleness(match_id: str, staleness_seconds: float) -> None:
-    DATA_STALENESS_SECONDS.labels(match_id=match_id).set(max(staleness_seconds, 0.0))
+    label = match_label(match_id)
+    if label != OTHER_MATCH_LABEL:
+        DATA_STALENESS_SECONDS.labels(match_id=label).set(max(staleness_seconds, 0.0))
 
 
 def set_active_scrapers(count: int) -> None:
     ACTIVE_SCRAPERS_COUNT.set(max(count, 0))
 
 
+def set_process_census(census: "ProcessCensus") -> None:
+    SCRAPER_CENSUS_PROCESSES.labels(kind="all").set(len(census.processes))
+    SCRAPER_CENSUS_PROCESSES.labels(kind="browser").set(census.browser_process_count)
+    SCRAPER_CENSUS_PROCESSES.labels(kind="orphaned_browser").set(len(census.orphaned_browser_pids()))
+    SCRAPER_CENSUS_DURATION_SECONDS.set(max(census.duration_seconds, 0.0))
+
+
+def record_memory_trend_alarm() -> None:
+    SCRAPER_MEMORY_TREND_ALARMS_TOTAL.inc()
+
+
+def observe_freshness(match_id: str, seconds: float) -> None:
+    SCRAPER_FRESHNESS_SECONDS.labels(match_id=match_label(match_id)).observe(max(seconds, 0.0))
+
+
+def set_freshness_attainment(match_id: str, ratio: Optional[float]) -> None:
+    """Publish a match's SLO attainment; ``None`` drops the series."""
+    label = match_label(match_id)
+    if label == OTHER_MATCH_LABEL:
+        return
+    if ratio is None:
+        try:
+            SCRAPER_FRESHNESS_SLO_ATTAINMENT.remove(label)
+        except KeyError:
+            pass
+        return
+    SCRAPER_FRESHNESS_SLO_ATTAINMENT.labels(match_id=label).set(min(max(ratio, 0.0), 1.0))
+
+
+def record_log_dropped(level: str) -> None:
+    SCRAPER_LOG_RECORDS_DROPPED_TOTAL.labels(level=level).inc()
+
+
+def record_artifact(outcome: str, count: int = 1) -> None:
+    SCRAPER_ARTIFACTS_TOTAL.labels(outcome=outcome).inc(count)
+
+
+def set_artifact_store_bytes(total_bytes: int) -> None:
+    SCRAPER_ARTIFACT_STORE_BYTES.set(total_bytes)
+
+
+def record_selector_lookup(selector_key: str, selector_index: Optional[int]) -> None:
+    """Count one resolution of ``selector_key``; ``selector_index`` is its position in ``SELECTORS``."""
+    index = "none" if selector_index is None else str(selector_index)
+    SCRAPER_SELECTOR_LOOKUPS_TOTAL.labels(selector_key=selector_key, selector_index=index).inc()
+
+
+def record_static_parse(page: str, outcome: str) -> None:
+    SCRAPER_STATIC_PARSES_TOTAL.labels(page=page, outcome=outcome).inc()
+
+
+def record_egress_result(
+    lane: str,
+    latency_seconds: float,
+    *,
+    success: bool,
+    slo_seconds: Optional[float] = None,
+) -> None:
+    latency = max(latency_seconds, 0.0)
+    SCRAPER_EGRESS_LATENCY_SECONDS.labels(lane=lane).observe(latency)
+    SCRAPER_EGRESS_REQUESTS_TOTAL.labels(lane=lane, outcome="sent" if success else "failed").inc()
+    if slo_seconds is not None and latency > slo_seconds:
+        SCRAPER_EGRESS_SLO_BREACHES_TOTAL.labels(lane=lane).inc()
+
+
+def record_egress_event(lane: str, outcome: str) -> None:
+    SCRAPER_EGRESS_REQUESTS_TOTAL.labels(lane=lane, outcome=outcome).inc()
+
+
+def set_egress_queue_depth(lane: str, depth: int) -> None:
+    SCRAPER_EGRESS_QUEUE_DEPTH.labels(lane=lane).set(max(depth, 0))
+
+
+def set_batch_controller_state(
+    controller: str,
+    *,
+    batch_size: int,
+    flush_interval_seconds: float,
+    p95_seconds: float,
+    error_rate: float,
+) -> None:
+    SCRAPER_BATCH_SIZE.labels(controller=controller).set(max(batch_size, 0))
+    SCRAPER_BATCH_FLUSH_INTERVAL_SECONDS.labels(controller=controller).set(max(flush_interval_seconds, 0.0))
+    SCRAPER_BATCH_OBSERVED_P95_SECONDS.labels(controller=controller).set(max(p95_seconds, 0.0))
+    SCRAPER_BATCH_OBSERVED_ERROR_RATE.labels(controller=controller).set(max(error_rate, 0.0))
+
+
+def record_batch_adjustment(controller: str, direction: str) -> None:
+    SCRAPER_BATCH_ADJUSTMENTS_TOTAL.labels(controller=controller, direction=direction).inc()
+
+
+def observe_stage(stage: str, seconds: float) -> None:
+    SCRAPER_STAGE_LATENCY_SECONDS.labels(stage=stage).observe(max(seconds, 0.0))
+
+
+@contextmanager
+def stage_timer(stage: str) -> Iterator[None]:
+    """Observe the wall time of the block under ``stage``, including when it raises."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe_stage(stage, time.perf_counter() - started)
+
+
+def set_queue_depth(queue: str, depth: int) -> None:
+    SCRAPER_QUEUE_DEPTH.labels(queue=queue).set(max(depth, 0))
+
+
+def record_egress_bytes(endpoint: str, encoding: str, size: int) -> None:
+    SCRAPER_EGRESS_BYTES_TOTAL.labels(endpoint=endpoint, encoding=encoding).inc(max(size, 0))
+
+
 def clear_scraper_gauges(match_id: str) -> None:
-    for gauge in (SCRAPER_MEMORY_BYTES, DATA_STALENESS_SECONDS):
+    """Drop a finished match's gauges now and its other series after the TTL."""
+    labels = _match_labels()
+    if not labels.is_tracked(match_id):
+        return
+    for gauge in (
+        SCRAPER_MEMORY_BYTES,
+        DATA_STALENESS_SECONDS,
+        SCRAPER_PIDS_TOTAL,
+        SCRAPER_CPU_PERCENT,
+        SCRAPER_FRESHNESS_SLO_ATTAINMENT,
+    ):
         try:
             gauge.remove(match_id)
         except KeyError:
             continue
+    labels.retire(match_id)
 
 
 def update_context_metrics(context: "ScraperContext") -> None:
     set_scraper_memory(context.match_id, float(context.memory_bytes))
     set_data_staleness(context.match_id, float(context.staleness_seconds))
+    label = match_label(context.match_id)
+    if label == OTHER_MATCH_LABEL:
+        return
     try:
-        SCRAPER_PIDS_TOTAL.labels(match_id=context.match_id).set(max(int(getattr(context, "total_pids", 0)), 0))
+        SCRAPER_PIDS_TOTAL.labels(match_id=label).set(max(int(getattr(context, "total_pids", 0)), 0))
+        SCRAPER_CPU_PERCENT.labels(match_id=label).set(max(float(getattr(context, "cpu_percent", 0.0)), 0.0))
     except Exception:
         pass
 
@@ -188,7 +802,42 @@ def reset_metrics_for_tests() -> None:
     global SCRAPER_MEMORY_BYTES
     global ACTIVE_SCRAPERS_COUNT
     global DATA_STALENESS_SECONDS
+    global SCRAPER_PIDS_TOTAL
+    global SCRAPER_EGRESS_LATENCY_SECONDS
+    global SCRAPER_EGRESS_REQUESTS_TOTAL
+    global SCRAPER_EGRESS_SLO_BREACHES_TOTAL
+    global SCRAPER_EGRESS_QUEUE_DEPTH
+    global SCRAPER_BATCH_SIZE
+    global SCRAPER_BATCH_FLUSH_INTERVAL_SECONDS
+    global SCRAPER_BATCH_OBSERVED_P95_SECONDS
+    global SCRAPER_BATCH_OBSERVED_ERROR_RATE
+    global SCRAPER_BATCH_ADJUSTMENTS_TOTAL
+    global SCRAPER_RETRY_BUDGET_TOKENS
+    global SCRAPER_RETRY_BUDGET_EXHAUSTED_TOTAL
+    global SCRAPER_BULKHEAD_IN_FLIGHT
+    global SCRAPER_BULKHEAD_QUEUED
+    global SCRAPER_BULKHEAD_SATURATION
+    global SCRAPER_BULKHEAD_REJECTIONS_TOTAL
+    global SCRAPER_DB_POOL_ACQUIRE_SECONDS
+    global SCRAPER_DB_POOL_EVENTS_TOTAL
+    global SCRAPER_DB_POOL_CONNECTIONS
+    global SCRAPER_CPU_PERCENT
+    global SCRAPER_CENSUS_PROCESSES
+    global SCRAPER_CENSUS_DURATION_SECONDS
+    global SCRAPER_STAGE_LATENCY_SECONDS
+    global SCRAPER_QUEUE_DEPTH
+    global SCRAPER_EGRESS_BYTES_TOTAL
+    global SCRAPER_MATCH_LABEL_EVENTS_TOTAL
+    global SCRAPER_MEMORY_TREND_ALARMS_TOTAL
+    global SCRAPER_FRESHNESS_SECONDS
+    global SCRAPER_FRESHNESS_SLO_ATTAINMENT
+    global SCRAPER_LOG_RECORDS_DROPPED_TOTAL
+    global SCRAPER_ARTIFACTS_TOTAL
+    global SCRAPER_ARTIFACT_STORE_BYTES
+    global SCRAPER_SELECTOR_LOOKUPS_TOTAL
+    global SCRAPER_STATIC_PARSES_TOTAL
     global _METRIC_SERVER_STARTED
+    global _label_cache
 
     with _METRIC_LOCK:
         METRIC_REGISTRY = CollectorRegistry()
@@ -200,17 +849,80 @@ def reset_metrics_for_tests() -> None:
         SCRAPER_MEMORY_BYTES = metrics["memory"]  # type: ignore[assignment]
         ACTIVE_SCRAPERS_COUNT = metrics["active"]  # type: ignore[assignment]
         DATA_STALENESS_SECONDS = metrics["staleness"]  # type: ignore[assignment]
+        SCRAPER_PIDS_TOTAL = metrics["pids"]  # type: ignore[assignment]
+        SCRAPER_EGRESS_LATENCY_SECONDS = metrics["egress_latency"]  # type: ignore[assignment]
+        SCRAPER_EGRESS_REQUESTS_TOTAL = metrics["egress_requests"]  # type: ignore[assignment]
+        SCRAPER_EGRESS_SLO_BREACHES_TOTAL = metrics["egress_slo_breaches"]  # type: ignore[assignment]
+        SCRAPER_EGRESS_QUEUE_DEPTH = metrics["egress_queue_depth"]  # type: ignore[assignment]
+        SCRAPER_BATCH_SIZE = metrics["batch_size"]  # type: ignore[assignment]
+        SCRAPER_BATCH_FLUSH_INTERVAL_SECONDS = metrics["batch_interval"]  # type: ignore[assignment]
+        SCRAPER_BATCH_OBSERVED_P95_SECONDS = metrics["batch_p95"]  # type: ignore[assignment]
+        SCRAPER_BATCH_OBSERVED_ERROR_RATE = metrics["batch_error_rate"]  # type: ignore[assignment]
+        SCRAPER_BATCH_ADJUSTMENTS_TOTAL = metrics["batch_adjustments"]  # type: ignore[assignment]
+        SCRAPER_RETRY_BUDGET_TOKENS = metrics["retry_budget_tokens"]  # type: ignore[assignment]
+        SCRAPER_RETRY_BUDGET_EXHAUSTED_TOTAL = metrics["retry_budget_exhausted"]  # type: ignore[assignment]
+        SCRAPER_BULKHEAD_IN_FLIGHT = metrics["bulkhead_in_flight"]  # type: ignore[assignment]
+        SCRAPER_BULKHEAD_QUEUED = metrics["bulkhead_queued"]  # type: ignore[assignment]
+        SCRAPER_BULKHEAD_SATURATION = metrics["bulkhead_saturation"]  # type: ignore[assignment]
+        SCRAPER_BULKHEAD_REJECTIONS_TOTAL = metrics["bulkhead_rejections"]  # type: ignore[assignment]
+        SCRAPER_DB_POOL_ACQUIRE_SECONDS = metrics["db_pool_acquire"]  # type: ignore[assignment]
+        SCRAPER_DB_POOL_EVENTS_TOTAL = metrics["db_pool_events"]  # type: ignore[assignment]
+        SCRAPER_DB_POOL_CONNECTIONS = metrics["db_pool_connections"]  # type: ignore[assignment]
+        SCRAPER_CPU_PERCENT = metrics["cpu"]  # type: ignore[assignment]
+        SCRAPER_CENSUS_PROCESSES = metrics["census_processes"]  # type: ignore[assignment]
+        SCRAPER_CENSUS_DURATION_SECONDS = metrics["census_duration"]  # type: ignore[assignment]
+        SCRAPER_STAGE_LATENCY_SECONDS = metrics["stage_latency"]  # type: ignore[assignment]
+        SCRAPER_QUEUE_DEPTH = metrics["queue_depth"]  # type: ignore[assignment]
+        SCRAPER_EGRESS_BYTES_TOTAL = metrics["egress_bytes"]  # type: ignore[assignment]
+        SCRAPER_MATCH_LABEL_EVENTS_TOTAL = metrics["match_label_events"]  # type: ignore[assignment]
+        SCRAPER_MEMORY_TREND_ALARMS_TOTAL = metrics["memory_trend_alarms"]  # type: ignore[assignment]
+        SCRAPER_FRESHNESS_SECONDS = metrics["freshness"]  # type: ignore[assignment]
+        SCRAPER_FRESHNESS_SLO_ATTAINMENT = metrics["freshness_slo"]  # type: ignore[assignment]
+        SCRAPER_LOG_RECORDS_DROPPED_TOTAL = metrics["log_dropped"]  # type: ignore[assignment]
+        SCRAPER_ARTIFACTS_TOTAL = metrics["artifacts"]  # type: ignore[assignment]
+        SCRAPER_ARTIFACT_STORE_BYTES = metrics["artifact_store_bytes"]  # type: ignore[assignment]
+        SCRAPER_SELECTOR_LOOKUPS_TOTAL = metrics["selector_lookups"]  # type: ignore[assignment]
+        SCRAPER_STATIC_PARSES_TOTAL = metrics["static_parses"]  # type: ignore[assignment]
         _METRIC_SERVER_STARTED = False
+        _label_cache = None
 
 
 __all__ = [
     "ensure_metrics_server",
     "record_scraper_error",
     "record_scraper_retry",
+    "set_retry_budget_tokens",
+    "record_retry_budget_exhausted",
     "record_scraper_update",
     "set_scraper_memory",
     "set_data_staleness",
     "set_active_scrapers",
+    "record_egress_result",
+    "record_egress_event",
+    "set_egress_queue_depth",
+    "set_batch_controller_state",
+    "record_batch_adjustment",
+    "set_bulkhead_state",
+    "record_bulkhead_rejection",
+    "record_db_pool_acquire",
+    "record_db_pool_event",
+    "set_db_pool_connections",
+    "set_process_census",
+    "observe_stage",
+    "stage_timer",
+    "set_queue_depth",
+    "record_egress_bytes",
+    "match_label",
+    "collect_stale_series",
+    "match_label_snapshot",
+    "record_memory_trend_alarm",
+    "observe_freshness",
+    "set_freshness_attainment",
+    "record_log_dropped",
+    "record_artifact",
+    "set_artifact_store_bytes",
+    "record_selector_lookup",
+    "record_static_parse",
     "clear_scraper_gauges",
     "update_context_metrics",
     "reset_metrics_for_tests",
@@ -223,4 +935,41 @@ __all__ = [
     "SCRAPER_PIDS_TOTAL",
     "ACTIVE_SCRAPERS_COUNT",
     "DATA_STALENESS_SECONDS",
+    "SCRAPER_EGRESS_LATENCY_SECONDS",
+    "SCRAPER_EGRESS_REQUESTS_TOTAL",
+    "SCRAPER_EGRESS_SLO_BREACHES_TOTAL",
+    "SCRAPER_EGRESS_QUEUE_DEPTH",
+    "SCRAPER_BATCH_SIZE",
+    "SCRAPER_BATCH_FLUSH_INTERVAL_SECONDS",
+    "SCRAPER_BATCH_OBSERVED_P95_SECONDS",
+    "SCRAPER_BATCH_OBSERVED_ERROR_RATE",
+    "SCRAPER_BATCH_ADJUSTMENTS_TOTAL",
+    "SCRAPER_RETRY_BUDGET_TOKENS",
+    "SCRAPER_RETRY_BUDGET_EXHAUSTED_TOTAL",
+    "SCRAPER_BULKHEAD_IN_FLIGHT",
+    "SCRAPER_BULKHEAD_QUEUED",
+    "SCRAPER_BULKHEAD_SATURATION",
+    "SCRAPER_BULKHEAD_REJECTIONS_TOTAL",
+    "SCRAPER_DB_POOL_ACQUIRE_SECONDS",
+    "SCRAPER_DB_POOL_EVENTS_TOTAL",
+    "SCRAPER_DB_POOL_CONNECTIONS",
+    "SCRAPER_CPU_PERCENT",
+    "SCRAPER_CENSUS_PROCESSES",
+    "SCRAPER_CENSUS_DURATION_SECONDS",
+    "SCRAPER_STAGE_LATENCY_SECONDS",
+    "SCRAPER_QUEUE_DEPTH",
+    "SCRAPER_EGRESS_BYTES_TOTAL",
+    "SCRAPER_MATCH_LABEL_EVENTS_TOTAL",
+    "MatchLabelCache",
+    "OTHER_MATCH_LABEL",
+    "STAGE_LATENCY_BUCKETS",
+    "FRESHNESS_BUCKETS",
+    "SCRAPER_MEMORY_TREND_ALARMS_TOTAL",
+    "SCRAPER_FRESHNESS_SECONDS",
+    "SCRAPER_FRESHNESS_SLO_ATTAINMENT",
+    "SCRAPER_LOG_RECORDS_DROPPED_TOTAL",
+    "SCRAPER_ARTIFACTS_TOTAL",
+    "SCRAPER_ARTIFACT_STORE_BYTES",
+    "SCRAPER_SELECTOR_LOOKUPS_TOTAL",
+    "SCRAPER_STATIC_PARSES_TOTAL",
 ]
@@ -0,0 +1,186 @@
+"""In-process sampling profiler for the scraper service.
+
+``SamplingProfiler`` snapshots ``sys._current_frames()`` at a fixed rate for a
+bounded window and counts identical stacks. Stacks are keyed by thread name
+and, for threads inside ``scraper_logging_context``, the match they work on,
+so a hot match shows up as its own root in a flamegraph. Only one profile
+runs at a time; a sample costs one frame walk per thread and nothing is
+installed in the profiled threads (no ``sys.setprofile``), so the overhead
+is limited to the sampling thread itself.
+
+The collapsed output is the ``stack count`` line format read by
+``flamegraph.pl`` and speedscope.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from types import FrameType
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.config import ScraperSettings, get_settings
+from src.logging.adapters import get_logger, thread_match_ids
+
+logger = get_logger(component="profiler")
+
+FramesFn = Callable[[], Dict[int, FrameType]]
+_MAX_DEPTH = 128
+
+
+class ProfilerBusyError(RuntimeError):
+    """Raised when a profile is requested while another one is running."""
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def _stack(frame: Optional[FrameType]) -> Tuple[str, ...]:
+    labels: List[str] = []
+    while frame is not None and len(labels) < _MAX_DEPTH:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    labels.reverse()
+    return tuple(labels)
+
+
+@dataclass
+class ProfileResult:
+    """Stack counts collected over one profiling window."""
+
+    duration_seconds: float
+    interval_seconds: float
+    samples: int
+    stacks: Counter = field(default_factory=Counter)
+
+    def collapsed(self) -> str:
+        """Flamegraph input: ``root;frame;...;leaf count`` per line, hottest first."""
+        return "\n".join(f"{';'.join(stack)} {count}" for stack, count in self.stacks.most_common())
+
+    def top(self, limit: int = 20) -> Dict[str, List[Dict[str, object]]]:
+        """The hottest threads, leaf functions (self time) and functions (inclusive)."""
+        threads: Counter = Counter()
+        leaves: Counter = Counter()
+        inclusive: Counter = Counter()
+        total = sum(self.stacks.values()) or 1
+        for stack, count in self.stacks.items():
+            threads[stack[0]] += count
+            if len(stack) > 1:
+                leaves[stack[-1]] += count
+            for label in set(stack[1:]):
+                inclusive[label] += count
+
+        def rows(counter: Counter) -> List[Dict[str, object]]:
+            return [
+                {"name": name, "samples": count, "percent": round(100.0 * count / total, 2)}
+                for name, count in counter.most_common(limit)
+            ]
+
+        return {"threads": rows(threads), "self": rows(leaves), "inclusive": rows(inclusive)}
+
+    def to_dict(self, *, top: int = 20) -> Dict[str, object]:
+        return {
+            "duration_seconds": round(self.duration_seconds, 3),
+            "interval_ms": round(self.interval_seconds * 1000, 3),
+            "samples": self.samples,
+            "distinct_stacks": len(self.stacks),
+            "top": self.top(top),
+        }
+
+
+class SamplingProfiler:
+    """Samples every thread's stack at ``sample_hz`` on the calling thread."""
+
+    def __init__(
+        self,
+        *,
+        settings: Optional[ScraperSettings] = None,
+        frames_fn: FramesFn = sys._current_frames,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._settings = settings or get_settings()
+        self._frames = frames_fn
+        self._sleep = sleep
+        self._clock = clock
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._lock.locked()
+
+    def profile(self, seconds: float, *, sample_hz: Optional[float] = None) -> ProfileResult:
+        """Sample for ``seconds`` (capped at ``profiler_max_seconds``) and return the counts."""
+        if not self._lock.acquire(blocking=False):
+            raise ProfilerBusyError("a profile is already running")
+        try:
+            return self._run(seconds, sample_hz or self._settings.profiler_sample_hz)
+        finally:
+            self._lock.release()
+
+    def sample_once(self, stacks: Counter, *, skip_ident: Optional[int] = None) -> None:
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        matches = thread_match_ids()
+        for ident, frame in self._frames().items():
+            if ident == skip_ident:
+                continue
+            root = names.get(ident, f"thread-{ident}")
+            match_id = matches.get(ident)
+            if match_id:
+                root = f"{root} [{match_id}]"
+            stacks[(root,) + _stack(frame)] += 1
+
+    def _run(self, seconds: float, sample_hz: float) -> ProfileResult:
+        duration = min(max(seconds, 0.0), self._settings.profiler_max_seconds)
+        interval = 1.0 / max(sample_hz, 1.0)
+        own_ident = threading.get_ident()
+        stacks: Counter = Counter()
+        samples = 0
+        started = self._clock()
+        logger.info("profiler.started", metadata={"seconds": duration, "sample_hz": sample_hz})
+        for tick in range(max(int(round(duration / interval)), 1)):
+            delay = started + tick * interval - self._clock()
+            if delay < -interval:
+                # Skip ticks missed while the host was starved rather than bursting to catch up.
+                continue
+            if delay > 0:
+                self._sleep(delay)
+            self.sample_once(stacks, skip_ident=own_ident)
+            samples += 1
+        result = ProfileResult(
+            duration_seconds=self._clock() - started,
+            interval_seconds=interval,
+            samples=samples,
+            stacks=stacks,
+        )
+        logger.info(
+            "profiler.finished",
+            metadata={"samples": samples, "distinct_stacks": len(stacks), "seconds": round(result.duration_seconds, 3)},
+        )
+        return result
+
+
+_profiler_lock = threading.Lock()
+_profiler: Optional[SamplingProfiler] = None
+
+
+def get_profiler(settings: Optional[ScraperSettings] = None) -> SamplingProfiler:
+    global _profiler
+    with _profiler_lock:
+        if _profiler is None:
+            _profiler = SamplingProfiler(settings=settings)
+        return _profiler
+
+
+__all__ = [
+    "ProfileResult",
+    "ProfilerBusyError",
+    "SamplingProfiler",
+    "get_profiler",
+]
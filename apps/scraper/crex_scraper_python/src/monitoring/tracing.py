@@ -0,0 +1,454 @@
+"""Lightweight span tracing with a local exporter.
+
+Spans follow the OpenTelemetry data model (trace/span ids, parent ids,
+links, attributes, ``UNSET``/``OK``/``ERROR`` status, unix-nano
+timestamps) so exported traces can be loaded by OTLP-aware tooling, but no
+SDK or collector is needed.
+
+A trace stays pending until every span in it has ended, then it is either
+kept or dropped:
+
+* head sampling – ``trace_sample_ratio`` of root spans are kept regardless;
+* tail sampling – any trace whose wall time reaches
+  ``trace_tail_latency_ms`` or that contains an ``ERROR`` span is kept too,
+  so latency outliers are never lost to the head ratio.
+
+Kept traces go to an in-memory ring (``trace_ring_size``, served by
+``/debug/traces``) and, when ``trace_export_path`` is set, to a size-rotated
+JSON-lines file. Spans that cross threads (egress sends) are started on the
+submitting thread and activated with ``use_span`` on the worker, so one ball
+can be followed from the tick that read it to the backend acknowledgement.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import logging.handlers
+import os
+import random
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, MutableMapping, NamedTuple, Optional, Sequence, Union
+
+from src.config import ScraperSettings, get_settings
+from src.logging.adapters import current_correlation_id, get_logger, thread_match_ids
+
+logger = get_logger(component="tracing")
+
+STATUS_UNSET = "UNSET"
+STATUS_OK = "OK"
+STATUS_ERROR = "ERROR"
+
+
+class SpanContext(NamedTuple):
+    trace_id: str
+    span_id: str
+    sampled: bool
+
+
+@dataclass
+class Span:
+    name: str
+    context: SpanContext
+    parent_span_id: Optional[str]
+    start_ns: int
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    links: List[SpanContext] = field(default_factory=list)
+    end_ns: Optional[int] = None
+    status: str = STATUS_UNSET
+    status_message: str = ""
+    _tracer: Optional["Tracer"] = field(default=None, repr=False, compare=False)
+
+    @property
+    def duration_ms(self) -> Optional[float]:
+        if self.end_ns is None:
+            return None
+        return (self.end_ns - self.start_ns) / 1e6
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def set_status(self, status: str, message: str = "") -> None:
+        self.status = status
+        self.status_message = message
+
+    def record_exception(self, exc: BaseException) -> None:
+        self.set_status(STATUS_ERROR, str(exc))
+        self.attributes["exception.type"] = type(exc).__name__
+
+    def end(self, end_ns: Optional[int] = None) -> None:
+        if self.end_ns is not None:
+            return
+        tracer = self._tracer
+        self.end_ns = end_ns if end_ns is not None else (tracer.clock_ns() if tracer else time.time_ns())
+        if tracer is not None:
+            tracer._finish(self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "traceId": self.context.trace_id,
+            "spanId": self.context.span_id,
+            "parentSpanId": self.parent_span_id,
+            "name": self.name,
+            "startTimeUnixNano": self.start_ns,
+            "endTimeUnixNano": self.end_ns,
+            "durationMs": round(self.duration_ms, 3) if self.duration_ms is not None else None,
+            "attributes": self.attributes,
+            "links": [{"traceId": link.trace_id, "spanId": link.span_id} for link in self.links],
+            "status": {"code": self.status, "message": self.status_message},
+        }
+
+
+ParentLike = Union[Span, SpanContext, None]
+_CURRENT_SPAN: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+_NO_PARENT = object()
+
+
+@dataclass
+class _PendingTrace:
+    sampled: bool
+    created_ns: int
+    open_spans: int = 0
+    spans: List[Span] = field(default_factory=list)
+
+
+class Tracer:
+    """Creates spans, applies head/tail sampling and keeps finished traces."""
+
+    def __init__(
+        self,
+        settings: Optional[ScraperSettings] = None,
+        *,
+        rng: Callable[[], float] = random.random,
+        clock_ns: Callable[[], int] = time.time_ns,
+    ) -> None:
+        cfg = settings or get_settings()
+        self._enabled = cfg.tracing_enabled
+        self._sample_ratio = cfg.trace_sample_ratio
+        self._tail_ns = int(cfg.trace_tail_latency_ms * 1e6)
+        self._ring_size = cfg.trace_ring_size
+        self._max_pending = max(cfg.trace_ring_size * 2, 16)
+        self._pending_timeout_ns = int(cfg.trace_pending_timeout_seconds * 1e9)
+        self._rng = rng
+        self.clock_ns = clock_ns
+        self._lock = threading.Lock()
+        self._pending: "OrderedDict[str, _PendingTrace]" = OrderedDict()
+        self._kept: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._stats = {"started": 0, "kept_head": 0, "kept_tail": 0, "kept_error": 0, "dropped": 0, "expired": 0}
+        self._export = _open_export_log(cfg) if cfg.trace_export_path else None
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    # ------------------------------------------------------------------
+    # Span API
+    # ------------------------------------------------------------------
+    def current_span(self) -> Optional[Span]:
+        return _CURRENT_SPAN.get()
+
+    def start_span(
+        self,
+        name: str,
+        *,
+        attributes: Optional[MutableMapping[str, Any]] = None,
+        parent: Any = _NO_PARENT,
+        links: Sequence[Optional[SpanContext]] = (),
+    ) -> Optional[Span]:
+        """Start a span without activating it; ``parent`` defaults to the current span.
+
+        Returns ``None`` when tracing is disabled so call sites can skip work.
+        """
+        if not self._enabled:
+            return None
+        parent_ctx = _context_of(_CURRENT_SPAN.get() if parent is _NO_PARENT else parent)
+        now = self.clock_ns()
+        if parent_ctx is None:
+            context = SpanContext(os.urandom(16).hex(), os.urandom(8).hex(), self._rng() < self._sample_ratio)
+            attrs: Dict[str, Any] = {}
+            correlation_id = current_correlation_id()
+            if correlation_id:
+                attrs["correlation.id"] = correlation_id
+            match_id = thread_match_ids().get(threading.get_ident())
+            if match_id:
+                attrs["match.id"] = match_id
+        else:
+            context = SpanContext(parent_ctx.trace_id, os.urandom(8).hex(), parent_ctx.sampled)
+            attrs = {}
+        attrs.update(attributes or {})
+        span = Span(
+            name=name,
+            context=context,
+            parent_span_id=parent_ctx.span_id if parent_ctx else None,
+            start_ns=now,
+            attributes=attrs,
+            links=[link for link in links if link is not None],
+            _tracer=self,
+        )
+        expired: List[_PendingTrace] = []
+        with self._lock:
+            pending = self._pending.get(context.trace_id)
+            if pending is None:
+                pending = self._pending[context.trace_id] = _PendingTrace(sampled=context.sampled, created_ns=now)
+                if parent_ctx is None:
+                    self._stats["started"] += 1
+                expired = self._expire_locked(now)
+            pending.open_spans += 1
+        for trace in expired:
+            self._finalize(trace, expired=True)
+        return span
+
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        *,
+        attributes: Optional[MutableMapping[str, Any]] = None,
+        parent: Any = _NO_PARENT,
+        links: Sequence[Optional[SpanContext]] = (),
+    ) -> Iterator[Optional[Span]]:
+        """Start, activate and end a span around the block; exceptions mark it ``ERROR``."""
+        span = self.start_span(name, attributes=attributes, parent=parent, links=links)
+        if span is None:
+            yield None
+            return
+        token = _CURRENT_SPAN.set(span)
+        try:
+            yield span
+        except BaseException as exc:
+            span.record_exception(exc)
+            raise
+        finally:
+            _CURRENT_SPAN.reset(token)
+            span.end()
+
+    @contextmanager
+    def use_span(self, span: Optional[Span], *, end_on_exit: bool = False) -> Iterator[Optional[Span]]:
+        """Make ``span`` current on this thread (e.g. a worker continuing a submitted span)."""
+        if span is None:
+            yield None
+            return
+        token = _CURRENT_SPAN.set(span)
+        try:
+            yield span
+        except BaseException as exc:
+            span.record_exception(exc)
+            raise
+        finally:
+            _CURRENT_SPAN.reset(token)
+            if end_on_exit:
+                span.end()
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def traces(
+        self,
+        *,
+        limit: int = 50,
+        min_duration_ms: float = 0.0,
+        name: Optional[str] = None,
+        correlation_id: Optional[str] = None,
+        match_id: Optional[str] = None,
+        errors_only: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Kept traces, newest first, filtered on their summary fields."""
+        with self._lock:
+            records = list(reversed(self._kept.values()))
+        matched = []
+        for record in records:
+            if record["duration_ms"] < min_duration_ms:
+                continue
+            if name and record["root"] != name:
+                continue
+            if correlation_id and record.get("correlation_id") != correlation_id:
+                continue
+            if match_id and record.get("match_id") != match_id:
+                continue
+            if errors_only and not record["error"]:
+                continue
+            matched.append(record)
+            if len(matched) >= limit:
+                break
+        return matched
+
+    def get_trace(self, trace_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._kept.get(trace_id)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self._stats,
+                "enabled": self._enabled,
+                "pending": len(self._pending),
+                "kept": len(self._kept),
+                "sample_ratio": self._sample_ratio,
+                "tail_latency_ms": self._tail_ns / 1e6,
+            }
+
+    def flush(self) -> None:
+        """Decide every pending trace now, even if some of its spans are still open."""
+        with self._lock:
+            pending = list(self._pending.values())
+            self._pending.clear()
+        for trace in pending:
+            self._finalize(trace, expired=True)
+
+    def close(self) -> None:
+        self.flush()
+        if self._export is not None:
+            for handler in list(self._export.handlers):
+                handler.close()
+                self._export.removeHandler(handler)
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _finish(self, span: Span) -> None:
+        with self._lock:
+            pending = self._pending.get(span.context.trace_id)
+            if pending is None:
+                # The trace was already decided (expired); keep the span only if the trace was kept.
+                record = self._kept.get(span.context.trace_id)
+                if record is not None:
+                    record["spans"].append(span.to_dict())
+                return
+            pending.spans.append(span)
+            pending.open_spans -= 1
+            if pending.open_spans > 0:
+                return
+            del self._pending[span.context.trace_id]
+        self._finalize(pending)
+
+    def _expire_locked(self, now: int) -> List[_PendingTrace]:
+        expired = []
+        while self._pending:
+            trace_id, oldest = next(iter(self._pending.items()))
+            if len(self._pending) <= self._max_pending and now - oldest.created_ns < self._pending_timeout_ns:
+                break
+            del self._pending[trace_id]
+            expired.append(oldest)
+        return expired
+
+    def _finalize(self, trace: _PendingTrace, *, expired: bool = False) -> None:
+        if not trace.spans:
+            if expired:
+                with self._lock:
+                    self._stats["expired"] += 1
+            return
+        spans = sorted(trace.spans, key=lambda item: (item.start_ns, item.parent_span_id is not None))
+        start = spans[0].start_ns
+        end = max(item.end_ns or item.start_ns for item in spans)
+        error = any(item.status == STATUS_ERROR for item in spans)
+        if trace.sampled:
+            reason = "head"
+        elif error:
+            reason = "error"
+        elif end - start >= self._tail_ns:
+            reason = "tail"
+        else:
+            reason = None
+        with self._lock:
+            if expired:
+                self._stats["expired"] += 1
+            if reason is None:
+                self._stats["dropped"] += 1
+                return
+            self._stats[f"kept_{reason}"] += 1
+        root = next((item for item in spans if item.parent_span_id is None), spans[0])
+        record = {
+            "trace_id": root.context.trace_id,
+            "root": root.name,
+            "start_time_unix_nano": start,
+            "duration_ms": round((end - start) / 1e6, 3),
+            "span_count": len(spans),
+            "error": error,
+            "kept": reason,
+            "correlation_id": root.attributes.get("correlation.id"),
+            "match_id": root.attributes.get("match.id"),
+            "spans": [item.to_dict() for item in spans],
+        }
+        with self._lock:
+            self._kept[record["trace_id"]] = record
+            self._kept.move_to_end(record["trace_id"])
+            while len(self._kept) > self._ring_size:
+                self._kept.popitem(last=False)
+        if self._export is not None:
+            try:
+                self._export.info(json.dumps(record, separators=(",", ":"), default=str))
+            except Exception as exc:  # pragma: no cover - exporting must never break the traced code
+                logger.warning("tracing.export_failed", metadata={"error": str(exc)})
+
+
+def _context_of(parent: ParentLike) -> Optional[SpanContext]:
+    if parent is None:
+        return None
+    if isinstance(parent, Span):
+        return parent.context
+    return parent
+
+
+def _open_export_log(cfg: ScraperSettings) -> logging.Logger:
+    os.makedirs(os.path.dirname(os.path.abspath(cfg.trace_export_path)), exist_ok=True)
+    export = logging.getLogger(f"scraper.traces.{id(cfg)}")
+    export.propagate = False
+    export.setLevel(logging.INFO)
+    handler = logging.handlers.RotatingFileHandler(
+        cfg.trace_export_path,
+        maxBytes=cfg.trace_export_max_bytes,
+        backupCount=cfg.trace_export_backups,
+        encoding="utf-8",
+    )
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    export.addHandler(handler)
+    return export
+
+
+def add_trace_context(_: Any, __: str, event_dict: MutableMapping[str, Any]) -> MutableMapping[str, Any]:
+    """Structlog processor that tags log records written inside a span with its ids."""
+    span = _CURRENT_SPAN.get()
+    if span is not None:
+        metadata = event_dict.get("metadata")
+        if isinstance(metadata, MutableMapping):
+            metadata.setdefault("trace_id", span.context.trace_id)
+            metadata.setdefault("span_id", span.context.span_id)
+    return event_dict
+
+
+_tracer_lock = threading.Lock()
+_tracer: Optional[Tracer] = None
+
+
+def get_tracer(settings: Optional[ScraperSettings] = None) -> Tracer:
+    global _tracer
+    with _tracer_lock:
+        if _tracer is None:
+            _tracer = Tracer(settings)
+        return _tracer
+
+
+def reset_tracer() -> None:
+    global _tracer
+    with _tracer_lock:
+        tracer, _tracer = _tracer, None
+    if tracer is not None:
+        tracer.close()
+
+
+__all__ = [
+    "STATUS_ERROR",
+    "STATUS_OK",
+    "STATUS_UNSET",
+    "Span",
+    "SpanContext",
+    "Tracer",
+    "add_trace_context",
+    "get_tracer",
+    "reset_tracer",
+]
@@ -0,0 +1,461 @@
+"""DOM selector utilities with fallback resolution for the scraper service.
+
+Every key in ``SELECTORS`` is a fallback chain. A lookup first tries the
+selector that matched last time, which costs one round trip in steady state.
+On a miss, handles that can run scripts (Playwright pages and element
+handles) probe the rest of the chain with one compiled in-page script that
+returns the winning position together with the matched elements, so the
+winner is not queried a second time. Other handles, and chains holding selectors
+the compiler cannot translate (Playwright-only syntax), are queried one
+selector at a time as before.
+
+``extract_live_match_hrefs`` compiles the badge and anchor chains into a
+single script that returns every live match link in one call.
+
+Lookups are counted per chain position (``scraper_selector_lookups_total``).
+Hits are logged only when a key's winning selector changes.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+try:  # pragma: no cover - type checking only
+    from typing import TYPE_CHECKING
+
+    if TYPE_CHECKING:  # pragma: no cover
+        from playwright.sync_api import ElementHandle
+except ImportError:  # pragma: no cover - typing fallback when playwright missing
+    TYPE_CHECKING = False  # type: ignore[misc]
+
+from src.logging.adapters import get_logger
+from src.monitoring.monitoring import record_selector_lookup
+
+logger = get_logger(component="parsers")
+
+
+SELECTORS: Mapping[str, Sequence[str]] = {
+    # Elements containing the "LIVE" chip within match listing cards
+    "live_match_badge": (
+        "div.live-card .live",
+        "[data-testid='live-card'] .live",
+        ".live-match-card .live",
+        "[data-status='live']",
+    ),
+    # Anchors that follow the badge and lead to the match details page
+    "live_match_anchor": (
+        ":scope >> xpath=../following-sibling::*[1]",
+        ":scope >> xpath=../../following-sibling::*[1]",
+        ":scope >> xpath=ancestor::div[contains(@class,'live-card')][1]//a[contains(@href,'match')]",
+        ":scope >> xpath=ancestor::a[1]",
+        "a[href*='/match/']",
+    ),
+}
+
+
+@dataclass
+class SelectorResolutionError(RuntimeError):
+    """Raised when no selector in the fallback chain resolves to a node."""
+
+    selector_key: str
+    selectors: Sequence[str]
+    context: Optional[Mapping[str, Any]] = None
+    message: Optional[str] = None
+
+    def __post_init__(self) -> None:  # pragma: no cover - simple formatting
+        details = {
+            "selector_key": self.selector_key,
+            "attempted_selectors": list(self.selectors),
+        }
+        if self.context:
+            details.update(self.context)
+        base = self.message or "All selectors failed to resolve"
+        super().__init__(f"{base}: {details}")
+
+
+def _log_fallback_hit(
+    selector_key: str,
+    selector: str,
+    attempt_index: int,
+    total_attempts: int,
+    metadata: Optional[Mapping[str, Any]],
+) -> None:
+    level = "selector.fallback.hit" if attempt_index > 0 else "selector.primary.hit"
+    logger.info(
+        level,
+        metadata={
+            "selector_key": selector_key,
+            "selector": selector,
+            "attempt": attempt_index + 1,
+            "attempts_total": total_attempts,
+            **(metadata or {}),
+        },
+    )
+
+
+def _log_selector_failure(
+    selector_key: str,
+    selectors: Sequence[str],
+    metadata: Optional[Mapping[str, Any]],
+    exc: Optional[Exception],
+) -> None:
+    log_metadata = {
+        "selector_key": selector_key,
+        "attempted_selectors": list(selectors),
+        **(metadata or {}),
+    }
+    if exc is not None:
+        log_metadata["error"] = str(exc)
+        log_metadata["error_type"] = type(exc).__name__
+    logger.error("selector.all_failed", metadata=log_metadata)
+
+
+_SCOPED_XPATH = re.compile(r"^(?::scope\s*>>\s*)?xpath=(?P<expression>.+)$", re.S)
+# Selector syntax only Playwright's own engines understand.
+_PLAYWRIGHT_ONLY = re.compile(
+    r">>|^\w+=|:has-text\(|:text(?:-is|-matches)?\(|:visible|:nth-match\(|:(?:left-of|right-of|above|below|near)\("
+)
+
+# (root, steps, many) -> [winning position or -1, matched elements]
+_FIND_JS = """
+(root, steps, many) => {
+  const doc = root.ownerDocument || root;
+  for (let i = 0; i < steps.length; i++) {
+    const [kind, expression] = steps[i];
+    let nodes = [];
+    try {
+      if (kind === 'css') {
+        nodes = many ? Array.from(root.querySelectorAll(expression)) : [root.querySelector(expression)].filter(Boolean);
+      } else {
+        const path = expression.startsWith('/') && root !== doc ? '.' + expression : expression;
+        const found = doc.evaluate(path, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        for (let j = 0; j < found.snapshotLength && (many || nodes.length === 0); j++) {
+          const node = found.snapshotItem(j);
+          if (node.nodeType === Node.ELEMENT_NODE) nodes.push(node);
+        }
+      }
+    } catch (error) {
+      nodes = [];
+    }
+    if (nodes.length) return [i, nodes];
+  }
+  return [-1, []];
+}
+"""
+# Matched elements keyed "<position>:<n>": one getProperties call on the result
+# yields the element handles and, from the keys, the winning position.
+_KEYED_MATCHES_JS = f"""
+(root, steps, many) => {{
+  const [position, nodes] = ({_FIND_JS})(root, steps, many);
+  return Object.fromEntries(nodes.map((node, n) => [position + ':' + n, node]));
+}}
+"""
+_PAGE_PROBE_JS = f"(arg) => ({_KEYED_MATCHES_JS})(document, arg.steps, arg.many)"
+_ELEMENT_PROBE_JS = f"(root, arg) => ({_KEYED_MATCHES_JS})(root, arg.steps, arg.many)"
+_DISCOVERY_JS = f"""
+(arg) => {{
+  const find = {_FIND_JS};
+  const [badgeIndex, badges] = find(document, arg.badge, true);
+  return [badgeIndex, badges.map((badge) => {{
+    const [anchorIndex, anchors] = find(badge, arg.anchor, false);
+    return [anchorIndex, anchorIndex < 0 ? null : anchors[0].getAttribute('href')];
+  }})];
+}}
+"""
+
+
+def compile_selector(selector: str) -> Optional[Tuple[str, str]]:
+    """``("css" | "xpath", expression)`` the in-page script can run, or ``None``."""
+
+    match = _SCOPED_XPATH.match(selector.strip())
+    if match:
+        return ("xpath", match.group("expression"))
+    if _PLAYWRIGHT_ONLY.search(selector):
+        return None
+    return ("css", selector)
+
+
+class SelectorEngine:
+    """Remembers the winning selector per key and counts every lookup."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._winners: Dict[str, int] = {}
+
+    def order(self, selector_key: str) -> List[int]:
+        """Chain positions to try: last winner first, then the rest in ``SELECTORS`` order."""
+
+        winner = self._winners.get(selector_key, 0)
+        return [winner] + [index for index in range(len(SELECTORS[selector_key])) if index != winner]
+
+    def record(
+        self,
+        selector_key: str,
+        index: Optional[int],
+        log_context: Optional[Mapping[str, Any]] = None,
+    ) -> None:
+        record_selector_lookup(selector_key, index)
+        if index is None:
+            return
+        with self._lock:
+            previous = self._winners.get(selector_key)
+            self._winners[selector_key] = index
+        if previous != index:
+            selectors = SELECTORS[selector_key]
+            _log_fallback_hit(selector_key, selectors[index], index, len(selectors), log_context)
+
+    def winners(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._winners)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._winners.clear()
+
+
+_ENGINE = SelectorEngine()
+
+
+def get_selector_engine() -> SelectorEngine:
+    return _ENGINE
+
+
+def _can_evaluate(handle: Any, method: str = "evaluate") -> bool:
+    return callable(getattr(handle, method, None))
+
+
+def _compiled_steps(selector_key: str, order: Sequence[int]) -> Optional[List[Tuple[str, str]]]:
+    steps = [compile_selector(SELECTORS[selector_key][index]) for index in order]
+    return None if None in steps else steps  # type: ignore[return-value]
+
+
+def _probe(handle: Any, steps: List[Tuple[str, str]], many: bool) -> Optional[Tuple[int, List[Any]]]:
+    """``(position in steps, element handles)`` of the first selector that matches.
+
+    ``(-1, [])`` when none matches, ``None`` if the probe failed.
+    """
+
+    script = _ELEMENT_PROBE_JS if hasattr(handle, "as_element") else _PAGE_PROBE_JS
+    try:
+        properties = handle.evaluate_handle(script, {"steps": steps, "many": many}).get_properties()
+    except Exception as exc:
+        logger.warning("selector.probe_error", metadata={"error": str(exc), "error_type": type(exc).__name__})
+        return None
+
+    position = -1
+    found: List[Tuple[int, Any]] = []
+    for name, value in properties.items():
+        prefix, _, number = name.partition(":")
+        element = value.as_element()
+        if element is None or not prefix.isdigit() or not number.isdigit():
+            return None
+        position = int(prefix)
+        found.append((int(number), element))
+    if position >= len(steps):
+        return None
+    return position, [element for _, element in sorted(found, key=lambda item: item[0])]
+
+
+def _query(
+    handle: Any,
+    selector_key: str,
+    index: int,
+    many: bool,
+    log_context: Optional[Mapping[str, Any]],
+) -> Tuple[Any, Optional[Exception]]:
+    selector = SELECTORS[selector_key][index]
+    try:
+        result = handle.query_selector_all(selector) if many else handle.query_selector(selector)
+    except Exception as exc:  # pragma: no cover - defensive logging
+        logger.warning(
+            "selector.query_error",
+            metadata={
+                "selector_key": selector_key,
+                "selector": selector,
+                "attempt": index + 1,
+                "error": str(exc),
+                "error_type": type(exc).__name__,
+                **(log_context or {}),
+            },
+        )
+        return None, exc
+    return result, None
+
+
+def _resolve(
+    handle: Any,
+    selector_key: str,
+    *,
+    many: bool,
+    log_context: Optional[Mapping[str, Any]],
+    required: bool,
+) -> Any:
+    selectors = SELECTORS.get(selector_key)
+    if not selectors:
+        raise KeyError(f"Unknown selector key: {selector_key}")
+
+    order = _ENGINE.order(selector_key)
+    last_exception: Optional[Exception] = None
+
+    result, last_exception = _query(handle, selector_key, order[0], many, log_context)
+    if result:
+        _ENGINE.record(selector_key, order[0], log_context)
+        return result
+
+    remaining = order[1:]
+    steps = (
+        _compiled_steps(selector_key, remaining)
+        if remaining and _can_evaluate(handle, "evaluate_handle")
+        else None
+    )
+    if steps is not None:
+        probed = _probe(handle, steps, many)
+        if probed is not None:
+            position, elements = probed
+            if position >= 0:
+                _ENGINE.record(selector_key, remaining[position], log_context)
+                return elements if many else elements[0]
+            remaining = []
+
+    for index in remaining:
+        result, error = _query(handle, selector_key, index, many, log_context)
+        last_exception = error or last_exception
+        if result:
+            _ENGINE.record(selector_key, index, log_context)
+            return result
+
+    _ENGINE.record(selector_key, None)
+    if required:
+        _log_selector_failure(selector_key, selectors, log_context, last_exception)
+        raise SelectorResolutionError(selector_key, selectors, log_context)
+    return None
+
+
+def select_first(
+    handle: Any,
+    selector_key: str,
+    *,
+    log_context: Optional[Mapping[str, Any]] = None,
+    required: bool = False,
+) -> Optional[Any]:
+    """Return the first element resolved for ``selector_key`` using fallbacks."""
+
+    return _resolve(handle, selector_key, many=False, log_context=log_context, required=required)
+
+
+def select_all(
+    handle: Any,
+    selector_key: str,
+    *,
+    log_context: Optional[Mapping[str, Any]] = None,
+    required: bool = False,
+) -> List[Any]:
+    """Return all elements resolved for ``selector_key`` using fallbacks."""
+
+    results = _resolve(handle, selector_key, many=True, log_context=log_context, required=required)
+    return list(results) if results else []
+
+
+def extract_match_href(
+    handle: Any,
+    *,
+    log_context: Optional[Mapping[str, Any]] = None,
+) -> str:
+    """Resolve the match hyperlink associated with a live match badge."""
+
+    anchor = select_first(handle, "live_match_anchor", log_context=log_context, required=True)
+    if anchor is None:
+        raise SelectorResolutionError("live_match_anchor", SELECTORS["live_match_anchor"], log_context)
+
+    href = anchor.get_attribute("href")
+    if href:
+        return href
+
+    _raise_missing_href(log_context)
+
+
+def _raise_missing_href(log_context: Optional[Mapping[str, Any]]) -> None:
+    logger.error(
+        "selector.anchor_missing_href",
+        metadata={
+            "selector_key": "live_match_anchor",
+            **(log_context or {}),
+        },
+    )
+    raise SelectorResolutionError(
+        "live_match_anchor",
+        SELECTORS["live_match_anchor"],
+        log_context,
+        message="Resolved anchor missing href",
+    )
+
+
+def extract_live_match_hrefs(
+    page: Any,
+    *,
+    log_context: Optional[Mapping[str, Any]] = None,
+) -> List[str]:
+    """Links of every live match on a listing page, in one ``page.evaluate``.
+
+    Raises ``SelectorResolutionError`` like ``select_all``/``extract_match_href``:
+    for ``live_match_badge`` when no badge is found, for ``live_match_anchor``
+    (with ``badge_index`` in its context) when a badge has no usable link.
+    """
+
+    badge_order = _ENGINE.order("live_match_badge")
+    anchor_order = _ENGINE.order("live_match_anchor")
+    badge_steps = _compiled_steps("live_match_badge", badge_order)
+    anchor_steps = _compiled_steps("live_match_anchor", anchor_order)
+
+    outcome = None
+    if _can_evaluate(page) and badge_steps is not None and anchor_steps is not None:
+        try:
+            outcome = page.evaluate(_DISCOVERY_JS, {"badge": badge_steps, "anchor": anchor_steps})
+        except Exception as exc:
+            logger.warning("selector.probe_error", metadata={"error": str(exc), "error_type": type(exc).__name__})
+    if not (isinstance(outcome, list) and len(outcome) == 2 and isinstance(outcome[0], int)):
+        return _extract_hrefs_per_query(page, log_context)
+
+    badge_position, anchors = outcome
+    if badge_position < 0:
+        _ENGINE.record("live_match_badge", None)
+        _log_selector_failure("live_match_badge", SELECTORS["live_match_badge"], log_context, None)
+        raise SelectorResolutionError("live_match_badge", SELECTORS["live_match_badge"], log_context)
+    _ENGINE.record("live_match_badge", badge_order[badge_position], log_context)
+
+    hrefs: List[str] = []
+    for badge_index, (anchor_position, href) in enumerate(anchors):
+        badge_context = {**(log_context or {}), "badge_index": badge_index}
+        if anchor_position < 0:
+            _ENGINE.record("live_match_anchor", None)
+            _log_selector_failure("live_match_anchor", SELECTORS["live_match_anchor"], badge_context, None)
+            raise SelectorResolutionError("live_match_anchor", SELECTORS["live_match_anchor"], badge_context)
+        _ENGINE.record("live_match_anchor", anchor_order[anchor_position], badge_context)
+        if not href:
+            _raise_missing_href(badge_context)
+        hrefs.append(href)
+    return hrefs
+
+
+def _extract_hrefs_per_query(page: Any, log_context: Optional[Mapping[str, Any]]) -> List[str]:
+    badges = select_all(page, "live_match_badge", log_context=log_context, required=True)
+    return [
+        extract_match_href(badge, log_context={**(log_context or {}), "badge_index": index})
+        for index, badge in enumerate(badges)
+    ]
+
+
+__all__ = [
+    "SELECTORS",
+    "SelectorResolutionError",
+    "select_first",
+    "select_all",
+    "extract_match_href",
+    "extract_live_match_hrefs",
+    "compile_selector",
+    "SelectorEngine",
+    "get_selector_engine",
+]
@@ -0,0 +1,20 @@
+"""Persistence helpers (SQLite pool, batched writes, URL index, ball archive)."""
+
+from .ball_archive import BallArchiveReader, MatchArchive, RecordKind, get_ball_archive
+from .batch_writer import BatchWriter, BatchWriterError
+from .db_pool import ConnectionPool, ConnectionPoolError, close_connection_pools, get_connection_pool
+from .url_index import LiveUrlIndex
+
+__all__ = [
+    "BallArchiveReader",
+    "BatchWriter",
+    "BatchWriterError",
+    "ConnectionPool",
+    "ConnectionPoolError",
+    "LiveUrlIndex",
+    "MatchArchive",
+    "RecordKind",
+    "close_connection_pools",
+    "get_ball_archive",
+    "get_connection_pool",
+]
@@ -0,0 +1,593 @@
+"""Append-only, per-match archive of ball-by-ball feed data.
+
+Everything the scraper decodes (sV3 ticks, DOM score updates, overs, odds and
+session ticks) used to be forwarded and forgotten. ``MatchArchive`` keeps a
+local copy in fixed-width binary records so a match can be replayed, backfilled
+or analysed afterwards.
+
+Layout of ``<ball_archive_dir>/<match_id>/``::
+
+    seg-000001.rec   fixed-width records (``RECORD`` below)
+    seg-000001.str   UTF-8 string table referenced by (offset, length)
+    index.json       per-segment stats (time, innings and over range, kinds)
+
+Appends only pack a record into an in-memory buffer; buffered records are
+written when enough accumulate, when the flush interval elapses, and on close.
+``BallArchiveReader`` memory-maps segments and uses the index to skip segments
+that cannot match a range query.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import re
+import struct
+import threading
+import time
+from enum import IntEnum
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from src.config import ScraperSettings, get_settings
+from src.logging.adapters import get_logger
+
+logger = get_logger(component="ball_archive")
+
+ARCHIVE_FORMAT_VERSION = 1
+
+# timestamp, kind, innings, over_ball (over * 10 + ball, -1 unknown),
+# four int32 values, string offset, string length.
+RECORD = struct.Struct("<dBBhiiiiII")
+
+_INDEX_FILE = "index.json"
+_BUFFER_RECORDS = 256
+_OVER_PATTERN = re.compile(r"(\d+)(?:\.(\d))?")
+
+
+class RecordKind(IntEnum):
+    """What a record describes; determines how ``values`` are interpreted."""
+
+    SV3 = 1  # values: favourite back, lay, batsman 1 runs, batsman 2 runs; text: decoded fields (JSON)
+    SCORE = 2  # values: runs, wickets; text: team name
+    OVER = 3  # values: total runs in the over; text: balls, space separated
+    ODDS = 4  # values: back, lay; text: team name
+    SESSION = 5  # values: back, lay; text: session name
+    TEXT = 6  # text: raw score update
+
+
+class ArchiveRecord(NamedTuple):
+    timestamp: float
+    kind: RecordKind
+    innings: int
+    over_ball: int
+    values: Tuple[int, int, int, int]
+    text: str
+
+    @property
+    def over(self) -> Optional[str]:
+        """Cricket notation (``"15.3"``) of ``over_ball`` or ``None`` when unknown."""
+        if self.over_ball < 0:
+            return None
+        return f"{self.over_ball // 10}.{self.over_ball % 10}"
+
+
+def parse_over(value: Any) -> int:
+    """Convert ``"15.3"``/``"Ov 15"``/``15`` into ``over * 10 + ball``; ``-1`` when unparseable."""
+    match = _OVER_PATTERN.search(str(value or ""))
+    if not match:
+        return -1
+    over = int(match.group(1))
+    ball = int(match.group(2) or 0)
+    return min(over * 10 + ball, 32767)
+
+
+def _to_int(value: Any) -> int:
+    if type(value) is int and -(2**31) <= value < 2**31:
+        return value
+    try:
+        number = int(float(value))
+    except (TypeError, ValueError):
+        return 0
+    return max(-(2**31), min(number, 2**31 - 1))
+
+
+def _split_odds(raw: Any) -> Tuple[int, int]:
+    """``"45+2"`` -> ``(45, 47)``: the feed sends back odds and the lay difference."""
+    parts = str(raw or "").split("+")
+    back = _to_int(parts[0]) if parts and parts[0] else 0
+    lay = back + _to_int(parts[1]) if len(parts) > 1 else back
+    return back, lay
+
+
+def _split_score(raw: Any) -> Tuple[int, int]:
+    parts = str(raw or "").split("/")
+    runs = _to_int(parts[0]) if parts and parts[0] else 0
+    wickets = _to_int(parts[1]) if len(parts) > 1 else 0
+    return runs, wickets
+
+
+def _segment_name(number: int) -> str:
+    return f"seg-{number:06d}"
+
+
+def _new_segment_stats(number: int) -> Dict[str, Any]:
+    return {
+        "segment": number,
+        "records": 0,
+        "first_ts": None,
+        "last_ts": None,
+        "innings_min": None,
+        "innings_max": None,
+        "over_min": None,
+        "over_max": None,
+        "kinds": 0,
+        "sealed": False,
+    }
+
+
+class MatchArchive:
+    """Buffered append-only writer for one match."""
+
+    def __init__(
+        self,
+        match_id: str,
+        *,
+        settings: Optional[ScraperSettings] = None,
+        directory: Optional[str] = None,
+        clock=time.time,
+    ) -> None:
+        self._settings = settings or get_settings()
+        self.match_id = match_id
+        self.directory = Path(directory or Path(self._settings.ball_archive_dir) / match_id)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._segment_records = self._settings.ball_archive_segment_records
+        self._flush_interval = self._settings.ball_archive_flush_interval_seconds
+        self._clock = clock
+        self._lock = threading.RLock()
+        self._closed = False
+
+        self._records = bytearray()
+        self._strings = bytearray()
+        self._string_offsets: Dict[str, Tuple[int, int]] = {}
+        self._string_size = 0
+        self._buffered = 0
+        self._last_flush = time.monotonic()
+        self._rec_file = None
+        self._str_file = None
+        self._appended = 0
+        self._write_errors = 0
+
+        self._innings = 1
+        self._over_ball = -1
+        self._team_overs: Dict[str, int] = {}
+        self._last_overs: Dict[int, str] = {}
+
+        self._segments: List[Dict[str, Any]] = self._load_index()
+        if self._segments:
+            # Resume after a restart: continue the position, but always start a fresh segment.
+            last = self._segments[-1]
+            last["sealed"] = True
+            self._innings = last["innings_max"] or 1
+            self._over_ball = last["over_max"] if last["over_max"] is not None else -1
+        next_number = self._segments[-1]["segment"] + 1 if self._segments else 1
+        self._current = _new_segment_stats(next_number)
+
+    # ------------------------------------------------------------------
+
+    @property
+    def position(self) -> Tuple[int, int]:
+        """Current ``(innings, over_ball)`` stamped on new records."""
+        with self._lock:
+            return self._innings, self._over_ball
+
+    def set_position(self, over_ball: int) -> None:
+        """Advance the current over; a drop of more than one over starts a new innings."""
+        if over_ball < 0:
+            return
+        with self._lock:
+            if self._over_ball >= 0 and over_ball < self._over_ball - 10:
+                self._innings = min(self._innings + 1, 255)
+                self._last_overs.clear()
+            self._over_ball = over_ball
+
+    def append(
+        self,
+        kind: RecordKind,
+        values: Sequence[int] = (),
+        *,
+        text: Optional[str] = None,
+        over_ball: Optional[int] = None,
+        timestamp: Optional[float] = None,
+    ) -> None:
+        """Buffer one record; ``over_ball`` defaults to the current position."""
+        padded = (tuple(_to_int(v) for v in values[:4]) + (0, 0, 0, 0))[:4]
+        ts = self._clock() if timestamp is None else timestamp
+        with self._lock:
+            if self._closed:
+                return
+            offset, length = self._intern(text) if text else (0, 0)
+            innings = self._innings
+            position = self._over_ball if over_ball is None else over_ball
+            self._records += RECORD.pack(ts, int(kind), innings, position, *padded, offset, length)
+            self._buffered += 1
+            self._appended += 1
+            self._observe(ts, kind, innings, position)
+            if self._current["records"] >= self._segment_records:
+                self._roll_locked()
+            elif self._buffered >= _BUFFER_RECORDS or time.monotonic() - self._last_flush >= self._flush_interval:
+                self._flush_locked()
+
+    # -- feed specific helpers -------------------------------------------
+
+    def record_sv3(self, fields: Dict[str, Any], *, odds: Any = None, sessions: Iterable[Dict[str, Any]] = ()) -> None:
+        """Archive one decoded sV3 tick plus its favourite odds and session lines."""
+        back, lay = _split_odds(odds if odds is not None else fields.get("favorite_team_odds"))
+        batsman_1 = fields.get("batsman_1_stats") or {}
+        batsman_2 = fields.get("batsman_2_stats") or {}
+        text = json.dumps(fields, separators=(",", ":"), default=str)
+        self.append(RecordKind.SV3, (back, lay, batsman_1.get("runs"), batsman_2.get("runs")), text=text)
+        self.append(RecordKind.ODDS, (back, lay), text=str(fields.get("favorite_team") or ""))
+        for session in sessions:
+            session_odds = session.get("odds") or []
+            values = [entry.get("value") for entry in session_odds[:2]]
+            self.append(RecordKind.SESSION, values, text=str(session.get("sessionName") or ""))
+
+    def record_score(self, team: str, score: Any, over: Any) -> None:
+        """Archive a team score; the team whose over count moved sets the position."""
+        over_ball = parse_over(over)
+        with self._lock:
+            previous = self._team_overs.get(team)
+            if over_ball >= 0 and previous != over_ball:
+                self._team_overs[team] = over_ball
+                # A side that has not batted yet shows 0.0; that must not look like a new innings.
+                if previous is not None or over_ball > 0:
+                    self.set_position(over_ball)
+        runs, wickets = _split_score(score)
+        self.append(RecordKind.SCORE, (runs, wickets), text=team, over_ball=over_ball if over_ball >= 0 else None)
+
+    def record_overs(self, overs: Iterable[Dict[str, Any]]) -> None:
+        """Archive completed overs from the overs slider, skipping ones already stored."""
+        for over in overs:
+            over_ball = parse_over(over.get("overNumber"))
+            if over_ball < 0:
+                continue
+            balls = " ".join(str(ball) for ball in over.get("balls") or [])
+            with self._lock:
+                if self._last_overs.get(over_ball) == balls:
+                    continue
+                self._last_overs[over_ball] = balls
+            self.append(RecordKind.OVER, (over.get("totalRuns"),), text=balls, over_ball=over_ball)
+
+    def record_odds(self, team: str, back: Any, lay: Any) -> None:
+        self.append(RecordKind.ODDS, (back, lay), text=team)
+
+    def record_text(self, text: str) -> None:
+        self.append(RecordKind.TEXT, text=text)
+
+    # ------------------------------------------------------------------
+
+    def flush(self) -> int:
+        """Write buffered records; returns how many were written."""
+        with self._lock:
+            return self._flush_locked()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._flush_locked()
+            self._current["sealed"] = True
+            self._write_index_locked()
+            self._close_files_locked()
+            self._closed = True
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "match_id": self.match_id,
+                "appended": self._appended,
+                "buffered": self._buffered,
+                "segments": len(self._segments) + (1 if self._current["records"] else 0),
+                "innings": self._innings,
+                "over": self._over_ball,
+                "write_errors": self._write_errors,
+            }
+
+    # ------------------------------------------------------------------
+
+    def _intern(self, text: str) -> Tuple[int, int]:
+        cached = self._string_offsets.get(text)
+        if cached is not None:
+            return cached
+        encoded = text.encode("utf-8")
+        entry = (self._string_size, len(encoded))
+        self._strings += encoded
+        self._string_size += len(encoded)
+        self._string_offsets[text] = entry
+        return entry
+
+    def _observe(self, ts: float, kind: RecordKind, innings: int, over_ball: int) -> None:
+        stats = self._current
+        stats["records"] += 1
+        if stats["first_ts"] is None:
+            stats["first_ts"] = ts
+        stats["last_ts"] = ts
+        stats["kinds"] |= 1 << int(kind)
+        stats["innings_min"] = innings if stats["innings_min"] is None else min(stats["innings_min"], innings)
+        stats["innings_max"] = innings if stats["innings_max"] is None else max(stats["innings_max"], innings)
+        if over_ball >= 0:
+            stats["over_min"] = over_ball if stats["over_min"] is None else min(stats["over_min"], over_ball)
+            stats["over_max"] = over_ball if stats["over_max"] is None else max(stats["over_max"], over_ball)
+
+    def _flush_locked(self) -> int:
+        self._last_flush = time.monotonic()
+        if not self._buffered:
+            return 0
+        written = self._buffered
+        try:
+            if self._rec_file is None:
+                name = _segment_name(self._current["segment"])
+                self._rec_file = open(self.directory / f"{name}.rec", "ab")
+                self._str_file = open(self.directory / f"{name}.str", "ab")
+            # Strings first so a record never points past the end of the table.
+            self._str_file.write(self._strings)
+            self._str_file.flush()
+            self._rec_file.write(self._records)
+            self._rec_file.flush()
+            self._write_index_locked()
+        except OSError as exc:
+            self._write_errors += 1
+            written = 0
+            logger.warning(
+                "ball_archive.write_failed",
+                metadata={"match_id": self.match_id, "error": str(exc), "dropped": self._buffered},
+            )
+            # The string table may now be shorter than the offsets handed out; start over.
+            self._records = bytearray()
+            self._strings = bytearray()
+            self._buffered = 0
+            self._start_next_segment_locked()
+            return written
+        self._records = bytearray()
+        self._strings = bytearray()
+        self._buffered = 0
+        return written
+
+    def _roll_locked(self) -> None:
+        self._flush_locked()
+        self._start_next_segment_locked()
+
+    def _start_next_segment_locked(self) -> None:
+        self._close_files_locked()
+        if self._current["records"]:
+            self._current["sealed"] = True
+            self._segments.append(self._current)
+        self._current = _new_segment_stats(self._current["segment"] + 1)
+        self._string_offsets.clear()
+        self._string_size = 0
+        try:
+            self._write_index_locked()
+        except OSError:
+            self._write_errors += 1
+
+    def _close_files_locked(self) -> None:
+        for handle in (self._rec_file, self._str_file):
+            if handle is not None:
+                handle.close()
+        self._rec_file = None
+        self._str_file = None
+
+    def _load_index(self) -> List[Dict[str, Any]]:
+        path = self.directory / _INDEX_FILE
+        if not path.exists():
+            return []
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            logger.warning("ball_archive.index_unreadable", metadata={"match_id": self.match_id, "error": str(exc)})
+            return []
+        return [entry for entry in data.get("segments", []) if entry.get("records")]
+
+    def _write_index_locked(self) -> None:
+        segments = list(self._segments)
+        if self._current["records"]:
+            segments.append(self._current)
+        payload = {
+            "version": ARCHIVE_FORMAT_VERSION,
+            "match_id": self.match_id,
+            "record_format": RECORD.format,
+            "segments": segments,
+        }
+        path = self.directory / _INDEX_FILE
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+
+class BallArchiveReader:
+    """Range scans over a match archive using memory-mapped segments."""
+
+    def __init__(self, directory: os.PathLike | str) -> None:
+        self.directory = Path(directory)
+
+    def segments(self) -> List[Dict[str, Any]]:
+        """Index entries for every segment on disk (unindexed ones get no stats)."""
+        indexed: Dict[int, Dict[str, Any]] = {}
+        path = self.directory / _INDEX_FILE
+        if path.exists():
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                data = {}
+            indexed = {entry["segment"]: entry for entry in data.get("segments", [])}
+        result = []
+        for rec_path in sorted(self.directory.glob("seg-*.rec")):
+            number = int(rec_path.stem.split("-")[1])
+            result.append(indexed.get(number) or {"segment": number})
+        return result
+
+    def scan(
+        self,
+        kinds: Optional[Iterable[RecordKind]] = None,
+        *,
+        over_from: Optional[int] = None,
+        over_to: Optional[int] = None,
+        innings: Optional[int] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+    ) -> Iterator[ArchiveRecord]:
+        """Yield records in write order.
+
+        ``over_from``/``over_to`` are inclusive completed-over numbers, so
+        ``over_from=15, over_to=20`` covers positions 15.0 through 20.5.
+        Records with an unknown over are excluded when an over range is given.
+        """
+        kind_set = {int(kind) for kind in kinds} if kinds is not None else None
+        kind_mask = sum(1 << kind for kind in kind_set) if kind_set is not None else None
+        low = over_from * 10 if over_from is not None else None
+        high = over_to * 10 + 9 if over_to is not None else None
+
+        for entry in self.segments():
+            if not self._may_match(entry, kind_mask, low, high, innings, since, until):
+                continue
+            yield from self._scan_segment(_segment_name(entry["segment"]), kind_set, low, high, innings, since, until)
+
+    def count(self) -> int:
+        total = 0
+        for rec_path in self.directory.glob("seg-*.rec"):
+            total += rec_path.stat().st_size // RECORD.size
+        return total
+
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _may_match(entry, kind_mask, low, high, innings, since, until) -> bool:
+        if "records" not in entry:
+            return True  # no stats (crash before the index was written); scan it
+        if kind_mask is not None and not entry["kinds"] & kind_mask:
+            return False
+        if innings is not None and entry["innings_min"] is not None:
+            if not entry["innings_min"] <= innings <= entry["innings_max"]:
+                return False
+        if (low is not None or high is not None) and entry["over_min"] is None:
+            return False
+        if low is not None and entry["over_max"] < low:
+            return False
+        if high is not None and entry["over_min"] > high:
+            return False
+        if since is not None and entry["last_ts"] is not None and entry["last_ts"] < since:
+            return False
+        if until is not None and entry["first_ts"] is not None and entry["first_ts"] > until:
+            return False
+        return True
+
+    def _scan_segment(self, name, kind_set, low, high, innings, since, until) -> Iterator[ArchiveRecord]:
+        rec_path = self.directory / f"{name}.rec"
+        str_path = self.directory / f"{name}.str"
+        try:
+            size = rec_path.stat().st_size
+        except OSError:
+            return
+        usable = size - size % RECORD.size  # ignore a torn trailing record
+        if usable <= 0:
+            return
+        with open(rec_path, "rb") as rec_file, mmap.mmap(rec_file.fileno(), 0, access=mmap.ACCESS_READ) as records:
+            strings = _map_optional(str_path)
+            view = memoryview(records)
+            try:
+                for ts, kind, record_innings, over_ball, v0, v1, v2, v3, offset, length in RECORD.iter_unpack(
+                    view[:usable]
+                ):
+                    if kind_set is not None and kind not in kind_set:
+                        continue
+                    if innings is not None and record_innings != innings:
+                        continue
+                    if low is not None and (over_ball < 0 or over_ball < low):
+                        continue
+                    if high is not None and (over_ball < 0 or over_ball > high):
+                        continue
+                    if since is not None and ts < since:
+                        continue
+                    if until is not None and ts > until:
+                        continue
+                    text = ""
+                    if length and strings is not None:
+                        text = strings[offset : offset + length].decode("utf-8", errors="replace")
+                    yield ArchiveRecord(ts, RecordKind(kind), record_innings, over_ball, (v0, v1, v2, v3), text)
+            finally:
+                view.release()
+                if strings is not None:
+                    strings.close()
+
+
+def _map_optional(path: Path) -> Optional[mmap.mmap]:
+    try:
+        with open(path, "rb") as handle:
+            if os.fstat(handle.fileno()).st_size == 0:
+                return None
+            # The mapping stays valid after the file object is closed.
+            return mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    except OSError:
+        return None
+
+
+_archives_lock = threading.Lock()
+_archives: Dict[str, MatchArchive] = {}
+
+
+def get_ball_archive(match_id: str, *, settings: Optional[ScraperSettings] = None) -> Optional[MatchArchive]:
+    """Return the shared archive for ``match_id`` or ``None`` when archiving is disabled."""
+
+    cfg = settings or get_settings()
+    if not cfg.ball_archive_enabled:
+        return None
+    with _archives_lock:
+        archive = _archives.get(match_id)
+        if archive is None:
+            try:
+                archive = MatchArchive(match_id, settings=cfg)
+            except OSError as exc:
+                logger.warning("ball_archive.open_failed", metadata={"match_id": match_id, "error": str(exc)})
+                return None
+            _archives[match_id] = archive
+        return archive
+
+
+def close_ball_archive(match_id: str) -> None:
+    with _archives_lock:
+        archive = _archives.pop(match_id, None)
+    if archive is not None:
+        archive.close()
+
+
+def close_ball_archives() -> None:
+    """Flush and close every open archive (service shutdown and tests)."""
+
+    with _archives_lock:
+        archives = list(_archives.values())
+        _archives.clear()
+    for archive in archives:
+        archive.close()
+
+
+def ball_archive_snapshots() -> List[Dict[str, Any]]:
+    with _archives_lock:
+        archives = list(_archives.values())
+    return [archive.snapshot() for archive in archives]
+
+
+__all__ = [
+    "ARCHIVE_FORMAT_VERSION",
+    "ArchiveRecord",
+    "BallArchiveReader",
+    "MatchArchive",
+    "RECORD",
+    "RecordKind",
+    "ball_archive_snapshots",
+    "close_ball_archive",
+    "close_ball_archives",
+    "get_ball_archive",
+    "parse_over",
+]
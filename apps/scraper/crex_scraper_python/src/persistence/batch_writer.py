@@ -5,10 +5,15 @@ from __future__ import annotations
 import threading
 import time
 from collections import deque
-from typing import Callable, Deque, List, Optional, Sequence, TypeVar
+from typing import TYPE_CHECKING, Callable, Deque, List, Optional, Sequence, TypeVar
 
-from ..config import ScraperSettings, get_settings
-from ..db_pool import ConnectionPool
+from src.config import ScraperSettings, get_settings
+from src.monitoring import set_queue_depth
+
+from .db_pool import ConnectionPool
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from src.egress.adaptive import AdaptiveBatchController
 
 T = TypeVar("T")
 MetricEmitter = Optional[Callable[[str, dict], None]]
@@ -19,7 +24,12 @@ class BatchWriterError(RuntimeError):
 
 
 class BatchWriter:
-    """Batched write helper with time/size based flush policies."""
+    """Batched write helper with time/size based flush policies.
+
+    ``add`` only queues. The worker thread flushes every ``flush_interval``
+    seconds, or as soon as ``batch_size`` updates are pending; callers never
+    wait on the database unless they ``flush`` (or add a ``critical`` update).
+    """
 
     def __init__(
         self,
@@ -30,6 +40,8 @@ class BatchWriter:
         batch_size: Optional[int] = None,
         flush_interval: Optional[float] = None,
         metric_emitter: MetricEmitter = None,
+        controller: Optional["AdaptiveBatchController"] = None,
+        name: Optional[str] = None,
     ) -> None:
         self._pool = pool
         self._persist_fn = persist_fn
@@ -42,6 +54,10 @@ class BatchWriter:
             raise ValueError("flush_interval must be positive")
 
         self._metric_emitter = metric_emitter
+        # When provided, the controller overrides batch_size/flush_interval at runtime.
+        self._controller = controller
+        # Named writers publish their pending depth as ``scraper_queue_depth{queue=name}``.
+        self._name = name
 
         self._queue: Deque[T] = deque()
         self._lock = threading.RLock()
@@ -66,14 +82,16 @@ class BatchWriter:
             self._persist_immediately(update)
             return
 
+        if self._controller is not None:
+            self._controller.observe_update()
         with self._lock:
             self._queue.append(update)
             self._stats["queued"] += 1
-            should_flush_now = len(self._queue) >= self._batch_size
+            depth = len(self._queue)
+            batch_full = depth >= self._current_batch_size()
+        self._publish_depth(depth)
 
-        if should_flush_now:
-            self.flush()
-        else:
+        if batch_full:
             self._flush_trigger.set()
 
     # ------------------------------------------------------------------
@@ -90,20 +108,28 @@ class BatchWriter:
         try:
             self._persist_batch(batch)
         except Exception as exc:
+            if self._controller is not None:
+                self._controller.observe_send(time.perf_counter() - start, success=False)
             with self._lock:
                 for item in reversed(batch):
                     self._queue.appendleft(item)
                 self._stats["flush_failures"] += 1
                 self._last_error = exc
+                depth = len(self._queue)
+            self._publish_depth(depth)
             if raise_exceptions:
                 raise
             return 0
 
         duration_ms = (time.perf_counter() - start) * 1000.0
+        if self._controller is not None:
+            self._controller.observe_send(duration_ms / 1000.0, success=True)
         with self._lock:
             self._stats["flushed"] += len(batch)
             self._stats["last_flush_duration_ms"] = duration_ms
             self._last_error = None
+            depth = len(self._queue)
+        self._publish_depth(depth)
 
         self._emit_metric(
             "batch_writer.flush",
@@ -120,7 +146,7 @@ class BatchWriter:
         self._stop_event.set()
         self._flush_trigger.set()
         if wait and self._worker.is_alive():
-            self._worker.join(timeout=self._flush_interval * 2)
+            self._worker.join(timeout=self._current_flush_interval() * 2)
         self.flush(raise_exceptions=False)
 
     # ------------------------------------------------------------------
@@ -130,6 +156,8 @@ class BatchWriter:
             return {
                 **self._stats,
                 "queued_pending": len(self._queue),
+                "batch_size": self._current_batch_size(),
+                "flush_interval_seconds": self._current_flush_interval(),
                 "last_error": repr(self._last_error) if self._last_error else None,
             }
 
@@ -137,7 +165,7 @@ class BatchWriter:
 
     def _run(self) -> None:
         while not self._stop_event.is_set():
-            self._flush_trigger.wait(timeout=self._flush_interval)
+            self._flush_trigger.wait(timeout=self._current_flush_interval())
             self._flush_trigger.clear()
             if self._stop_event.is_set():
                 break
@@ -145,6 +173,16 @@ class BatchWriter:
         # Final flush attempt on shutdown
         self.flush(raise_exceptions=False)
 
+    def _current_batch_size(self) -> int:
+        if self._controller is not None:
+            return self._controller.batch_size
+        return self._batch_size
+
+    def _current_flush_interval(self) -> float:
+        if self._controller is not None:
+            return self._controller.flush_interval
+        return self._flush_interval
+
     def _persist_batch(self, batch: Sequence[T]) -> None:
         if not batch:
             return
@@ -158,6 +196,10 @@ class BatchWriter:
             self._stats["critical"] += 1
         self._emit_metric("batch_writer.critical", {"count": 1})
 
+    def _publish_depth(self, depth: int) -> None:
+        if self._name is not None:
+            set_queue_depth(self._name, depth)
+
     def _emit_metric(self, name: str, payload: dict) -> None:
         if self._metric_emitter is not None:
             try:
@@ -1,7 +1,15 @@
-"""Thread-safe SQLite connection pool for the scraper service."""
+"""Thread-safe SQLite connection pool for the scraper service.
+
+Connections are long-lived, opened in WAL mode with a busy timeout so
+readers never block the writer. Each connection keeps its own
+prepared-statement cache (``cached_statements``), so reusing a pooled
+connection also reuses the compiled statements. Connections are validated
+on checkout and replaced when they turn out to be unusable.
+"""
 
 from __future__ import annotations
 
+import os
 import sqlite3
 import threading
 import time
@@ -9,7 +17,8 @@ from collections import deque
 from contextlib import contextmanager
 from typing import Deque, Dict, Iterator, Optional
 
-from .config import ScraperSettings, get_settings
+from src.config import ScraperSettings, get_settings
+from src.monitoring import record_db_pool_acquire, record_db_pool_event, set_db_pool_connections
 
 
 class ConnectionPoolError(RuntimeError):
@@ -27,6 +36,7 @@ class ConnectionPool:
         min_size: Optional[int] = None,
         max_size: Optional[int] = None,
         acquire_timeout: Optional[float] = None,
+        name: Optional[str] = None,
     ) -> None:
         self._settings = settings or get_settings()
         self._database_path = database_path or self._settings.sqlite_db_path
@@ -35,6 +45,7 @@ class ConnectionPool:
         self._acquire_timeout = (
             acquire_timeout if acquire_timeout is not None else self._settings.sqlite_timeout_seconds
         )
+        self.name = name or os.path.basename(self._database_path) or "sqlite"
 
         if self._min_size < 0 or self._max_size < 1:
             raise ValueError("Pool sizes must be positive")
@@ -43,25 +54,40 @@ class ConnectionPool:
 
         self._lock = threading.RLock()
         self._condition = threading.Condition(self._lock)
-    self._available: Deque[sqlite3.Connection] = deque()
-    self._in_use: set[sqlite3.Connection] = set()
-    self._open_connections = 0
+        self._available: Deque[sqlite3.Connection] = deque()
+        self._in_use: set[sqlite3.Connection] = set()
+        self._open_connections = 0
         self._closed = False
+        self._acquire_timeouts = 0
+        self._replaced = 0
 
-        for _ in range(self._min_size):
-            self._available.append(self._create_connection())
+        with self._condition:
+            for _ in range(self._min_size):
+                self._available.append(self._create_connection())
+            self._publish_locked()
 
     # ------------------------------------------------------------------
 
     def _create_connection(self) -> sqlite3.Connection:
+        busy_timeout = self._settings.sqlite_timeout_seconds
+        directory = os.path.dirname(self._database_path)
+        if directory and self._database_path != ":memory:":
+            os.makedirs(directory, exist_ok=True)
         connection = sqlite3.connect(
             self._database_path,
-            timeout=self._settings.sqlite_timeout_seconds,
+            timeout=busy_timeout,
             check_same_thread=False,
             detect_types=sqlite3.PARSE_DECLTYPES,
+            cached_statements=self._settings.sqlite_statement_cache_size,
         )
         connection.row_factory = sqlite3.Row
-    self._open_connections += 1
+        connection.execute(f"PRAGMA busy_timeout = {int(busy_timeout * 1000)}")
+        if self._settings.sqlite_wal_enabled:
+            # WAL lets readers proceed while a write is in progress; NORMAL sync is
+            # durable across application crashes and much cheaper than FULL in WAL mode.
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.execute("PRAGMA synchronous = NORMAL")
+        self._open_connections += 1
         return connection
 
     def _is_connection_healthy(self, connection: sqlite3.Connection) -> bool:
@@ -71,8 +97,18 @@ class ConnectionPool:
         except sqlite3.Error:
             return False
 
+    def _discard_locked(self, connection: sqlite3.Connection) -> None:
+        try:
+            connection.close()
+        except sqlite3.Error:
+            pass
+        self._open_connections = max(0, self._open_connections - 1)
+        self._replaced += 1
+        record_db_pool_event(self.name, "unhealthy_replaced")
+
     def _acquire(self) -> sqlite3.Connection:
-        deadline = time.monotonic() + self._acquire_timeout
+        start = time.monotonic()
+        deadline = start + self._acquire_timeout
         with self._condition:
             if self._closed:
                 raise ConnectionPoolError("Connection pool is closed")
@@ -81,24 +117,28 @@ class ConnectionPool:
                 if self._available:
                     connection = self._available.pop()
                     if not self._is_connection_healthy(connection):
-                        try:
-                            connection.close()
-                        except sqlite3.Error:
-                            pass
+                        self._discard_locked(connection)
                         continue
-                    self._in_use.add(connection)
-                    return connection
+                    break
 
                 current_size = len(self._in_use) + len(self._available)
                 if current_size < self._max_size:
                     connection = self._create_connection()
-                    self._in_use.add(connection)
-                    return connection
+                    break
 
                 remaining = deadline - time.monotonic()
                 if remaining <= 0:
+                    self._acquire_timeouts += 1
+                    record_db_pool_event(self.name, "acquire_timeout")
                     raise ConnectionPoolError("Timed out waiting for available database connection")
                 self._condition.wait(timeout=remaining)
+                if self._closed:
+                    raise ConnectionPoolError("Connection pool is closed")
+
+            self._in_use.add(connection)
+            self._publish_locked()
+        record_db_pool_acquire(self.name, time.monotonic() - start)
+        return connection
 
     def _release(self, connection: sqlite3.Connection) -> None:
         with self._condition:
@@ -113,21 +153,18 @@ class ConnectionPool:
                 return
 
             if not self._is_connection_healthy(connection):
-                try:
-                    connection.close()
-                except sqlite3.Error:
-                    pass
-                self._open_connections -= 1
-                if not self._closed:
-                    current_size = len(self._in_use) + len(self._available)
-                    if current_size < self._min_size:
-                        self._available.append(self._create_connection())
-                self._condition.notify()
-                return
-
-            self._available.append(connection)
+                self._discard_locked(connection)
+                current_size = len(self._in_use) + len(self._available)
+                if current_size < self._min_size:
+                    self._available.append(self._create_connection())
+            else:
+                self._available.append(connection)
+            self._publish_locked()
             self._condition.notify()
 
+    def _publish_locked(self) -> None:
+        set_db_pool_connections(self.name, in_use=len(self._in_use), available=len(self._available))
+
     # ------------------------------------------------------------------
 
     @contextmanager
@@ -168,6 +205,7 @@ class ConnectionPool:
             closed_count = len(self._available)
             self._available.clear()
             self._open_connections = max(0, self._open_connections - closed_count)
+            self._publish_locked()
             self._condition.notify_all()
 
     def stats(self) -> Dict[str, int]:
@@ -178,7 +216,45 @@ class ConnectionPool:
                 "in_use": len(self._in_use),
                 "min_size": self._min_size,
                 "max_size": self._max_size,
+                "acquire_timeouts": self._acquire_timeouts,
+                "replaced_connections": self._replaced,
             }
 
 
-__all__ = ["ConnectionPool", "ConnectionPoolError"]
+_pools_lock = threading.Lock()
+_pools: Dict[str, ConnectionPool] = {}
+
+
+def get_connection_pool(
+    database_path: Optional[str] = None,
+    *,
+    settings: Optional[ScraperSettings] = None,
+) -> ConnectionPool:
+    """Return the shared pool for ``database_path`` (the configured DB by default)."""
+
+    cfg = settings or get_settings()
+    key = os.path.abspath(database_path or cfg.sqlite_db_path)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = ConnectionPool(settings=cfg, database_path=database_path or cfg.sqlite_db_path)
+            _pools[key] = pool
+        return pool
+
+
+def close_connection_pools() -> None:
+    """Close and forget every shared pool (service shutdown and tests)."""
+
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+__all__ = [
+    "ConnectionPool",
+    "ConnectionPoolError",
+    "close_connection_pools",
+    "get_connection_pool",
+]
@@ -0,0 +1,165 @@
+"""Authoritative in-memory index of live match URLs.
+
+Discovery used to read the whole ``scraped_urls`` table (twice) and rewrite
+it on every cycle. ``LiveUrlIndex`` loads the table once, answers diffs from
+memory and persists changes write-behind through a ``BatchWriter``, so a
+discovery cycle performs no synchronous database I/O. Deletion-attempt
+counters (how many consecutive cycles a URL has been missing) live here too.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from src.config import ScraperSettings, get_settings
+from src.logging.adapters import get_logger
+
+from .batch_writer import BatchWriter
+from .db_pool import ConnectionPool
+
+logger = get_logger(component="url_index")
+
+
+class LiveUrlIndex:
+    """URL -> deletion-attempt counter map backed by ``scraped_urls``."""
+
+    def __init__(
+        self,
+        pool: ConnectionPool,
+        *,
+        settings: Optional[ScraperSettings] = None,
+        flush_interval: Optional[float] = None,
+    ) -> None:
+        self._settings = settings or get_settings()
+        self._pool = pool
+        self._lock = threading.RLock()
+        self._urls: Dict[str, int] = {}
+        self._load()
+        self._writer = BatchWriter(
+            pool,
+            self._persist,
+            settings=self._settings,
+            # Only the interval flushes in practice; the size trigger just bounds memory.
+            batch_size=10_000,
+            flush_interval=flush_interval or self._settings.url_index_flush_interval_seconds,
+            name="url_index",
+        )
+
+    def _load(self) -> None:
+        with self._pool.get_connection() as conn:
+            rows = conn.execute("SELECT url, deletion_attempts FROM scraped_urls").fetchall()
+        with self._lock:
+            self._urls = {row[0]: int(row[1] or 0) for row in rows}
+        logger.info("url_index.loaded", metadata={"count": len(rows)})
+
+    # ------------------------------------------------------------------
+
+    def urls(self) -> Set[str]:
+        with self._lock:
+            return set(self._urls)
+
+    def __contains__(self, url: object) -> bool:
+        with self._lock:
+            return url in self._urls
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._urls)
+
+    def deletion_attempts(self, url: str) -> int:
+        with self._lock:
+            return self._urls.get(url, 0)
+
+    def diff(self, new_urls: Iterable[str]) -> Tuple[List[str], List[str]]:
+        """Return ``(added, deleted)`` relative to the index without changing it."""
+
+        current = list(dict.fromkeys(new_urls))
+        with self._lock:
+            added = [url for url in current if url not in self._urls]
+            present = set(current)
+            deleted = [url for url in self._urls if url not in present]
+        return added, deleted
+
+    def update(self, new_urls: Iterable[str]) -> Tuple[List[str], List[str]]:
+        """Record a discovery cycle and return ``(added, deleted)``.
+
+        URLs seen in this cycle reset their deletion-attempt counter; known URLs
+        that are missing have it incremented. Persistence happens in the background.
+        """
+
+        current = list(dict.fromkeys(new_urls))
+        with self._lock:
+            added, deleted = self.diff(current)
+            for url in current:
+                self._urls[url] = 0
+            for url in deleted:
+                self._urls[url] += 1
+        self._enqueue(current + deleted)
+        return added, deleted
+
+    def upsert(self, urls: Iterable[str]) -> None:
+        """Mark ``urls`` as live (deletion attempts reset to zero)."""
+
+        urls = list(urls)
+        with self._lock:
+            for url in urls:
+                self._urls[url] = 0
+        self._enqueue(urls)
+
+    def remove(self, url: str) -> bool:
+        with self._lock:
+            removed = self._urls.pop(url, None) is not None
+        self._enqueue([url])
+        return removed
+
+    def clear(self) -> None:
+        with self._lock:
+            urls = list(self._urls)
+            self._urls.clear()
+        self._enqueue(urls)
+
+    # ------------------------------------------------------------------
+
+    def flush(self) -> int:
+        return self._writer.flush()
+
+    def close(self) -> None:
+        self._writer.shutdown()
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            tracked = len(self._urls)
+            missing = sum(1 for attempts in self._urls.values() if attempts)
+        stats = self._writer.get_stats()
+        return {"tracked": tracked, "missing": missing, "pending_writes": stats["queued_pending"]}
+
+    # ------------------------------------------------------------------
+
+    def _enqueue(self, urls: Sequence[str]) -> None:
+        for url in urls:
+            self._writer.add(url)
+
+    def _persist(self, conn: Any, urls: Sequence[str]) -> None:
+        upserts = []
+        deletes = []
+        with self._lock:
+            # Only the final state of each URL matters.
+            for url in dict.fromkeys(urls):
+                attempts = self._urls.get(url)
+                if attempts is None:
+                    deletes.append((url,))
+                else:
+                    upserts.append((url, attempts))
+        if upserts:
+            conn.executemany(
+                "INSERT INTO scraped_urls (url, deletion_attempts) VALUES (?, ?) "
+                "ON CONFLICT(url) DO UPDATE SET deletion_attempts = excluded.deletion_attempts",
+                upserts,
+            )
+        if deletes:
+            conn.executemany("DELETE FROM scraped_urls WHERE url = ?", deletes)
+        conn.commit()
+
+
+__all__ = ["LiveUrlIndex"]
@@ -0,0 +1,17 @@
+"""Record live matches and replay them offline through the scraping pipeline."""
+
+from .harness import ReplayPage, ReplayResponse, ReplayResult, Replayer, StubBackend
+from .recorder import MatchRecorder, Recording, RecordingPage, open_recorder, script_id
+
+__all__ = [
+    "MatchRecorder",
+    "Recording",
+    "RecordingPage",
+    "ReplayPage",
+    "ReplayResponse",
+    "ReplayResult",
+    "Replayer",
+    "StubBackend",
+    "open_recorder",
+    "script_id",
+]
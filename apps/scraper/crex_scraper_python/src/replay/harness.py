@@ -0,0 +1,484 @@
+"""Replay recorded matches through the live pipeline against a stub backend.
+
+``Replayer`` feeds a ``Recording`` through the same functions the live
+scraper uses: sV3 responses go through ``handle_api_responses`` (which
+triggers the sC4 fetch and ``handle_sC4_result``), and each recorded DOM pass
+runs ``observe_iteration`` against a ``ReplayPage`` that answers
+``page.evaluate`` from the recording. Everything the pipeline sends ends up
+at ``StubBackend``, a local HTTP server that also serves the recorded sC4
+responses.
+
+Replays run at a multiple of real time (``speed``) or, with ``speed=0``, as
+fast as the pipeline accepts events. The result reports throughput, CPU and
+memory cost and end-to-end latency.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Deque, Dict, Iterator, List, Optional, Sequence
+from urllib.parse import parse_qs, urlparse
+
+import psutil
+
+from src.logging.adapters import get_logger
+
+from .recorder import Recording, script_id
+
+logger = get_logger(component="replay")
+
+RESULT_FORMAT_VERSION = 1
+
+# Backend endpoints the root scraper reads from the environment at call time.
+_BACKEND_ENV = {
+    "TOKEN_URL": "/token/generate-token",
+    "SERVICE_URL": "/cricket-data",
+    "API_ENDPOINT": "/cricket-data/match-info/save",
+    "API_ENDPOINT_SC4": "/cricket-data/sC4-stats/save",
+    "CREX_SC4_URL": "/v10/sC4.php",
+}
+
+
+class ReplayError(LookupError):
+    """Raised when the pipeline asks for something the recording does not contain."""
+
+
+# ----------------------------------------------------------------------
+# Stand-ins for Playwright objects
+
+
+class ReplayPage:
+    """Answers ``page.evaluate`` with the results recorded for the current pass."""
+
+    def __init__(self) -> None:
+        self._latest: Dict[str, List[Any]] = {}
+        self._pending: Dict[str, Deque[Any]] = {}
+
+    def load(self, event: Dict[str, Any]) -> None:
+        self._latest.update(event.get("data") or {})
+        current = {key: self._latest[key] for key in event.get("unchanged", ()) if key in self._latest}
+        current.update(event.get("data") or {})
+        self._pending = {key: deque(results) for key, results in current.items()}
+
+    def evaluate(self, expression: str, *args: Any) -> Any:
+        key = script_id(expression)
+        queue = self._pending.get(key)
+        if not queue:
+            raise ReplayError(f"No recorded result for script {key}")
+        return queue.popleft()
+
+    def wait_for_load_state(self, *args: Any, **kwargs: Any) -> None:
+        return None
+
+
+class _ReplayRequest:
+    def __init__(self) -> None:
+        self.headers: Dict[str, str] = {}
+
+
+class ReplayResponse:
+    """The parts of a Playwright response that ``handle_api_responses`` reads."""
+
+    frame = None
+
+    def __init__(self, url: str, data: Any) -> None:
+        self.url = url
+        self._data = data
+        self.request = _ReplayRequest()
+
+    def json(self) -> Any:
+        return self._data
+
+
+# ----------------------------------------------------------------------
+# Stub backend
+
+
+@dataclass
+class BackendReceipt:
+    received_at: float
+    path: str
+    match_url: Optional[str]
+    size: int
+
+
+class StubBackend:
+    """Local HTTP server standing in for the Spring backend and the crex sC4 API."""
+
+    def __init__(self, *, delay_seconds: float = 0.0) -> None:
+        self.delay_seconds = delay_seconds
+        self._lock = threading.Lock()
+        self._sc4: Dict[str, Deque[Any]] = {}
+        self._last_sc4: Dict[str, Any] = {}
+        self.receipts: List[BackendReceipt] = []
+        self.cpu_seconds = 0.0
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name="ReplayStubBackend", daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def add_sc4_response(self, key: str, data: Any) -> None:
+        with self._lock:
+            self._sc4.setdefault(key, deque()).append(data)
+
+    def request_count(self) -> int:
+        with self._lock:
+            return len(self.receipts)
+
+    def start(self) -> "StubBackend":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "StubBackend":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+    # ------------------------------------------------------------------
+
+    def _next_sc4(self, key: str) -> Any:
+        with self._lock:
+            queue = self._sc4.get(key)
+            if queue:
+                self._last_sc4[key] = queue.popleft()
+            return self._last_sc4.get(key)
+
+    def _record(self, receipt: BackendReceipt, cpu: float) -> None:
+        with self._lock:
+            self.receipts.append(receipt)
+            self.cpu_seconds += cpu
+
+    def _handler_class(self):
+        backend = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format: str, *args: Any) -> None:  # noqa: A002 - stdlib signature
+                return None
+
+            def _reply(self, status: int, payload: Any) -> None:
+                body = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self) -> None:  # noqa: N802 - stdlib naming
+                started = time.thread_time()
+                parsed = urlparse(self.path)
+                if parsed.path.endswith("sC4.php"):
+                    key = parse_qs(parsed.query).get("key", [""])[0]
+                    data = backend._next_sc4(key)
+                    if data is None:
+                        self._reply(404, {"error": "no recorded sC4 response"})
+                    else:
+                        self._reply(200, data)
+                else:
+                    self._reply(404, {"error": "unknown path"})
+                backend._record(BackendReceipt(time.monotonic(), parsed.path, None, 0), time.thread_time() - started)
+
+            def do_POST(self) -> None:  # noqa: N802 - stdlib naming
+                started = time.thread_time()
+                body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                if self.path.startswith(_BACKEND_ENV["TOKEN_URL"]):
+                    self._reply(200, {"token": "replay-token"})
+                    backend._record(BackendReceipt(time.monotonic(), self.path, None, len(body)), 0.0)
+                    return
+                match_url = None
+                if "json" in (self.headers.get("Content-Type") or ""):
+                    try:
+                        payload = json.loads(body)
+                        if isinstance(payload, dict):
+                            match_url = payload.get("url")
+                    except ValueError:
+                        pass
+                cpu = time.thread_time() - started
+                if backend.delay_seconds:
+                    time.sleep(backend.delay_seconds)
+                self._reply(200, {"status": "ok"})
+                backend._record(BackendReceipt(time.monotonic(), self.path, match_url, len(body)), cpu)
+
+        return Handler
+
+
+# ----------------------------------------------------------------------
+# Replay
+
+
+@dataclass
+class ReplayResult:
+    """Benchmark figures for one replay run (``to_dict`` is the stored JSON)."""
+
+    recordings: List[str]
+    matches: int
+    speed: float
+    events: Dict[str, int]
+    updates: int
+    wall_seconds: float
+    updates_per_second: float
+    cpu_ms_per_update: float
+    memory_mb_per_match: float
+    peak_rss_mb: float
+    latency_ms: Dict[str, float]
+    backend_requests: int
+    errors: int
+    environment: Dict[str, Any] = field(default_factory=dict)
+    version: int = RESULT_FORMAT_VERSION
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def replay_url(url: str, copy: int) -> str:
+    """URL for replay copy ``copy``; copies get their own match slug so state never collides."""
+    if copy == 0:
+        return url
+    base, live, rest = url.rpartition("/live")
+    if not live:
+        return f"{url}-r{copy}"
+    return f"{base}-r{copy}{live}{rest}"
+
+
+def latency_samples(feeds: Sequence[float], receipts: Sequence[float]) -> List[float]:
+    """End-to-end latencies for one match.
+
+    For each backend request, the latency is measured from the oldest fed
+    event that had not yet been reflected at the backend. Coalesced sends
+    therefore count against the event that waited longest.
+    """
+    samples = []
+    index = 0
+    for received in sorted(receipts):
+        if index < len(feeds) and feeds[index] <= received:
+            samples.append(received - feeds[index])
+            while index < len(feeds) and feeds[index] <= received:
+                index += 1
+    return samples
+
+
+def _percentiles(samples: Sequence[float]) -> Dict[str, float]:
+    if not samples:
+        return {"count": 0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+    ordered = sorted(samples)
+
+    def pick(q: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000, 2)
+
+    return {
+        "count": len(ordered),
+        "p50": pick(0.50),
+        "p95": pick(0.95),
+        "p99": pick(0.99),
+        "max": round(ordered[-1] * 1000, 2),
+    }
+
+
+@contextmanager
+def backend_environment(base_url: str) -> Iterator[None]:
+    previous = {name: os.environ.get(name) for name in _BACKEND_ENV}
+    os.environ.update({name: base_url + path for name, path in _BACKEND_ENV.items()})
+    try:
+        yield
+    finally:
+        for name, value in previous.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+class _MatchReplay:
+    def __init__(self, recording: Recording, url: str, scraper: Any) -> None:
+        self.recording = recording
+        self.url = url
+        self.scraper = scraper
+        self.data_store = scraper.create_data_store(url)
+        self.page = ReplayPage()
+        self.previous: Dict[str, Any] = scraper.new_change_state()
+        self.is_test_match = "test" in url.lower()
+        self.odds_button = False
+        self.token: Optional[str] = None
+        self.feeds: List[float] = []
+        self.counts: Dict[str, int] = {}
+        self.errors = 0
+
+    def run(self, speed: float, start: float) -> None:
+        self.token = self.scraper.cricket_data_service.get_bearer_token()
+        try:
+            for event in self.recording:
+                if speed > 0:
+                    delay = start + event["t"] / speed - time.monotonic()
+                    if delay > 0:
+                        time.sleep(delay)
+                self._feed(event)
+        finally:
+            self.scraper.close_data_store(self.data_store)
+
+    def _feed(self, event: Dict[str, Any]) -> None:
+        kind = event["type"]
+        self.counts[kind] = self.counts.get(kind, 0) + 1
+        try:
+            if kind == "local_storage":
+                with self.data_store["lock"]:
+                    self.data_store["local_storage_data"] = event["data"]
+            elif kind == "observe":
+                self.is_test_match = bool(event["data"].get("is_test_match", self.is_test_match))
+                self.odds_button = bool(event["data"].get("odds_button", False))
+            elif kind == "sv3":
+                self.feeds.append(time.monotonic())
+                self.scraper.handle_api_responses(ReplayResponse(event.get("url", ""), event["data"]), self.data_store)
+            elif kind == "dom":
+                self.feeds.append(time.monotonic())
+                self.page.load(event)
+                self.scraper.observe_iteration(
+                    self.page,
+                    self.odds_button,
+                    self.token,
+                    self.url,
+                    self.data_store,
+                    self.is_test_match,
+                    self.previous,
+                )
+        except Exception as exc:  # the live loop logs and carries on; so does the replay
+            self.errors += 1
+            logger.warning("replay.event_failed", metadata={"type": kind, "error": str(exc)})
+
+
+class Replayer:
+    """Drive recordings through the pipeline and measure it."""
+
+    def __init__(
+        self,
+        recordings: Sequence[Recording],
+        *,
+        speed: float = 1.0,
+        copies: int = 1,
+        backend_delay_seconds: float = 0.0,
+        drain_timeout: float = 30.0,
+    ) -> None:
+        if speed < 0:
+            raise ValueError("speed must be >= 0 (0 replays as fast as possible)")
+        if copies < 1:
+            raise ValueError("copies must be >= 1")
+        self.recordings = list(recordings)
+        self.speed = speed
+        self.copies = copies
+        self.backend_delay_seconds = backend_delay_seconds
+        self.drain_timeout = drain_timeout
+
+    def run(self) -> ReplayResult:
+        import crex_match_data_scraper as scraper  # root module; needs apps/scraper on sys.path
+        from src.egress import get_dispatcher
+
+        process = psutil.Process()
+        with StubBackend(delay_seconds=self.backend_delay_seconds) as backend, backend_environment(backend.base_url):
+            for recording in self.recordings:
+                for event in recording:
+                    if event["type"] == "sc4":
+                        for _ in range(self.copies):
+                            backend.add_sc4_response(event.get("key", ""), event["data"])
+
+            replays = [
+                _MatchReplay(recording, replay_url(recording.url, copy), scraper)
+                for recording in self.recordings
+                for copy in range(self.copies)
+            ]
+            baseline_rss = process.memory_info().rss
+            peak_rss = [baseline_rss]
+            stop = threading.Event()
+            sampler = threading.Thread(target=self._sample_rss, args=(process, peak_rss, stop), daemon=True)
+            sampler.start()
+
+            cpu_start = process.cpu_times()
+            start = time.monotonic()
+            threads = [
+                threading.Thread(target=replay.run, args=(self.speed, start), name=f"replay-{i}")
+                for i, replay in enumerate(replays)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            fed_seconds = time.monotonic() - start
+            self._drain(backend, get_dispatcher())
+            wall_seconds = time.monotonic() - start
+            cpu_end = process.cpu_times()
+            stop.set()
+            sampler.join()
+
+        updates = sum(len(replay.feeds) for replay in replays)
+        cpu_seconds = (cpu_end.user - cpu_start.user) + (cpu_end.system - cpu_start.system) - backend.cpu_seconds
+        samples: List[float] = []
+        for replay in replays:
+            receipts = [r.received_at for r in backend.receipts if r.match_url == replay.url]
+            samples.extend(latency_samples(replay.feeds, receipts))
+        events: Dict[str, int] = {}
+        for replay in replays:
+            for kind, count in replay.counts.items():
+                events[kind] = events.get(kind, 0) + count
+
+        return ReplayResult(
+            recordings=[recording.name for recording in self.recordings],
+            matches=len(replays),
+            speed=self.speed,
+            events=events,
+            updates=updates,
+            wall_seconds=round(wall_seconds, 3),
+            updates_per_second=round(updates / fed_seconds, 2) if fed_seconds else 0.0,
+            cpu_ms_per_update=round(max(cpu_seconds, 0.0) / updates * 1000, 4) if updates else 0.0,
+            memory_mb_per_match=round((peak_rss[0] - baseline_rss) / len(replays) / (1024 * 1024), 3),
+            peak_rss_mb=round(peak_rss[0] / (1024 * 1024), 2),
+            latency_ms=_percentiles(samples),
+            backend_requests=len(backend.receipts),
+            errors=sum(replay.errors for replay in replays),
+            environment={"python": platform.python_version(), "platform": platform.platform()},
+        )
+
+    def _drain(self, backend: StubBackend, dispatcher: Any) -> None:
+        """Wait for sC4 callbacks and egress queues to settle."""
+        deadline = time.monotonic() + self.drain_timeout
+        last = -1
+        while time.monotonic() < deadline:
+            dispatcher.flush(timeout=max(0.0, deadline - time.monotonic()))
+            count = backend.request_count()
+            if count == last:
+                return
+            last = count
+            time.sleep(0.2)
+
+    @staticmethod
+    def _sample_rss(process: psutil.Process, peak: List[int], stop: threading.Event) -> None:
+        while not stop.wait(0.05):
+            peak[0] = max(peak[0], process.memory_info().rss)
+
+
+__all__ = [
+    "BackendReceipt",
+    "ReplayError",
+    "ReplayPage",
+    "ReplayResponse",
+    "ReplayResult",
+    "Replayer",
+    "StubBackend",
+    "latency_samples",
+    "replay_url",
+]
@@ -0,0 +1,196 @@
+"""Capture what a live match scraper sees so it can be replayed offline.
+
+A recording is a gzip-compressed JSON-lines file per match. The first line is
+a header; every other line is an event with ``t`` (seconds since the
+recording started) and ``type``:
+
+``local_storage``  categorised localStorage maps extracted from the scorecard tab
+``observe``        observation loop flags (``is_test_match``, ``odds_button``)
+``sv3``            raw sV3 response JSON (request headers are not kept)
+``sc4``            raw sC4 response JSON for ``key``
+``dom``            results of every ``page.evaluate`` made during one pass of
+                   the observation loop, keyed by script id; scripts whose
+                   result did not change since the previous pass are listed
+                   under ``unchanged`` instead of being stored again
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from src.config import ScraperSettings, get_settings
+from src.logging.adapters import get_logger
+
+logger = get_logger(component="replay_recorder")
+
+RECORDING_FORMAT_VERSION = 1
+RECORDING_SUFFIX = ".jsonl.gz"
+
+
+def script_id(expression: str) -> str:
+    """Stable identifier of a ``page.evaluate`` script (whitespace-insensitive)."""
+    normalized = " ".join(expression.split())
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()[:12]
+
+
+class MatchRecorder:
+    """Append-only writer for one match recording."""
+
+    def __init__(self, path: Path, *, match_id: str, url: str, clock=time.monotonic) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._clock = clock
+        self._started = clock()
+        self._lock = threading.Lock()
+        self._events = 0
+        self._closed = False
+        self._file = gzip.open(self.path, "wt", encoding="utf-8", compresslevel=5)
+        self._write(
+            {
+                "version": RECORDING_FORMAT_VERSION,
+                "match_id": match_id,
+                "url": url,
+                "started_at": time.time(),
+            }
+        )
+
+    def record(self, event_type: str, data: Any, **fields: Any) -> None:
+        event = {"t": round(self._clock() - self._started, 4), "type": event_type, **fields, "data": data}
+        with self._lock:
+            if self._closed:
+                return
+            try:
+                self._write(event)
+                self._events += 1
+            except (OSError, TypeError, ValueError) as exc:
+                logger.warning("replay.record_failed", metadata={"path": str(self.path), "error": str(exc)})
+
+    def wrap_page(self, page: Any) -> "RecordingPage":
+        return RecordingPage(page, self)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._file.close()
+        logger.info("replay.recording.closed", metadata={"path": str(self.path), "events": self._events})
+
+    def _write(self, payload: Dict[str, Any]) -> None:
+        self._file.write(json.dumps(payload, separators=(",", ":"), default=str))
+        self._file.write("\n")
+
+
+class RecordingPage:
+    """Proxy around a Playwright page that records ``evaluate`` results per loop pass."""
+
+    def __init__(self, page: Any, recorder: MatchRecorder) -> None:
+        self._page = page
+        self._recorder = recorder
+        self._captured: Dict[str, List[Any]] = {}
+        self._previous: Dict[str, List[Any]] = {}
+
+    def evaluate(self, expression: str, *args: Any) -> Any:
+        result = self._page.evaluate(expression, *args)
+        self._captured.setdefault(script_id(expression), []).append(result)
+        return result
+
+    def end_iteration(self) -> None:
+        """Write the results captured since the last call as one ``dom`` event."""
+        if not self._captured:
+            return
+        changed = {}
+        unchanged = []
+        for key, results in self._captured.items():
+            if self._previous.get(key) == results:
+                unchanged.append(key)
+            else:
+                changed[key] = results
+        self._recorder.record("dom", changed, unchanged=unchanged)
+        self._previous = self._captured
+        self._captured = {}
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._page, name)
+
+
+def open_recorder(
+    match_id: str,
+    url: str,
+    *,
+    settings: Optional[ScraperSettings] = None,
+) -> Optional[MatchRecorder]:
+    """Start a recording for ``match_id`` when ``SCRAPER_RECORD_DIR`` is set."""
+
+    cfg = settings or get_settings()
+    if not cfg.replay_record_dir:
+        return None
+    stamp = time.strftime("%Y%m%dT%H%M%S", time.gmtime())
+    path = Path(cfg.replay_record_dir) / f"{match_id}-{stamp}{RECORDING_SUFFIX}"
+    try:
+        recorder = MatchRecorder(path, match_id=match_id, url=url)
+    except OSError as exc:
+        logger.warning("replay.recording.open_failed", metadata={"path": str(path), "error": str(exc)})
+        return None
+    logger.info("replay.recording.started", metadata={"path": str(path), "match_id": match_id})
+    return recorder
+
+
+class Recording:
+    """A loaded recording: its header and events in capture order."""
+
+    def __init__(self, header: Dict[str, Any], events: List[Dict[str, Any]], *, name: str = "") -> None:
+        self.header = header
+        self.events = events
+        self.name = name or header.get("match_id", "recording")
+
+    @property
+    def url(self) -> str:
+        return self.header.get("url", "")
+
+    @property
+    def duration(self) -> float:
+        return self.events[-1]["t"] if self.events else 0.0
+
+    def counts(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for event in self.events:
+            counts[event["type"]] = counts.get(event["type"], 0) + 1
+        return counts
+
+    @classmethod
+    def load(cls, path: Path | str) -> "Recording":
+        path = Path(path)
+        opener = gzip.open if path.suffix == ".gz" else open
+        events: List[Dict[str, Any]] = []
+        with opener(path, "rt", encoding="utf-8") as handle:
+            header = json.loads(handle.readline())
+            if header.get("version") != RECORDING_FORMAT_VERSION:
+                raise ValueError(f"Unsupported recording version {header.get('version')} in {path}")
+            try:
+                for line in handle:
+                    if line.strip():
+                        events.append(json.loads(line))
+            except (EOFError, ValueError) as exc:
+                # A scraper that was killed leaves a truncated tail; keep what is complete.
+                logger.warning("replay.recording.truncated", metadata={"path": str(path), "error": str(exc)})
+        return cls(header, events, name=path.name.split(".")[0])
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self.events)
+
+
+__all__ = [
+    "RECORDING_FORMAT_VERSION",
+    "MatchRecorder",
+    "Recording",
+    "RecordingPage",
+    "open_recorder",
+    "script_id",
+]
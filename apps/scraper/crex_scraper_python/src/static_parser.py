@@ -0,0 +1,261 @@
+"""Browser-free parsing of server-rendered pages.
+
+The live cards on the match listing and the header of a match info page
+(``.toss-wrap``, ``.match-date``, ``.match-venue``) are plain markup, so
+they can be read from fetched HTML without starting Chromium.
+``parse_html`` builds an lxml tree whose elements answer the subset of the
+Playwright ``ElementHandle`` API that ``parsers`` uses (``query_selector``,
+``query_selector_all``, ``get_attribute``, ``inner_text``). The
+``SELECTORS`` fallback chains, learned ordering and lookup metrics therefore
+apply unchanged.
+
+Selectors are the ones ``parsers.compile_selector`` accepts. CSS is
+translated to XPath by cssselect; XPath (``xpath=`` or ``:scope >> xpath=``)
+runs on lxml directly. Both are compiled once per selector. Playwright-only
+syntax (``text=``, ``:has-text``, ``>>`` chains) raises
+``UnsupportedSelectorError``; ``parsers`` logs that and moves on to the next
+selector in the chain. As in the browser, table rows get the ``tbody`` the
+HTML parser implies.
+
+``inner_text`` approximates the browser's ``innerText``: it joins the text
+content, skipping scripts and styles, and collapses whitespace. It does not
+know about CSS visibility. The static path is only an optimisation.
+Callers fall back to Chromium whenever it comes back incomplete.
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Union
+
+import lxml.html
+import requests
+from cssselect import SelectorError
+from lxml import etree
+from lxml.cssselect import LxmlHTMLTranslator
+from requests import RequestException
+
+from src.parsers import (
+    SelectorResolutionError,
+    compile_selector,
+    extract_match_href,
+    select_all,
+)
+from src.config import ScraperSettings, get_settings
+from src.logging.adapters import get_logger
+from src.monitoring.monitoring import record_static_parse
+
+logger = get_logger(component="static_parser")
+
+HTML_BACKEND = "lxml"
+
+_WHITESPACE = re.compile(r"\s+")
+_USER_AGENT = (
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+_TRANSLATOR = LxmlHTMLTranslator()
+_VISIBLE_TEXT = etree.XPath(
+    "descendant-or-self::text()"
+    "[not(ancestor::script or ancestor::style or ancestor::template or ancestor::noscript)]"
+)
+
+
+class UnsupportedSelectorError(ValueError):
+    """The selector uses syntax only a browser engine can evaluate."""
+
+
+@lru_cache(maxsize=512)
+def _compile(selector: str, scope: str) -> etree.XPath:
+    """XPath for ``selector``; CSS matches below ``scope`` (``descendant`` or ``descendant-or-self``)."""
+
+    compiled = compile_selector(selector)
+    if compiled is None:
+        raise UnsupportedSelectorError(f"Selector needs a browser engine: {selector!r}")
+    kind, expression = compiled
+    try:
+        if kind == "css":
+            expression = _TRANSLATOR.css_to_xpath(expression, prefix=f"{scope}::")
+        return etree.XPath(expression)
+    except (SelectorError, etree.XPathSyntaxError) as exc:
+        raise UnsupportedSelectorError(f"Unsupported selector {selector!r}: {exc}") from exc
+
+
+def _elements(result: Any) -> List["Node"]:
+    # XPath may select text or attribute nodes (or a number); only elements are handles.
+    if not isinstance(result, list):
+        return []
+    return [item for item in result if isinstance(item, etree.ElementBase) and isinstance(item.tag, str)]
+
+
+class _Queryable:
+    """``query_selector``/``query_selector_all`` over an lxml context node."""
+
+    _css_scope = "descendant"
+
+    def _context(self) -> Any:
+        return self
+
+    def query_selector(self, selector: str) -> Optional["Node"]:
+        found = self.query_selector_all(selector)
+        return found[0] if found else None
+
+    def query_selector_all(self, selector: str) -> List["Node"]:
+        xpath = _compile(selector, self._css_scope)
+        try:
+            return _elements(xpath(self._context()))
+        except etree.XPathEvalError as exc:
+            raise UnsupportedSelectorError(f"Unsupported selector {selector!r}: {exc}") from exc
+
+
+class Node(_Queryable, lxml.html.HtmlElement):
+    """Element of a parsed page with the ``ElementHandle`` methods ``parsers`` calls.
+
+    lxml recreates element proxies freely, so this class holds no state of
+    its own; ``tag``, ``get`` and ``text_content`` come from lxml.
+    """
+
+    def __bool__(self) -> bool:
+        # Like a Playwright handle (and unlike lxml, where an element without
+        # children is falsy), so ``if element:`` means "was found".
+        return True
+
+    def get_attribute(self, name: str) -> Optional[str]:
+        return self.get(name)
+
+    def inner_text(self) -> str:
+        return _WHITESPACE.sub(" ", "".join(_VISIBLE_TEXT(self))).strip()
+
+
+class StaticDocument(_Queryable):
+    """Root of a parsed page; ``backend`` names the parser that built it."""
+
+    # CSS from the document may match the root element itself.
+    _css_scope = "descendant-or-self"
+
+    def __init__(self, tree: Any, backend: str = HTML_BACKEND) -> None:
+        self.tree = tree
+        self.backend = backend
+
+    def _context(self) -> Any:
+        return self.tree
+
+    def inner_text(self) -> str:
+        root = self.tree.getroot()
+        return root.inner_text() if root is not None else ""
+
+
+_PARSER = lxml.html.HTMLParser()
+_PARSER.set_element_class_lookup(
+    etree.ElementDefaultClassLookup(
+        element=Node,
+        comment=lxml.html.HtmlComment,
+        pi=lxml.html.HtmlProcessingInstruction,
+        entity=lxml.html.HtmlEntity,
+    )
+)
+
+
+def parse_html(html: Union[str, bytes]) -> StaticDocument:
+    """Parse ``html`` into a ``StaticDocument``."""
+
+    root = lxml.html.document_fromstring(html, parser=_PARSER)
+    _add_implied_tbody(root)
+    return StaticDocument(root.getroottree())
+
+
+def _add_implied_tbody(root: Any) -> None:
+    """Move rows that sit directly in a ``table`` into a ``tbody``, as browsers do."""
+
+    for table in root.iter("table"):
+        body = None
+        for child in list(table):
+            if child.tag == "tr":
+                if body is None:
+                    body = table.makeelement("tbody", {})
+                    child.addprevious(body)
+                body.append(child)
+            elif isinstance(child.tag, str):
+                body = None
+
+
+# ---------------------------------------------------------------------------
+# Page extraction
+# ---------------------------------------------------------------------------
+def fetch_document(
+    url: str,
+    *,
+    page: str,
+    settings: Optional[ScraperSettings] = None,
+    session: Optional[Any] = None,
+) -> Optional[StaticDocument]:
+    """GET ``url`` and parse it; ``None`` when static parsing is disabled or the fetch fails.
+
+    ``page`` labels ``scraper_static_parses_total`` (e.g. ``"listing"``, ``"match_info"``).
+    """
+
+    cfg = settings or get_settings()
+    if not cfg.static_parse_enabled:
+        return None
+    try:
+        response = (session or requests).get(
+            url,
+            timeout=cfg.static_fetch_timeout_seconds,
+            headers={"User-Agent": _USER_AGENT},
+        )
+        response.raise_for_status()
+    except (RequestException, ValueError) as exc:
+        record_static_parse(page, "fetch_error")
+        logger.info(
+            "static.fetch_failed",
+            metadata={
+                "url": str(url),
+                "page": page,
+                "error": str(exc),
+                "error_type": type(exc).__name__,
+            },
+        )
+        return None
+    return parse_html(response.text)
+
+
+def extract_live_match_hrefs_static(
+    document: Union[StaticDocument, Node],
+    *,
+    log_context: Optional[Dict[str, Any]] = None,
+) -> Optional[List[str]]:
+    """Live match links found in server-rendered markup, or ``None`` when incomplete.
+
+    Uses the same ``live_match_badge``/``live_match_anchor`` chains as the
+    browser path. A page with no badge, or a badge without a link, is
+    "incomplete": the listing may be rendered client-side, so the caller
+    should ask Chromium instead of trusting an empty result.
+    """
+
+    context = {**(log_context or {}), "parser": "static"}
+    badges = select_all(document, "live_match_badge", log_context=context)
+    if not badges:
+        logger.info("static.incomplete", metadata={"selector_key": "live_match_badge", **context})
+        return None
+    hrefs: List[str] = []
+    for index, badge in enumerate(badges):
+        try:
+            hrefs.append(extract_match_href(badge, log_context={**context, "badge_index": index}))
+        except SelectorResolutionError as exc:
+            logger.info(
+                "static.incomplete",
+                metadata={"selector_key": exc.selector_key, "badge_index": index, **context},
+            )
+            return None
+    return hrefs
+
+
+__all__ = [
+    "HTML_BACKEND",
+    "Node",
+    "StaticDocument",
+    "UnsupportedSelectorError",
+    "extract_live_match_hrefs_static",
+    "fetch_document",
+    "parse_html",
+]
@@ -0,0 +1,14 @@
+"""Keep test databases out of the source tree.
+
+``SCRAPER_DB_PATH`` is read when ``src.crex_main_url`` and the state store
+are first imported, so it is set before any test module loads. The WAL
+``-wal``/``-shm`` files land next to it in a temporary directory.
+"""
+import atexit
+import os
+import shutil
+import tempfile
+
+_DATA_DIR = tempfile.mkdtemp(prefix="crex-scraper-tests-")
+atexit.register(shutil.rmtree, _DATA_DIR, ignore_errors=True)
+os.environ.setdefault("SCRAPER_DB_PATH", os.path.join(_DATA_DIR, "url_state.db"))
@@ -0,0 +1,57 @@
+"""Import smoke test for the container layout.
+
+The Dockerfile copies the standalone helper modules and the *contents* of
+``crex_scraper_python`` side by side into ``/app``, so there is no
+``crex_scraper_python`` package at runtime. Entry points must import from
+that flattened tree.
+"""
+import os
+import re
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PACKAGE_DIR = Path(__file__).resolve().parents[2]
+SCRAPER_DIR = PACKAGE_DIR.parent
+DOCKERFILE = SCRAPER_DIR / "Dockerfile"
+
+
+def _helper_modules():
+    """Files named by the Dockerfile's ``COPY <helpers...> ./`` line."""
+
+    for line in DOCKERFILE.read_text(encoding="utf-8").splitlines():
+        match = re.match(r"COPY\s+(.+\.py)\s+\./\s*$", line.strip())
+        if match:
+            return match.group(1).split()
+    return []
+
+
+@pytest.fixture
+def image_root(tmp_path):
+    app = tmp_path / "app"
+    shutil.copytree(
+        PACKAGE_DIR,
+        app,
+        ignore=shutil.ignore_patterns("__pycache__", "*.db", "*.db-*", "*.log", "artifacts", "tests"),
+    )
+    for name in _helper_modules():
+        shutil.copy(SCRAPER_DIR / name, app / name)
+    return app
+
+
+@pytest.mark.parametrize("module", ["run_server", "crex_info_url", "crex_match_data_scraper"])
+def test_entry_points_import_from_flattened_layout(image_root, module):
+    assert _helper_modules(), "Dockerfile helper COPY line not found"
+    env = {key: value for key, value in os.environ.items() if key != "PYTHONPATH"}
+    result = subprocess.run(
+        [sys.executable, "-c", f"import {module}"],
+        cwd=image_root,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr
@@ -1,8 +1,13 @@
 import unittest
 from flask import json
-from crex_scraper_python.src.crex_main_url import app
+from crex_scraper_python.src.crex_main_url import app, initialize_database
 
 class APITestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """Create the leads table in the test database."""
+        initialize_database()
+
     def setUp(self):
         self.app = app.test_client()
         self.app.testing = True
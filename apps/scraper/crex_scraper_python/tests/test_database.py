@@ -1,6 +1,6 @@
 import unittest
 import sqlite3
-from src.crex_main_url import initialize_database, store_urls, load_previous_urls
+from src.crex_main_url import DB_FILE, initialize_database, store_urls, load_previous_urls
 
 class TestDatabase(unittest.TestCase):
 
@@ -11,7 +11,7 @@ class TestDatabase(unittest.TestCase):
 
     def setUp(self):
         """Set up a fresh database connection for each test."""
-        self.conn = sqlite3.connect('url_state.db')
+        self.conn = sqlite3.connect(DB_FILE)
         self.cursor = self.conn.cursor()
 
     def tearDown(self):
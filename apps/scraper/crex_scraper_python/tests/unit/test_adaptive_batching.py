@@ -0,0 +1,112 @@
+import pytest
+
+from src import monitoring
+from src.config import load_settings
+from src.egress.adaptive import AdaptiveBatchController
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def _reset_metrics():
+    monitoring.reset_metrics_for_tests()
+    yield
+    monitoring.reset_metrics_for_tests()
+
+
+def _controller(clock, **env):
+    base = {
+        "EGRESS_FRESHNESS_BUDGET_SECONDS": "5",
+        "SCRAPER_BATCH_TARGET_LATENCY_SECONDS": "0.5",
+        "SCRAPER_BATCH_MAX_ERROR_RATE": "0.1",
+        "SCRAPER_BATCH_ADJUST_INTERVAL_SECONDS": "1",
+        "SCRAPER_BATCH_MIN_FLUSH_INTERVAL_SECONDS": "0.25",
+    }
+    base.update(env)
+    return AdaptiveBatchController(
+        "test",
+        load_settings(base),
+        initial_batch_size=10,
+        initial_flush_interval=2.0,
+        clock=clock,
+    )
+
+
+def test_healthy_backend_tightens_interval_additively():
+    clock = _Clock()
+    controller = _controller(clock)
+
+    for _ in range(5):
+        controller.observe_send(0.05, success=True)
+    decision = controller.adjust()
+
+    assert decision.flush_interval_seconds == pytest.approx(1.75)
+
+
+def test_slow_backend_backs_off_multiplicatively():
+    clock = _Clock()
+    controller = _controller(clock)
+
+    for _ in range(20):
+        controller.observe_send(1.0, success=True)
+    decision = controller.adjust()
+
+    assert decision.flush_interval_seconds == pytest.approx(4.0)
+
+
+def test_errors_trigger_backoff():
+    clock = _Clock()
+    controller = _controller(clock)
+
+    for index in range(10):
+        controller.observe_send(0.05, success=index % 2 == 0)
+
+    assert controller.adjust().flush_interval_seconds == pytest.approx(4.0)
+
+
+def test_interval_respects_freshness_budget():
+    clock = _Clock()
+    controller = _controller(clock)
+
+    for _ in range(3):
+        for _ in range(20):
+            controller.observe_send(2.0, success=True)
+        controller.adjust()
+
+    # Budget 5s minus 2s p95 leaves at most 3s of queueing time.
+    assert controller.flush_interval == pytest.approx(3.0)
+
+
+def test_batch_size_follows_peak_update_rate():
+    clock = _Clock()
+    controller = _controller(clock, SCRAPER_BATCH_ADJUST_INTERVAL_SECONDS="10")
+
+    for step in range(40):
+        clock.now = step * 0.25
+        controller.observe_update("match-1")
+        if step % 4 == 0:
+            controller.observe_update("match-2")
+    clock.now = 10.0
+    # The adjust interval has elapsed, so this observation triggers a decision.
+    controller.observe_send(0.05, success=True)
+    decision = controller.decision()
+
+    # match-1 produces ~4 updates/s, so a 1.75s interval carries ~7 updates.
+    assert decision.batch_size == 7
+
+
+def test_decisions_exported_as_metrics():
+    clock = _Clock()
+    controller = _controller(clock)
+    controller.observe_send(1.0, success=True)
+    controller.adjust()
+
+    module = monitoring.monitoring
+    assert module.SCRAPER_BATCH_FLUSH_INTERVAL_SECONDS.labels(controller="test")._value.get() == pytest.approx(4.0)
+    assert module.SCRAPER_BATCH_ADJUSTMENTS_TOTAL.labels(controller="test", direction="backoff")._value.get() == 1
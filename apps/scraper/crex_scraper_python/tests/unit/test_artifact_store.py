@@ -0,0 +1,100 @@
+import json
+import threading
+
+from src.config import load_settings
+from src.logging.artifact_store import MANIFEST_FILENAME, ArtifactStore
+from src.monitoring import monitoring
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1_000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _store(tmp_path, clock=None, **env):
+    settings = load_settings({"ARTIFACT_STORE_MAX_BYTES": str(1024 * 1024), **env})
+    return ArtifactStore(tmp_path / "store", settings=settings, retention_seconds=3600, clock=clock or _Clock())
+
+
+def test_identical_captures_are_stored_once_and_compressed(tmp_path):
+    store = _store(tmp_path)
+    page = "<html><body>" + "<div class='badge'>live</div>" * 2000 + "</body></html>"
+    before = monitoring.SCRAPER_ARTIFACTS_TOTAL.labels(outcome="deduplicated")._value.get()
+    try:
+        first = store.put(page, correlation_id="c1")
+        second = store.put(page, correlation_id="c2")
+        assert store.flush(timeout=5)
+    finally:
+        store.close()
+
+    assert not first.deduplicated and second.deduplicated
+    assert first.path == second.path and first.path.name.endswith(".html.gz")
+    assert first.path.stat().st_size < len(page) / 10
+    assert store.read(first.digest) == page.encode("utf-8")
+    assert monitoring.SCRAPER_ARTIFACTS_TOTAL.labels(outcome="deduplicated")._value.get() == before + 1
+
+    manifest = json.loads((tmp_path / "store" / MANIFEST_FILENAME).read_text())
+    entry = manifest["artifacts"][first.digest]
+    assert entry["hits"] == 2
+    assert [ref["correlation_id"] for ref in entry["refs"]] == ["c1", "c2"]
+
+
+def test_budget_evicts_least_recently_seen(tmp_path):
+    clock = _Clock()
+    store = _store(tmp_path, clock)
+    store._budget = 2 * 1024  # two of the incompressible blobs below fit, three do not
+    blobs = [bytes([i]) * 16 + bytes(range(256)) * 3 for i in range(3)]
+    try:
+        refs = []
+        for blob in blobs[:2]:
+            refs.append(store.put(blob, kind="screenshot"))
+            clock.now += 1
+        store.flush(timeout=5)
+        store.put(blobs[0], kind="screenshot")  # seen again: now the most recent
+        clock.now += 1
+        refs.append(store.put(blobs[2], kind="screenshot"))
+        store.flush(timeout=5)
+    finally:
+        store.close()
+
+    assert refs[0].path.exists() and refs[2].path.exists()
+    assert not refs[1].path.exists()
+    assert store.snapshot()["stored_bytes"] <= 2 * 1024
+    assert store.read(refs[1].digest) is None
+
+
+def test_manifest_survives_restart_and_expired_artifacts_are_evicted(tmp_path):
+    clock = _Clock()
+    store = _store(tmp_path, clock)
+    try:
+        old = store.put("<html>old outage</html>")
+        store.flush(timeout=5)
+    finally:
+        store.close()
+
+    reopened = _store(tmp_path, clock)
+    try:
+        assert reopened.read(old.digest) == b"<html>old outage</html>"
+        clock.now += 7200
+        reopened.put("<html>new outage</html>")
+        reopened.flush(timeout=5)
+    finally:
+        reopened.close()
+
+    assert not old.path.exists()
+    assert reopened.snapshot()["artifacts"] == 1
+
+
+def test_full_write_queue_drops_instead_of_blocking(tmp_path):
+    store = _store(tmp_path, ARTIFACT_STORE_QUEUE_SIZE="1")
+    gate = threading.Event()
+    store._writer.submit(gate.wait, 5)  # hold the writer thread
+    try:
+        assert store.put("<html>a</html>") is not None
+        assert store.put("<html>b</html>") is None
+    finally:
+        gate.set()
+        store.close()
@@ -0,0 +1,138 @@
+import json
+
+import pytest
+
+from src.config import load_settings
+from src.persistence.ball_archive import (
+    RECORD,
+    BallArchiveReader,
+    MatchArchive,
+    RecordKind,
+    close_ball_archives,
+    get_ball_archive,
+    parse_over,
+)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1_000.0
+
+    def __call__(self):
+        self.now += 1.0
+        return self.now
+
+
+@pytest.fixture
+def settings(tmp_path):
+    return load_settings({"BALL_ARCHIVE_DIR": str(tmp_path), "BALL_ARCHIVE_SEGMENT_RECORDS": "64"})
+
+
+def _archive(settings, match_id="m1"):
+    return MatchArchive(match_id, settings=settings, clock=_Clock())
+
+
+def test_parse_over():
+    assert parse_over("15.3") == 153
+    assert parse_over("Ov 7") == 70
+    assert parse_over(12) == 120
+    assert parse_over("") == -1
+
+
+def test_range_scan_returns_odds_ticks_for_over_window(settings, tmp_path):
+    archive = _archive(settings)
+    for over in range(0, 25):
+        archive.record_score("IND", f"{over * 8}/1", f"{over}.2")
+        archive.record_odds("IND", 40 + over, 42 + over)
+    archive.close()
+
+    reader = BallArchiveReader(tmp_path / "m1")
+    ticks = list(reader.scan([RecordKind.ODDS], over_from=15, over_to=20))
+
+    assert [tick.over for tick in ticks] == [f"{over}.2" for over in range(15, 21)]
+    assert ticks[0].values[:2] == (55, 57)
+    assert ticks[0].text == "IND"
+    assert reader.count() == 50
+
+
+def test_segments_roll_and_index_prunes(settings, tmp_path):
+    archive = _archive(settings)
+    for ball in range(200):
+        archive.set_position(ball)
+        archive.record_text(f"ball {ball}")
+    archive.close()
+
+    reader = BallArchiveReader(tmp_path / "m1")
+    segments = reader.segments()
+    assert len(segments) == 4
+    assert all(entry["sealed"] for entry in segments)
+    assert [record.text for record in reader.scan(over_from=19, over_to=19)] == [
+        f"ball {ball}" for ball in range(190, 200)
+    ]
+
+
+def test_second_innings_detected_from_score_updates(settings, tmp_path):
+    archive = _archive(settings)
+    archive.record_score("AUS", "0/0", "0.0")
+    archive.record_score("IND", "180/5", "20.0")
+    archive.record_score("AUS", "4/0", "0.3")
+    archive.record_odds("AUS", 60, 62)
+    archive.close()
+
+    records = list(BallArchiveReader(tmp_path / "m1").scan([RecordKind.ODDS]))
+    assert [(record.innings, record.over) for record in records] == [(2, "0.3")]
+
+
+def test_sv3_tick_records_fields_odds_and_sessions(settings, tmp_path):
+    archive = _archive(settings)
+    sessions = [{"sessionName": "6 over", "odds": [{"value": "45"}, {"value": "47"}]}]
+    archive.record_sv3(
+        {"favorite_team": "IND", "favorite_team_odds": "45+2", "batsman_1_stats": {"runs": "12"}},
+        sessions=sessions,
+    )
+    archive.close()
+
+    records = list(BallArchiveReader(tmp_path / "m1").scan())
+    assert [record.kind for record in records] == [RecordKind.SV3, RecordKind.ODDS, RecordKind.SESSION]
+    assert records[0].values == (45, 47, 12, 0)
+    assert json.loads(records[0].text)["favorite_team"] == "IND"
+    assert records[2].text == "6 over"
+
+
+def test_overs_are_deduplicated(settings, tmp_path):
+    archive = _archive(settings)
+    overs = [{"overNumber": "Ov 5", "balls": ["1", "4", "0"], "totalRuns": "5"}]
+    archive.record_overs(overs)
+    archive.record_overs(overs)
+    archive.close()
+
+    assert BallArchiveReader(tmp_path / "m1").count() == 1
+
+
+def test_reopen_resumes_in_new_segment_and_ignores_torn_records(settings, tmp_path):
+    archive = _archive(settings)
+    archive.record_score("IND", "50/2", "8.4")
+    archive.close()
+    with open(tmp_path / "m1" / "seg-000001.rec", "ab") as handle:
+        handle.write(b"\x00" * (RECORD.size // 2))
+
+    reopened = _archive(settings)
+    assert reopened.position == (1, 84)
+    reopened.record_text("after restart")
+    reopened.close()
+
+    reader = BallArchiveReader(tmp_path / "m1")
+    assert [entry["segment"] for entry in reader.segments()] == [1, 2]
+    assert [record.text for record in reader.scan()] == ["IND", "after restart"]
+
+
+def test_registry_respects_enabled_flag(tmp_path):
+    disabled = load_settings({"BALL_ARCHIVE_ENABLED": "false", "BALL_ARCHIVE_DIR": str(tmp_path)})
+    assert get_ball_archive("m1", settings=disabled) is None
+
+    enabled = load_settings({"BALL_ARCHIVE_DIR": str(tmp_path)})
+    archive = get_ball_archive("m2", settings=enabled)
+    try:
+        assert get_ball_archive("m2", settings=enabled) is archive
+    finally:
+        close_ball_archives()
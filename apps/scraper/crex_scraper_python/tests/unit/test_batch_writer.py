@@ -24,6 +24,13 @@ def _count_rows(pool) -> int:
     return int(result)
 
 
+def _wait_until(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.01)
+
+
 def test_flush_on_batch_size(tmp_path):
     pool = _create_pool(tmp_path)
     _ensure_table(pool)
@@ -35,14 +42,15 @@ def test_flush_on_batch_size(tmp_path):
         conn.executemany("INSERT INTO events (value) VALUES (?)", [(item,) for item in batch])
         conn.commit()
 
-    writer = BatchWriter(pool, persist, batch_size=3, flush_interval=2.0)
+    writer = BatchWriter(pool, persist, batch_size=3, flush_interval=60.0)
 
     try:
         writer.add(1)
         writer.add(2)
-        writer.add(3)
-        assert _count_rows(pool) == 3
-        assert sum(len(b) for b in persisted) == 3
+        assert persisted == []
+        writer.add(3)  # wakes the worker
+        _wait_until(lambda: _count_rows(pool) == 3)
+        assert persisted == [[1, 2, 3]]
     finally:
         writer.shutdown()
         pool.close()
@@ -67,6 +75,29 @@ def test_flush_by_interval(tmp_path):
         pool.close()
 
 
+def test_adds_below_batch_size_wait_for_the_interval(tmp_path):
+    pool = _create_pool(tmp_path)
+    _ensure_table(pool)
+    persisted = []
+
+    def persist(conn: sqlite3.Connection, batch):
+        persisted.append(list(batch))
+
+    writer = BatchWriter(pool, persist, batch_size=10, flush_interval=60.0)
+
+    try:
+        for value in range(5):
+            writer.add(value)
+        assert persisted == []
+        assert writer.get_stats()["queued_pending"] == 5
+
+        assert writer.flush() == 5
+        assert persisted == [[0, 1, 2, 3, 4]]
+    finally:
+        writer.shutdown()
+        pool.close()
+
+
 def test_critical_event_bypasses_batch(tmp_path):
     pool = _create_pool(tmp_path)
     _ensure_table(pool)
@@ -100,12 +131,12 @@ def test_flush_failure_requeues_items(tmp_path):
         conn.executemany("INSERT INTO events (value) VALUES (?)", [(item,) for item in batch])
         conn.commit()
 
-    writer = BatchWriter(pool, persist, batch_size=2, flush_interval=5.0)
+    writer = BatchWriter(pool, persist, batch_size=2, flush_interval=60.0)
 
     try:
         writer.add(1)
-        with pytest.raises(RuntimeError):
-            writer.add(2)  # Trigger flush that fails
+        writer.add(2)  # the worker's flush fails
+        _wait_until(lambda: writer.get_stats()["flush_failures"] == 1)
 
         stats = writer.get_stats()
         assert stats["queued_pending"] == 2
@@ -0,0 +1,142 @@
+import threading
+
+import pytest
+
+from src import monitoring
+from src.config import load_settings
+from src.core.bulkhead import Bulkhead, BulkheadFullError, parse_bulkhead_limits
+from src.core.circuit_breaker import CircuitBreaker, CircuitBreakerState
+from src.core.retry_utils import RetryConfig, retryable
+
+
+@pytest.fixture(autouse=True)
+def _reset_metrics():
+    monitoring.reset_metrics_for_tests()
+    yield
+    monitoring.reset_metrics_for_tests()
+
+
+def _hold_slots(bulkhead, count):
+    """Occupy ``count`` slots from worker threads until the returned event is set."""
+
+    release = threading.Event()
+    started = threading.Barrier(count + 1)
+
+    def worker():
+        with bulkhead.slot():
+            started.wait()
+            release.wait(5)
+
+    threads = [threading.Thread(target=worker) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    started.wait()
+    return release, threads
+
+
+def test_rejects_when_queue_is_full():
+    bulkhead = Bulkhead("sc4-save", max_concurrent=1, max_queue=0)
+    release, threads = _hold_slots(bulkhead, 1)
+    try:
+        with pytest.raises(BulkheadFullError) as info:
+            bulkhead.call(lambda: None)
+        assert info.value.reason == "queue_full"
+    finally:
+        release.set()
+        for thread in threads:
+            thread.join()
+
+    assert bulkhead.call(lambda: "ok") == "ok"
+    module = monitoring.monitoring
+    assert module.SCRAPER_BULKHEAD_REJECTIONS_TOTAL.labels(dependency="sc4-save", reason="queue_full")._value.get() == 1
+
+
+def test_queued_call_times_out():
+    bulkhead = Bulkhead("match-info", max_concurrent=1, max_queue=1, queue_timeout_seconds=0.05)
+    release, threads = _hold_slots(bulkhead, 1)
+    try:
+        with pytest.raises(BulkheadFullError) as info:
+            bulkhead.call(lambda: None)
+        assert info.value.reason == "timeout"
+        assert bulkhead.queued == 0
+    finally:
+        release.set()
+        for thread in threads:
+            thread.join()
+
+
+def test_queued_call_runs_when_slot_frees():
+    bulkhead = Bulkhead("auth", max_concurrent=1, max_queue=1, queue_timeout_seconds=5)
+    release, threads = _hold_slots(bulkhead, 1)
+    timer = threading.Timer(0.05, release.set)
+    timer.start()
+
+    assert bulkhead.call(lambda: "ok") == "ok"
+    for thread in threads:
+        thread.join()
+    snapshot = bulkhead.snapshot()
+    assert snapshot["in_flight"] == 0
+    assert snapshot["peak_in_flight"] == 1
+    assert snapshot["total_calls"] == 2
+
+
+def test_saturation_is_exported():
+    bulkhead = Bulkhead("crex-api", max_concurrent=2)
+    release, threads = _hold_slots(bulkhead, 1)
+    try:
+        module = monitoring.monitoring
+        assert module.SCRAPER_BULKHEAD_SATURATION.labels(dependency="crex-api")._value.get() == pytest.approx(0.5)
+        assert module.SCRAPER_BULKHEAD_IN_FLIGHT.labels(dependency="crex-api")._value.get() == 1
+    finally:
+        release.set()
+        for thread in threads:
+            thread.join()
+
+
+def test_shed_calls_do_not_trip_the_breaker():
+    breaker = CircuitBreaker(name="backend", failure_threshold=1, timeout_seconds=30, success_threshold=1)
+    bulkhead = Bulkhead("match-info", max_concurrent=1, max_queue=0)
+    release, threads = _hold_slots(bulkhead, 1)
+    calls = []
+
+    def _post():
+        with bulkhead.slot():
+            calls.append(1)
+
+    decorated = retryable(
+        config=RetryConfig(max_attempts=3, base_delay=0, max_delay=0, jitter=0, retry_exceptions=(Exception,)),
+        sleep=lambda _: None,
+        breaker=breaker,
+    )(_post)
+    try:
+        with pytest.raises(BulkheadFullError):
+            decorated()
+        with pytest.raises(BulkheadFullError):
+            bulkhead.call(breaker.call, lambda: None)
+    finally:
+        release.set()
+        for thread in threads:
+            thread.join()
+
+    assert calls == []
+    assert breaker.state is CircuitBreakerState.CLOSED
+
+
+def test_limits_from_settings():
+    settings = load_settings({"BULKHEAD_LIMITS": "sc4-save=3:1:0.5", "BULKHEAD_MAX_CONCURRENT": "7"})
+
+    sc4 = Bulkhead.from_settings("sc4-save", settings)
+    auth = Bulkhead.from_settings("auth", settings)
+    other = Bulkhead.from_settings("unknown", settings)
+
+    assert (sc4.max_concurrent, sc4.max_queue, sc4.queue_timeout_seconds) == (3, 1, 0.5)
+    assert auth.max_concurrent == 2
+    assert other.max_concurrent == 7
+
+
+def test_parse_bulkhead_limits_rejects_garbage():
+    assert parse_bulkhead_limits("auth=2, crex-api=4:8") == {"auth": (2, 4, 2.0), "crex-api": (4, 8, 2.0)}
+    with pytest.raises(ValueError):
+        parse_bulkhead_limits("auth")
+    with pytest.raises(ValueError):
+        parse_bulkhead_limits("auth=0")
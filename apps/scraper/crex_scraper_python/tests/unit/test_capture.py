@@ -0,0 +1,119 @@
+import dataclasses
+import json
+import zipfile
+
+import pytest
+
+from src import crex_main_url
+from src.config import load_settings
+from src.logging import capture
+from src.logging.capture import CaptureRegistry, capture_session
+
+MATCH_URL = "https://crex.example/scoreboard/abc/ind-vs-aus/live"
+MATCH_ID = crex_main_url.derive_match_id(MATCH_URL.rsplit("/live", 1)[0])
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1_000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    clock = _Clock()
+    registry = CaptureRegistry(load_settings({"DEBUG_CAPTURE_TICKS": "3"}), clock=clock)
+    monkeypatch.setattr(capture, "_registry", registry)
+    return registry, clock
+
+
+def test_nothing_is_captured_until_armed(registry):
+    registry, _ = registry
+    assert capture_session(MATCH_ID) is None
+    registry.arm(MATCH_ID)
+    assert capture_session(MATCH_ID) is not None
+    assert capture_session("another-match") is None
+
+
+def test_tick_limit_writes_one_archive(registry, tmp_path):
+    registry, clock = registry
+    session = registry.arm(MATCH_ID)
+    session.record("local_storage", {"p_1_name": "Batter A"})
+    session.record("sv3", {"a": "1.2", "b": "4"})
+    for tick in range(3):
+        session.record("dom", f"<html>tick {tick}</html>")
+        session.record("state", json.dumps({"tick": tick}))
+        clock.now += 2.5
+        path = registry.end_tick(MATCH_ID, directory=tmp_path)
+        assert (path is None) == (tick < 2)
+
+    assert capture_session(MATCH_ID) is None
+    with zipfile.ZipFile(path) as archive:
+        names = archive.namelist()
+        assert json.loads(archive.read("session.json"))["ticks"] == 3
+        dom = sorted(name for name in names if name.startswith("dom/"))
+        assert len(dom) == 3 and dom[-1].endswith(".html")
+        assert archive.read(dom[-1]).decode() == "<html>tick 2</html>"
+        state = sorted(name for name in names if name.startswith("state/"))
+        assert json.loads(archive.read(state[0])) == {"tick": 0}
+        (local_storage,) = [name for name in names if name.startswith("local_storage/")]
+        assert json.loads(archive.read(local_storage)) == {"p_1_name": "Batter A"}
+    assert registry.status(MATCH_ID)["finished"][0]["archive"] == str(path)
+
+
+def test_time_limit_ends_the_capture(registry, tmp_path):
+    registry, clock = registry
+    registry.arm(MATCH_ID, ticks=100, seconds=10)
+    assert registry.end_tick(MATCH_ID, directory=tmp_path) is None
+    clock.now += 11
+    assert registry.end_tick(MATCH_ID, directory=tmp_path) is not None
+
+
+def _debug_settings(monkeypatch, **changes):
+    settings = dataclasses.replace(crex_main_url.SETTINGS, **changes)
+    monkeypatch.setattr(crex_main_url, "SETTINGS", settings)
+
+
+def test_debug_endpoints_need_enabling_and_a_token(monkeypatch):
+    monkeypatch.setitem(crex_main_url.scraping_tasks, MATCH_URL, {"status": "running"})
+    headers = {"X-Debug-Token": "s3cret"}
+
+    with crex_main_url.app.test_client() as client:
+        _debug_settings(monkeypatch, debug_endpoints_enabled=False, debug_token="s3cret")
+        assert client.get(f"/debug/capture/{MATCH_ID}", headers=headers).status_code == 404
+        _debug_settings(monkeypatch, debug_endpoints_enabled=True, debug_token="")
+        assert client.get(f"/debug/capture/{MATCH_ID}").status_code == 404
+
+        _debug_settings(monkeypatch, debug_endpoints_enabled=True, debug_token="s3cret")
+        assert client.get(f"/debug/capture/{MATCH_ID}").status_code == 403
+        assert client.get(f"/debug/capture/{MATCH_ID}", headers={"X-Debug-Token": "guess"}).status_code == 403
+        assert client.get(f"/debug/capture/{MATCH_ID}", headers=headers).status_code == 200
+
+
+def test_debug_defaults_are_closed_and_the_token_is_not_dumped():
+    settings = load_settings({"DEBUG_ENDPOINTS_TOKEN": "s3cret"})
+    assert load_settings({}).debug_endpoints_enabled is False
+    assert settings.debug_token == "s3cret"
+    assert "s3cret" not in settings.to_dict().values()
+    assert "debug_token" not in settings.to_dict()
+
+
+def test_capture_endpoint_arms_only_running_matches(registry, monkeypatch):
+    registry, _ = registry
+    monkeypatch.setattr(crex_main_url, "get_capture_registry", lambda settings=None: registry)
+    monkeypatch.setitem(crex_main_url.scraping_tasks, MATCH_URL, {"status": "running"})
+    _debug_settings(monkeypatch, debug_endpoints_enabled=True, debug_token="s3cret")
+
+    with crex_main_url.app.test_client() as client:
+        client.environ_base["HTTP_X_DEBUG_TOKEN"] = "s3cret"
+        assert client.post("/debug/capture/not-running").status_code == 404
+
+        response = client.post(f"/debug/capture/{MATCH_ID}?ticks=5&seconds=60")
+        assert response.status_code == 202
+        assert response.get_json()["armed"]["max_ticks"] == 5
+
+        active = client.get(f"/debug/capture/{MATCH_ID}").get_json()["active"]
+        assert [item["match_id"] for item in active] == [MATCH_ID]
+        assert client.post(f"/debug/capture/{MATCH_ID}?ticks=lots").status_code == 400
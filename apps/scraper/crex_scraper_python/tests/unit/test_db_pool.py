@@ -97,3 +97,32 @@ def test_unhealthy_connection_replaced(tmp_path: Path):
     stats = pool.stats()
     assert stats["open_connections"] >= stats["min_size"]
     pool.close()
+
+
+def test_connections_use_wal_and_busy_timeout(tmp_path: Path):
+    pool = ConnectionPool(database_path=str(tmp_path / "pool.sqlite"), min_size=1, max_size=1, acquire_timeout=1)
+
+    with pool.get_connection() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] > 0
+
+    pool.close()
+
+
+def test_acquire_timeout_is_counted(tmp_path: Path):
+    from src import monitoring
+
+    monitoring.reset_metrics_for_tests()
+    pool = ConnectionPool(
+        database_path=str(tmp_path / "pool.sqlite"), min_size=0, max_size=1, acquire_timeout=0.05, name="test"
+    )
+
+    with pool.get_connection():
+        with pytest.raises(ConnectionPoolError):
+            with pool.get_connection():
+                pass
+
+    counter = monitoring.monitoring.SCRAPER_DB_POOL_EVENTS_TOTAL.labels(pool="test", event="acquire_timeout")
+    assert counter._value.get() == 1
+    assert pool.stats()["acquire_timeouts"] == 1
+    pool.close()
@@ -0,0 +1,146 @@
+import threading
+import time
+
+import pytest
+
+from src import monitoring
+from src.config import load_settings
+from src.egress.lanes import (
+    EgressDispatcher,
+    EgressLane,
+    classify_payload,
+    coalesce_key_for,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_metrics():
+    monitoring.reset_metrics_for_tests()
+    yield
+    monitoring.reset_metrics_for_tests()
+
+
+@pytest.fixture
+def dispatcher():
+    settings = load_settings(
+        {
+            "EGRESS_COALESCE_INTERVAL_SECONDS": "0.05",
+            "EGRESS_BULK_RATE_PER_SECOND": "100",
+        }
+    )
+    instance = EgressDispatcher(settings)
+    yield instance
+    instance.shutdown(timeout=2.0)
+
+
+def test_classify_payload_routes_by_kind():
+    assert classify_payload({"match_update": {}, "url": "u"}) is EgressLane.REALTIME
+    assert classify_payload({"score_update": "4 runs"}) is EgressLane.REALTIME
+    assert classify_payload({"odds_data": []}) is EgressLane.COALESCED
+    assert classify_payload({"firstTeamData": [], "sessionData": []}) is EgressLane.COALESCED
+    assert classify_payload({"batsman_data": [], "bowler_data": {}}) is EgressLane.COALESCED
+    assert classify_payload({"match_stats_by_innings": {}}) is EgressLane.BULK
+    assert classify_payload({"something_new": 1}) is EgressLane.REALTIME
+
+
+def test_coalesce_key_separates_odds_and_players():
+    assert coalesce_key_for({"odds_data": []}, "u") == ("u", "odds")
+    assert coalesce_key_for({"batsman_data": []}, "u") == ("u", "players")
+    assert coalesce_key_for({"odds_data": []}, "u") != coalesce_key_for({"odds_data": []}, "v")
+
+
+def test_realtime_not_blocked_by_slow_bulk(dispatcher):
+    release_bulk = threading.Event()
+    realtime_done = threading.Event()
+
+    def slow_bulk():
+        release_bulk.wait(2.0)
+        return True
+
+    def score():
+        realtime_done.set()
+        return True
+
+    for index in range(5):
+        dispatcher.submit(EgressLane.BULK, slow_bulk, coalesce_key=("u", index))
+    time.sleep(0.05)
+    dispatcher.submit(EgressLane.REALTIME, score, coalesce_key="u")
+
+    assert realtime_done.wait(1.0)
+    release_bulk.set()
+    assert dispatcher.flush(timeout=5.0)
+
+
+def test_realtime_preserves_order_per_key(dispatcher):
+    seen = []
+    lock = threading.Lock()
+
+    def make(value):
+        def send():
+            time.sleep(0.005)
+            with lock:
+                seen.append(value)
+            return True
+
+        return send
+
+    for value in range(10):
+        dispatcher.submit(EgressLane.REALTIME, make(value), coalesce_key="match-1")
+
+    assert dispatcher.flush(timeout=2.0)
+    assert seen == list(range(10))
+
+
+def test_coalesced_lane_keeps_latest_value(dispatcher):
+    sent = []
+
+    for value in range(5):
+        dispatcher.submit(
+            EgressLane.COALESCED,
+            lambda value=value: sent.append(value) or True,
+            coalesce_key=("u", "odds"),
+        )
+
+    assert dispatcher.flush(timeout=2.0)
+    assert sent == [4]
+    stats = dispatcher.get_stats()["lanes"]["coalesced"]
+    assert stats["coalesced"] == 4
+    assert stats["sent"] == 1
+
+
+def test_bulk_lane_drops_oldest_when_full():
+    settings = load_settings({"EGRESS_BULK_MAX_QUEUE": "2", "EGRESS_BULK_RATE_PER_SECOND": "0.01"})
+    dispatcher = EgressDispatcher(settings)
+    sent = []
+    try:
+        # The first token is spent immediately; the rest wait behind the rate limit.
+        for value in range(4):
+            dispatcher.submit(
+                EgressLane.BULK,
+                lambda value=value: sent.append(value) or True,
+                coalesce_key=("u", value),
+            )
+        time.sleep(0.1)
+        assert dispatcher.get_stats()["lanes"]["bulk"]["dropped"] >= 1
+    finally:
+        dispatcher.shutdown(timeout=2.0)
+    assert 3 in sent
+
+
+def test_slo_breach_recorded():
+    clock = {"now": 0.0}
+    settings = load_settings({"EGRESS_REALTIME_SLO_SECONDS": "0.5"})
+    slow = EgressDispatcher(settings, clock=lambda: clock["now"])
+
+    def send():
+        clock["now"] += 2.0
+        return True
+
+    try:
+        slow.submit(EgressLane.REALTIME, send)
+        assert slow.flush(timeout=None)
+    finally:
+        slow.shutdown(timeout=1.0)
+
+    breaches = monitoring.monitoring.SCRAPER_EGRESS_SLO_BREACHES_TOTAL.labels(lane="realtime")._value.get()
+    assert breaches == 1
@@ -0,0 +1,89 @@
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.config import load_settings
+from src.core.scraper_context import ScraperContext
+from src.egress.lanes import EgressDispatcher, EgressLane
+from src.monitoring import freshness, monitoring
+from src.monitoring.freshness import FreshnessStamp, FreshnessTracker
+
+URL = "https://crex.example/scoreboard/abc/live"
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1_000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def tracker(monkeypatch):
+    clock = _Clock()
+    settings = load_settings({"FRESHNESS_SLO_SECONDS": "3", "FRESHNESS_SLO_WINDOW_SECONDS": "60"})
+    tracker = FreshnessTracker(settings, clock=clock)
+    monkeypatch.setattr(freshness, "_tracker", tracker)
+    return tracker, clock
+
+
+def test_acknowledgements_feed_latency_and_slo_attainment(tracker):
+    tracker, clock = tracker
+    for latency in (0.5, 1.0, 2.0, 5.0):
+        clock.now += 1
+        assert tracker.record_ack(FreshnessStamp(URL, clock.now - latency, "m-fresh")) == pytest.approx(latency)
+
+    assert tracker.attainment(URL) == pytest.approx(0.75)
+    # The 5s ack carried older data than the 2s one before it; freshness does not regress.
+    assert tracker.last_fresh_at(URL) == pytest.approx(clock.now - 1 - 2.0)
+    match = tracker.snapshot()["matches"]["m-fresh"]
+    assert match["p95_seconds"] == 5.0
+    assert match["meets_slo"] is False
+    assert monitoring.SCRAPER_FRESHNESS_SLO_ATTAINMENT.labels(match_id="m-fresh")._value.get() == pytest.approx(0.75)
+
+    clock.now += 120
+    assert tracker.attainment(URL) is None
+    tracker.forget(URL)
+    assert tracker.last_fresh_at(URL) is None
+
+
+def test_context_staleness_follows_acknowledged_source_data(tracker):
+    tracker, _ = tracker
+    settings = load_settings({"STALENESS_THRESHOLD_SECONDS": "60"})
+    context = ScraperContext(match_id="m-fresh", url=URL, settings=settings)
+    context.last_update_time = datetime.now(tz=timezone.utc) - timedelta(minutes=10)
+    assert context.should_restart()
+
+    tracker.record_ack(FreshnessStamp(URL, time.time() - 5, "m-fresh"), acked_at=time.time())
+    assert context.staleness_seconds == pytest.approx(5, abs=1)
+    assert not context.should_restart()
+    assert context.health_status == "healthy"
+
+
+def test_dispatcher_records_freshness_only_for_acknowledged_sends(tracker):
+    tracker, clock = tracker
+    dispatcher = EgressDispatcher(load_settings({}))
+    try:
+        dispatcher.submit(
+            EgressLane.REALTIME,
+            lambda: False,
+            coalesce_key=URL,
+            freshness=FreshnessStamp(URL, clock.now - 1, "m-fresh"),
+        )
+        assert dispatcher.flush(timeout=2.0)
+        assert tracker.last_fresh_at(URL) is None
+
+        dispatcher.submit(
+            EgressLane.COALESCED,
+            lambda: True,
+            coalesce_key=(URL, "odds"),
+            freshness=FreshnessStamp(URL, clock.now - 2, "m-fresh"),
+        )
+        assert dispatcher.flush(timeout=2.0)
+    finally:
+        dispatcher.shutdown(timeout=2.0)
+
+    assert tracker.last_fresh_at(URL) == pytest.approx(clock.now - 2)
+    assert tracker.snapshot()["matches"]["m-fresh"]["acks"] == 1
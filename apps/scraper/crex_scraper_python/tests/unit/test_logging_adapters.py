@@ -79,3 +79,52 @@ def test_metadata_captures_extra_fields():
     
     assert "unexpected_field" not in log_entry
     assert log_entry["metadata"]["unexpected_field"] == "should_be_in_metadata"
+
+
+def test_get_logger_is_cached_and_binds_to_the_later_configuration():
+    """Loggers created at import time still use the configuration applied afterwards."""
+    logger = get_logger("early_component")
+    assert get_logger("early_component") is logger
+
+    stream = StringIO()
+    configure_logging(stream=stream)
+    get_logger("early_component").info("test.late_config")
+
+    log_entry = json.loads(stream.getvalue().strip())
+    assert log_entry["component"] == "early_component"
+    assert get_logger("early_component") is not logger  # reconfiguring hands out fresh loggers
+
+
+def test_metadata_passes_through_unless_extras_are_merged():
+    """Plain metadata is not copied; extras are merged into a copy, never the caller's dict."""
+    from src.logging.adapters import _ensure_standard_schema
+
+    metadata = {"key": "value"}
+    event = _ensure_standard_schema(None, "info", {"event": "e", "metadata": metadata})
+    assert event["metadata"] is metadata
+
+    event = _ensure_standard_schema(None, "info", {"event": "e", "metadata": metadata, "extra": 1})
+    assert event["metadata"] == {"key": "value", "extra": 1}
+    assert metadata == {"key": "value"}
+
+
+def test_json_renderer_uses_orjson():
+    from src.logging.adapters import OrjsonRenderer, build_json_renderer
+
+    render = build_json_renderer()
+    assert isinstance(render, OrjsonRenderer)
+    assert json.loads(render(None, "info", {"event": "e", "metadata": {"over": 4.2}})) == {
+        "event": "e",
+        "metadata": {"over": 4.2},
+    }
+    assert not isinstance(build_json_renderer(json_indent=4), OrjsonRenderer)
+
+
+def test_renderer_falls_back_for_values_orjson_rejects():
+    """Oversized integers and unknown types still render."""
+    from src.logging.adapters import build_json_renderer
+
+    render = build_json_renderer()
+    rendered = json.loads(render(None, "info", {"event": "e", "big": 2**70, "obj": object()}))
+    assert rendered["big"] == 2**70
+    assert rendered["obj"].startswith("<object object")
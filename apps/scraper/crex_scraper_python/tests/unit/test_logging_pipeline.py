@@ -0,0 +1,150 @@
+import gzip
+import io
+import json
+import logging
+
+import pytest
+import structlog
+
+from src.config import load_settings
+from src.logging import adapters
+from src.logging.pipeline import CompressingRotatingFileHandler, LoggingPipeline
+from src.monitoring import monitoring
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1_000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def restore_logger():
+    saved = []
+
+    def _track(name):
+        logger = logging.getLogger(name)
+        saved.append((logger, logger.level, list(logger.handlers), logger.propagate))
+        return logger
+
+    yield _track
+    for logger, level, handlers, propagate in saved:
+        logger.setLevel(level)
+        logger.handlers[:] = handlers
+        logger.propagate = propagate
+
+
+def _record(message, level=logging.INFO, name="pipeline.test"):
+    return logging.LogRecord(name, level, __file__, 1, message, None, None)
+
+
+def test_full_queue_drops_and_counts_without_blocking():
+    pipeline = LoggingPipeline(load_settings({"LOG_QUEUE_SIZE": "100"}), stream=io.StringIO())
+    before = monitoring.SCRAPER_LOG_RECORDS_DROPPED_TOTAL.labels(level="ERROR")._value.get()
+
+    # The listener is not running, so nothing drains the queue.
+    for i in range(150):
+        pipeline.handler.handle(_record(f"line {i}", logging.ERROR))
+
+    snapshot = pipeline.snapshot()
+    assert snapshot["queued"] == 100
+    assert snapshot["dropped"] == {"ERROR": 50}
+    assert monitoring.SCRAPER_LOG_RECORDS_DROPPED_TOTAL.labels(level="ERROR")._value.get() == before + 50
+
+
+def test_routed_loggers_write_files_and_structlog_events_on_the_listener(tmp_path, restore_logger, monkeypatch):
+    console = io.StringIO()
+    pipeline = LoggingPipeline(load_settings({}), stream=console)
+    api = restore_logger("pipeline.test.api")
+    restore_logger("pipeline.test.events")
+    structlog_config = structlog.get_config()
+    monkeypatch.setattr(adapters, "_IS_CONFIGURED", False)
+    pipeline.route("pipeline.test.api", str(tmp_path / "api.log"), level=logging.DEBUG, console_level=logging.WARNING)
+    pipeline.route("pipeline.test.events", str(tmp_path / "events.log"), level=logging.INFO)
+    adapters.configure_logging(level="INFO", pipeline=pipeline)
+    pipeline.start()
+    try:
+        api.debug("fetched %s", "sV3")
+        api.warning("slow response")
+        structlog.get_logger("pipeline.test.events").info("scrape.done", metadata={"match_id": "m1"})
+    finally:
+        pipeline.stop()
+        structlog.configure(**structlog_config)
+
+    api_lines = (tmp_path / "api.log").read_text().splitlines()
+    assert "fetched sV3" in api_lines[0] and "slow response" in api_lines[1]
+    (event,) = [json.loads(line) for line in (tmp_path / "events.log").read_text().splitlines()]
+    assert event["event"] == "scrape.done"
+    assert event["metadata"] == {"match_id": "m1"}
+    # DEBUG stays out of the console; WARNING and the INFO event reach it.
+    assert "fetched sV3" not in console.getvalue()
+    assert "slow response" in console.getvalue() and "scrape.done" in console.getvalue()
+
+
+def test_inline_mode_writes_on_the_calling_thread(tmp_path, restore_logger):
+    pipeline = LoggingPipeline(load_settings({"LOG_QUEUE_ENABLED": "false"}), stream=io.StringIO())
+    logger = restore_logger("pipeline.test.inline")
+    pipeline.route("pipeline.test.inline", str(tmp_path / "inline.log"))
+    pipeline.start()
+    try:
+        logger.info("written now")
+        assert "written now" in (tmp_path / "inline.log").read_text()
+        assert pipeline.snapshot()["mode"] == "inline"
+    finally:
+        pipeline.stop()
+
+
+def test_size_rotation_compresses_backups(tmp_path):
+    path = tmp_path / "scraper.log"
+    handler = CompressingRotatingFileHandler(str(path), max_bytes=200, backup_count=2)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    try:
+        for i in range(30):
+            handler.handle(_record(f"entry {i:03d} " + "x" * 20))
+        handler.wait_for_compression()
+    finally:
+        handler.close()
+
+    backups = sorted(p.name for p in tmp_path.iterdir() if p.name != "scraper.log")
+    assert backups == ["scraper.log.1.gz", "scraper.log.2.gz"]
+    assert "entry" in gzip.decompress((tmp_path / "scraper.log.1.gz").read_bytes()).decode()
+    assert path.stat().st_size <= 200
+
+
+def test_time_rotation_rolls_files_by_age(tmp_path):
+    clock = _Clock()
+    path = tmp_path / "api.log"
+    handler = CompressingRotatingFileHandler(
+        str(path), interval_seconds=60, backup_count=3, compress=False, clock=clock
+    )
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    try:
+        handler.handle(_record("first"))
+        clock.now += 61
+        handler.handle(_record("second"))
+        clock.now += 122
+        handler.handle(_record("third"))
+    finally:
+        handler.close()
+
+    assert (tmp_path / "api.log.1").read_text() == "second\n"
+    assert (tmp_path / "api.log.2").read_text() == "first\n"
+    assert path.read_text() == "third\n"
+
+
+def test_route_accepts_level_names(restore_logger):
+    console = io.StringIO()
+    pipeline = LoggingPipeline(load_settings({"LOG_QUEUE_ENABLED": "false"}), stream=console)
+    logger = restore_logger("pipeline.test.named")
+    pipeline.route("pipeline.test.named", level="DEBUG", console_level="WARNING")
+    pipeline.start()
+    try:
+        logger.info("quiet")
+        logger.warning("loud")
+    finally:
+        pipeline.stop()
+
+    assert logger.level == logging.DEBUG
+    assert "quiet" not in console.getvalue() and "loud" in console.getvalue()
@@ -0,0 +1,96 @@
+import pytest
+
+import crex_match_data_scraper
+from src.config import load_settings
+from src.core import match_info_cache
+from src.core.match_info_cache import MatchInfoCache
+
+INFO = {"venue": "Perth Stadium", "toss_info": "IND won the toss", "playing_xi": {"IND": ["A", "B"]}}
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1_000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _cache(clock, **env):
+    return MatchInfoCache(load_settings({"MATCH_INFO_CACHE_TTL_SECONDS": "60", **env}), clock=clock)
+
+
+def test_entries_expire_after_ttl():
+    clock = _Clock()
+    cache = _cache(clock)
+    assert cache.put("ind-vs-aus", INFO)
+
+    clock.now += 59
+    assert cache.get("ind-vs-aus") == INFO
+    clock.now += 1
+    assert cache.get("ind-vs-aus") is None
+    assert cache.snapshot()["hits"] == 1 and cache.snapshot()["misses"] == 1
+    assert cache.snapshot()["entries"] == 0
+
+
+def test_cached_info_cannot_be_mutated_by_callers():
+    cache = _cache(_Clock())
+    info = {"playing_xi": {"IND": ["A"]}}
+    cache.put("m", info)
+    info["playing_xi"]["IND"].append("B")
+
+    cached = cache.get("m")
+    cached["playing_xi"]["IND"].append("C")
+    assert cache.get("m") == {"playing_xi": {"IND": ["A"]}}
+
+
+def test_failed_scrapes_and_disabled_cache_store_nothing():
+    clock = _Clock()
+    assert not _cache(clock).put("m", {})
+    disabled = _cache(clock, MATCH_INFO_CACHE_TTL_SECONDS="0")
+    assert not disabled.put("m", INFO)
+    assert disabled.get("m") is None
+
+
+def test_oldest_entries_are_dropped_beyond_max_entries():
+    clock = _Clock()
+    cache = _cache(clock, MATCH_INFO_CACHE_MAX_ENTRIES="2")
+    for match_id in ("a", "b", "c"):
+        cache.put(match_id, {"match_id": match_id})
+        clock.now += 1
+
+    assert cache.get("a") is None
+    assert cache.get("b") and cache.get("c")
+
+
+def test_restarted_job_reuses_info_scraped_by_its_predecessor(monkeypatch):
+    monkeypatch.setattr(match_info_cache, "_cache", _cache(_Clock()))
+    scraped = []
+    sent = []
+
+    def _scrape(info_url, browser_context=None):
+        scraped.append((info_url, browser_context))
+        return dict(INFO)
+
+    monkeypatch.setattr(crex_match_data_scraper, "scrape_match_info", _scrape)
+    monkeypatch.setattr(crex_match_data_scraper.cricket_data_service, "get_bearer_token", lambda: "token")
+    monkeypatch.setattr(
+        crex_match_data_scraper.cricket_data_service,
+        "queue_data_to_api_endpoint",
+        lambda data, token, url, endpoint: sent.append(url),
+    )
+
+    url = "https://crex.example/scoreboard/X/Y/ind-vs-aus/live"
+    browser_context = object()
+    for _ in range(3):  # first start, then two restarts
+        data_store = {"url": url, "match_id": "ind-vs-aus"}
+        crex_match_data_scraper.load_match_info(data_store, None, browser_context)
+        assert data_store["match_info"] == INFO
+
+    assert scraped == [("https://crex.example/scoreboard/X/Y/ind-vs-aus/info", browser_context)]
+    assert sent == ["https://crex.example/scoreboard/X/Y/ind-vs-aus/info"]
+
+
+@pytest.fixture(autouse=True)
+def _reset_cache(monkeypatch):
+    monkeypatch.setattr(match_info_cache, "_cache", None)
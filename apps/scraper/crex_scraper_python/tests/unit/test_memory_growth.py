@@ -0,0 +1,104 @@
+import threading
+import tracemalloc
+from types import SimpleNamespace
+
+import pytest
+
+from src.config import load_settings
+from src.logging.adapters import bind_thread_match_id, unbind_thread_match_id
+from src.monitoring import monitoring
+from src.monitoring.memory_growth import MB, MemoryGrowthTracker, approximate_size, trend_slope
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_approximate_size_walks_containers_once():
+    shared = "x" * 10_000
+    assert approximate_size({"a": [shared], "b": (shared,)}) < 2 * len(shared)
+    assert approximate_size([b"y" * 50_000]) > 50_000
+    assert approximate_size(threading.Lock()) < 1_000
+
+
+def test_trend_slope_fits_a_line():
+    assert trend_slope([(0, 10), (10, 30), (20, 50)]) == pytest.approx(2.0)
+    assert trend_slope([(0, 10)]) is None
+    assert trend_slope([(5, 10), (5, 20)]) is None
+
+
+def test_rising_context_memory_raises_one_alarm_until_it_levels_off():
+    clock = _Clock()
+    context = SimpleNamespace(match_id="m1", memory_bytes=0)
+    settings = load_settings({"MEMORY_TREND_WINDOW": "3", "MEMORY_SOFT_LIMIT_MB": "1536"})
+    tracker = MemoryGrowthTracker(lambda: [context], settings=settings, clock=clock)
+    before = monitoring.SCRAPER_MEMORY_TREND_ALARMS_TOTAL._value.get()
+
+    for step in range(4):
+        context.memory_bytes = (100 + 100 * step) * MB
+        report = tracker.sample_once()
+        clock.now += 60
+    (alarm,) = report["alarms"]
+    assert alarm["match_id"] == "m1"
+    assert alarm["slope_mb_per_minute"] == pytest.approx(100.0)
+    assert monitoring.SCRAPER_MEMORY_TREND_ALARMS_TOTAL._value.get() == before + 1
+
+    for _ in range(3):
+        tracker.sample_once()
+        clock.now += 60
+    assert tracker.sample_once()["alarms"] == []
+
+
+def test_watched_match_objects_report_growth():
+    store = {"session_data": []}
+    tracker = MemoryGrowthTracker(settings=load_settings({}))
+    tracker.watch_match("m1", lambda: {"data_store": store})
+    tracker.sample_once()
+    store["session_data"].extend(range(10_000))
+
+    grown = tracker.sample_once()["matches"]["m1"]["objects"]["data_store"]
+    assert grown["growth_bytes"] > 10_000 * 24
+
+    tracker.unwatch_match("m1")
+    assert tracker.sample_once()["matches"] == {}
+
+
+def _hold_allocation(started, stop, holder):
+    holder.append([str(i) * 8 for i in range(20_000)])
+    started.set()
+    stop.wait(60)
+
+
+def _leaky_scrape(started, stop, holder):
+    bind_thread_match_id("match-leak")
+    try:
+        _hold_allocation(started, stop, holder)
+    finally:
+        unbind_thread_match_id()
+
+
+def test_growth_sites_are_attributed_to_the_allocating_thread():
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start(25)
+    started, stop, holder = threading.Event(), threading.Event(), []
+    thread = threading.Thread(target=_leaky_scrape, args=(started, stop, holder), name="scraper-leak")
+    try:
+        tracker = MemoryGrowthTracker(settings=load_settings({"MEMORY_TOP_N": "5"}))
+        tracker.sample_once()
+        thread.start()
+        assert started.wait(5)
+
+        growth = tracker.sample_once()["growth_since_previous"]
+        site = next(row for row in growth if "test_memory_growth.py" in row["site"])
+        assert site["size_diff_kb"] > 100
+        assert {"thread": "scraper-leak", "match_id": "match-leak"} in site["threads"]
+    finally:
+        stop.set()
+        thread.join(5)
+        if not was_tracing:
+            tracemalloc.stop()
@@ -1,7 +1,7 @@
 from prometheus_client import generate_latest
 from prometheus_client.parser import text_string_to_metric_families
 
-from crex_scraper_python import monitoring
+from src.monitoring import monitoring
 from src.config import ScraperSettings
 from src.core.scraper_context import ScraperContext
 
@@ -12,7 +12,12 @@ def setup_function() -> None:
 
 def _collect_metrics():
     metrics_text = generate_latest(monitoring.METRIC_REGISTRY).decode("utf-8")
-    return {family.name: family for family in text_string_to_metric_families(metrics_text)}
+    families = {}
+    for family in text_string_to_metric_families(metrics_text):
+        families[family.name] = family
+        if family.type == "counter":  # the parser strips the _total suffix
+            families[f"{family.name}_total"] = family
+    return families
 
 
 def test_record_update_and_error_metrics():
@@ -109,3 +114,90 @@ def test_ensure_metrics_server_runs_once(monkeypatch):
     assert first is True
     assert second is False
     assert calls == [(8081, settings.prometheus_host, monitoring.METRIC_REGISTRY)]
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _label_cache(monkeypatch, limit=2, idle_seconds=60.0, series_ttl_seconds=30.0):
+    clock = _Clock()
+    cache = monitoring.MatchLabelCache(
+        limit, idle_seconds=idle_seconds, series_ttl_seconds=series_ttl_seconds, clock=clock
+    )
+    monkeypatch.setattr(monitoring, "_label_cache", cache)
+    return clock
+
+
+def _match_ids(families, name):
+    family = families.get(name)
+    return {sample.labels.get("match_id") for sample in family.samples} if family else set()
+
+
+def test_matches_over_label_limit_are_counted_as_other(monkeypatch):
+    _label_cache(monkeypatch)
+    for match_id in ("m1", "m2", "m3"):
+        monitoring.record_scraper_update(match_id)
+        monitoring.set_scraper_memory(match_id, 1024)
+
+    families = _collect_metrics()
+    assert _match_ids(families, "scraper_updates") == {"m1", "m2", "other"}
+    assert _match_ids(families, "scraper_memory_bytes") == {"m1", "m2"}
+    overflow = next(
+        sample
+        for sample in families["scraper_match_label_events"].samples
+        if sample.name.endswith("_total") and sample.labels["event"] == "overflow"
+    )
+    assert overflow.value >= 1
+
+
+def test_idle_match_label_is_evicted_for_a_new_match(monkeypatch):
+    clock = _label_cache(monkeypatch)
+    monitoring.record_scraper_update("m1")
+    clock.now = 30.0
+    monitoring.record_scraper_update("m2")
+    clock.now = 61.0
+    monitoring.record_scraper_update("m3")
+
+    assert _match_ids(_collect_metrics(), "scraper_updates") == {"m2", "m3"}
+
+
+def test_cleared_match_series_are_collected_after_ttl(monkeypatch):
+    clock = _label_cache(monkeypatch)
+    monitoring.record_scraper_update("m1", latency_seconds=0.5)
+    monitoring.record_scraper_error("m1", "TimeoutError")
+    monitoring.clear_scraper_gauges("m1")
+
+    families = _collect_metrics()
+    assert "m1" not in _match_ids(families, "data_staleness_seconds")
+    assert "m1" in _match_ids(families, "scraper_updates")
+
+    clock.now = 31.0
+    assert monitoring.collect_stale_series() == 1
+    families = _collect_metrics()
+    assert "m1" not in _match_ids(families, "scraper_updates")
+    assert "m1" not in _match_ids(families, "scraper_errors")
+    assert "m1" not in _match_ids(families, "scraper_update_latency_seconds")
+    assert monitoring.match_label_snapshot()["tracked"] == 0
+
+
+def test_stage_timer_and_queue_depth():
+    with monitoring.stage_timer("tick"):
+        pass
+    monitoring.set_queue_depth("sc4_executor", 3)
+    monitoring.record_egress_bytes("/cricket-data", "json", 120)
+
+    families = _collect_metrics()
+    count = next(
+        sample
+        for sample in families["scraper_stage_latency_seconds"].samples
+        if sample.name.endswith("_count") and sample.labels["stage"] == "tick"
+    )
+    assert count.value == 1.0
+    assert families["scraper_queue_depth"].samples[0].value == 3.0
+    egress = next(sample for sample in families["scraper_egress_bytes"].samples if sample.name.endswith("_total"))
+    assert egress.value == 120.0
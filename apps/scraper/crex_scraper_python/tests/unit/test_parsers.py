@@ -4,13 +4,17 @@ import pytest
 
 from src.config import ScraperSettings
 from crex_scraper_python.logging_config import setup_logging
-from crex_scraper_python.parsers import (
+from src.parsers import (
     SELECTORS,
     SelectorResolutionError,
+    compile_selector,
+    extract_live_match_hrefs,
     extract_match_href,
+    get_selector_engine,
     select_all,
     select_first,
 )
+from src.monitoring import monitoring
 
 
 class FakeHandle:
@@ -40,6 +44,72 @@ class FakeAnchor(FakeHandle):
         return super().get_attribute(attribute)
 
 
+class FakeJSHandle:
+    def __init__(self, element=None, properties=None, calls=None):
+        self._element = element
+        self._properties = properties or {}
+        self._calls = calls
+
+    def as_element(self):
+        return self._element
+
+    def get_properties(self):
+        self._calls.append("get_properties")
+        return self._properties
+
+
+class FakePage(FakeHandle):
+    """Handle that also answers compiled scripts with canned results.
+
+    ``evaluate`` pops ``evaluate_results``; ``evaluate_handle`` (the fallback
+    probe) pops ``probe_results`` of ``(position, elements)``. ``calls``
+    records every round trip.
+    """
+
+    def __init__(self, selectors, evaluate_results=(), probe_results=()):
+        super().__init__(selectors)
+        self.queries = []
+        self.evaluations = []
+        self.calls = []
+        self._results = list(evaluate_results)
+        self._probes = list(probe_results)
+
+    def query_selector(self, selector):
+        self.queries.append(selector)
+        self.calls.append("query_selector")
+        return super().query_selector(selector)
+
+    def query_selector_all(self, selector):
+        self.queries.append(selector)
+        self.calls.append("query_selector_all")
+        return super().query_selector_all(selector)
+
+    def evaluate(self, script, arg):
+        self.evaluations.append(arg)
+        self.calls.append("evaluate")
+        return self._results.pop(0)
+
+    def evaluate_handle(self, script, arg):
+        self.evaluations.append(arg)
+        self.calls.append("evaluate_handle")
+        position, elements = self._probes.pop(0)
+        properties = {f"{position}:{n}": FakeJSHandle(element) for n, element in enumerate(elements)}
+        return FakeJSHandle(properties=properties, calls=self.calls)
+
+
+def _lookups(selector_key, selector_index):
+    return monitoring.SCRAPER_SELECTOR_LOOKUPS_TOTAL.labels(
+        selector_key=selector_key, selector_index=selector_index
+    )._value.get()
+
+
+@pytest.fixture(autouse=True)
+def reset_selector_engine():
+    get_selector_engine().reset()
+    yield
+    get_selector_engine().reset()
+
+
 @pytest.fixture(autouse=True)
 def configure_logging():
     stream = StringIO()
@@ -109,3 +179,70 @@ def test_extract_match_href_raises_when_href_missing():
 
     with pytest.raises(SelectorResolutionError):
         extract_match_href(handle)
+
+
+def test_compile_selector_translates_css_and_scoped_xpath():
+    assert compile_selector("div.live-card .live") == ("css", "div.live-card .live")
+    assert compile_selector(":scope >> xpath=ancestor::a[1]") == ("xpath", "ancestor::a[1]")
+    assert compile_selector("text=Live") is None
+    assert compile_selector("div.card >> a") is None
+    assert compile_selector("a:has-text('Live')") is None
+
+
+def test_fallback_is_found_with_one_probe_and_learned_for_next_lookup():
+    winner = SELECTORS["live_match_badge"][2]
+    badge = object()
+    page = FakePage({winner: badge}, probe_results=[(1, [badge])])
+    before = _lookups("live_match_badge", "2")
+
+    assert select_first(page, "live_match_badge", required=True) is badge
+    # Primary query, then one probe over the remaining chain that also returns the elements.
+    assert page.calls == ["query_selector", "evaluate_handle", "get_properties"]
+    assert page.queries == [SELECTORS["live_match_badge"][0]]
+    assert [css for _, css in page.evaluations[0]["steps"]] == list(SELECTORS["live_match_badge"][1:])
+
+    page.queries.clear()
+    assert select_first(page, "live_match_badge", required=True) is badge
+    assert page.queries == [winner]
+    assert len(page.evaluations) == 1
+    assert get_selector_engine().winners()["live_match_badge"] == 2
+    assert _lookups("live_match_badge", "2") == before + 2
+
+
+def test_select_all_miss_returns_the_probed_elements_in_order():
+    badges = [object(), object(), object()]
+    page = FakePage({}, probe_results=[(2, badges)])
+
+    assert select_all(page, "live_match_badge", required=True) == badges
+    assert page.calls == ["query_selector_all", "evaluate_handle", "get_properties"]
+    assert get_selector_engine().winners()["live_match_badge"] == 3
+
+
+def test_probe_miss_fails_without_querying_each_selector():
+    page = FakePage({}, probe_results=[(-1, [])])
+    before = _lookups("live_match_badge", "none")
+
+    with pytest.raises(SelectorResolutionError):
+        select_first(page, "live_match_badge", required=True)
+
+    assert page.queries == [SELECTORS["live_match_badge"][0]]
+    assert _lookups("live_match_badge", "none") == before + 1
+
+
+def test_extract_live_match_hrefs_uses_one_evaluation():
+    page = FakePage({}, evaluate_results=[[0, [[2, "/match/1"], [4, "/match/2"]]]])
+
+    assert extract_live_match_hrefs(page) == ["/match/1", "/match/2"]
+    assert len(page.evaluations) == 1 and page.queries == []
+    assert get_selector_engine().winners() == {"live_match_badge": 0, "live_match_anchor": 4}
+
+
+def test_extract_live_match_hrefs_reports_the_failing_chain():
+    with pytest.raises(SelectorResolutionError) as badge_error:
+        extract_live_match_hrefs(FakePage({}, evaluate_results=[[-1, []]]))
+    assert badge_error.value.selector_key == "live_match_badge"
+
+    with pytest.raises(SelectorResolutionError) as anchor_error:
+        extract_live_match_hrefs(FakePage({}, evaluate_results=[[0, [[0, "/match/1"], [0, None]]]]))
+    assert anchor_error.value.selector_key == "live_match_anchor"
+    assert anchor_error.value.context == {"badge_index": 1}
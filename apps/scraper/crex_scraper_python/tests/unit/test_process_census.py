@@ -0,0 +1,162 @@
+import os
+
+import pytest
+
+from src.config import load_settings
+from src.core import process_census
+from src.core.process_census import (
+    ProcessCensus,
+    ProcessCensusSampler,
+    ProcessInfo,
+    browser_root_pid,
+    current_census,
+    reset_census,
+)
+from src.core.scraper_context import ScraperContext
+
+MB = 1024 * 1024
+
+
+def _info(pid, ppid, name, rss_mb=10, cpu=1.0, pss_mb=None, uss_mb=None):
+    return ProcessInfo(
+        pid=pid,
+        ppid=ppid,
+        name=name,
+        rss_bytes=rss_mb * MB,
+        cpu_percent=cpu,
+        is_browser=name.startswith("chrom"),
+        pss_bytes=pss_mb * MB if pss_mb is not None else None,
+        uss_bytes=uss_mb * MB if uss_mb is not None else None,
+    )
+
+
+def _census(*infos):
+    return ProcessCensus.from_processes(infos, taken_at=0.0)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_census():
+    reset_census()
+    yield
+    reset_census()
+
+
+def test_usage_is_attributed_to_browser_subtree():
+    census = _census(
+        _info(1, 0, "python3"),
+        _info(10, 1, "chrome", rss_mb=100, cpu=5.0, pss_mb=60),
+        _info(11, 10, "chrome", rss_mb=50, cpu=2.5, pss_mb=30),
+        _info(12, 11, "chrome", rss_mb=20, cpu=0.5, pss_mb=10),
+        _info(20, 1, "chrome", rss_mb=300),
+    )
+
+    usage = census.usage_for(10)
+
+    assert usage.pids == 3
+    assert usage.rss_bytes == 170 * MB
+    assert usage.memory_bytes == 100 * MB
+    assert usage.cpu_percent == 8.0
+    assert census.usage_for(999) is None
+
+
+def test_memory_falls_back_to_rss_without_full_pss():
+    census = _census(_info(10, 1, "chrome", rss_mb=100, pss_mb=60), _info(11, 10, "chrome", rss_mb=50))
+
+    assert census.usage_for(10).memory_bytes == 150 * MB
+
+
+def test_orphans_are_browsers_without_python_or_browser_parent():
+    census = _census(
+        _info(1, 0, "systemd"),
+        _info(5, 1, "python3"),
+        _info(10, 5, "chrome"),
+        _info(11, 10, "chrome"),
+        _info(30, 1, "chrome"),
+        _info(31, 404, "chromium"),
+    )
+
+    assert sorted(census.orphaned_browser_pids()) == [30, 31]
+
+
+def test_context_applies_census():
+    context = ScraperContext(match_id="m1", url="u", settings=load_settings({}))
+    context.set_browser_pid(10)
+    census = _census(_info(1, 0, "python3"), _info(10, 1, "chrome", rss_mb=40, cpu=3.0), _info(11, 10, "chrome"))
+
+    context.apply_census(census)
+    assert (context.total_pids, context.memory_bytes, context.cpu_percent) == (2, 50 * MB, 4.0)
+
+    context.apply_census(_census(_info(1, 0, "python3"), _info(20, 1, "chrome")))
+    assert context.browser_pid is None
+    assert context.total_pids == 1
+    assert context.memory_bytes == 0
+
+
+def test_renderers_reparented_after_a_crash_stay_attributed():
+    context = ScraperContext(match_id="m1", url="u", settings=load_settings({}))
+    context.set_browser_pid(10)
+    context.apply_census(
+        _census(_info(1, 0, "init"), _info(10, 1, "node"), _info(11, 10, "chrome"), _info(12, 11, "chrome", rss_mb=900))
+    )
+    assert context.tracked_pids == {10, 11, 12}
+
+    # Driver and browser died; the renderer was reparented to init.
+    context.apply_census(_census(_info(1, 0, "init"), _info(12, 1, "chrome", rss_mb=900)))
+
+    assert context.browser_pid is None
+    assert context.tracked_pids == {12}
+    assert context.memory_bytes == 900 * MB
+
+
+def test_health_payload_reports_memory_breakdown():
+    settings = load_settings({"MEMORY_SOFT_LIMIT_MB": "256", "MEMORY_HARD_LIMIT_MB": "512"})
+    context = ScraperContext(match_id="m1", url="u", settings=settings)
+    context.set_browser_pid(10)
+
+    context.apply_census(_census(_info(10, 1, "chrome", rss_mb=700, pss_mb=600, uss_mb=550)))
+
+    payload = context.to_health_payload()
+    assert payload["memory_mb"] == 600
+    assert payload["memory_breakdown_mb"] == {"rss": 700, "pss": 600, "uss": 550}
+    assert payload["status"] == "stopping"
+    assert context.restart_reason == "memory_soft_limit"
+
+
+def test_browser_root_pid_reads_the_driver_process():
+    class _Node:
+        def __init__(self, **attrs):
+            self.__dict__.update(attrs)
+
+    browser = _Node(_impl_obj=_Node(_connection=_Node(_transport=_Node(_proc=_Node(pid=4242)))))
+
+    assert browser_root_pid(browser) == 4242
+    assert browser_root_pid(object()) is None
+
+
+def test_contexts_share_one_walk(monkeypatch):
+    calls = []
+    real = process_census.take_census
+
+    def counting(**kwargs):
+        calls.append(kwargs)
+        return real(**kwargs)
+
+    monkeypatch.setattr(process_census, "take_census", counting)
+    settings = load_settings({"PROCESS_CENSUS_INTERVAL_SECONDS": "60"})
+    for index in range(5):
+        ScraperContext(match_id=f"m{index}", url="u", settings=settings).update_resource_usage()
+
+    assert len(calls) == 1
+
+
+def test_sampler_publishes_to_contexts():
+    own = ScraperContext(match_id="self", url="u", settings=load_settings({}))
+    own.set_browser_pid(os.getpid())
+    sampler = ProcessCensusSampler(lambda: [own], settings=load_settings({}))
+
+    census = sampler.sample_once()
+
+    assert census is not None and os.getpid() in census.processes
+    assert own.total_pids >= 1 and own.memory_bytes > 0
+    assert sampler.snapshot()["samples"] == 1
+    assert current_census(max_age_seconds=60) is census
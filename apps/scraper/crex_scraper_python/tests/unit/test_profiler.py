@@ -0,0 +1,78 @@
+import threading
+
+import pytest
+
+from src.config import load_settings
+from src.logging.adapters import bind_thread_match_id, unbind_thread_match_id
+from src.monitoring.profiler import ProfilerBusyError, SamplingProfiler
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def _busy_loop(started, stop):
+    bind_thread_match_id("match-hot")
+    started.set()
+    try:
+        while not stop.is_set():
+            sum(range(100))
+    finally:
+        unbind_thread_match_id()
+
+
+@pytest.fixture
+def hot_thread():
+    started, stop = threading.Event(), threading.Event()
+    thread = threading.Thread(target=_busy_loop, args=(started, stop), name="scraper-hot")
+    thread.start()
+    started.wait(5)
+    yield thread
+    stop.set()
+    thread.join(5)
+
+
+def test_profile_groups_stacks_by_thread_and_match(hot_thread):
+    clock = _Clock()
+    profiler = SamplingProfiler(settings=load_settings({}), sleep=clock.sleep, clock=clock)
+
+    result = profiler.profile(1.0, sample_hz=10)
+
+    assert result.samples == 10
+    roots = {stack[0] for stack in result.stacks}
+    assert "scraper-hot [match-hot]" in roots
+    assert threading.current_thread().name not in roots
+    hot_line = next(line for line in result.collapsed().splitlines() if line.startswith("scraper-hot [match-hot];"))
+    assert "_busy_loop (test_profiler.py:" in hot_line
+    assert hot_line.rsplit(" ", 1)[1] == "10"
+
+
+def test_top_summary_reports_threads_and_functions(hot_thread):
+    clock = _Clock()
+    profiler = SamplingProfiler(settings=load_settings({}), sleep=clock.sleep, clock=clock)
+
+    summary = profiler.profile(0.5, sample_hz=10).to_dict(top=100)
+
+    assert summary["samples"] == 5
+    threads = {row["name"]: row["samples"] for row in summary["top"]["threads"]}
+    assert threads["scraper-hot [match-hot]"] == 5
+    assert any(row["name"].startswith("_busy_loop ") for row in summary["top"]["inclusive"])
+
+
+def test_profile_duration_is_capped_and_exclusive():
+    clock = _Clock()
+    settings = load_settings({"PROFILER_MAX_SECONDS": "2"})
+    profiler = SamplingProfiler(settings=settings, frames_fn=dict, sleep=clock.sleep, clock=clock)
+
+    assert profiler.profile(60, sample_hz=1).samples == 2
+
+    with profiler._lock:
+        with pytest.raises(ProfilerBusyError):
+            profiler.profile(1)
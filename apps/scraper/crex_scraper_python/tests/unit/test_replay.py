@@ -0,0 +1,111 @@
+import gzip
+import json
+
+import pytest
+import requests
+
+from src.config import load_settings
+from src.replay.harness import ReplayError, ReplayPage, StubBackend, latency_samples, replay_url
+from src.replay.recorder import MatchRecorder, Recording, open_recorder, script_id
+
+SCORE_JS = "() => document.querySelector('.score').textContent"
+CRR_JS = "() => document.querySelector('.crr').textContent"
+
+
+class _Page:
+    def __init__(self, values):
+        self.values = values
+
+    def evaluate(self, expression):
+        return self.values[expression]
+
+
+def _record_two_passes(path):
+    recorder = MatchRecorder(path, match_id="m1", url="https://crex.live/m1/live")
+    page = _Page({SCORE_JS: "10/0", CRR_JS: "6.0"})
+    wrapped = recorder.wrap_page(page)
+    recorder.record("sv3", {"B": "1"}, url="https://api-v1.com/v10/sV3.php?key=k")
+    wrapped.evaluate(SCORE_JS)
+    wrapped.evaluate(CRR_JS)
+    wrapped.end_iteration()
+    page.values[SCORE_JS] = "14/0"
+    wrapped.evaluate(SCORE_JS)
+    wrapped.evaluate(CRR_JS)
+    wrapped.end_iteration()
+    recorder.close()
+
+
+def test_recording_round_trip_deduplicates_unchanged_scripts(tmp_path):
+    path = tmp_path / "m1.jsonl.gz"
+    _record_two_passes(path)
+
+    recording = Recording.load(path)
+    assert recording.url == "https://crex.live/m1/live"
+    assert recording.counts() == {"sv3": 1, "dom": 2}
+    second = recording.events[2]
+    assert second["data"] == {script_id(SCORE_JS): ["14/0"]}
+    assert second["unchanged"] == [script_id(CRR_JS)]
+
+
+def test_replay_page_rebuilds_each_pass(tmp_path):
+    path = tmp_path / "m1.jsonl.gz"
+    _record_two_passes(path)
+    dom_events = [event for event in Recording.load(path) if event["type"] == "dom"]
+
+    page = ReplayPage()
+    page.load(dom_events[0])
+    assert page.evaluate(SCORE_JS) == "10/0"
+    page.load(dom_events[1])
+    assert page.evaluate("  " + SCORE_JS) == "14/0"
+    assert page.evaluate(CRR_JS) == "6.0"
+    with pytest.raises(ReplayError):
+        page.evaluate(CRR_JS)
+
+
+def test_truncated_recording_keeps_complete_events(tmp_path):
+    path = tmp_path / "m1.jsonl"
+    lines = [
+        json.dumps({"version": 1, "match_id": "m1", "url": "u"}),
+        json.dumps({"t": 0.1, "type": "sv3", "data": {}}),
+        '{"t": 0.2, "type": "sv',
+    ]
+    path.write_text("\n".join(lines), encoding="utf-8")
+
+    assert Recording.load(path).counts() == {"sv3": 1}
+
+
+def test_open_recorder_only_when_configured(tmp_path):
+    assert open_recorder("m1", "u", settings=load_settings({})) is None
+
+    recorder = open_recorder("m1", "u", settings=load_settings({"SCRAPER_RECORD_DIR": str(tmp_path)}))
+    recorder.close()
+    (recorded,) = tmp_path.glob("m1-*.jsonl.gz")
+    with gzip.open(recorded, "rt") as handle:
+        assert json.loads(handle.readline())["match_id"] == "m1"
+
+
+def test_stub_backend_serves_sc4_and_records_posts():
+    with StubBackend() as backend:
+        backend.add_sc4_response("k", [{"c": "IND"}])
+        backend.add_sc4_response("k", [{"c": "AUS"}])
+        first = requests.get(f"{backend.base_url}/v10/sC4.php?key=k", timeout=5).json()
+        second = requests.get(f"{backend.base_url}/v10/sC4.php?key=k", timeout=5).json()
+        third = requests.get(f"{backend.base_url}/v10/sC4.php?key=k", timeout=5).json()
+        requests.post(f"{backend.base_url}/cricket-data", json={"url": "https://crex.live/m1/live"}, timeout=5)
+
+    assert [first[0]["c"], second[0]["c"], third[0]["c"]] == ["IND", "AUS", "AUS"]
+    assert backend.receipts[-1].match_url == "https://crex.live/m1/live"
+
+
+def test_latency_is_measured_from_oldest_undelivered_event():
+    feeds = [0.0, 0.5, 1.0, 3.0]
+    receipts = [1.2, 1.3, 3.4]
+
+    assert latency_samples(feeds, receipts) == pytest.approx([1.2, 0.4])
+
+
+def test_replay_copies_get_distinct_match_slugs():
+    url = "https://crex.live/scoreboard/A/B/ind-vs-aus/live"
+
+    assert replay_url(url, 0) == url
+    assert replay_url(url, 2) == "https://crex.live/scoreboard/A/B/ind-vs-aus-r2/live"
@@ -0,0 +1,160 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from src.core.circuit_breaker import CircuitBreaker, CircuitBreakerOpenError
+from src.core.retry_utils import (
+    RetryBudget,
+    RetryBudgetExhaustedError,
+    RetryConfig,
+    RetryError,
+    TransientHTTPError,
+    async_retryable,
+    parse_retry_after,
+    raise_for_transient_status,
+    retryable,
+)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _config(**overrides):
+    data = {"max_attempts": 5, "base_delay": 1, "max_delay": 8, "jitter": 0, "retry_exceptions": (ValueError,)}
+    data.update(overrides)
+    return RetryConfig(**data)
+
+
+def test_budget_limits_retries_across_callers():
+    clock = _Clock()
+    budget = RetryBudget("backend", capacity=2, refill_per_second=0, clock=clock)
+    delays = []
+
+    def always_fail():
+        raise ValueError("down")
+
+    decorated = retryable(config=_config(), sleep=delays.append, budget=budget)(always_fail)
+
+    with pytest.raises(RetryBudgetExhaustedError):
+        decorated()
+    # Second caller gets no retries at all once the shared bucket is empty.
+    with pytest.raises(RetryBudgetExhaustedError):
+        decorated()
+
+    assert delays == [1.0, 2.0]
+
+
+def test_budget_refills_and_success_deposits():
+    clock = _Clock()
+    budget = RetryBudget("backend", capacity=2, refill_per_second=1, success_deposit=0.5, clock=clock)
+    assert budget.try_acquire() and budget.try_acquire()
+    assert not budget.try_acquire()
+
+    clock.now = 1.0
+    assert budget.tokens == pytest.approx(1.0)
+    budget.record_success()
+    assert budget.tokens == pytest.approx(1.5)
+
+
+def test_retry_after_hint_overrides_backoff_and_is_shared():
+    clock = _Clock()
+    budget = RetryBudget("backend", capacity=10, refill_per_second=0, clock=clock)
+    delays = []
+    calls = []
+
+    def rate_limited():
+        calls.append(1)
+        if len(calls) == 1:
+            raise TransientHTTPError(429, retry_after=5)
+        return "ok"
+
+    decorated = retryable(
+        config=_config(retry_exceptions=(TransientHTTPError,)), sleep=delays.append, budget=budget
+    )(rate_limited)
+
+    assert decorated() == "ok"
+    assert delays == [5.0]
+    assert budget.blocked_for() == pytest.approx(5.0)
+
+
+def test_shared_backpressure_longer_than_max_delay_fails_fast():
+    clock = _Clock()
+    budget = RetryBudget("backend", capacity=10, refill_per_second=0, clock=clock)
+    budget.defer(60)
+    calls = []
+
+    decorated = retryable(config=_config(), sleep=lambda _: None, budget=budget)(lambda: calls.append(1))
+
+    with pytest.raises(RetryBudgetExhaustedError):
+        decorated()
+    assert calls == []
+
+
+def test_open_breaker_stops_retries():
+    breaker = CircuitBreaker(name="backend", failure_threshold=2, timeout_seconds=30, success_threshold=1)
+    calls = []
+
+    def failing():
+        calls.append(1)
+        raise ValueError("boom")
+
+    decorated = retryable(config=_config(), sleep=lambda _: None, breaker=breaker)(failing)
+
+    with pytest.raises(CircuitBreakerOpenError):
+        decorated()
+    assert len(calls) == 2
+
+
+def test_async_retryable_retries_coroutines():
+    delays = []
+    calls = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    @async_retryable(config=_config(), sleep=fake_sleep)
+    async def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise ValueError("temporary")
+        return "ok"
+
+    assert asyncio.run(flaky()) == "ok"
+    assert delays == [1.0, 2.0]
+
+
+def test_async_retryable_raises_retry_error():
+    @async_retryable(config=_config(max_attempts=2), sleep=lambda _: asyncio.sleep(0))
+    async def broken():
+        raise ValueError("nope")
+
+    with pytest.raises(RetryError):
+        asyncio.run(broken())
+
+
+def test_parse_retry_after_formats():
+    now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    assert parse_retry_after("7") == 7.0
+    assert parse_retry_after(format_datetime(now + timedelta(seconds=30), usegmt=True), now=now) == pytest.approx(30)
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_raise_for_transient_status():
+    class _Response:
+        status_code = 503
+        headers = {"Retry-After": "3"}
+
+    with pytest.raises(TransientHTTPError) as info:
+        raise_for_transient_status(_Response())
+    assert info.value.retry_after == 3.0
+
+    _Response.status_code = 400
+    raise_for_transient_status(_Response())
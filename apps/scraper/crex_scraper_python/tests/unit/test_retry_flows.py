@@ -27,7 +27,7 @@ def test_run_with_retry_succeeds_after_transient_failure(monkeypatch):
     def flaky_operation():
         attempts.append("call")
         if len(attempts) == 1:
-            raise Exception("temporary failure")
+            raise scraper.PlaywrightTimeoutError("temporary failure")
         return "ok"
 
     monkeypatch.setattr(scraper, "record_scraper_retry", recorded_operations.append)
@@ -43,7 +43,7 @@ def test_run_with_retry_raises_after_exhaustion(monkeypatch):
     recorded_operations = []
 
     def failing_operation():
-        raise Exception("persistent failure")
+        raise scraper.RequestException("persistent failure")
 
     monkeypatch.setattr(scraper, "record_scraper_retry", recorded_operations.append)
 
@@ -216,3 +216,19 @@ def test_create_state_snapshot():
     assert snapshot.metadata["innings"] == 1
     assert snapshot.metadata["team"] == "Pakistan"
     assert snapshot.last_update_timestamp is not None
+
+
+def test_create_state_snapshot_carries_warm_restart_state():
+    context = ScraperContext(match_id="match-warm", url="https://example.com/warm")
+
+    snapshot = context.create_state_snapshot(
+        code_dictionary={"team_data": {"t_IND_name": "India"}},
+        storage_state={"cookies": [], "origins": []},
+        match_info={"venue": "Perth"},
+        sent_hashes={"texts": "abc"},
+    )
+
+    assert snapshot.code_dictionary["team_data"]["t_IND_name"] == "India"
+    assert snapshot.storage_state == {"cookies": [], "origins": []}
+    assert snapshot.match_info == {"venue": "Perth"}
+    assert snapshot.sent_hashes == {"texts": "abc"}
@@ -1,10 +1,14 @@
 """Unit tests for scraper state snapshot persistence."""
 
+import json
+import threading
+from datetime import timedelta
 from pathlib import Path
 
 import pytest
 
-from src.core.scraper_state import ScraperStateSnapshot, StateStore
+from src.core import scraper_state
+from src.core.scraper_state import ScraperStateSnapshot, StateStore, _utcnow, payload_digest
 
 
 def test_snapshot_serialization():
@@ -202,3 +206,143 @@ def test_snapshot_handles_none_values(tmp_path: Path):
     assert loaded.last_processed_over is None
     assert loaded.last_processed_ball is None
     assert loaded.last_score is None
+
+
+def _store(tmp_path: Path) -> StateStore:
+    from src.config import load_settings
+
+    settings = load_settings({"STATE_STORE_FLUSH_INTERVAL_SECONDS": "60", "STATE_STORE_BATCH_SIZE": "1000"})
+    return StateStore(settings=settings, db_path=str(tmp_path / "test_state.db"))
+
+
+def _rows(store: StateStore):
+    with store._pool.get_connection() as conn:
+        return conn.execute("SELECT match_id, payload_version, payload_size FROM state_snapshots").fetchall()
+
+
+def test_saves_are_written_behind_latest_wins(tmp_path: Path):
+    store = _store(tmp_path)
+
+    for over in range(10):
+        store.save(ScraperStateSnapshot(match_id="m1", url="u", last_processed_over=over))
+    # Below the batch size nothing wakes the writer before its 60s interval.
+    assert _rows(store) == []
+    assert store.load("m1").last_processed_over == 9
+
+    assert store.flush() == 10
+    rows = _rows(store)
+    assert len(rows) == 1
+    assert rows[0]["payload_version"] == 1
+    store.close()
+
+    reopened = _store(tmp_path)
+    assert reopened.load("m1").last_processed_over == 9
+    reopened.close()
+
+
+def test_delete_is_not_undone_by_an_in_flight_flush(tmp_path: Path, monkeypatch):
+    store = _store(tmp_path)
+    store.save(ScraperStateSnapshot(match_id="m1", url="u"))
+    encoding, release = threading.Event(), threading.Event()
+    encode = scraper_state.encode_snapshot
+
+    def _slow_encode(snapshot, **kwargs):
+        encoding.set()
+        release.wait(5)
+        return encode(snapshot, **kwargs)
+
+    monkeypatch.setattr(scraper_state, "encode_snapshot", _slow_encode)
+    flusher = threading.Thread(target=store.flush)
+    flusher.start()
+    assert encoding.wait(5)  # the flush has read m1's snapshot
+
+    deleter = threading.Thread(target=store.delete, args=("m1",))
+    deleter.start()
+    deleter.join(0.2)  # an unguarded delete finishes here, before the flush writes
+    release.set()
+    flusher.join(5)
+    deleter.join(5)
+
+    assert _rows(store) == []
+    assert store.load("m1") is None
+    store.close()
+
+
+def test_critical_save_is_synchronous(tmp_path: Path):
+    store = _store(tmp_path)
+    store.save(ScraperStateSnapshot(match_id="m1", url="u"), critical=True)
+    assert len(_rows(store)) == 1
+    store.close()
+
+
+def test_legacy_json_rows_still_load(tmp_path: Path):
+    store = _store(tmp_path)
+    legacy = ScraperStateSnapshot(match_id="old", url="u", last_score="99/1")
+    with store._pool.get_connection() as conn:
+        conn.execute(
+            "INSERT INTO state_snapshots (match_id, url, snapshot_data, snapshot_timestamp) VALUES (?, ?, ?, ?)",
+            ("old", "u", json.dumps(legacy.to_dict()), legacy.snapshot_timestamp),
+        )
+
+    assert store.load("old").last_score == "99/1"
+    store.close()
+
+
+def test_list_metadata_skips_payload_decoding(tmp_path: Path):
+    store = _store(tmp_path)
+    store.save(ScraperStateSnapshot(match_id="m1", url="u1"))
+    store.save(ScraperStateSnapshot(match_id="m2", url="u2"))
+
+    metadata = store.list_metadata()
+
+    assert {row["match_id"] for row in metadata} == {"m1", "m2"}
+    assert all(row["payload_size"] > 0 and "payload" not in row for row in metadata)
+    with store._pool.get_connection() as conn:
+        indexes = {row["name"] for row in conn.execute("PRAGMA index_list(state_snapshots)")}
+    assert "idx_state_snapshots_updated_at" in indexes
+    store.close()
+
+
+def test_warm_restart_state_round_trips(tmp_path: Path):
+    store = _store(tmp_path)
+    storage_state = {"cookies": [], "origins": [{"origin": "https://crex.com", "localStorage": [{"name": "p_P1_name", "value": "Kohli"}]}]}
+    store.save(
+        ScraperStateSnapshot(
+            match_id="m1",
+            url="u",
+            code_dictionary={"player_data": {"p_P1_name": "Kohli"}},
+            storage_state=storage_state,
+            match_info={"team1": "IND"},
+            sent_hashes={"score": payload_digest([{"score": "10/0"}])},
+        ),
+        critical=True,
+    )
+    store.close()
+
+    restored = _store(tmp_path).load("m1")
+    assert restored.code_dictionary["player_data"]["p_P1_name"] == "Kohli"
+    assert restored.storage_state == storage_state
+    assert restored.match_info == {"team1": "IND"}
+    assert restored.sent_hashes["score"] == payload_digest([{"score": "10/0"}])
+
+
+def test_snapshots_without_warm_state_decode_with_defaults():
+    restored = ScraperStateSnapshot.from_dict({"match_id": "old", "url": "u", "last_score": "1/0"})
+
+    assert restored.code_dictionary == {}
+    assert restored.storage_state is None
+    assert restored.sent_hashes == {}
+
+
+def test_snapshot_age():
+    snapshot = ScraperStateSnapshot(match_id="m1", url="u")
+    later = _utcnow() + timedelta(seconds=120)
+
+    assert 119 <= snapshot.age_seconds(later) <= 121
+    assert ScraperStateSnapshot(match_id="m1", url="u", snapshot_timestamp="garbage").age_seconds() is None
+
+
+def test_payload_digest_is_order_insensitive_for_sets():
+    assert payload_digest({"b", "a"}) == payload_digest({"a", "b"})
+    assert payload_digest({"x": 1, "y": 2}) == payload_digest({"y": 2, "x": 1})
+    assert payload_digest([1, 2]) != payload_digest([2, 1])
@@ -0,0 +1,115 @@
+import json
+
+import msgspec
+import pytest
+
+from src.config import load_settings
+from src.egress import serialization
+from src.egress.serialization import (
+    JSON_CONTENT_TYPE,
+    MSGPACK_CONTENT_TYPE,
+    PayloadEncoder,
+    Serializer,
+    get_json_serializer,
+    prepare_payload,
+    schema_for,
+)
+
+
+class _Response:
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+
+class _Session:
+    def __init__(self, statuses):
+        self.statuses = list(statuses)
+        self.calls = []
+
+    def post(self, url, data=None, headers=None, timeout=None):
+        self.calls.append({"url": url, "data": data, "headers": headers, "timeout": timeout})
+        return _Response(self.statuses.pop(0))
+
+
+def test_prepare_payload_drops_none_and_orders_schema_fields():
+    payload = {"url": "u", "extra": None, "overs_data": [], "match_update": {"crr": "8.0"}}
+
+    prepared = prepare_payload(payload)
+
+    assert schema_for(payload).name == "match_update"
+    assert list(prepared) == ["match_update", "overs_data", "url"]
+
+
+def test_prepare_payload_filters_list_items():
+    assert prepare_payload([{"a": 1, "b": None}, {"c": None}]) == [{"a": 1}, {}]
+
+
+@pytest.mark.parametrize("name", serialization.available_serializers())
+def test_json_serializers_round_trip(name):
+    serializer = serialization._SERIALIZERS[name]
+    if serializer.content_type != JSON_CONTENT_TYPE:
+        pytest.skip("binary encoder")
+    payload = {"score_update": "SIX! über long-on", "url": "u"}
+    assert json.loads(serializer.encode(payload)) == payload
+
+
+def test_unknown_serializer_rejected():
+    with pytest.raises(ValueError):
+        get_json_serializer("yaml")
+    with pytest.raises(ValueError):
+        load_settings({"EGRESS_SERIALIZER": "yaml"})
+
+
+def test_encoder_downgrades_endpoint_after_415(monkeypatch):
+    fake_binary = Serializer("msgpack", MSGPACK_CONTENT_TYPE, lambda obj: b"\x81")
+    monkeypatch.setitem(serialization._SERIALIZERS, "msgpack", fake_binary)
+    encoder = PayloadEncoder(load_settings({"EGRESS_MSGPACK_ENABLED": "true", "EGRESS_SERIALIZER": "json"}))
+    session = _Session([415, 200, 200])
+
+    first = encoder.post("http://backend/save", {"score_update": "1 run"}, session=session, timeout=5)
+    second = encoder.post("http://backend/save", {"score_update": "2 runs"}, session=session)
+
+    assert first.status_code == 200
+    assert second.status_code == 200
+    content_types = [call["headers"]["Content-Type"] for call in session.calls]
+    assert content_types == [MSGPACK_CONTENT_TYPE, JSON_CONTENT_TYPE, JSON_CONTENT_TYPE]
+    assert json.loads(session.calls[1]["data"]) == {"score_update": "1 run"}
+
+
+def test_encoder_uses_json_when_msgpack_disabled():
+    encoder = PayloadEncoder(load_settings({"EGRESS_SERIALIZER": "json"}))
+    body, content_type = encoder.encode("http://backend/save", {"odds_data": [], "x": None})
+
+    assert content_type == JSON_CONTENT_TYPE
+    assert json.loads(body) == {"odds_data": []}
+
+
+def test_msgspec_is_the_default_encoder_and_speaks_msgpack():
+    encoder = PayloadEncoder(load_settings({"EGRESS_MSGPACK_ENABLED": "true"}))
+    session = _Session([200])
+    payload = {"match_update": {"crr": "8.0"}, "url": "u", "ts": None}
+
+    encoder.post("http://backend/save", payload, session=session)
+
+    assert encoder.json_serializer.name == "msgspec"
+    call = session.calls[0]
+    assert call["headers"]["Content-Type"] == MSGPACK_CONTENT_TYPE
+    assert msgspec.msgpack.decode(call["data"]) == {"match_update": {"crr": "8.0"}, "url": "u"}
+    assert json.loads(encoder.json_serializer.encode(payload)) == payload
+
+
+def test_known_payloads_are_encoded_through_msgspec_structs():
+    payload = {"url": "u", "overs_data": None, "match_update": {"crr": "8.0"}}
+    encoder = PayloadEncoder(load_settings({}))
+
+    struct = prepare_payload(payload, structs=True)
+
+    assert isinstance(struct, msgspec.Struct)
+    assert type(struct) is schema_for(payload).struct
+    body, _ = encoder.encode("http://backend/save", payload)
+    assert body == encoder.json_serializer.encode(prepare_payload(payload))
+    assert body == b'{"match_update":{"crr":"8.0"},"url":"u"}'
+
+    with_extra = {**payload, "ts": 1}
+    assert prepare_payload(with_extra, structs=True) == {"match_update": {"crr": "8.0"}, "url": "u", "ts": 1}
+    assert all(schema.struct is not None for schema in serialization.SCHEMAS)
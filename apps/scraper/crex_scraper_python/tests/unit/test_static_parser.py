@@ -0,0 +1,231 @@
+from pathlib import Path
+
+import pytest
+import requests
+
+from src.parsers import SELECTORS, get_selector_engine, select_first
+from src.static_parser import (
+    UnsupportedSelectorError,
+    extract_live_match_hrefs_static,
+    fetch_document,
+    parse_html,
+)
+from src import crex_main_url, crex_scraper
+from src.config import load_settings
+from src.monitoring import monitoring
+
+FIXTURES = Path(__file__).resolve().parents[2] / "benchmarks" / "fixtures"
+
+CARD = """
+<div class="live-card">
+  <div class="head"><span class="series">T20 Series</span><span class="live">Live</span></div>
+  <a class="match-link" href="/scoreboard/{code}/4th-match/live"><span class="team">IND</span> vs <b>AUS</b></a>
+</div>
+"""
+
+
+@pytest.fixture(autouse=True)
+def reset_selector_engine():
+    get_selector_engine().reset()
+    yield
+    get_selector_engine().reset()
+
+
+class _Response:
+    def __init__(self, text, status_code=200):
+        self.text = text
+        self.status_code = status_code
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error")
+
+
+class _Session:
+    def __init__(self, response=None, error=None):
+        self.response = response
+        self.error = error
+        self.calls = []
+
+    def get(self, url, **kwargs):
+        self.calls.append((url, kwargs))
+        if self.error is not None:
+            raise self.error
+        return self.response
+
+
+def test_css_matches_like_the_browser():
+    document = parse_html(
+        """<ul id="nav"><li class="item first"><a href="/a">A</a></li><li class="item"><a href="/match/1">B</a>
+        <li class="item" data-state="live"><a href="/match/2" rel="x y">C</a></ul>
+        <table id="table"><tr><td>1</td><td>Avg Score</td></tr></table><p>one<p>two"""
+    )
+
+    assert [li.inner_text() for li in document.query_selector_all("#nav > li.item")] == ["A", "B", "C"]
+    assert document.query_selector("li.first + li a").get_attribute("href") == "/match/1"
+    assert len(document.query_selector_all("li.first ~ li")) == 2
+    assert document.query_selector("[data-state='live'] a[rel~=y]").inner_text() == "C"
+    links = document.query_selector_all("a[href^='/match'], li.first a")
+    assert [a.inner_text() for a in links] == ["A", "B", "C"]
+    # Browsers put table rows in an implied tbody.
+    assert document.query_selector("#table tbody tr td + td").inner_text() == "Avg Score"
+    assert [p.inner_text() for p in document.query_selector_all("p")] == ["one", "two"]
+
+    with pytest.raises(UnsupportedSelectorError):
+        document.query_selector("a:has-text('B')")
+
+
+def test_found_elements_behave_like_browser_handles():
+    document = parse_html("<p><a href='/x'>x</a><!-- note --></p>")
+
+    assert document.query_selector("a")  # lxml treats an element without children as false
+    assert document.query_selector("p").inner_text() == "x"
+    assert document.query_selector_all("xpath=//a/@href") == []  # only elements are handles
+    assert document.query_selector_all("xpath=//p/node()")[0].get_attribute("href") == "/x"
+
+
+def test_xpath_resolves_the_anchor_chain():
+    document = parse_html(CARD.format(code="abc"))
+    badge = document.query_selector(".live")
+
+    sibling, card_link = (badge.query_selector(SELECTORS["live_match_anchor"][i]) for i in (0, 2))
+    assert sibling.get_attribute("href") == card_link.get_attribute("href") == "/scoreboard/abc/4th-match/live"
+    assert badge.query_selector(SELECTORS["live_match_anchor"][1]) is None  # the card has no next sibling
+    assert badge.query_selector(SELECTORS["live_match_anchor"][3]) is None  # nor an enclosing link
+    assert badge.query_selector(":scope >> xpath=ancestor::*[1]").get_attribute("class") == "head"
+    assert [node.tag for node in document.query_selector_all("xpath=//div/span")] == ["span", "span"]
+
+
+def test_select_first_runs_the_shared_fallback_chain():
+    document = parse_html("<div data-status='live'><span>Live</span></div>")
+    before = monitoring.SCRAPER_SELECTOR_LOOKUPS_TOTAL.labels(
+        selector_key="live_match_badge", selector_index="3"
+    )._value.get()
+
+    assert select_first(document, "live_match_badge").tag == "div"
+    assert monitoring.SCRAPER_SELECTOR_LOOKUPS_TOTAL.labels(
+        selector_key="live_match_badge", selector_index="3"
+    )._value.get() == before + 1
+
+
+def test_listing_fixture_yields_every_live_match():
+    document = parse_html((FIXTURES / "listing_live.html").read_text(encoding="utf-8"))
+
+    hrefs = extract_live_match_hrefs_static(document)
+
+    assert len(hrefs) == len(document.query_selector_all(".live-card")) == 14
+    assert all(href.startswith("/scoreboard/") and href.endswith("/live") for href in hrefs)
+
+
+def test_client_rendered_listing_is_incomplete():
+    assert extract_live_match_hrefs_static(parse_html("<div id='root'></div>")) is None
+    no_link = "<div class='live-card'><span class='live'>Live</span></div>"
+    assert extract_live_match_hrefs_static(parse_html(no_link)) is None
+
+
+def test_fetch_document_reports_failures_and_honours_the_switch():
+    settings = load_settings({"STATIC_FETCH_TIMEOUT_SECONDS": "3"})
+    failed = monitoring.SCRAPER_STATIC_PARSES_TOTAL.labels(page="listing", outcome="fetch_error")
+    before = failed._value.get()
+
+    down = _Session(error=requests.ConnectionError("down"))
+    unavailable = _Session(_Response("", status_code=503))
+    for session in (down, unavailable):
+        assert fetch_document("https://crex.example/", page="listing", settings=settings, session=session) is None
+    assert failed._value.get() == before + 2
+
+    session = _Session(_Response(CARD.format(code="x")))
+    assert fetch_document("https://crex.example/", page="listing", settings=settings, session=session).backend
+    assert session.calls[0][1]["timeout"] == 3.0
+
+    disabled = load_settings({"STATIC_PARSE_ENABLED": "false"})
+    assert fetch_document("https://crex.example/", page="listing", settings=disabled, session=session) is None
+    assert len(session.calls) == 1
+
+
+def test_scrape_skips_the_browser_when_static_parse_is_complete(monkeypatch):
+    document = parse_html(CARD.format(code="one") + CARD.format(code="two"))
+    monkeypatch.setattr(crex_scraper, "fetch_document", lambda url, page: document)
+
+    def _no_browser():
+        raise AssertionError("Chromium should not be started")
+
+    monkeypatch.setattr(crex_scraper, "sync_playwright", _no_browser)
+
+    assert crex_scraper.scrape("https://crex.example/") == [
+        "/scoreboard/one/4th-match/live",
+        "/scoreboard/two/4th-match/live",
+    ]
+
+
+class _UrlIndex:
+    def __init__(self):
+        self.updates = []
+
+    def update(self, urls):
+        self.updates.append(list(urls))
+        return [], []
+
+
+@pytest.fixture
+def discovery_cycle(monkeypatch):
+    """``crex_main_url.scrape`` with the URL index, backend sync and sleep stubbed out."""
+
+    index = _UrlIndex()
+    monkeypatch.setattr(crex_main_url, "get_live_url_index", lambda: index)
+    monkeypatch.setattr(crex_main_url.CricketDataService, "get_bearer_token", staticmethod(lambda: None))
+    monkeypatch.setattr(crex_main_url.CricketDataService, "add_live_matches", staticmethod(lambda urls, token: None))
+    monkeypatch.setattr(crex_main_url.time, "sleep", lambda seconds: None)
+    return index
+
+
+def test_discovery_job_reads_the_listing_without_chromium(monkeypatch, discovery_cycle):
+    document = parse_html(CARD.format(code="one") + CARD.format(code="two"))
+    monkeypatch.setattr(crex_main_url, "fetch_document", lambda url, page: document)
+
+    def _no_browser():
+        raise AssertionError("Chromium should not be started")
+
+    result = crex_main_url.scrape(_no_browser, "https://crex.com")
+
+    assert result["match_urls"] == [
+        "https://crex.com/scoreboard/one/4th-match/live",
+        "https://crex.com/scoreboard/two/4th-match/live",
+    ]
+    assert discovery_cycle.updates == [result["match_urls"]]
+
+
+def test_discovery_job_falls_back_to_chromium_when_the_listing_is_incomplete(monkeypatch, discovery_cycle):
+    monkeypatch.setattr(crex_main_url, "fetch_document", lambda url, page: parse_html("<div id='root'></div>"))
+
+    class _Handle:
+        def __init__(self, href=None):
+            self.href = href
+
+        def query_selector(self, selector):
+            return self
+
+        def get_attribute(self, name):
+            return self.href
+
+    class _Page:
+        def __init__(self):
+            self.visited = []
+
+        def goto(self, url):
+            self.visited.append(url)
+
+        def wait_for_timeout(self, ms):
+            pass
+
+        def query_selector(self, selector):
+            return _Handle()
+
+        def query_selector_all(self, selector):
+            return [_Handle("/scoreboard/three/4th-match/live")]
+
+    page = _Page()
+    result = crex_main_url.scrape(lambda: page, "https://crex.com")
+
+    assert page.visited == ["https://crex.com"]
+    assert result["match_urls"] == ["https://crex.com/scoreboard/three/4th-match/live"]
@@ -0,0 +1,118 @@
+import json
+
+import pytest
+
+from src.config import load_settings
+from src.egress.lanes import EgressDispatcher, EgressLane
+from src.logging.adapters import bind_correlation_id, clear_correlation_id
+from src.monitoring import tracing
+from src.monitoring.tracing import STATUS_ERROR, Tracer
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1_000_000_000
+
+    def __call__(self):
+        return self.now
+
+    def advance_ms(self, ms):
+        self.now += int(ms * 1e6)
+
+
+def _tracer(ratio="0", **overrides):
+    env = {"TRACE_SAMPLE_RATIO": ratio, "TRACE_TAIL_LATENCY_MS": "100", **overrides}
+    clock = _Clock()
+    return Tracer(load_settings(env), rng=lambda: 0.5, clock_ns=clock), clock
+
+
+@pytest.fixture
+def global_tracer(monkeypatch):
+    tracer, _ = _tracer(ratio="1")
+    monkeypatch.setattr(tracing, "_tracer", tracer)
+    return tracer
+
+
+def test_fast_unsampled_traces_are_dropped_and_slow_ones_kept():
+    tracer, clock = _tracer()
+    with tracer.span("tick"):
+        clock.advance_ms(5)
+    with tracer.span("tick") as slow:
+        with tracer.span("evaluate"):
+            clock.advance_ms(150)
+
+    (kept,) = tracer.traces()
+    assert kept["trace_id"] == slow.context.trace_id
+    assert kept["kept"] == "tail"
+    assert kept["duration_ms"] == pytest.approx(150)
+    assert [span["name"] for span in kept["spans"]] == ["tick", "evaluate"]
+    assert kept["spans"][1]["parentSpanId"] == slow.context.span_id
+    assert tracer.snapshot()["dropped"] == 1
+
+
+def test_errors_are_kept_and_head_sampling_keeps_everything():
+    tracer, _ = _tracer()
+    with pytest.raises(ValueError):
+        with tracer.span("tick"):
+            raise ValueError("boom")
+    (kept,) = tracer.traces(errors_only=True)
+    assert kept["kept"] == "error"
+    assert kept["spans"][0]["status"] == {"code": STATUS_ERROR, "message": "boom"}
+
+    sampled, _ = _tracer(ratio="1")
+    with sampled.span("tick"):
+        pass
+    assert sampled.traces()[0]["kept"] == "head"
+
+
+def test_root_span_carries_correlation_id_and_filters():
+    tracer, clock = _tracer()
+    bind_correlation_id("corr-1")
+    try:
+        with tracer.span("tick", attributes={"match.id": "m1"}):
+            clock.advance_ms(200)
+    finally:
+        clear_correlation_id()
+
+    assert tracer.traces(correlation_id="corr-1")[0]["match_id"] == "m1"
+    assert tracer.traces(match_id="m2") == []
+    assert tracer.traces(min_duration_ms=500) == []
+
+
+def test_egress_span_continues_the_submitting_tick(global_tracer):
+    dispatcher = EgressDispatcher(load_settings({}))
+    try:
+        with global_tracer.span("tick") as tick:
+            dispatcher.submit(EgressLane.REALTIME, lambda: True, coalesce_key="m1", label="cricket-data")
+        assert dispatcher.flush(timeout=2.0)
+    finally:
+        dispatcher.shutdown(timeout=2.0)
+
+    trace = global_tracer.get_trace(tick.context.trace_id)
+    egress = next(span for span in trace["spans"] if span["name"] == "egress")
+    assert egress["parentSpanId"] == tick.context.span_id
+    assert egress["attributes"]["egress.outcome"] == "sent"
+    assert egress["attributes"]["egress.lane"] == "realtime"
+
+
+def test_kept_traces_are_exported_as_json_lines(tmp_path):
+    path = tmp_path / "traces" / "traces.jsonl"
+    tracer, _ = _tracer(ratio="1", TRACE_EXPORT_PATH=str(path))
+    with tracer.span("tick"):
+        pass
+    tracer.close()
+
+    (line,) = path.read_text(encoding="utf-8").splitlines()
+    assert json.loads(line)["root"] == "tick"
+
+
+def test_abandoned_spans_expire_into_a_decision():
+    tracer, clock = _tracer(TRACE_PENDING_TIMEOUT_SECONDS="1")
+    tracer.start_span("leaked")
+    clock.advance_ms(2000)
+    with tracer.span("tick"):
+        pass
+
+    snapshot = tracer.snapshot()
+    assert snapshot["expired"] == 1
+    assert snapshot["pending"] == 0
@@ -0,0 +1,53 @@
+from pathlib import Path
+
+from src.persistence.db_pool import ConnectionPool
+from src.persistence.url_index import LiveUrlIndex
+
+
+def _pool(tmp_path: Path) -> ConnectionPool:
+    pool = ConnectionPool(database_path=str(tmp_path / "urls.sqlite"), min_size=1, max_size=2, acquire_timeout=1)
+    with pool.get_connection() as conn:
+        conn.execute("CREATE TABLE scraped_urls (url TEXT PRIMARY KEY, deletion_attempts INTEGER DEFAULT 0)")
+    return pool
+
+
+def _table(pool):
+    with pool.get_connection() as conn:
+        return dict(conn.execute("SELECT url, deletion_attempts FROM scraped_urls").fetchall())
+
+
+def test_update_diffs_in_memory_and_writes_behind(tmp_path: Path):
+    pool = _pool(tmp_path)
+    index = LiveUrlIndex(pool, flush_interval=60)
+
+    added, deleted = index.update(["a", "b", "a"])
+    assert added == ["a", "b"]
+    assert deleted == []
+    # Nothing wakes the writer before its 60s interval; flush() is the only write.
+    assert _table(pool) == {}
+    assert index.snapshot()["pending_writes"] == 2
+
+    added, deleted = index.update(["b", "c"])
+    assert added == ["c"]
+    assert deleted == ["a"]
+    assert index.deletion_attempts("a") == 1
+
+    index.flush()
+    assert _table(pool) == {"a": 1, "b": 0, "c": 0}
+    index.close()
+    pool.close()
+
+
+def test_remove_and_reload(tmp_path: Path):
+    pool = _pool(tmp_path)
+    index = LiveUrlIndex(pool, flush_interval=60)
+    index.update(["a", "b"])
+    index.update(["b"])
+    assert index.remove("a") is True
+    index.close()
+
+    reloaded = LiveUrlIndex(pool, flush_interval=60)
+    assert reloaded.urls() == {"b"}
+    assert reloaded.diff(["b", "d"]) == (["d"], [])
+    reloaded.close()
+    pool.close()
@@ -1,15 +1,43 @@
 import requests
-import json
-import requests
-import json
+import functools
 import os
+import threading
+import time
 import logging 
 
-logging.basicConfig(filename='crex_scraper.log', level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
+from src.core.bulkhead import BulkheadFullError, get_bulkhead
+from src.logging.pipeline import LoggingPipeline, route_logger
+from src.core.circuit_breaker import CircuitBreaker, CircuitBreakerOpenError
+from src.core.retry_utils import (
+    RetryConfig,
+    RetryError,
+    TransientHTTPError,
+    get_retry_budget,
+    raise_for_transient_status,
+    retryable,
+)
+from src.egress import EgressLane, classify_payload, coalesce_key_for, get_dispatcher, get_payload_encoder, prepare_payload
+
+# Shared by every match thread: once the endpoint keeps failing, nobody retries it.
+_api_endpoint_breaker = CircuitBreaker.from_settings("backend_api_endpoint")
+
+route_logger(LoggingPipeline.ROOT, 'crex_scraper.log', level=logging.DEBUG, console_level=logging.WARN)
+
+# Tokens are shared by every match thread (and survive warm restarts) until they age out.
+_token_cache = {}
+_token_cache_lock = threading.Lock()
 
-def get_bearer_token():
+
+def get_bearer_token(force_refresh=False):
     # Define the URL of the token endpoint
     token_url = os.getenv('TOKEN_URL', 'http://127.0.0.1:8099/token/generate-token')
+    cache_seconds = float(os.getenv('TOKEN_CACHE_SECONDS', '300'))
+
+    if not force_refresh and cache_seconds > 0:
+        with _token_cache_lock:
+            cached = _token_cache.get(token_url)
+        if cached and cached[1] > time.monotonic():
+            return cached[0]
 
 
     # Define the credentials required to obtain the token (if needed)
@@ -21,22 +49,35 @@ def get_bearer_token():
     try:
         logging.info("Requesting bearer token from token endpoint.")
         # Send a POST request to the token endpoint to obtain the token
-        response = requests.post(token_url, json=credentials)
+        response = get_bulkhead("auth").call(requests.post, token_url, json=credentials)
 
         # Check the response status code
         if response.status_code == 200:
             # Parse the JSON response to get the token
             token_data = response.json()
             logging.info("Bearer token obtained successfully.")
-            return token_data.get("token")
+            token = token_data.get("token")
+            if token and cache_seconds > 0:
+                with _token_cache_lock:
+                    _token_cache[token_url] = (token, time.monotonic() + cache_seconds)
+            return token
         else:
             logging.error(f"Failed to obtain bearer token. Status code: {response.status_code}")
+    except BulkheadFullError as e:
+        logging.warning(f"Bearer token request shed: {e}")
     except Exception as e:
         logging.error(f"An error occurred while obtaining bearer token: {str(e)}")
 
 
 
-def send_cricket_data_to_service(data, bearer_token,url):
+def send_cricket_data_to_service(data, bearer_token,url, freshness=None):
+    """Queue a live update for the cricket-data service on its priority lane.
+
+    Score/commentary updates go out immediately, odds and batsman/bowler
+    snapshots are coalesced (latest wins) so they never hold up the score.
+    ``freshness`` (a ``FreshnessStamp``) records when the payload's source data
+    was observed; the acknowledgement feeds the freshness SLO.
+    """
     # Define the URL of the service where you want to send the data
     service_url = os.getenv('SERVICE_URL', 'http://127.0.0.1:8099/cricket-data')
 
@@ -50,37 +91,46 @@ def send_cricket_data_to_service(data, bearer_token,url):
     if bearer_token:
         headers["Authorization"] = f"Bearer {bearer_token}"
 
-    # Convert the data to JSON (assuming data is a dictionary)
-    #json_data = json.dumps(data)
-    json_payload = {}
     try:
         logging.info("Preparing data to send to the service.")
-        #filter data before sending  only non None values are sent
+        # Schema normalisation drops None values (also inside list payloads)
         if isinstance(data, list) :
-            filtered_data = [
-            {k: v for k, v in item.items() if v is not None} for item in data
-        ]
-            json_payload = {"data": filtered_data, "url": url}
-            print("json_payload to be sent back for test match " , json_payload)
+            json_payload = {"data": prepare_payload(data), "url": url}
         else : 
-            filtered_data = {k: v for k, v in data.items() if v is not None}
-            filtered_data['url'] = url
-            json_payload = filtered_data
-            
-            
+            json_payload = prepare_payload({**data, 'url': url})
+
+        lane = classify_payload(json_payload)
+        coalesce_key = url if lane is EgressLane.REALTIME else coalesce_key_for(json_payload, url)
+        get_dispatcher().submit(
+            lane,
+            functools.partial(_post_cricket_data, service_url, headers, json_payload),
+            coalesce_key=coalesce_key,
+            label="cricket-data",
+            freshness=freshness,
+        )
+    except Exception as e:
+        logging.error(f"An error occurred while queueing data: {str(e)}")
+
+
+def _post_cricket_data(service_url, headers, json_payload):
+    try:
         logging.info(f"Sending data to service URL: {service_url}")
-        logging.debug(f"Payload: {json_payload}")
         
         # Send the POST request to the service (works even without token!)
-        response = requests.post(service_url, headers=headers, json=json_payload)
+        response = get_bulkhead("cricket-data").call(
+            get_payload_encoder().post, service_url, json_payload, headers=headers, timeout=5
+        )
 
         # Check the response status code
         if response.status_code == 200:
             logging.info("Data sent successfully to the service.")
-        else:
-            logging.error(f"Failed to send data. Status code: {response.status_code}")
+            return True
+        logging.error(f"Failed to send data. Status code: {response.status_code}")
+    except BulkheadFullError as e:
+        logging.warning(f"Cricket data send shed: {e}")
     except Exception as e:
         logging.error(f"An error occurred while sending data: {str(e)}")
+    return False
         
         
 def add_live_matches(data, bearer_token):
@@ -97,11 +147,11 @@ def add_live_matches(data, bearer_token):
         headers["Authorization"] = f"Bearer {bearer_token}"
 
     try:
-        # Convert the data to a JSON array
-        payload = json.dumps(data)
-        logging.info(f"Payload: {payload}")
+        logging.info(f"Adding {len(data)} live matches")
         # Send the POST request to the service
-        response = requests.post(service_url, headers=headers, data=payload)
+        response = get_bulkhead("cricket-data").call(
+            get_payload_encoder().post, service_url, data, headers=headers, timeout=5
+        )
 
         # Check the response status code
         if response.status_code == 200:
@@ -111,6 +161,11 @@ def add_live_matches(data, bearer_token):
     except Exception as e:
         logging.error(f"An error occurred while adding live matches data: {str(e)}")
 
+def _dependency_for_endpoint(api_endpoint):
+    """Bulkhead name for a save endpoint: sC4 scorecards are isolated from match info."""
+    return 'sc4-save' if 'sc4' in api_endpoint.lower() else 'match-info'
+
+
 def send_data_to_api_endpoint(data, bearer_token, url, api_endpoint=None):
     if api_endpoint is None:
         api_endpoint = os.getenv('API_ENDPOINT', 'http://127.0.0.1:8099/cricket-data/match-info/save')
@@ -133,18 +188,25 @@ def send_data_to_api_endpoint(data, bearer_token, url, api_endpoint=None):
             logging.error("Data should be a dictionary.")
             return False
 
-        # Serialize the payload to JSON string
-        try:
-            json_payload_str = json.dumps(json_payload)
-            logging.debug(f"Serialized JSON payload: {json_payload_str}")
-        except Exception as e:
-            logging.error(f"Error serializing json_payload: {e}")
-            return False
-
         logging.info(f"Sending data to API endpoint: {api_endpoint}")
 
-        # Send the POST request with the JSON string
-        response = requests.post(api_endpoint, headers=headers, data=json_payload_str, timeout=5)
+        bulkhead = get_bulkhead(_dependency_for_endpoint(api_endpoint))
+
+        def _post():
+            # Encoding (fast JSON, or MessagePack where the backend accepts it) happens in the encoder
+            with bulkhead.slot():
+                response = get_payload_encoder().post(api_endpoint, json_payload, headers=headers, timeout=5)
+            raise_for_transient_status(response, url=api_endpoint)
+            return response
+
+        post_with_retry = retryable(
+            config=RetryConfig.from_settings(
+                overrides={"max_attempts": 3, "retry_exceptions": (TransientHTTPError, requests.RequestException)}
+            ),
+            budget=get_retry_budget("backend.api_endpoint"),
+            breaker=_api_endpoint_breaker,
+        )(_post)
+        response = post_with_retry()
 
         if 200 <= response.status_code < 300:
             logging.info("Data sent successfully to the API endpoint.")
@@ -153,12 +215,30 @@ def send_data_to_api_endpoint(data, bearer_token, url, api_endpoint=None):
             logging.error(f"Failed to send data. Status code: {response.status_code}")
             logging.error(f"Response content: {response.text}")
             return False
+    except CircuitBreakerOpenError:
+        logging.warning(f"API endpoint circuit open, skipping send to {api_endpoint}")
+        return False
+    except RetryError as e:
+        logging.error(f"Giving up on API endpoint {api_endpoint}: {e} ({e.__cause__})")
+        return False
+    except BulkheadFullError as e:
+        logging.warning(f"API endpoint send shed: {e}")
+        return False
     except Exception as e:
         logging.exception(f"An error occurred while sending data: {str(e)}")
         return False
-                        
 
-        
 
-        
+def queue_data_to_api_endpoint(data, bearer_token, url, api_endpoint=None):
+    """Queue a large payload (scorecard, match info) on the rate-limited bulk lane.
 
+    Only the newest payload per (url, endpoint) is kept while waiting, so a
+    slow backend never accumulates stale scorecards. Returns False when the
+    payload could not be queued.
+    """
+    return get_dispatcher().submit(
+        EgressLane.BULK,
+        functools.partial(send_data_to_api_endpoint, data, bearer_token, url, api_endpoint),
+        coalesce_key=(url, api_endpoint),
+        label=api_endpoint or "match-info",
+    )
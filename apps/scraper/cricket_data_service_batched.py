@@ -14,7 +14,11 @@ import time
 from collections import defaultdict
 from typing import Dict, List, Any, Optional
 
-logging.basicConfig(filename='crex_scraper.log', level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
+from src.config import get_settings
+from src.egress.adaptive import AdaptiveBatchController, get_batch_controller
+from src.logging.pipeline import LoggingPipeline, route_logger
+
+route_logger(LoggingPipeline.ROOT, 'crex_scraper.log', level=logging.DEBUG, console_level=logging.WARN)
 
 class BatchedCricketDataService:
     """
@@ -31,10 +35,13 @@ class BatchedCricketDataService:
         self,
         max_batch_size: int = 10,
         flush_interval: float = 5.0,
-        service_url: Optional[str] = None
+        service_url: Optional[str] = None,
+        controller: Optional[AdaptiveBatchController] = None
     ):
         self.max_batch_size = max_batch_size
         self.flush_interval = flush_interval
+        # Optional adaptive controller; when set it overrides the static limits above
+        self.controller = controller
         self.service_url = service_url or os.getenv('SERVICE_URL', 'http://127.0.0.1:8099/cricket-data')
         
         # Batch storage: url -> list of data items
@@ -80,11 +87,21 @@ class BatchedCricketDataService:
                 self._last_flush_time[url] = time.time()
             
             # Check if we should flush this batch
+            if self.controller is not None:
+                self.controller.observe_update(url)
+            max_batch_size, flush_interval = self._current_limits()
             batch_size = len(self._batches[url])
             time_since_flush = time.time() - self._last_flush_time[url]
             
-            if batch_size >= self.max_batch_size or time_since_flush >= self.flush_interval:
+            if batch_size >= max_batch_size or time_since_flush >= flush_interval:
                 self._flush_batch_locked(url)
+
+    def _current_limits(self):
+        """Return (max_batch_size, flush_interval), preferring the adaptive controller."""
+        if self.controller is not None:
+            decision = self.controller.decision()
+            return decision.batch_size, decision.flush_interval_seconds
+        return self.max_batch_size, self.flush_interval
     
     def _flush_batch_locked(self, url: str) -> None:
         """Flush a batch for a specific URL (must be called with lock held)."""
@@ -116,16 +133,22 @@ class BatchedCricketDataService:
             "updates": batch_data
         }
         
+        started = time.perf_counter()
+        success = False
         try:
             logging.info(f"Sending batched data for {url}: {len(batch_data)} updates")
             response = requests.post(self.service_url, headers=headers, json=payload, timeout=5)
             
             if response.status_code == 200:
+                success = True
                 logging.info(f"Batch sent successfully for {url}: {len(batch_data)} updates")
             else:
                 logging.error(f"Failed to send batch. Status code: {response.status_code}")
         except Exception as e:
             logging.error(f"Error sending batched data: {str(e)}")
+        finally:
+            if self.controller is not None:
+                self.controller.observe_send(time.perf_counter() - started, success=success)
     
     def flush_all(self) -> None:
         """Flush all pending batches immediately."""
@@ -138,14 +161,15 @@ class BatchedCricketDataService:
     def _background_flusher(self) -> None:
         """Background thread that periodically flushes old batches."""
         while not self._stop_event.is_set():
-            time.sleep(1.0)  # Check every second
+            _, flush_interval = self._current_limits()
+            time.sleep(min(1.0, flush_interval))  # Check at least every second
             
             with self._lock:
                 current_time = time.time()
                 urls_to_flush = []
                 
                 for url, last_flush in self._last_flush_time.items():
-                    if self._batches[url] and (current_time - last_flush) >= self.flush_interval:
+                    if self._batches[url] and (current_time - last_flush) >= flush_interval:
                         urls_to_flush.append(url)
                 
                 for url in urls_to_flush:
@@ -187,9 +211,22 @@ def get_batch_service() -> BatchedCricketDataService:
     if _batch_service is None:
         with _batch_service_lock:
             if _batch_service is None:
+                max_batch_size = int(os.getenv('BATCH_SIZE', '10'))
+                flush_interval = float(os.getenv('BATCH_FLUSH_INTERVAL', '5.0'))
+                settings = get_settings()
+                controller = None
+                if settings.adaptive_batching_enabled:
+                    # Static env values only seed the controller; it retunes from observed latency
+                    controller = get_batch_controller(
+                        "cricket-data-batched",
+                        settings,
+                        initial_batch_size=max_batch_size,
+                        initial_flush_interval=flush_interval,
+                    )
                 _batch_service = BatchedCricketDataService(
-                    max_batch_size=int(os.getenv('BATCH_SIZE', '10')),
-                    flush_interval=float(os.getenv('BATCH_FLUSH_INTERVAL', '5.0'))
+                    max_batch_size=max_batch_size,
+                    flush_interval=flush_interval,
+                    controller=controller
                 )
     
     return _batch_service